@@ -66,6 +66,12 @@ _LONG_B64 = re.compile(r"\b[A-Za-z0-9+/_\-]{40,}={0,2}\b")
 # PEM private-key header.
 _PEM = re.compile(r"-----BEGIN (?:RSA |EC |OPENSSH |DSA |PGP )?PRIVATE KEY-----")
 
+# The three exact detectors above as one alternation, so a prompt is scanned
+# once for all of them (each keeps its own flags inside its group).
+_ANY_SHAPE = re.compile(
+    "(?:%s)|(?i:%s)|(?:%s)" % (_PREFIX.pattern, _BEARER.pattern, _PEM.pattern)
+)
+
 
 def _looks_like_secret(text):
     """Return True if the text contains a token-shaped string.
@@ -74,11 +80,7 @@ def _looks_like_secret(text):
     """
     if not text:
         return False
-    if _PREFIX.search(text):
-        return True
-    if _BEARER.search(text):
-        return True
-    if _PEM.search(text):
+    if _ANY_SHAPE.search(text):
         return True
     # The long-base64 heuristic is the loosest, so require that the matched
     # run actually mixes character classes (digits + letters), which rules out
@@ -0,0 +1,287 @@
+"""Keep-alive connections for the Odoo transport. Standard library only.
+
+`urllib.request.urlopen` opened a new connection - and for https a new TLS
+handshake - for every JSON-2 call, and a fresh `xmlrpc.client.ServerProxy`
+did the same for every XML-RPC call. Against a remote instance the handshake
+costs more than a small `search_read`.
+
+One `ConnectionPool` belongs to one `OdooClient`, so to one profile:
+
+  * Idle `http.client` connections to the profile's origin, at most
+    `MAX_IDLE`. A connection is checked out for the whole request, so
+    threads never share a socket.
+  * One SSL context, passed in once by the client rather than built per
+    request.
+  * Idle connections are dropped after `IDLE_TIMEOUT` seconds, and a reused
+    socket the server has already closed is noticed before anything is sent.
+  * A request that fails on a *reused* connection is retried once on a fresh
+    one: always when it failed while sending (the server never saw it), and
+    when it failed waiting for the reply only if the caller marked it
+    `retry_safe`. A write is never sent twice.
+  * A response that asks to close (`Connection: close`, HTTP/1.0) closes its
+    connection instead of pooling it. Odoo's own HTTP server answers that
+    way; a reverse proxy in front of it usually keeps the connection open.
+
+`PooledTransport` plugs a pool into `xmlrpc.client.ServerProxy`.
+
+Cancellation. Code running inside `cancel_scope(token)` sends its requests
+on behalf of that `CancelToken`. `token.cancel()` - from any thread - shuts
+down the sockets those requests are waiting on, so a blocked call returns
+at once instead of at its timeout, and any later request in the scope
+raises `Cancelled` before it is sent. The scope is a context variable:
+worker threads a call starts must run in a copy of its context to inherit
+it.
+
+Network failures raise `OSError` (`ssl.SSLError` and `TimeoutError`
+included); a malformed reply raises `http.client.HTTPException`. HTTP error
+statuses are returned, not raised.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import http.client
+import select
+import socket
+import threading
+import time
+import urllib.parse
+import xmlrpc.client
+from contextlib import contextmanager
+from typing import Iterator, NamedTuple, Optional
+
+IDLE_TIMEOUT = 15.0
+MAX_IDLE = 4
+
+_STALE_ERRORS = (http.client.RemoteDisconnected, http.client.BadStatusLine,
+                 BrokenPipeError, ConnectionResetError, ConnectionAbortedError)
+
+
+class Response(NamedTuple):
+    status: int
+    reason: str
+    headers: dict
+    body: bytes
+
+
+class _Unsent(Exception):
+    """The request failed before the server could have seen it."""
+
+
+class Cancelled(Exception):
+    """The request's `CancelToken` was cancelled."""
+
+
+class CancelToken:
+    """Lets one thread abandon the requests another thread is making."""
+
+    def __init__(self):
+        self.cancelled = False
+        self._conns: set = set()
+        self._lock = threading.Lock()
+
+    def cancel(self) -> None:
+        with self._lock:
+            self.cancelled = True
+            conns = list(self._conns)
+        for conn in conns:
+            _abort(conn)
+
+    def _attach(self, conn) -> None:
+        with self._lock:
+            if self.cancelled:
+                raise Cancelled()
+            self._conns.add(conn)
+
+    def _detach(self, conn) -> None:
+        with self._lock:
+            self._conns.discard(conn)
+
+
+_scope: contextvars.ContextVar = contextvars.ContextVar("odoo_mcp_cancel", default=None)
+
+
+@contextmanager
+def cancel_scope(token: CancelToken) -> Iterator[CancelToken]:
+    """Requests made inside the ``with`` body can be abandoned by ``token``."""
+    reset = _scope.set(token)
+    try:
+        yield token
+    finally:
+        _scope.reset(reset)
+
+
+class ConnectionPool:
+    """Idle keep-alive connections to the origin of one Odoo URL."""
+
+    def __init__(self, url: str, context=None, max_idle: int = MAX_IDLE,
+                 idle_timeout: float = IDLE_TIMEOUT):
+        parts = urllib.parse.urlsplit(url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise ValueError("not an http(s) URL: %r" % url)
+        self.scheme = parts.scheme
+        self.host = parts.hostname
+        self.port = parts.port or (443 if parts.scheme == "https" else 80)
+        #: Any path the profile URL carries (Odoo served under a sub-path).
+        self.prefix = parts.path.rstrip("/")
+        self.context = context
+        self.max_idle = max_idle
+        self.idle_timeout = idle_timeout
+        self._idle: list = []
+        self._lock = threading.Lock()
+        self.counters = {"opened": 0, "reused": 0, "retried": 0}
+
+    # -- connection bookkeeping --------------------------------------------
+
+    def _connect(self, timeout: float):
+        with self._lock:
+            self.counters["opened"] += 1
+        if self.scheme == "https":
+            return http.client.HTTPSConnection(self.host, self.port, timeout=timeout,
+                                               context=self.context)
+        return http.client.HTTPConnection(self.host, self.port, timeout=timeout)
+
+    def _checkout(self, timeout: float):
+        now = time.monotonic()
+        with self._lock:
+            while self._idle:
+                conn, stamp = self._idle.pop()
+                if now - stamp < self.idle_timeout and not _peer_closed(conn):
+                    self.counters["reused"] += 1
+                    conn.timeout = timeout
+                    if conn.sock is not None:
+                        conn.sock.settimeout(timeout)
+                    return conn, True
+                conn.close()
+        return self._connect(timeout), False
+
+    def _checkin(self, conn) -> None:
+        with self._lock:
+            if len(self._idle) < self.max_idle:
+                self._idle.append((conn, time.monotonic()))
+                return
+        conn.close()
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn, _ in idle:
+            conn.close()
+
+    # -- requests -----------------------------------------------------------
+
+    def request(self, method: str, path: str, body: Optional[bytes] = None,
+                headers: Optional[dict] = None, timeout: float = 30,
+                retry_safe: bool = False) -> Response:
+        """Send one request. ``path`` is absolute on the origin (it already
+        carries :attr:`prefix`). ``retry_safe`` allows a repeat after the
+        request may have reached the server - read-only calls only."""
+        hdrs = dict(headers or {})
+        conn, reused = self._checkout(timeout)
+        try:
+            return self._exchange(conn, method, path, body, hdrs)
+        except _Unsent as exc:
+            if not reused:
+                raise exc.__cause__
+        except _STALE_ERRORS:
+            if not (reused and retry_safe):
+                raise
+        with self._lock:
+            self.counters["retried"] += 1
+        try:
+            return self._exchange(self._connect(timeout), method, path, body, hdrs)
+        except _Unsent as exc:
+            raise exc.__cause__
+
+    def _exchange(self, conn, method, path, body, hdrs) -> Response:
+        token = _scope.get()
+        if token is not None:
+            try:
+                token._attach(conn)
+            except Cancelled:
+                self._checkin(conn)
+                raise
+        try:
+            try:
+                conn.request(method, path, body=body, headers=hdrs)
+            except _STALE_ERRORS as exc:
+                conn.close()
+                raise _Unsent() from exc
+            except BaseException:
+                conn.close()
+                raise
+            if token is not None and token.cancelled:
+                conn.close()  # cancelled while connecting: nothing to wake
+                raise Cancelled()
+            try:
+                resp = conn.getresponse()
+                data = resp.read()
+            except BaseException:
+                conn.close()
+                raise
+        except (OSError, http.client.HTTPException, _Unsent):
+            if token is not None and token.cancelled:
+                raise Cancelled() from None
+            raise
+        finally:
+            if token is not None:
+                token._detach(conn)
+        if resp.will_close:
+            conn.close()
+        else:
+            self._checkin(conn)
+        return Response(resp.status, resp.reason, dict(resp.getheaders()), data)
+
+
+def _abort(conn) -> None:
+    """Wake whoever is blocked reading ``conn``. Safe from any thread."""
+    sock = conn.sock
+    if sock is not None:
+        try:
+            sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+
+
+def _peer_closed(conn) -> bool:
+    """A readable idle socket was closed by the server (or holds bytes nobody
+    asked for); either way it cannot carry the next request."""
+    sock = conn.sock
+    if sock is None:
+        return False
+    try:
+        readable, _, _ = select.select([sock], [], [], 0)
+        return bool(readable)
+    except (OSError, ValueError):
+        return True
+
+
+class PooledTransport(xmlrpc.client.Transport):
+    """XML-RPC over a `ConnectionPool`, with the profile's timeout.
+
+    Cheap to build: it holds no connection of its own, so a `ServerProxy` may
+    be made per call to carry that call's ``retry_safe``.
+    """
+
+    def __init__(self, pool: ConnectionPool, timeout: float, retry_safe: bool = False,
+                 user_agent: str = ""):
+        super().__init__()
+        self.pool = pool
+        self.timeout = timeout
+        self.retry_safe = retry_safe
+        if user_agent:
+            self.user_agent = user_agent
+
+    def request(self, host, handler, request_body, verbose=False):
+        resp = self.pool.request(
+            "POST", handler, request_body,
+            {"Content-Type": "text/xml", "User-Agent": self.user_agent},
+            timeout=self.timeout, retry_safe=self.retry_safe,
+        )
+        if resp.status != 200:
+            raise xmlrpc.client.ProtocolError(host + handler, resp.status, resp.reason,
+                                              resp.headers)
+        parser, unmarshaller = self.getparser()
+        parser.feed(resp.body)
+        parser.close()
+        return unmarshaller.close()
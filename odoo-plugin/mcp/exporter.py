@@ -0,0 +1,175 @@
+"""Streaming export behind `odoo_search` with `export_to`. Standard library only.
+
+`odoo_search` answers at most MAX_LIMIT rows inside MAX_CHARS characters, and
+paging deeper with `offset` makes the server skip every earlier row again on
+each page. An export instead walks the table in id order - each batch asks
+for `id > <last id of the previous batch>` - which costs the same at row one
+million as at row one, and writes the rows to a file instead of the context
+window. The model only sees a summary.
+
+Files. NDJSON (`.ndjson`, `.jsonl`) is one record per line. CSV has a header
+row; relational values (`[id, "name"]`, id lists) are JSON-encoded in their
+cell. Values are redacted like tool output, never truncated.
+
+Resume. After every batch the data file is flushed and a small
+`<name>.state.json` beside it records the request, the last id and the byte
+length written. If a run stops - an error, a cancelled call, a crash - the
+same request with the same `export_to` truncates any partly written batch
+and continues after the last id. A finished export removes its state file;
+asking for it again, or for a different request into an existing file,
+needs `overwrite`.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+import guards
+from guards import GuardError
+from odoo_client import OdooError
+
+BATCH = 500
+#: Where exports go when the profile sets no ``export_dir``.
+DEFAULT_DIR = Path(os.path.expanduser("~")) / ".odoo-mcp" / "exports"
+
+
+def _signature(model: str, domain: list, fields: Optional[list], fmt: str) -> str:
+    return json.dumps([model, domain, fields or [], fmt], sort_keys=True, default=str)
+
+
+def _cell(value: Any) -> Any:
+    if isinstance(value, (list, dict)):
+        return json.dumps(value, ensure_ascii=False, default=str)
+    if value is False:
+        return ""  # Odoo's "no value"
+    return value
+
+
+def export(client, model: str, domain: list, fields: Optional[list], path: Path,
+           context: Optional[dict] = None, max_rows: int = 0, overwrite: bool = False,
+           secrets=()) -> dict:
+    """Write every matching record to ``path``; return the summary for the model."""
+    fmt = "csv" if path.suffix == ".csv" else "ndjson"
+    state_path = path.with_name(path.name + ".state.json")
+    signature = _signature(model, domain, fields, fmt)
+
+    state: dict = {}
+    if state_path.exists() and not overwrite:
+        try:
+            state = json.loads(state_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            state = {}
+        if state.get("signature") != signature:
+            raise GuardError(
+                "%s holds an unfinished export of a different request. Repeat that "
+                "request to resume it, or pass overwrite: true to start over." % path.name
+            )
+    elif path.exists() and not overwrite:
+        raise GuardError(
+            "%s already exists. Pass overwrite: true to replace it, or choose another "
+            "export_to name." % path.name
+        )
+
+    if state and not path.exists():
+        state = {}  # the data went away; the checkpoint describes nothing
+    resumed = bool(state)
+    last_id = int(state.get("last_id") or 0)
+    rows = int(state.get("rows") or 0)
+    written = int(state.get("bytes") or 0)
+    header = state.get("header") or list(fields or [])
+    started, batches, run_rows = time.monotonic(), 0, 0
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if not resumed:
+        # Checkpoint before the file exists, so a run stopped before its first
+        # batch leaves a resumable export, not an empty file that needs
+        # `overwrite`.
+        _save_state(state_path, {"signature": signature, "last_id": 0, "rows": 0,
+                                 "bytes": 0, "header": header})
+    fh = open(path, "r+b" if resumed else "wb")
+    error = ""
+    try:
+        fh.truncate(written)  # drop a batch written after the last checkpoint
+        fh.seek(written)
+        while not max_rows or rows < max_rows:
+            size = BATCH if not max_rows else min(BATCH, max_rows - rows)
+            try:
+                batch = client.search_read(
+                    model, domain + [["id", ">", last_id]], fields=fields,
+                    limit=size, order="id", context=context,
+                )
+            except OdooError as exc:
+                if not batches and not resumed:
+                    raise
+                error = str(exc)
+                break
+            if not isinstance(batch, list) or not batch:
+                break
+            batch = guards.redact(batch, secrets)
+            if fmt == "csv":
+                if not header:
+                    header = list(batch[0])
+                buf = io.StringIO()
+                out = csv.writer(buf, lineterminator="\n")
+                if written == 0:
+                    out.writerow(header)
+                for rec in batch:
+                    out.writerow([_cell(rec.get(k)) for k in header])
+                chunk = buf.getvalue()
+            else:
+                chunk = "".join(json.dumps(rec, ensure_ascii=False, default=str) + "\n"
+                                for rec in batch)
+            data = chunk.encode("utf-8")
+            fh.write(data)
+            fh.flush()
+            os.fsync(fh.fileno())
+            written += len(data)
+            rows += len(batch)
+            run_rows += len(batch)
+            batches += 1
+            last_id = max(int(rec["id"]) for rec in batch)
+            _save_state(state_path, {"signature": signature, "last_id": last_id,
+                                     "rows": rows, "bytes": written, "header": header})
+            if len(batch) < size:
+                break
+    finally:
+        fh.close()
+
+    complete = not error
+    if complete:
+        try:
+            state_path.unlink()
+        except OSError:
+            pass
+    summary = {
+        "model": model,
+        "file": str(path),
+        "format": fmt,
+        "rows": rows,
+        "rows_this_run": run_rows,
+        "bytes": written,
+        "batches": batches,
+        "elapsed_s": round(time.monotonic() - started, 3),
+        "last_id": last_id,
+        "resumed": resumed,
+        "complete": complete,
+    }
+    if max_rows and rows >= max_rows:
+        summary["note"] = "Stopped at limit=%d rows." % max_rows
+    if error:
+        summary["error"] = error
+        summary["note"] = ("Stopped early; the rows so far are kept. Repeat the same call to "
+                           "resume after id %d." % last_id)
+    return summary
+
+
+def _save_state(path: Path, state: dict) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps(state), encoding="utf-8")
+    os.replace(tmp, path)
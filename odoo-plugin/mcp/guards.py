@@ -246,6 +246,21 @@ def clamp_limit(limit: Any, default: int, hard_max: int) -> int:
     return min(limit, hard_max)
 
 
+_EXPORT_NAME = re.compile(r"^[A-Za-z0-9][A-Za-z0-9._-]{0,120}\.(ndjson|jsonl|csv)$")
+
+
+def check_export_name(name: Any) -> str:
+    """Exports are written only into the export directory, under a plain file
+    name. No directories, no traversal, no executable or dotfile names."""
+    if not isinstance(name, str) or not _EXPORT_NAME.match(name.strip()):
+        raise GuardError(
+            "export_to must be a plain file name ending in .ndjson, .jsonl or .csv, "
+            "e.g. \"partners.ndjson\". It is written into the export directory; paths "
+            "are not accepted."
+        )
+    return name.strip()
+
+
 # --------------------------------------------------------------------------
 # Redaction
 # --------------------------------------------------------------------------
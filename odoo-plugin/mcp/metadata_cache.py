@@ -0,0 +1,182 @@
+"""Model-metadata cache for the schema tools. Standard library only.
+
+`odoo_inspect_model` spent five round trips per call - `fields_get` and four
+`check_access_rights` - and `odoo_list_models` re-read `ir.model` every time,
+although a schema rarely changes within a session.
+
+What is cached, per model: the `fields_get` answer, the four access verdicts,
+and the full `ir.model` listing (filtered locally per call). Nothing else -
+records are never cached.
+
+Scope. One `MetadataCache` belongs to one (url, db, user). It also remembers
+the server version, the context language and a fingerprint of the installed
+modules and their versions; if any of those differs from what the entries
+were recorded under, every entry is dropped. The module fingerprint is read
+again every `RECHECK_SECONDS` (5 minutes) while the cache is open, so
+installing or upgrading a module mid-session invalidates it within that
+interval.
+
+Lifetime. Entries live `ttl` seconds (profile `metadata_ttl`, default 3600).
+`odoo_status` clears the cache. Profile `metadata_cache` picks where it lives:
+
+  memory   (default) for the life of the server process
+  disk     also in ~/.odoo-mcp/cache/, so the next session starts warm. The
+           file name is a digest; the file holds field metadata and access
+           verdicts, never a credential or a record.
+  off      no caching; every call goes to the server
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from odoo_client import OdooError
+
+DEFAULT_TTL = 3600
+#: How often an open cache reads the module fingerprint again, so a module
+#: installed or upgraded mid-session drops the entries within minutes.
+RECHECK_SECONDS = 300
+CACHE_DIR = Path(os.path.expanduser("~")) / ".odoo-mcp" / "cache"
+
+#: Returned by :meth:`MetadataCache.get` when there is no live entry.
+MISS = object()
+
+
+def _digest(*parts: Any) -> str:
+    return hashlib.sha256(json.dumps(parts, default=str).encode("utf-8")).hexdigest()
+
+
+class MetadataCache:
+    """Entries keyed by (kind, model), valid for one schema ``stamp``."""
+
+    def __init__(self, owner: tuple, stamp: str, ttl: int = DEFAULT_TTL,
+                 persist: bool = False, restamp: Optional[Callable[[], str]] = None):
+        self.stamp = stamp
+        self.ttl = ttl
+        self._restamp = restamp
+        self._checked = time.time()
+        self.path: Optional[Path] = None
+        if persist:
+            self.path = CACHE_DIR / ("%s.json" % _digest(*owner)[:32])
+        self._entries: dict = {}
+        self._lock = threading.Lock()
+        self.counters = {"hits": 0, "misses": 0}
+        self._load()
+
+    def get(self, kind: str, model: str = "", now: Optional[float] = None) -> Any:
+        """The cached value, or :data:`MISS`."""
+        now = time.time() if now is None else now
+        self._recheck(now)
+        with self._lock:
+            hit = self._entries.get("%s:%s" % (kind, model))
+            if hit is not None and now - hit[0] < self.ttl:
+                self.counters["hits"] += 1
+                return hit[1]
+            self.counters["misses"] += 1
+        return MISS
+
+    def put(self, kind: str, model: str, value: Any, now: Optional[float] = None) -> None:
+        now = time.time() if now is None else now
+        with self._lock:
+            self._entries["%s:%s" % (kind, model)] = (now, value)
+            self._save()
+
+    def _recheck(self, now: float) -> None:
+        """Every :data:`RECHECK_SECONDS`, compute the stamp again (one call,
+        made outside the lock by whichever caller gets there first) and drop
+        every entry if it changed."""
+        if self._restamp is None or now - self._checked < RECHECK_SECONDS:
+            return
+        with self._lock:
+            if now - self._checked < RECHECK_SECONDS:
+                return
+            self._checked = now
+        try:
+            stamp = self._restamp()
+        except OdooError:
+            return  # keep serving; the next interval asks again
+        with self._lock:
+            if stamp != self.stamp:
+                self.stamp = stamp
+                self._entries = {}
+                self._save()
+
+    def clear(self) -> None:
+        """Forget everything, on disk too."""
+        with self._lock:
+            self._entries = {}
+            if self.path is not None:
+                try:
+                    self.path.unlink()
+                except OSError:
+                    pass
+
+    # -- persistence -------------------------------------------------------
+
+    def _load(self) -> None:
+        if self.path is None:
+            return
+        try:
+            doc = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if not isinstance(doc, dict) or doc.get("stamp") != self.stamp:
+            return  # another schema: the entries describe models that changed
+        entries = doc.get("entries")
+        if isinstance(entries, dict):
+            self._entries = {k: tuple(v) for k, v in entries.items()
+                             if isinstance(v, list) and len(v) == 2}
+
+    def _save(self) -> None:
+        """Rewrite the file atomically. Caller holds the lock. A cache that
+        cannot be written is still a cache for this process."""
+        if self.path is None:
+            return
+        doc = {"stamp": self.stamp, "entries": {k: list(v) for k, v in self._entries.items()}}
+        tmp = self.path.with_suffix(".tmp%d" % os.getpid())
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(json.dumps(doc, separators=(",", ":")), encoding="utf-8")
+            os.replace(tmp, self.path)
+        except OSError:
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
+
+
+def open_for(client, profile) -> Optional[MetadataCache]:
+    """The cache for this client's user and schema, or None when the profile
+    turns caching off. Costs one call: the installed-module fingerprint."""
+    if profile.metadata_cache == "off" or profile.metadata_ttl <= 0:
+        return None
+    version = client.version().get("server_version")
+    # XML-RPC authenticates to a uid; JSON-2 is the API key's own user.
+    user = client.uid() if client.flavor == "xmlrpc" else _digest(profile.api_key)
+    owner = (profile.url, profile.db, user)
+
+    def restamp() -> str:
+        return _digest(version, profile.lang, _module_fingerprint(client))
+    return MetadataCache(owner, restamp(), ttl=profile.metadata_ttl,
+                         persist=profile.metadata_cache == "disk", restamp=restamp)
+
+
+def _module_fingerprint(client) -> str:
+    """Installed modules and their versions. A user who cannot read
+    ir.module.module gets "" and relies on the TTL alone."""
+    try:
+        rows = client.search_read(
+            "ir.module.module", [["state", "=", "installed"]],
+            fields=["name", "latest_version"], order="name",
+        )
+    except OdooError:
+        return ""
+    if not isinstance(rows, list):
+        return ""
+    return _digest(sorted((r.get("name"), r.get("latest_version")) for r in rows))
@@ -11,6 +11,9 @@ Two wire protocols, chosen automatically from the server version:
              a password is, and this path is non-interactive so it is not
              blocked by 2FA.
 
+Both paths run over one keep-alive connection pool per client (so per
+profile; see connection_pool.py), with the profile's timeout.
+
 Both paths execute as the authenticated Odoo user, so ir.model.access,
 ir.rule and field-level groups apply exactly as they would in the web client.
 Nothing here uses sudo, raw SQL, or a shell.
@@ -24,16 +27,18 @@ Portability notes baked in:
 
 from __future__ import annotations
 
+import functools
+import http.client
 import json
 import re
 import socket
 import ssl
 import urllib.error
-import urllib.request
 import xmlrpc.client
 from typing import Any, Optional
 
-from guards import redact
+from connection_pool import ConnectionPool, PooledTransport
+from guards import READ_ONLY_METHODS, redact
 
 JSON2_MIN_MAJOR = 19
 USER_AGENT = "odoo-plugin-mcp/1.0 (+claude-code)"
@@ -43,12 +48,14 @@ class OdooError(Exception):
     """Actionable failure. The message is shown to the model, so it explains the fix."""
 
 
-def _ssl_context(verify: bool):
-    if verify:
-        return None  # urllib default: verified
+@functools.lru_cache(maxsize=2)
+def _ssl_context(verify: bool) -> ssl.SSLContext:
+    """One context per setting for the life of the process: building one loads
+    the system CA store, which cost more than the request it was built for."""
     ctx = ssl.create_default_context()
-    ctx.check_hostname = False
-    ctx.verify_mode = ssl.CERT_NONE
+    if not verify:
+        ctx.check_hostname = False
+        ctx.verify_mode = ssl.CERT_NONE
     return ctx
 
 
@@ -77,10 +84,40 @@ class OdooClient:
         self._version: Optional[dict] = None
         self._uid: Optional[int] = None
         self._flavor: Optional[str] = None
+        self._pool: Optional[ConnectionPool] = None
 
     # -- low level ---------------------------------------------------------
 
-    def _post_json(self, path: str, payload: dict, headers: Optional[dict] = None) -> Any:
+    @property
+    def pool(self) -> ConnectionPool:
+        if self._pool is None:
+            https = self.p.url.lower().startswith("https")
+            try:
+                self._pool = ConnectionPool(
+                    self.p.url, context=_ssl_context(self.p.verify_ssl) if https else None
+                )
+            except ValueError:
+                raise OdooError(
+                    "the profile \"url\" %r is not an http(s) address. Use the address "
+                    "you open Odoo at in a browser, e.g. https://odoo.example.com."
+                    % self.p.url
+                )
+        return self._pool
+
+    def close(self) -> None:
+        """Drop the idle connections. The client stays usable."""
+        if self._pool is not None:
+            self._pool.close()
+
+    def _timeout_hint(self, url: str) -> str:
+        return (
+            "timed out after %ss calling %s. The server may be busy, or a long "
+            "operation was triggered. Raise \"timeout\" in the profile if this is expected."
+            % (self.p.timeout, url)
+        )
+
+    def _post_json(self, path: str, payload: dict, headers: Optional[dict] = None,
+                   retry_safe: bool = False) -> Any:
         url = "%s%s" % (self.p.url, path)
         body = json.dumps(payload).encode("utf-8")
         hdrs = {
@@ -90,27 +127,17 @@ class OdooClient:
         }
         if headers:
             hdrs.update(headers)
-        req = urllib.request.Request(url, data=body, headers=hdrs, method="POST")
         try:
-            with urllib.request.urlopen(
-                req, timeout=self.p.timeout, context=_ssl_context(self.p.verify_ssl)
-            ) as resp:
-                raw = resp.read().decode("utf-8", "replace")
-        except urllib.error.HTTPError as exc:
-            detail = ""
-            try:
-                detail = exc.read().decode("utf-8", "replace")[:2000]
-            except Exception:
-                pass
-            raise OdooError(self._http_hint(exc.code, detail, path))
-        except urllib.error.URLError as exc:
-            raise OdooError(self._net_hint(exc))
+            resp = self.pool.request("POST", self.pool.prefix + path, body, hdrs,
+                                     timeout=self.p.timeout, retry_safe=retry_safe)
         except socket.timeout:
-            raise OdooError(
-                "timed out after %ss calling %s. The server may be busy, or a long "
-                "operation was triggered. Raise \"timeout\" in the profile if this is expected."
-                % (self.p.timeout, url)
-            )
+            raise OdooError(self._timeout_hint(url))
+        except (OSError, http.client.HTTPException) as exc:
+            raise OdooError(self._net_hint(exc))
+        if resp.status >= 300:
+            detail = resp.body[:2000].decode("utf-8", "replace")
+            raise OdooError(self._http_hint(resp.status, detail, path, resp.headers))
+        raw = resp.body.decode("utf-8", "replace")
         if not raw.strip():
             return None
         try:
@@ -122,9 +149,17 @@ class OdooClient:
                 % (url, raw[:200])
             )
 
-    def _http_hint(self, code: int, detail: str, path: str) -> str:
+    def _http_hint(self, code: int, detail: str, path: str,
+                   headers: Optional[dict] = None) -> str:
         detail = (detail or "").strip()
         snippet = _clean_fault(detail)[:600]
+        if 300 <= code < 400:
+            location = {k.lower(): v for k, v in (headers or {}).items()}.get("location", "?")
+            return (
+                "HTTP %d from %s: the server redirects to %s.\n"
+                "Set \"url\" in the profile to the address it redirects to (often the "
+                "https:// form), so calls go to Odoo directly." % (code, path, location)
+            )
         if code == 401:
             return (
                 "401 Unauthorized from Odoo. The API key was rejected.\n"
@@ -167,12 +202,12 @@ class OdooClient:
             )
         return base + extra
 
-    def _xmlrpc(self, endpoint: str):
+    def _xmlrpc(self, endpoint: str, retry_safe: bool = False):
+        """A proxy over the pooled transport. Built per call to carry that
+        call's ``retry_safe``; the connection underneath is reused."""
         url = "%s/xmlrpc/2/%s" % (self.p.url, endpoint)
-        ctx = None
-        if not self.p.verify_ssl and url.lower().startswith("https"):
-            ctx = _ssl_context(False)
-        return xmlrpc.client.ServerProxy(url, allow_none=True, context=ctx)
+        transport = PooledTransport(self.pool, self.p.timeout, retry_safe, USER_AGENT)
+        return xmlrpc.client.ServerProxy(url, transport=transport, allow_none=True)
 
     # -- capability detection ---------------------------------------------
 
@@ -182,26 +217,27 @@ class OdooClient:
 
         # Odoo 19 exposes an unauthenticated version probe.
         try:
-            req = urllib.request.Request(
-                "%s/json/version" % self.p.url,
+            resp = self.pool.request(
+                "GET", self.pool.prefix + "/json/version",
                 headers={"Accept": "application/json", "User-Agent": USER_AGENT},
-                method="GET",
+                timeout=min(self.p.timeout, 15), retry_safe=True,
             )
-            with urllib.request.urlopen(
-                req, timeout=min(self.p.timeout, 15), context=_ssl_context(self.p.verify_ssl)
-            ) as resp:
-                data = json.loads(resp.read().decode("utf-8", "replace"))
+            data = json.loads(resp.body.decode("utf-8", "replace")) if resp.status == 200 else None
             if isinstance(data, dict) and data.get("server_version_info"):
                 self._version = data
                 return data
+        except OdooError:
+            raise
         except Exception:
             pass  # older server, or probe unavailable - fall through
 
         try:
-            data = self._xmlrpc("common").version()
+            data = self._xmlrpc("common", retry_safe=True).version()
         except xmlrpc.client.Fault as exc:
             raise OdooError("Odoo rejected the version probe: %s" % _clean_fault(exc.faultString))
-        except (urllib.error.URLError, OSError, socket.timeout) as exc:
+        except socket.timeout:
+            raise OdooError(self._timeout_hint("%s/xmlrpc/2/common" % self.p.url))
+        except (urllib.error.URLError, OSError, http.client.HTTPException) as exc:
             raise OdooError(self._net_hint(exc))
         except xmlrpc.client.ProtocolError as exc:
             raise OdooError(
@@ -243,7 +279,7 @@ class OdooClient:
                 "then put it in the profile or reference it as ${ENV_VAR}."
             )
         try:
-            res = self._xmlrpc("common").authenticate(
+            res = self._xmlrpc("common", retry_safe=True).authenticate(
                 self.p.db, self.p.username, self.p.api_key, {}
             )
         except xmlrpc.client.Fault as exc:
@@ -254,7 +290,9 @@ class OdooClient:
                     "Use odoo_status to see what the server reports." % (msg, self.p.db)
                 )
             raise OdooError("authentication failed: %s" % msg)
-        except (urllib.error.URLError, OSError, socket.timeout) as exc:
+        except socket.timeout:
+            raise OdooError(self._timeout_hint("%s/xmlrpc/2/common" % self.p.url))
+        except (urllib.error.URLError, OSError, http.client.HTTPException) as exc:
             raise OdooError(self._net_hint(exc))
 
         # 17.0+ may return a dict; the MFA path yields {'uid': None}, so a bare
@@ -315,7 +353,8 @@ class OdooClient:
         # several databases are served, X-Odoo-Database disambiguates.
         if self.p.db:
             headers["X-Odoo-Database"] = self.p.db
-        result = self._post_json("/json/2/%s/%s" % (model, method), payload, headers)
+        result = self._post_json("/json/2/%s/%s" % (model, method), payload, headers,
+                                 retry_safe=method in READ_ONLY_METHODS)
         if isinstance(result, dict) and result.get("error") and "result" not in result:
             err = result["error"]
             msg = err.get("message") if isinstance(err, dict) else str(err)
@@ -326,14 +365,16 @@ class OdooClient:
         uid = self.uid()
         positional = ([ids] if ids else []) + args
         try:
-            return self._xmlrpc("object").execute_kw(
+            return self._xmlrpc("object", retry_safe=method in READ_ONLY_METHODS).execute_kw(
                 self.p.db, uid, self.p.api_key, model, method, positional, kwargs
             )
         except xmlrpc.client.Fault as exc:
             raise OdooError(
                 "%s.%s failed: %s" % (model, method, _clean_fault(exc.faultString))
             )
-        except (urllib.error.URLError, OSError, socket.timeout) as exc:
+        except socket.timeout:
+            raise OdooError(self._timeout_hint("%s/xmlrpc/2/object" % self.p.url))
+        except (urllib.error.URLError, OSError, http.client.HTTPException) as exc:
             raise OdooError(self._net_hint(exc))
         except xmlrpc.client.ProtocolError as exc:
             raise OdooError("XML-RPC protocol error %s" % getattr(exc, "errcode", "?"))
@@ -35,6 +35,7 @@ USER_FILE = "profiles.json"
 _ENV_REF = re.compile(r"\$\{([A-Za-z_][A-Za-z0-9_]*)\}")
 
 VALID_MODES = ("read", "write")
+VALID_METADATA_CACHE = ("memory", "disk", "off")
 
 
 class ProfileError(Exception):
@@ -58,6 +59,10 @@ class Profile:
     tz: str = ""
     timeout: int = 30
     verify_ssl: bool = True
+    metadata_cache: str = "memory"
+    metadata_ttl: int = 3600
+    max_concurrency: int = 4
+    export_dir: str = ""
     source: str = ""
 
     @property
@@ -91,6 +96,10 @@ class Profile:
             "allow_write_models": sorted(self.allow_write_models),
             "allowed_company_ids": list(self.companies) or None,
             "api_key_set": bool(self.api_key),
+            "metadata_cache": self.metadata_cache,
+            "metadata_ttl": self.metadata_ttl,
+            "max_concurrency": self.max_concurrency,
+            "export_dir": self.export_dir,
             "source": self.source,
         }
 
@@ -201,6 +210,31 @@ def _build(name: str, raw: dict, source: str) -> Profile:
     except (TypeError, ValueError):
         raise ProfileError("profile %r: timeout must be an integer number of seconds" % name)
 
+    metadata_cache = str(raw.get("metadata_cache") or "memory").strip().lower()
+    if metadata_cache not in VALID_METADATA_CACHE:
+        raise ProfileError(
+            "profile %r has metadata_cache %r; expected one of %s"
+            % (name, metadata_cache, ", ".join(VALID_METADATA_CACHE))
+        )
+    metadata_ttl = raw.get("metadata_ttl", 3600)
+    try:
+        metadata_ttl = max(0, int(metadata_ttl))
+    except (TypeError, ValueError):
+        raise ProfileError(
+            "profile %r: metadata_ttl must be an integer number of seconds" % name
+        )
+
+    max_concurrency = raw.get("max_concurrency", 4)
+    try:
+        max_concurrency = max(1, min(int(max_concurrency), 16))
+    except (TypeError, ValueError):
+        raise ProfileError("profile %r: max_concurrency must be an integer from 1 to 16" % name)
+
+    export_dir = str(raw.get("export_dir") or "").strip()
+    if export_dir:
+        # Relative to the project, like the project file itself.
+        export_dir = str(project_dir() / os.path.expanduser(export_dir))
+
     production = _as_bool(raw.get("production"))
     verify_ssl = _as_bool(raw.get("verify_ssl"), True)
     if not verify_ssl:
@@ -238,6 +272,10 @@ def _build(name: str, raw: dict, source: str) -> Profile:
         tz=str(raw.get("tz") or "").strip(),
         timeout=timeout,
         verify_ssl=verify_ssl,
+        metadata_cache=metadata_cache,
+        metadata_ttl=metadata_ttl,
+        max_concurrency=max_concurrency,
+        export_dir=export_dir,
         source=source,
     )
 
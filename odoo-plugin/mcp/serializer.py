@@ -0,0 +1,199 @@
+"""Budget-aware encoding of tool results. Standard library only.
+
+`tools._dump` used to copy the whole payload through `_shrink`, walk it again
+in `guards.redact`, encode all of it with `json.dumps(indent=2)` and only then
+cut the text at MAX_CHARS. A 500-row search with wide rows spent most of that
+work on text that was thrown away, and the cut landed mid-record, leaving
+JSON the model could not parse.
+
+`dump` encodes the payload's largest list or mapping (the records, groups,
+models or fields) one entry at a time, shrinking and redacting each entry
+just before encoding it, and stops at the first entry that does not fit.
+The other top-level values are small and encoded whole. The result is
+always valid JSON; when entries were left out, a trailing `truncated` object
+says exactly how many were shown.
+
+When a list of records does not fit, a compact columnar encoding is tried as
+well - one `columns` header, one array per record, no indentation - and used
+if it shows more records. Rows of many short fields fit three to four times
+as many; rows dominated by one long text field gain little.
+
+A payload that fits is encoded exactly as `json.dumps(..., indent=2)` would.
+A payload with nothing to shorten (no list or mapping at the top level) falls
+back to the old cut-and-note.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Iterable, Optional
+
+import guards
+
+HINT = "Narrow `fields`, lower `limit`, or use odoo_read_group to aggregate."
+
+# Kept free for the `truncated` object when entries are left out. The object
+# is well under this; the budget is what must never be exceeded.
+_TRAILER = 400
+
+
+def shrink(node: Any, max_str: int) -> Any:
+    """Truncate oversized strings. Odoo rows carry HTML bodies and base64 blobs
+    that would otherwise dominate the context window."""
+    if isinstance(node, str):
+        if len(node) > max_str:
+            return node[:max_str] + ("... [truncated %d chars]" % (len(node) - max_str))
+        return node
+    if isinstance(node, dict):
+        return {k: shrink(v, max_str) for k, v in node.items()}
+    if isinstance(node, list):
+        return [shrink(v, max_str) for v in node]
+    return node
+
+
+def _pretty(value: Any, depth: int) -> str:
+    text = json.dumps(value, indent=2, ensure_ascii=False, default=str)
+    return text.replace("\n", "\n" + "  " * depth) if depth else text
+
+
+def _compact(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, default=str, separators=(",", ":"))
+
+
+def _main_key(payload: Any) -> Optional[str]:
+    """The top-level key holding the largest list or mapping, if any."""
+    if not isinstance(payload, dict) or "truncated" in payload:
+        return None
+    best, size = None, 0
+    for k, v in payload.items():
+        if not isinstance(k, str):
+            return None
+        if isinstance(v, (list, dict)) and len(v) > size:
+            best, size = k, len(v)
+    return best
+
+
+def dump(payload: Any, secrets: Iterable[str] = (), budget: int = 60000,
+         max_str: int = 800, columnar: bool = True) -> str:
+    """Encode ``payload`` for the model in at most ``budget`` characters."""
+    secrets = tuple(secrets)
+    key = _main_key(payload)
+    if key is None:
+        return _whole(payload, secrets, budget, max_str)
+    main = payload[key]
+    head = guards.redact({k: shrink(v, max_str) for k, v in payload.items() if k != key},
+                         secrets)
+
+    def clean(node: Any) -> Any:
+        return guards.redact(shrink(node, max_str), secrets)
+
+    parts = {k: "%s: %s" % (_compact(k), _pretty(v, 1)) for k, v in head.items()}
+    # Everything but the entries: "{\n  " and "\n}", ",\n  " between members,
+    # the main key with its ": " and the closing "\n  ]". Exact, so a payload
+    # that fits is never cut.
+    frame = 8 + 4 * len(payload) + sum(len(p) for p in parts.values()) + len(_compact(key))
+    entries, sizes = [], []
+    used, room = 0, budget - frame
+    items = main.items() if isinstance(main, dict) else ((None, v) for v in main)
+    for k, v in items:
+        if k is None:
+            text = _pretty(clean(v), 2)
+        else:
+            # Redacted as a pair: the key-name check in guards.redact needs the key.
+            text = "%s: %s" % (_compact(k), _pretty(clean({k: v})[k], 2))
+        used += len(text) + 6  # "\n    " before it, "," or "\n  " after it
+        if used > room:
+            break
+        entries.append(text)
+        sizes.append(len(text) + 6)
+    total = len(main)
+    if len(entries) == total:
+        return _assemble(payload, key, parts, main, entries, None)
+
+    # Not everything fits: make room for the trailer, then see whether the
+    # columnar form shows more.
+    used -= len(text) + 6
+    while entries and used > room - _TRAILER:
+        entries.pop()
+        used -= sizes.pop()
+    shown = len(entries)
+    if columnar:
+        text = _columnar(payload, key, head, main, clean, budget, shown)
+        if text is not None:
+            return text
+    if room - _TRAILER < 0:
+        return _whole(payload, secrets, budget, max_str)
+    trailer = {
+        "shown": shown,
+        "total": total,
+        "of": key,
+        "note": "Only the first %d of %d %s fit in %d characters. %s"
+                % (shown, total, key, budget, HINT),
+    }
+    return _assemble(payload, key, parts, main, entries, trailer)
+
+
+def _assemble(payload, key, parts, main, entries, trailer) -> str:
+    if entries:
+        open_, close = ("{", "}") if isinstance(main, dict) else ("[", "]")
+        body = open_ + "\n    " + ",\n    ".join(entries) + "\n  " + close
+    else:
+        body = "{}" if isinstance(main, dict) else "[]"
+    out = ["%s: %s" % (_compact(key), body) if k == key else parts[k] for k in payload]
+    if trailer is not None:
+        out.append('"truncated": %s' % _pretty(trailer, 1))
+    return "{\n  " + ",\n  ".join(out) + "\n}"
+
+
+def _columnar(payload, key, head, main, clean, budget, beat) -> Optional[str]:
+    """The compact form if it shows more than ``beat`` records, else None."""
+    if not isinstance(main, list) or not all(isinstance(r, dict) for r in main):
+        return None
+    columns, seen = [], set()
+    for rec in main:
+        for k in rec:
+            if k not in seen:
+                seen.add(k)
+                columns.append(k)
+    members = ["%s:%s" % (_compact(k), _compact(v)) for k, v in head.items()]
+    frame = 2 + sum(len(m) + 1 for m in members) + len(_compact(key)) \
+        + len('{"columns":,"rows":[]}') + len(_compact(columns)) + 1
+    room = budget - frame - _TRAILER
+    rows, used = [], 0
+    for rec in main:
+        rec = clean(rec)
+        text = _compact([rec.get(c) for c in columns])
+        used += len(text) + 1
+        if used > room:
+            break
+        rows.append(text)
+    if len(rows) <= beat:
+        return None
+    total = len(main)
+    out, i = [], 0
+    for k in payload:
+        if k == key:
+            out.append('%s:{"columns":%s,"rows":[%s]}'
+                       % (_compact(key), _compact(columns), ",".join(rows)))
+        else:
+            out.append(members[i])
+            i += 1
+    if len(rows) < total:
+        out.append('"truncated":%s' % _compact({
+            "shown": len(rows),
+            "total": total,
+            "of": key,
+            "note": "Only the first %d of %d %s fit in %d characters, as `columns` + "
+                    "`rows`. %s" % (len(rows), total, key, budget, HINT),
+        }))
+    return "{" + ",".join(out) + "}"
+
+
+def _whole(payload, secrets, budget, max_str) -> str:
+    text = _pretty(guards.redact(shrink(payload, max_str), secrets), 0)
+    if len(text) > budget:
+        text = text[:budget] + (
+            "\n... [output truncated at %d chars. Narrow `fields`, lower `limit`, "
+            "or use odoo_read_group to aggregate.]" % budget
+        )
+    return text
@@ -15,6 +15,15 @@ work.
 Two rules this file must never break:
   1. stdout carries protocol messages only. Every diagnostic goes to stderr.
   2. one message per line, no embedded newlines.
+
+Concurrency: the reader thread answers lifecycle, `ping` and listing
+requests itself and hands each `tools/call` to a pool of ODOO_MCP_WORKERS
+threads (default 8; 0 runs every call on the reader thread, as before). So a
+slow `odoo_read_group` no longer holds up `ping` or an unrelated search.
+Calls against one profile are further bounded by its `max_concurrency`.
+Responses may therefore arrive out of order, which JSON-RPC allows; one lock
+keeps each line whole. `notifications/cancelled` abandons a queued call, or
+wakes an in-flight one by closing its socket, and its response is dropped.
 """
 
 from __future__ import annotations
@@ -22,11 +31,14 @@ from __future__ import annotations
 import json
 import os
 import sys
+import threading
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 import tools  # noqa: E402
+from connection_pool import CancelToken, cancel_scope  # noqa: E402
 from tools import Session  # noqa: E402
 
 SERVER_NAME = "odoo"
@@ -43,6 +55,13 @@ METHOD_NOT_FOUND = -32601
 INVALID_PARAMS = -32602
 INTERNAL_ERROR = -32603
 
+DEFAULT_WORKERS = 8
+
+_send_lock = threading.Lock()
+_workers: ThreadPoolExecutor | None = None
+_inflight: dict = {}  # request id -> CancelToken, for tools/call being worked on
+_inflight_lock = threading.Lock()
+
 
 def log(msg: str) -> None:
     print("[odoo-mcp] %s" % msg, file=sys.stderr, flush=True)
@@ -73,8 +92,9 @@ def send(msg: dict) -> None:
     # Defensive: a stray newline would split one message into two frames.
     line = line.replace("\r", "").replace("\n", " ")
     try:
-        sys.stdout.write(line + "\n")
-        sys.stdout.flush()
+        with _send_lock:
+            sys.stdout.write(line + "\n")
+            sys.stdout.flush()
     except BrokenPipeError:
         raise SystemExit(0)
 
@@ -114,7 +134,11 @@ def handle(session: Session, msg: dict) -> None:
         )
         return
 
-    if method in ("notifications/initialized", "initialized", "notifications/cancelled"):
+    if method == "notifications/cancelled":
+        _cancel(params.get("requestId"), params.get("reason"))
+        return
+
+    if method in ("notifications/initialized", "initialized"):
         return  # notifications carry no response
 
     if method == "ping":
@@ -124,6 +148,10 @@ def handle(session: Session, msg: dict) -> None:
     if method in ("shutdown", "exit"):
         if not is_notification:
             reply(req_id, {})
+        with _inflight_lock:
+            pending = list(_inflight.values())
+        for token in pending:
+            token.cancel()  # nobody will read the answers
         raise SystemExit(0)
 
     # ---- tools ----
@@ -140,11 +168,13 @@ def handle(session: Session, msg: dict) -> None:
         if not isinstance(args, dict):
             fail(req_id, INVALID_PARAMS, "'arguments' must be an object")
             return
-        text, is_error = tools.dispatch(session, name, args)
-        reply(
-            req_id,
-            {"content": [{"type": "text", "text": text}], "isError": bool(is_error)},
-        )
+        token = CancelToken()
+        if _workers is None:
+            _call_tool(session, req_id, name, args, token)
+            return
+        with _inflight_lock:
+            _inflight[_key(req_id)] = token
+        _workers.submit(_call_tool, session, req_id, name, args, token)
         return
 
     # Empty lists rather than errors: some clients probe these regardless of
@@ -165,7 +195,53 @@ def handle(session: Session, msg: dict) -> None:
         fail(req_id, METHOD_NOT_FOUND, "method not found: %s" % method)
 
 
+def _key(req_id):
+    """Ids may be numbers or strings; 5 and "5" are different requests."""
+    return (type(req_id).__name__, req_id)
+
+
+def _call_tool(session: Session, req_id, name: str, args: dict, token: CancelToken) -> None:
+    try:
+        with cancel_scope(token), session.slot(lambda: token.cancelled) as got:
+            if not got or token.cancelled:
+                return
+            text, is_error = tools.dispatch(session, name, args)
+        if token.cancelled:
+            return  # the client has stopped waiting; a reply would be noise
+        reply(
+            req_id,
+            {"content": [{"type": "text", "text": text}], "isError": bool(is_error)},
+        )
+    except Exception as exc:  # a worker must never die silently
+        log("unhandled error in %s: %s" % (name, exc))
+        log(traceback.format_exc())
+        if not token.cancelled:
+            fail(req_id, INTERNAL_ERROR, "%s: %s" % (type(exc).__name__, exc))
+    finally:
+        with _inflight_lock:
+            if _inflight.get(_key(req_id)) is token:
+                del _inflight[_key(req_id)]
+
+
+def _cancel(req_id, reason) -> None:
+    with _inflight_lock:
+        token = _inflight.pop(_key(req_id), None)
+    if token is not None:
+        log("cancelled request %r%s" % (req_id, ": %s" % reason if reason else ""))
+        token.cancel()
+
+
+def _worker_count() -> int:
+    raw = os.environ.get("ODOO_MCP_WORKERS", "").strip()
+    try:
+        return max(0, min(int(raw), 64)) if raw else DEFAULT_WORKERS
+    except ValueError:
+        log("ODOO_MCP_WORKERS=%r is not a number; using %d" % (raw, DEFAULT_WORKERS))
+        return DEFAULT_WORKERS
+
+
 def main() -> int:
+    global _workers
     _setup_streams()
     session = Session()
     log("started (pid %d, python %s)" % (os.getpid(), sys.version.split()[0]))
@@ -181,6 +257,10 @@ def main() -> int:
     except Exception as exc:  # never prevent startup
         log("profile resolution failed: %s" % exc)
 
+    workers = _worker_count()
+    if workers:
+        _workers = ThreadPoolExecutor(workers, thread_name_prefix="odoo-mcp")
+
     for raw in sys.stdin:
         raw = raw.strip()
         if not raw:
@@ -203,6 +283,8 @@ def main() -> int:
         _guarded(session, msg)
 
     log("stdin closed, exiting")
+    if _workers is not None:
+        _workers.shutdown(wait=True)  # answer what was already asked
     return 0
 
 
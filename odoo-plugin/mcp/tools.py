@@ -7,15 +7,24 @@ to 138 tools; this one stays near the low end and pushes breadth into
 parameters instead of new tool names.
 
 Every state-changing path goes through guards.check_write_allowed. No tool here
-offers SQL, shell, filesystem or module-installation access.
+offers SQL, shell, filesystem or module-installation access; the one file
+write, `odoo_search` with `export_to`, goes to a plain file name inside the
+profile's export directory (see exporter.py).
 """
 
 from __future__ import annotations
 
-import json
+import contextvars
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
 from typing import Any
 
+import exporter
 import guards
+import metadata_cache
+import serializer
 from guards import GuardError
 from odoo_client import OdooClient, OdooError
 from profiles import ProfileError, discover
@@ -119,10 +128,21 @@ TOOLS = [
                 "model": {"type": "string"},
                 "domain": _DOMAIN,
                 "fields": _FIELDS,
-                "limit": {"type": "integer", "description": "Default 50, max 500."},
+                "limit": {"type": "integer", "description": "Default 50, max 500. "
+                          "With export_to: the most rows to export; omit for all."},
                 "offset": {"type": "integer"},
                 "order": {"type": "string", "description": "e.g. 'date desc, id desc'"},
                 "context": _CONTEXT,
+                "export_to": {
+                    "type": "string",
+                    "description": "Write every matching record to this file (e.g. "
+                                   "'partners.ndjson' or 'partners.csv') in the export "
+                                   "directory instead of returning rows; returns a "
+                                   "summary. No row cap. Repeating an interrupted export "
+                                   "resumes it.",
+                },
+                "overwrite": {"type": "boolean",
+                              "description": "With export_to: replace an existing file."},
             },
             "required": ["model"],
         },
@@ -256,29 +276,9 @@ TOOLS = [
 # --------------------------------------------------------------------------
 
 
-def _shrink(node: Any) -> Any:
-    """Truncate oversized strings. Odoo rows carry HTML bodies and base64 blobs
-    that would otherwise dominate the context window."""
-    if isinstance(node, str):
-        if len(node) > MAX_STR:
-            return node[:MAX_STR] + ("... [truncated %d chars]" % (len(node) - MAX_STR))
-        return node
-    if isinstance(node, dict):
-        return {k: _shrink(v) for k, v in node.items()}
-    if isinstance(node, list):
-        return [_shrink(v) for v in node]
-    return node
-
-
 def _dump(payload: Any, secrets=()) -> str:
-    payload = guards.redact(_shrink(payload), secrets)
-    text = json.dumps(payload, indent=2, ensure_ascii=False, default=str)
-    if len(text) > MAX_CHARS:
-        text = text[:MAX_CHARS] + (
-            "\n... [output truncated at %d chars. Narrow `fields`, lower `limit`, "
-            "or use odoo_read_group to aggregate.]" % MAX_CHARS
-        )
-    return text
+    """Encode a tool result within MAX_CHARS; see serializer.py."""
+    return serializer.dump(payload, secrets, budget=MAX_CHARS, max_str=MAX_STR)
 
 
 SETUP_HELP = """No Odoo connection is configured yet, so this MCP server has nothing to talk to.
@@ -323,16 +323,28 @@ Run the /odoo-mcp command for a guided walkthrough."""
 
 
 class Session:
-    """Caches the resolved profile and client for the life of the process."""
+    """Caches the resolved profile, client and model metadata for the life of
+    the process. Safe to share between the server's worker threads."""
 
     def __init__(self):
         self._profile = None
         self._client = None
         self._error = None
+        self._meta = None
+        self._lock = threading.RLock()
+        self._slots: dict = {}
 
     def load(self, force=False):
+        with self._lock:
+            return self._load(force)
+
+    def _load(self, force):
         if force:
-            self._profile = self._client = self._error = None
+            if self._client is not None:
+                self._client.close()
+            if self._meta is not None:
+                self._meta.clear()
+            self._profile = self._client = self._error = self._meta = None
         if self._profile is None and self._error is None:
             try:
                 import profiles as profiles_mod
@@ -343,14 +355,72 @@ class Session:
         return self._profile, self._error
 
     def client(self):
-        prof, err = self.load()
-        if err:
-            raise OdooError("configuration problem:\n%s" % err)
-        if prof is None or not prof.configured:
-            raise OdooError(SETUP_HELP)
-        if self._client is None:
-            self._client = OdooClient(prof)
-        return self._client
+        with self._lock:
+            prof, err = self._load(False)
+            if err:
+                raise OdooError("configuration problem:\n%s" % err)
+            if prof is None or not prof.configured:
+                raise OdooError(SETUP_HELP)
+            if self._client is None:
+                self._client = OdooClient(prof)
+            return self._client
+
+    def metadata(self):
+        """The model-metadata cache (see metadata_cache.py), or None when the
+        profile turns it off. Opened on first use, outside the lock: opening
+        costs round trips that other workers' ``client()`` and ``slot()``
+        must not wait for."""
+        with self._lock:
+            if self._meta is not None:
+                return self._meta
+            client, prof = self.client(), self._profile
+        meta = metadata_cache.open_for(client, prof)
+        with self._lock:
+            # Another worker may have opened it meanwhile, or odoo_status
+            # reloaded the profile; then this one is used once and dropped.
+            if self._meta is None and self._profile is prof:
+                self._meta = meta
+            return self._meta if self._meta is not None else meta
+
+    @contextmanager
+    def slot(self, cancelled=lambda: False):
+        """Hold one of the current profile's ``max_concurrency`` call slots.
+
+        Yields False without a slot if ``cancelled()`` turns true while
+        waiting. Unconfigured sessions are not limited: their calls never
+        reach a server.
+        """
+        with self._lock:
+            prof, _ = self._load(False)
+            limit = getattr(prof, "max_concurrency", 0)
+            sem = None
+            if limit:
+                key = (prof.name, prof.url, prof.db, limit)
+                sem = self._slots.setdefault(key, threading.BoundedSemaphore(limit))
+        if sem is None:
+            yield True
+            return
+        while not sem.acquire(timeout=0.05):
+            if cancelled():
+                yield False
+                return
+        try:
+            yield True
+        finally:
+            sem.release()
+
+    def cached(self, kind, model, fetch, keep=lambda value: True):
+        """``fetch()``, answered from the metadata cache when it can be.
+        A fetched value is stored only if ``keep(value)``."""
+        meta = self.metadata()
+        if meta is None:
+            return fetch()
+        value = meta.get(kind, model)
+        if value is metadata_cache.MISS:
+            value = fetch()
+            if keep(value):
+                meta.put(kind, model, value)
+        return value
 
     def secrets(self):
         prof = self._profile
@@ -393,22 +463,22 @@ def _status(sess: Session, args: dict) -> str:
 def _list_models(sess: Session, args: dict) -> str:
     c = sess.client()
     limit = guards.clamp_limit(args.get("limit"), DEFAULT_LIMIT, MAX_LIMIT)
-    domain: list = []
-    pattern = (args.get("pattern") or "").strip()
-    if pattern:
-        domain = ["|", ["model", "ilike", pattern], ["name", "ilike", pattern]]
-    if not args.get("transient"):
-        domain = domain + [["transient", "=", False]]
-    rows = c.search_read(
-        "ir.model", domain, fields=["model", "name", "transient"], limit=limit, order="model"
-    )
+    pattern = (args.get("pattern") or "").strip().lower()
+    # The whole registry is read once and filtered here, so a second search
+    # with another pattern costs no call.
+    rows = sess.cached("models", "", lambda: c.search_read(
+        "ir.model", [], fields=["model", "name", "transient"], order="model"
+    ))
+    rows = [
+        r for r in rows if isinstance(r, dict)
+        and (args.get("transient") or not r.get("transient"))
+        and (not pattern or pattern in str(r.get("model", "")).lower()
+             or pattern in str(r.get("name", "")).lower())
+    ][:limit]
     return _dump({"count": len(rows), "models": rows}, sess.secrets())
 
 
-def _inspect_model(sess: Session, args: dict) -> str:
-    c = sess.client()
-    model = guards.check_model_name(args.get("model"))
-
+def _fields_get(c: OdooClient, model: str):
     meta = c.fields_get(
         model,
         attributes=[
@@ -418,6 +488,33 @@ def _inspect_model(sess: Session, args: dict) -> str:
     )
     if not isinstance(meta, dict):
         raise OdooError("unexpected fields_get response for %s" % model)
+    return meta
+
+
+def _access_rights(c: OdooClient, model: str) -> dict:
+    """The four check_access_rights verdicts, asked concurrently."""
+    def check(op):
+        try:
+            return c.call(
+                model, "check_access_rights",
+                kwargs={"operation": op, "raise_exception": False},
+            )
+        except OdooError:
+            return "unknown"
+
+    ops = ("read", "write", "create", "unlink")
+    with ThreadPoolExecutor(len(ops)) as pool:
+        # Each check runs in a copy of this context, so a cancellation of the
+        # tool call (connection_pool.cancel_scope) reaches it too.
+        futures = [pool.submit(contextvars.copy_context().run, check, op) for op in ops]
+        return dict(zip(ops, (f.result() for f in futures)))
+
+
+def _inspect_model(sess: Session, args: dict) -> str:
+    c = sess.client()
+    model = guards.check_model_name(args.get("model"))
+
+    meta = sess.cached("fields", model, lambda: _fields_get(c, model))
 
     wanted = args.get("fields") or []
     pattern = (args.get("field_pattern") or "").strip().lower()
@@ -435,15 +532,9 @@ def _inspect_model(sess: Session, args: dict) -> str:
             entry["help"] = help_text[:200] + "..."
         fields[fname] = entry
 
-    access = {}
-    for op in ("read", "write", "create", "unlink"):
-        try:
-            access[op] = c.call(
-                model, "check_access_rights",
-                kwargs={"operation": op, "raise_exception": False},
-            )
-        except OdooError:
-            access[op] = "unknown"
+    # "unknown" is a failed check, not a verdict: asked again next time.
+    access = sess.cached("access", model, lambda: _access_rights(c, model),
+                         keep=lambda v: "unknown" not in v.values())
 
     return _dump(
         {
@@ -461,6 +552,8 @@ def _search(sess: Session, args: dict) -> str:
     model = guards.check_model_name(args.get("model"))
     domain = guards.check_domain(args.get("domain"))
     ctx = guards.check_context(args.get("context"))
+    if args.get("export_to") is not None:
+        return _export(sess, c, model, domain, ctx, args)
     limit = guards.clamp_limit(args.get("limit"), DEFAULT_LIMIT, MAX_LIMIT)
     fields = args.get("fields") or None
 
@@ -483,6 +576,21 @@ def _search(sess: Session, args: dict) -> str:
     return _dump(out, sess.secrets())
 
 
+def _export(sess: Session, c: OdooClient, model: str, domain: list, ctx: dict,
+            args: dict) -> str:
+    name = guards.check_export_name(args.get("export_to"))
+    if args.get("offset") or args.get("order"):
+        raise GuardError("export_to walks the records in id order; drop offset and order")
+    prof, _ = sess.load()
+    max_rows = guards.clamp_limit(args.get("limit"), 0, 1 << 31)
+    summary = exporter.export(
+        c, model, domain, args.get("fields") or None, Path(prof.export_dir or exporter.DEFAULT_DIR) / name,
+        context=ctx, max_rows=max_rows, overwrite=args.get("overwrite") is True,
+        secrets=sess.secrets(),
+    )
+    return _dump(summary, sess.secrets())
+
+
 def _count(sess: Session, args: dict) -> str:
     c = sess.client()
     model = guards.check_model_name(args.get("model"))
@@ -0,0 +1,295 @@
+"""Benchmark: OdooClient over pooled keep-alive connections vs. one connection per call.
+
+Starts a local stub Odoo (`StubOdoo`) that answers the JSON-2 (19+) and
+XML-RPC (<=18) paths the client uses, and times N small `search_read` calls
+three ways per protocol:
+
+    legacy   the original transport, kept verbatim below as the reference:
+             `urllib.request.urlopen` per JSON-2 call, a new
+             `xmlrpc.client.ServerProxy` per XML-RPC call
+    pooled   the current `OdooClient`, one thread
+    threads  the current `OdooClient`, shared by --threads threads
+
+The stub can hold every new connection for --connect-ms before serving it,
+standing in for the TCP + TLS handshake to a remote instance (a loopback
+connection otherwise costs almost nothing). Every mode must return the same
+rows; the script exits 1 otherwise.
+
+    python tests/mcp/bench_odoo_client.py
+    python tests/mcp/bench_odoo_client.py -n 500 --connect-ms 40 --threads 8
+
+Standard library only.
+"""
+
+from __future__ import annotations
+
+import argparse
+import http.server
+import json
+import socket
+import statistics
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+import xmlrpc.client
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+MCP_DIR = Path(__file__).resolve().parents[2] / "mcp"
+sys.path.insert(0, str(MCP_DIR))
+
+import odoo_client  # noqa: E402
+from odoo_client import OdooClient, OdooError, _ssl_context  # noqa: E402
+from profiles import Profile  # noqa: E402
+
+ROWS = [{"id": i, "name": "Partner %d" % i, "email": "p%d@example.com" % i} for i in range(1, 6)]
+
+
+class StubOdoo:
+    """A threaded HTTP/1.1 server speaking just enough Odoo for the client.
+
+    ``major`` picks the protocol (19 answers /json/version, older versions
+    404 it). ``connect_ms`` delays each new connection. ``keep_alive=False``
+    answers ``Connection: close`` like Odoo's own server. ``drop_silently``
+    closes every connection after one response without saying so, to
+    exercise stale-socket handling. ``hang_up`` lists JSON-2 methods that are
+    received and then answered by closing the connection, as a crashed
+    worker would. ``redirect`` answers 301 to JSON-2. ``answers`` maps
+    ``(model, method)`` or ``method`` to a result; anything else gets
+    ``ROWS`` from ``search_read`` and ``[42]`` otherwise. ``delays`` maps a
+    method to seconds to wait before answering it, like a slow query.
+    ``tables`` maps a model to its records; ``search_read`` on it honours
+    ``["id", ">", n]`` leaves, ``limit`` and id order, and every domain it
+    was asked is kept in ``domains``.
+    """
+
+    def __init__(self, major=19, connect_ms=0.0, keep_alive=True, drop_silently=False,
+                 hang_up=(), redirect="", answers=None, delays=None, tables=None):
+        stub = self
+        self.major = major
+        self.answers = dict(answers or {})
+        self.delays = dict(delays or {})
+        self.tables = dict(tables or {})
+        self.domains: list = []
+        self.connections = 0
+        self.calls: list = []
+        self._lock = threading.Lock()
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def _reply(self, status, body, ctype="application/json"):
+                self.send_response(status)
+                self.send_header("Content-Type", ctype)
+                self.send_header("Content-Length", str(len(body)))
+                if redirect and status == 301:
+                    self.send_header("Location", redirect)
+                if not keep_alive:
+                    self.send_header("Connection", "close")
+                # One write for head and body, as a production server does;
+                # two small writes meet Nagle + delayed ACK on a kept-alive
+                # socket and cost ~40 ms that are the stub's, not the client's.
+                self._headers_buffer.append(b"\r\n" + body)
+                self.flush_headers()
+                if drop_silently:
+                    self.close_connection = True
+
+            def do_GET(self):
+                if self.path == "/json/version" and stub.major >= 19:
+                    self._reply(200, json.dumps({
+                        "server_version": "%d.0" % stub.major,
+                        "server_version_info": [stub.major, 0, 0, "final", 0, ""],
+                    }).encode())
+                else:
+                    self._reply(404, b"{}")
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+                if self.path.startswith("/json/2/"):
+                    if redirect:
+                        return self._reply(301, b"")
+                    _, _, _, model, method = self.path.split("/")
+                    stub._record(model, method)
+                    if method in hang_up:
+                        self.close_connection = True
+                        return None
+                    result = stub.answer(model, method, json.loads(body or b"{}"))
+                    return self._reply(200, json.dumps(result).encode())
+                params, name = xmlrpc.client.loads(body)
+                if name == "version":
+                    result = {"server_version": "%d.0" % stub.major,
+                              "server_version_info": [stub.major, 0, 0, "final", 0, ""]}
+                elif name == "authenticate":
+                    result = 2
+                else:
+                    stub._record(params[3], params[4])
+                    kwargs = params[6] if len(params) > 6 else {}
+                    result = stub.answer(params[3], params[4], kwargs)
+                self._reply(200, xmlrpc.client.dumps((result,), methodresponse=True,
+                                                     allow_none=True).encode(), "text/xml")
+
+        class Server(http.server.ThreadingHTTPServer):
+            daemon_threads = True
+
+            def handle_error(self, request, client_address):
+                pass  # a client that hung up on a slow answer is expected here
+
+            def finish_request(self, request, client_address):
+                with stub._lock:
+                    stub.connections += 1
+                if connect_ms:
+                    time.sleep(connect_ms / 1000)
+                super().finish_request(request, client_address)
+
+        self.server = Server(("127.0.0.1", 0), Handler)
+        self.url = "http://127.0.0.1:%d" % self.server.server_address[1]
+
+    def answer(self, model, method, kwargs=None):
+        if method in self.delays:
+            time.sleep(self.delays[method])
+        if model in self.tables and method == "search_read":
+            return self._keyset(model, (kwargs or {}).get("domain") or [], kwargs or {})
+        default = ROWS if method == "search_read" else [42]
+        return self.answers.get((model, method), self.answers.get(method, default))
+
+    def _keyset(self, model, domain, kwargs):
+        with self._lock:
+            self.domains.append(domain)
+        after = max([leaf[2] for leaf in domain
+                     if isinstance(leaf, list) and leaf[:2] == ["id", ">"]] or [0])
+        rows = sorted((r for r in self.tables[model] if r["id"] > after), key=lambda r: r["id"])
+        fields = kwargs.get("fields")
+        if fields:
+            rows = [{k: v for k, v in r.items() if k == "id" or k in fields} for r in rows]
+        return rows[:kwargs.get("limit") or None]
+
+    def _record(self, model, method):
+        with self._lock:
+            self.calls.append((model, method))
+
+    def __enter__(self):
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def profile_for(url: str, **overrides) -> Profile:
+    fields = dict(name="bench", url=url, db="bench", username="mcp", api_key="k" * 20,
+                  timeout=10)
+    fields.update(overrides)
+    return Profile(**fields)
+
+
+class LegacyClient(OdooClient):
+    """The transport before pooling, kept verbatim as the reference."""
+
+    def _post_json(self, path, payload, headers=None, retry_safe=False):
+        url = "%s%s" % (self.p.url, path)
+        body = json.dumps(payload).encode("utf-8")
+        hdrs = {
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+            "User-Agent": odoo_client.USER_AGENT,
+        }
+        if headers:
+            hdrs.update(headers)
+        req = urllib.request.Request(url, data=body, headers=hdrs, method="POST")
+        try:
+            with urllib.request.urlopen(
+                req, timeout=self.p.timeout, context=_legacy_ssl_context(self.p.verify_ssl)
+            ) as resp:
+                raw = resp.read().decode("utf-8", "replace")
+        except urllib.error.HTTPError as exc:
+            raise OdooError(self._http_hint(exc.code, "", path))
+        except urllib.error.URLError as exc:
+            raise OdooError(self._net_hint(exc))
+        except socket.timeout:
+            raise OdooError(self._timeout_hint(url))
+        if not raw.strip():
+            return None
+        return json.loads(raw)
+
+    def _xmlrpc(self, endpoint, retry_safe=False):
+        url = "%s/xmlrpc/2/%s" % (self.p.url, endpoint)
+        ctx = None
+        if not self.p.verify_ssl and url.lower().startswith("https"):
+            ctx = _legacy_ssl_context(False)
+        return xmlrpc.client.ServerProxy(url, allow_none=True, context=ctx)
+
+
+def _legacy_ssl_context(verify):
+    if verify:
+        return None  # urllib default: verified
+    ctx = _ssl_context.__wrapped__(False)
+    return ctx
+
+
+def _timed(fn, runs):
+    samples, result = [], None
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        result = fn()
+        samples.append(time.perf_counter() - t0)
+    return statistics.median(samples), result
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=(__doc__ or "").split("\n")[0])
+    ap.add_argument("-n", type=int, default=200, help="search_read calls per mode (default: 200)")
+    ap.add_argument("--connect-ms", type=float, default=15.0,
+                    help="stub delay per new connection, standing in for TCP+TLS setup "
+                         "(default: 15)")
+    ap.add_argument("--threads", type=int, default=4)
+    ap.add_argument("--runs", type=int, default=3)
+    args = ap.parse_args(argv)
+
+    def calls(client, n):
+        return [client.search_read("res.partner", [], fields=["name", "email"], limit=5)
+                for _ in range(n)]
+
+    same = True
+    print("OdooClient transport - %d search_read calls, %.0f ms per new connection, "
+          "median of %d" % (args.n, args.connect_ms, args.runs))
+    print("  %-8s %-8s %9s %9s %8s" % ("api", "mode", "ms", "conns", "speedup"))
+    for major, api in ((19, "JSON-2"), (17, "XML-RPC")):
+        with StubOdoo(major=major, connect_ms=args.connect_ms) as stub:
+            results = {}
+            for mode in ("legacy", "pooled", "threads"):
+                cls = LegacyClient if mode == "legacy" else OdooClient
+                client = cls(profile_for(stub.url))
+                client.version()
+                if major < 19:
+                    client.uid()
+                before = stub.connections
+                if mode == "threads":
+                    per = max(1, args.n // args.threads)
+
+                    def fn():
+                        with ThreadPoolExecutor(args.threads) as pool:
+                            parts = list(pool.map(lambda _: calls(client, per),
+                                                  range(args.threads)))
+                        return [row for part in parts for row in part]
+                else:
+                    def fn():
+                        return calls(client, args.n)
+                seconds, rows = _timed(fn, args.runs)
+                conns = (stub.connections - before) / args.runs
+                results[mode] = seconds
+                same = same and all(r == ROWS for r in rows)
+                client.close()
+                print("  %-8s %-8s %9.1f %9.1f %7.2fx" % (
+                    api, mode, seconds * 1000, conns, results["legacy"] / max(seconds, 1e-9)))
+    print("  identical rows: %s" % ("yes" if same else "NO"))
+    return 0 if same else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,223 @@
+"""Concurrency tests for the Odoo MCP server.
+
+Drives the real server process over stdio against `StubOdoo`
+(tests/mcp/bench_odoo_client.py) configured with a slow `read_group`, and
+checks that a slow tool call holds up neither `ping` nor other calls, that
+`max_concurrency` bounds one profile, and that `notifications/cancelled`
+frees the worker and suppresses the answer. Loopback only.
+
+Run standalone:   python tests/mcp/test_concurrency.py
+Run under pytest: pytest tests/mcp/test_concurrency.py
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import queue
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bench_odoo_client import StubOdoo  # noqa: E402
+
+SERVER = Path(__file__).resolve().parents[2] / "mcp" / "server.py"
+SLOW = 1.0  # seconds the stub takes to answer read_group
+
+
+class PipeClient:
+    """Speaks to the server over pipes; responses are collected by id, in
+    whatever order they arrive."""
+
+    def __init__(self, url, max_concurrency=4, workers=None, metadata_cache="off"):
+        self.dir = tempfile.mkdtemp(prefix="odoo-mcp-conc-")
+        with open(os.path.join(self.dir, ".odoo-mcp.json"), "w", encoding="utf-8") as f:
+            json.dump({"url": url, "db": "bench", "username": "mcp", "api_key": "k" * 20,
+                       "max_concurrency": max_concurrency, "metadata_cache": metadata_cache}, f)
+        env = {k: v for k, v in os.environ.items()
+               if not k.startswith(("ODOO_", "CLAUDE_PROJECT_DIR"))}
+        env.update({"PYTHONIOENCODING": "utf-8", "ODOO_MCP_PROJECT_DIR": self.dir,
+                    "HOME": self.dir, "USERPROFILE": self.dir})
+        if workers is not None:
+            env["ODOO_MCP_WORKERS"] = str(workers)
+        self.proc = subprocess.Popen(
+            [sys.executable, str(SERVER)], stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE, text=True, encoding="utf-8", bufsize=1, env=env,
+        )
+        self.inbox: queue.Queue = queue.Queue()
+        threading.Thread(target=self._read, daemon=True).start()
+        self._id = 0
+        self.send("initialize", {"protocolVersion": "2025-06-18", "capabilities": {},
+                                 "clientInfo": {"name": "test", "version": "0"}})
+        self.wait(self._id)
+
+    def _read(self):
+        for line in self.proc.stdout:
+            self.inbox.put((time.monotonic(), json.loads(line)))
+
+    def send(self, method, params=None, notify=False):
+        msg = {"jsonrpc": "2.0", "method": method}
+        if not notify:
+            self._id += 1
+            msg["id"] = self._id
+        if params is not None:
+            msg["params"] = params
+        self.proc.stdin.write(json.dumps(msg) + "\n")
+        self.proc.stdin.flush()
+        return msg.get("id")
+
+    def call(self, tool, args):
+        return self.send("tools/call", {"name": tool, "arguments": args})
+
+    def wait(self, *ids, timeout=10.0):
+        """{id: (arrival time, message)} for every id, failing on a timeout."""
+        got, deadline = {}, time.monotonic() + timeout
+        while set(ids) - set(got):
+            try:
+                at, msg = self.inbox.get(timeout=max(0.01, deadline - time.monotonic()))
+            except queue.Empty:
+                raise AssertionError("no response to %s" % sorted(set(ids) - set(got)))
+            got[msg.get("id")] = (at, msg)
+        return got
+
+    def close(self):
+        try:
+            self.proc.stdin.close()
+            self.proc.wait(timeout=10)
+        finally:
+            if self.proc.poll() is None:
+                self.proc.kill()
+            self.proc.stdout.close()
+            self.proc.stderr.close()
+            shutil.rmtree(self.dir, ignore_errors=True)
+
+
+def _group(client):
+    return client.call("odoo_read_group", {"model": "sale.order", "groupby": ["state"]})
+
+
+def _with(stub_kwargs, client_kwargs, body):
+    with StubOdoo(major=19, delays={"read_group": SLOW}, **stub_kwargs) as stub:
+        client = PipeClient(stub.url, **client_kwargs)
+        try:
+            body(stub, client)
+        finally:
+            client.close()
+
+
+def test_ping_is_answered_while_a_tool_call_is_slow():
+    def body(stub, client):
+        t0 = time.monotonic()
+        slow = _group(client)
+        time.sleep(0.2)  # let the call reach the stub
+        ping = client.send("ping")
+        got = client.wait(slow, ping)
+        assert got[ping][0] - t0 < SLOW, "ping waited for read_group"
+        assert got[ping][0] < got[slow][0]
+        assert not got[slow][1]["result"]["isError"], got[slow]
+    _with({}, {}, body)
+
+
+def test_independent_calls_overlap():
+    def body(stub, client):
+        t0 = time.monotonic()
+        ids = [_group(client) for _ in range(3)]
+        got = client.wait(*ids)
+        elapsed = max(at for at, _ in got.values()) - t0
+        assert elapsed < 2 * SLOW, "three slow calls took %.2fs; they ran one by one" % elapsed
+        assert stub.calls.count(("sale.order", "read_group")) == 3
+    _with({}, {}, body)
+
+
+def test_max_concurrency_bounds_one_profile():
+    def body(stub, client):
+        t0 = time.monotonic()
+        ids = [_group(client) for _ in range(2)]
+        got = client.wait(*ids)
+        elapsed = max(at for at, _ in got.values()) - t0
+        assert elapsed >= 2 * SLOW, "max_concurrency=1 let two calls overlap (%.2fs)" % elapsed
+    _with({}, {"max_concurrency": 1}, body)
+
+
+def test_zero_workers_keeps_the_serial_loop():
+    def body(stub, client):
+        slow = _group(client)
+        ping = client.send("ping")
+        got = client.wait(slow, ping)
+        assert got[slow][0] <= got[ping][0], "ODOO_MCP_WORKERS=0 must answer in order"
+    _with({}, {"workers": 0}, body)
+
+
+def test_cancel_frees_the_slot_and_drops_the_answer():
+    def body(stub, client):
+        slow = _group(client)
+        time.sleep(0.2)
+        t0 = time.monotonic()
+        client.send("notifications/cancelled", {"requestId": slow, "reason": "user"},
+                    notify=True)
+        # With one slot, this only runs once the cancelled call let go of it.
+        count = client.call("odoo_count", {"model": "res.partner"})
+        got = client.wait(count)
+        assert got[count][0] - t0 < SLOW / 2, "the cancelled call kept its slot"
+        time.sleep(SLOW)
+        leftovers = [m for _, m in list(client.inbox.queue) if m.get("id") == slow]
+        assert leftovers == [], "a cancelled call was still answered: %r" % leftovers
+    _with({}, {"max_concurrency": 1}, body)
+
+
+def test_opening_the_metadata_cache_blocks_no_other_call():
+    # The first inspect opens the metadata cache, whose module fingerprint
+    # (a search_read) is slow here; a count must not wait for it.
+    with StubOdoo(major=19, delays={"search_read": SLOW},
+                  answers={"fields_get": {"name": {"type": "char"}}}) as stub:
+        client = PipeClient(stub.url, metadata_cache="memory")
+        try:
+            slow = client.call("odoo_inspect_model", {"model": "res.partner"})
+            time.sleep(0.2)
+            t0 = time.monotonic()
+            count = client.call("odoo_count", {"model": "res.partner"})
+            got = client.wait(slow, count)
+            assert got[count][0] - t0 < SLOW / 2, "odoo_count waited for the cache to open"
+            assert not got[slow][1]["result"]["isError"], got[slow]
+        finally:
+            client.close()
+
+
+def test_responses_stay_one_per_line_under_load():
+    def body(stub, client):
+        ids = [client.call("odoo_search", {"model": "res.partner", "limit": 5})
+               for _ in range(40)]
+        ids += [client.send("ping") for _ in range(20)]
+        got = client.wait(*ids)
+        assert len(got) == 60
+    _with({}, {}, body)
+
+
+def _run_all():
+    fns = [(n, f) for n, f in sorted(globals().items())
+           if n.startswith("test_") and callable(f)]
+    passed, failed = 0, []
+    for name, fn in fns:
+        try:
+            fn()
+            passed += 1
+            print("  PASS  %s" % name)
+        except AssertionError as exc:
+            failed.append((name, str(exc) or "assertion failed"))
+            print("  FAIL  %s\n        %s" % (name, str(exc)[:400]))
+        except Exception as exc:
+            failed.append((name, "%s: %s" % (type(exc).__name__, exc)))
+            print("  ERROR %s\n        %s: %s" % (name, type(exc).__name__, str(exc)[:400]))
+    print("\n%d passed, %d failed, %d total" % (passed, len(failed), len(fns)))
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    print("Odoo MCP concurrency tests\n" + "-" * 60)
+    raise SystemExit(_run_all())
@@ -0,0 +1,164 @@
+"""Tests for the keep-alive connection pool behind OdooClient.
+
+Runs the real client against `StubOdoo` (tests/mcp/bench_odoo_client.py), a
+local HTTP/1.1 server that answers the JSON-2 and XML-RPC paths. Loopback
+only; no Odoo instance is needed.
+
+Run standalone:   python tests/mcp/test_connection_pool.py
+Run under pytest: pytest tests/mcp/test_connection_pool.py
+"""
+
+from __future__ import annotations
+
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bench_odoo_client import ROWS, StubOdoo, profile_for  # noqa: E402
+
+import connection_pool  # noqa: E402
+from odoo_client import OdooClient, OdooError, _ssl_context  # noqa: E402
+
+
+def _read(client):
+    return client.search_read("res.partner", [], fields=["name"], limit=5)
+
+
+def test_json2_calls_share_one_connection():
+    with StubOdoo(major=19) as stub:
+        client = OdooClient(profile_for(stub.url))
+        assert client.major == 19
+        for _ in range(20):
+            assert _read(client) == ROWS
+        client.close()
+        assert stub.connections == 1, stub.connections
+        assert client.pool.counters["opened"] == 1, client.pool.counters
+
+
+def test_xmlrpc_calls_share_one_connection():
+    with StubOdoo(major=17) as stub:
+        client = OdooClient(profile_for(stub.url))
+        assert client.major == 17
+        for _ in range(20):
+            assert _read(client) == ROWS
+        client.close()
+        # version, authenticate and 20 execute_kw over a single socket
+        assert stub.connections == 1, stub.connections
+        assert len(stub.calls) == 20
+
+
+def test_threads_never_share_a_socket():
+    with StubOdoo(major=19) as stub:
+        client = OdooClient(profile_for(stub.url))
+        client.version()
+        with ThreadPoolExecutor(8) as pool:
+            results = list(pool.map(lambda _: _read(client), range(64)))
+        client.close()
+        assert all(r == ROWS for r in results)
+        assert len(stub.calls) == 64
+        assert client.pool.counters["reused"] > 0, client.pool.counters
+
+
+def test_connection_close_responses_are_not_pooled():
+    with StubOdoo(major=19, keep_alive=False) as stub:
+        client = OdooClient(profile_for(stub.url))
+        client.version()
+        for _ in range(3):
+            assert _read(client) == ROWS
+        assert stub.connections == 4, stub.connections
+        assert client.pool.counters["reused"] == 0
+
+
+def test_a_silently_closed_socket_never_loses_a_read():
+    # The server closes after every reply without saying so. Whether the
+    # client sees the close before reusing the socket or only when the next
+    # send fails, every read must land exactly once.
+    with StubOdoo(major=19, drop_silently=True) as stub:
+        client = OdooClient(profile_for(stub.url))
+        client.version()
+        for _ in range(5):
+            assert _read(client) == ROWS
+        assert len(stub.calls) == 5, stub.calls
+
+
+def test_a_stale_socket_is_retried_for_reads():
+    saved = connection_pool._peer_closed
+    connection_pool._peer_closed = lambda conn: False  # lose the race on purpose
+    try:
+        with StubOdoo(major=19, drop_silently=True) as stub:
+            client = OdooClient(profile_for(stub.url))
+            client.version()
+            assert _read(client) == ROWS
+            assert client.pool.counters["retried"] == 1, client.pool.counters
+            assert len(stub.calls) == 1, stub.calls
+    finally:
+        connection_pool._peer_closed = saved
+
+
+def test_a_write_that_may_have_arrived_is_not_sent_again():
+    with StubOdoo(major=19, hang_up=("create",)) as stub:
+        client = OdooClient(profile_for(stub.url, mode="write"))
+        client.version()
+        try:
+            client.create("res.partner", {"name": "x"})
+        except OdooError:
+            pass
+        else:
+            raise AssertionError("a write that got no reply must surface as an error")
+        assert stub.calls == [("res.partner", "create")], stub.calls
+        assert client.pool.counters["retried"] == 0, client.pool.counters
+
+
+def test_redirects_name_the_new_location():
+    target = "https://odoo.example.com/json/2/res.partner/search_read"
+    with StubOdoo(major=19, redirect=target) as stub:
+        client = OdooClient(profile_for(stub.url))
+        client.version()
+        try:
+            _read(client)
+        except OdooError as exc:
+            assert "odoo.example.com" in str(exc), str(exc)
+        else:
+            raise AssertionError("a 301 must surface as an OdooError")
+
+
+def test_a_bad_url_is_an_odoo_error():
+    client = OdooClient(profile_for("ftp://odoo.example.com"))
+    try:
+        client.pool
+    except OdooError as exc:
+        assert "ftp://odoo.example.com" in str(exc), str(exc)
+    else:
+        raise AssertionError("a non-http URL must be rejected")
+
+
+def test_ssl_context_is_built_once():
+    assert _ssl_context(True) is _ssl_context(True)
+    assert _ssl_context(False) is _ssl_context(False)
+    assert _ssl_context(True) is not _ssl_context(False)
+
+
+def _run_all():
+    fns = [(n, f) for n, f in sorted(globals().items())
+           if n.startswith("test_") and callable(f)]
+    passed, failed = 0, []
+    for name, fn in fns:
+        try:
+            fn()
+            passed += 1
+            print("  PASS  %s" % name)
+        except AssertionError as exc:
+            failed.append((name, str(exc) or "assertion failed"))
+            print("  FAIL  %s\n        %s" % (name, str(exc)[:400]))
+        except Exception as exc:
+            failed.append((name, "%s: %s" % (type(exc).__name__, exc)))
+            print("  ERROR %s\n        %s: %s" % (name, type(exc).__name__, str(exc)[:400]))
+    print("\n%d passed, %d failed, %d total" % (passed, len(failed), len(fns)))
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    print("Odoo MCP connection pool tests\n" + "-" * 60)
+    raise SystemExit(_run_all())
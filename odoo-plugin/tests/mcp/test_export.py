@@ -0,0 +1,180 @@
+"""Tests for the keyset-paginated export behind odoo_search's export_to.
+
+Runs the real tool against `StubOdoo` (tests/mcp/bench_odoo_client.py)
+holding a table larger than one batch. Loopback only; files go to a
+temporary export directory.
+
+Run standalone:   python tests/mcp/test_export.py
+Run under pytest: pytest tests/mcp/test_export.py
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bench_odoo_client import StubOdoo, profile_for  # noqa: E402
+
+import exporter  # noqa: E402
+import tools  # noqa: E402
+from odoo_client import OdooError  # noqa: E402
+
+TABLE = [{"id": i * 3, "name": "Order %d" % i, "partner_id": [i % 7 + 1, "P%d" % (i % 7)],
+          "amount": i * 1.5} for i in range(1, 1201)]
+FIELDS = ["name", "partner_id", "amount"]
+
+
+class _Env:
+    def __init__(self, major=19, mode="read"):
+        self.dir = Path(tempfile.mkdtemp(prefix="odoo-mcp-export-"))
+        self.stub = StubOdoo(major=major, tables={"sale.order": TABLE})
+        self.mode = mode
+
+    def __enter__(self):
+        self.stub.__enter__()
+        self.sess = tools.Session()
+        self.sess._profile = profile_for(self.stub.url, export_dir=str(self.dir),
+                                         mode=self.mode)
+        return self
+
+    def __exit__(self, *exc):
+        self.stub.__exit__(*exc)
+        shutil.rmtree(self.dir, ignore_errors=True)
+
+    def export(self, **args):
+        args = dict({"model": "sale.order", "fields": FIELDS}, **args)
+        text, is_error = tools.dispatch(self.sess, "odoo_search", args)
+        return text, is_error
+
+
+def test_ndjson_export_walks_ids_in_batches():
+    for major in (19, 17):
+        with _Env(major) as env:
+            text, is_error = env.export(export_to="orders.ndjson")
+            assert not is_error, text
+            summary = json.loads(text)
+            assert summary["rows"] == 1200 and summary["complete"], summary
+            assert summary["batches"] == 3, summary
+            lines = (env.dir / "orders.ndjson").read_text(encoding="utf-8").splitlines()
+            assert [json.loads(x)["id"] for x in lines] == [r["id"] for r in TABLE]
+            assert summary["bytes"] == (env.dir / "orders.ndjson").stat().st_size
+            # keyset, not offset: each batch starts after the previous batch's last id
+            assert [d[-1] for d in env.stub.domains] == [
+                ["id", ">", 0], ["id", ">", 1500], ["id", ">", 3000]]
+            assert len(text) < 1000, "the summary must not carry the rows"
+
+
+def test_csv_export_has_a_header_and_encoded_relations():
+    with _Env() as env:
+        text, is_error = env.export(export_to="orders.csv", domain=[["amount", ">", 0]],
+                                    limit=10)
+        assert not is_error, text
+        assert json.loads(text)["rows"] == 10
+        with open(env.dir / "orders.csv", encoding="utf-8", newline="") as f:
+            rows = list(csv.reader(f))
+        assert rows[0] == FIELDS
+        assert rows[1] == ["Order 1", '[2, "P1"]', "1.5"]
+        assert len(rows) == 11
+
+
+def test_an_interrupted_export_resumes_after_the_last_id():
+    with _Env() as env:
+        real = env.sess.client().search_read
+        calls = []
+
+        def flaky(*a, **kw):
+            calls.append(kw)
+            if len(calls) == 2:
+                raise OdooError("timed out after 30s")
+            return real(*a, **kw)
+        env.sess.client().search_read = flaky
+        text, _ = env.export(export_to="orders.ndjson")
+        first = json.loads(text)
+        assert first["complete"] is False and first["rows"] == 500, first
+        assert (env.dir / "orders.ndjson.state.json").exists()
+        # a partial batch written after the checkpoint is dropped on resume
+        with open(env.dir / "orders.ndjson", "a", encoding="utf-8") as f:
+            f.write('{"id": 99999, "name": "half a batch')
+        text, _ = env.export(export_to="orders.ndjson")
+        second = json.loads(text)
+        assert second["resumed"] and second["complete"], second
+        assert second["rows"] == 1200 and second["rows_this_run"] == 700, second
+        lines = (env.dir / "orders.ndjson").read_text(encoding="utf-8").splitlines()
+        assert [json.loads(x)["id"] for x in lines] == [r["id"] for r in TABLE]
+        assert not (env.dir / "orders.ndjson.state.json").exists()
+
+
+def test_a_failed_first_batch_can_be_retried():
+    with _Env() as env:
+        client = env.sess.client()
+        real = client.search_read
+
+        def down(*a, **kw):
+            raise OdooError("boom")
+        client.search_read = down
+        text, is_error = env.export(export_to="orders.ndjson")
+        assert is_error and "boom" in text, text
+        client.search_read = real
+        text, is_error = env.export(export_to="orders.ndjson")
+        assert not is_error, text
+        out = json.loads(text)
+        assert out["complete"] and out["rows"] == 1200, out
+        assert not (env.dir / "orders.ndjson.state.json").exists()
+
+
+def test_existing_files_need_overwrite():
+    with _Env() as env:
+        env.export(export_to="orders.ndjson", limit=5)
+        text, is_error = env.export(export_to="orders.ndjson", limit=5)
+        assert is_error and "overwrite" in text, text
+        text, is_error = env.export(export_to="orders.ndjson", limit=7, overwrite=True)
+        assert not is_error and json.loads(text)["rows"] == 7, text
+
+
+def test_guards_still_apply():
+    with _Env() as env:
+        for name in ("../escape.ndjson", "/tmp/x.csv", "orders.py", ".hidden.csv", ""):
+            text, is_error = env.export(export_to=name)
+            assert is_error and text.startswith("Refused"), (name, text)
+        text, is_error = env.export(export_to="x.csv", domain="[('id','>',0)]")
+        assert is_error and "domain" in text, text
+        text, is_error = env.export(export_to="x.csv", model="res.partner; drop")
+        assert is_error, text
+        text, is_error = env.export(export_to="x.csv", offset=10)
+        assert is_error and "id order" in text, text
+        assert list(env.dir.iterdir()) == []
+        assert env.stub.calls == []
+
+
+def test_default_directory_is_under_the_user_config():
+    assert exporter.DEFAULT_DIR.parts[-2:] == (".odoo-mcp", "exports")
+
+
+def _run_all():
+    fns = [(n, f) for n, f in sorted(globals().items())
+           if n.startswith("test_") and callable(f)]
+    passed, failed = 0, []
+    for name, fn in fns:
+        try:
+            fn()
+            passed += 1
+            print("  PASS  %s" % name)
+        except AssertionError as exc:
+            failed.append((name, str(exc) or "assertion failed"))
+            print("  FAIL  %s\n        %s" % (name, str(exc)[:400]))
+        except Exception as exc:
+            failed.append((name, "%s: %s" % (type(exc).__name__, exc)))
+            print("  ERROR %s\n        %s: %s" % (name, type(exc).__name__, str(exc)[:400]))
+    print("\n%d passed, %d failed, %d total" % (passed, len(failed), len(fns)))
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    print("Odoo MCP export tests\n" + "-" * 60)
+    raise SystemExit(_run_all())
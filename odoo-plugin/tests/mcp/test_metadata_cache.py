@@ -0,0 +1,200 @@
+"""Tests for the model-metadata cache behind odoo_inspect_model and odoo_list_models.
+
+Runs the real tools against `StubOdoo` (tests/mcp/bench_odoo_client.py) and
+counts the calls that reach it. Loopback only; no Odoo instance is needed.
+
+Run standalone:   python tests/mcp/test_metadata_cache.py
+Run under pytest: pytest tests/mcp/test_metadata_cache.py
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bench_odoo_client import StubOdoo, profile_for  # noqa: E402
+
+import metadata_cache  # noqa: E402
+import tools  # noqa: E402
+
+FIELDS = {
+    "name": {"string": "Name", "type": "char", "required": True},
+    "email": {"string": "Email", "type": "char"},
+}
+MODELS = [
+    {"id": 1, "model": "res.partner", "name": "Contact", "transient": False},
+    {"id": 2, "model": "sale.order", "name": "Sales Order", "transient": False},
+    {"id": 3, "model": "base.language.install", "name": "Install Language", "transient": True},
+]
+MODULES = [{"id": 1, "name": "base", "latest_version": "19.0.1.3"}]
+
+
+def _stub(major=19, modules=MODULES):
+    return StubOdoo(major=major, answers={
+        "fields_get": FIELDS,
+        "check_access_rights": True,
+        ("ir.model", "search_read"): MODELS,
+        ("ir.module.module", "search_read"): modules,
+    })
+
+
+def _session(url, **overrides):
+    sess = tools.Session()
+    sess._profile = profile_for(url, **overrides)
+    return sess
+
+
+def _inspect(sess, model="res.partner"):
+    text, is_error = tools.dispatch(sess, "odoo_inspect_model", {"model": model})
+    assert not is_error, text
+    return json.loads(text)
+
+
+def _schema_calls(stub):
+    return [c for c in stub.calls if c[1] in ("fields_get", "check_access_rights")]
+
+
+def test_a_warm_inspect_costs_no_call():
+    for major in (19, 17):
+        with _stub(major) as stub:
+            sess = _session(stub.url)
+            first = _inspect(sess)
+            assert len(_schema_calls(stub)) == 5, stub.calls
+            assert first["your_access"] == {"read": True, "write": True, "create": True,
+                                            "unlink": True}
+            before = len(stub.calls)
+            assert _inspect(sess) == first
+            assert len(stub.calls) == before, stub.calls[before:]
+
+
+def test_a_failed_access_check_is_not_cached():
+    hang_up = {"check_access_rights"}
+    with StubOdoo(answers=_stub().answers, hang_up=hang_up) as stub:
+        sess = _session(stub.url)
+        assert set(_inspect(sess)["your_access"].values()) == {"unknown"}
+        hang_up.clear()
+        assert _inspect(sess)["your_access"]["read"] is True
+        before = len(stub.calls)
+        _inspect(sess)
+        assert len(stub.calls) == before, stub.calls[before:]
+
+
+def test_list_models_filters_one_cached_listing():
+    with _stub() as stub:
+        sess = _session(stub.url)
+        text, _ = tools.dispatch(sess, "odoo_list_models", {"pattern": "SALE"})
+        assert [m["model"] for m in json.loads(text)["models"]] == ["sale.order"]
+        text, _ = tools.dispatch(sess, "odoo_list_models", {"pattern": "contact"})
+        assert [m["model"] for m in json.loads(text)["models"]] == ["res.partner"]
+        text, _ = tools.dispatch(sess, "odoo_list_models", {"transient": True, "limit": 2})
+        assert [m["model"] for m in json.loads(text)["models"]] == ["res.partner", "sale.order"]
+        assert stub.calls.count(("ir.model", "search_read")) == 1, stub.calls
+
+
+def test_status_clears_the_cache():
+    with _stub() as stub:
+        env = {"ODOO_URL": stub.url, "ODOO_DB": "bench", "ODOO_API_KEY": "k" * 20,
+               "ODOO_MCP_PROFILE": "", "ODOO_MCP_PROJECT_DIR": tempfile.gettempdir()}
+        saved = {k: os.environ.get(k) for k in env}
+        os.environ.update(env)
+        try:
+            sess = tools.Session()
+            _inspect(sess)
+            _inspect(sess)
+            assert len(_schema_calls(stub)) == 5, stub.calls
+            text, is_error = tools.dispatch(sess, "odoo_status", {})
+            assert not is_error and '"connected": true' in text, text
+            _inspect(sess)
+            assert len(_schema_calls(stub)) == 10, stub.calls
+        finally:
+            for k, v in saved.items():
+                if v is None:
+                    os.environ.pop(k, None)
+                else:
+                    os.environ[k] = v
+
+
+def test_off_asks_the_server_every_time():
+    with _stub() as stub:
+        sess = _session(stub.url, metadata_cache="off")
+        _inspect(sess)
+        _inspect(sess)
+        assert len(_schema_calls(stub)) == 10, stub.calls
+        assert ("ir.module.module", "search_read") not in stub.calls
+
+
+def test_disk_cache_survives_a_restart_until_a_module_changes():
+    tmp = Path(tempfile.mkdtemp(prefix="odoo-mcp-meta-"))
+    saved = metadata_cache.CACHE_DIR
+    metadata_cache.CACHE_DIR = tmp
+    try:
+        with _stub() as stub:
+            _inspect(_session(stub.url, metadata_cache="disk"))
+            files = list(tmp.glob("*.json"))
+            assert len(files) == 1, files
+            text = files[0].read_text(encoding="utf-8")
+            assert stub.url not in text and "k" * 20 not in text
+            _inspect(_session(stub.url, metadata_cache="disk"))  # a new process
+            assert len(_schema_calls(stub)) == 5, stub.calls
+        upgraded = [dict(MODULES[0], latest_version="19.0.1.4")]
+        with _stub(modules=upgraded) as stub:
+            _inspect(_session(stub.url, metadata_cache="disk"))
+            assert len(_schema_calls(stub)) == 5, stub.calls
+    finally:
+        metadata_cache.CACHE_DIR = saved
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def test_a_module_change_mid_session_is_noticed():
+    saved = metadata_cache.RECHECK_SECONDS
+    metadata_cache.RECHECK_SECONDS = 0
+    try:
+        modules = list(MODULES)
+        with _stub(modules=modules) as stub:
+            sess = _session(stub.url)
+            _inspect(sess)
+            _inspect(sess)
+            assert len(_schema_calls(stub)) == 5, stub.calls
+            modules[0] = dict(MODULES[0], latest_version="19.0.1.4")
+            _inspect(sess)
+            assert len(_schema_calls(stub)) == 10, stub.calls
+    finally:
+        metadata_cache.RECHECK_SECONDS = saved
+
+
+def test_entries_expire():
+    cache = metadata_cache.MetadataCache(("u", "db", 2), "stamp", ttl=60)
+    cache.put("fields", "res.partner", FIELDS, now=1000.0)
+    assert cache.get("fields", "res.partner", now=1059.0) == FIELDS
+    assert cache.get("fields", "res.partner", now=1060.0) is metadata_cache.MISS
+    assert cache.counters == {"hits": 1, "misses": 1}
+
+
+def _run_all():
+    fns = [(n, f) for n, f in sorted(globals().items())
+           if n.startswith("test_") and callable(f)]
+    passed, failed = 0, []
+    for name, fn in fns:
+        try:
+            fn()
+            passed += 1
+            print("  PASS  %s" % name)
+        except AssertionError as exc:
+            failed.append((name, str(exc) or "assertion failed"))
+            print("  FAIL  %s\n        %s" % (name, str(exc)[:400]))
+        except Exception as exc:
+            failed.append((name, "%s: %s" % (type(exc).__name__, exc)))
+            print("  ERROR %s\n        %s: %s" % (name, type(exc).__name__, str(exc)[:400]))
+    print("\n%d passed, %d failed, %d total" % (passed, len(failed), len(fns)))
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    print("Odoo MCP metadata cache tests\n" + "-" * 60)
+    raise SystemExit(_run_all())
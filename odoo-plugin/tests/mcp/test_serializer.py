@@ -0,0 +1,169 @@
+"""Tests for the budget-aware encoder behind every tool result (mcp/serializer.py).
+
+Pure functions; no server or Odoo instance is involved.
+
+Run standalone:   python tests/mcp/test_serializer.py
+Run under pytest: pytest tests/mcp/test_serializer.py
+"""
+
+from __future__ import annotations
+
+import datetime
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "mcp"))
+
+import guards  # noqa: E402
+import serializer  # noqa: E402
+import tools  # noqa: E402
+
+ROW = {"id": 0, "name": "Order", "note": "<p>" + "x" * 1500 + "</p>", "state": "sale",
+       "partner_id": [7, "Deco Addict"], "amount_total": 1234.5, "tag_ids": [1, 2, 3],
+       "date_order": "2026-01-05 10:00:00", "active": True, "user_id": False}
+WIDE = {"model": "sale.order", "returned": 500,
+        "records": [dict(ROW, id=i, name="S%05d" % i) for i in range(1, 501)],
+        "total_matching": 9000, "note": "Showing 500 of 9000."}
+
+
+def _old_dump(payload, secrets=(), budget=60000, max_str=800):
+    """tools._dump before the serializer, for comparison."""
+    payload = guards.redact(serializer.shrink(payload, max_str), secrets)
+    text = json.dumps(payload, indent=2, ensure_ascii=False, default=str)
+    if len(text) > budget:
+        text = text[:budget] + "\n... [output truncated]"
+    return text
+
+
+def test_a_payload_that_fits_is_unchanged():
+    payloads = [
+        {"model": "res.partner", "returned": 2,
+         "records": [{"id": 1, "name": "Zoë", "child_ids": []}, {"id": 2, "name": "李"}]},
+        {"model": "res.partner", "fields": {"name": {"type": "char"}, "email": {}}},
+        {"model": "x", "records": [], "count": 0},
+        {"when": datetime.date(2026, 1, 5), "groups": [{"state": "draft", "__count": 3}]},
+        {"count": 4},
+        [1, 2, {"a": [3]}],
+        "plain",
+        {"model": "x", "records": [{"body": "y" * 5000}]},
+    ]
+    for payload in payloads:
+        assert serializer.dump(payload) == _old_dump(payload), payload
+
+
+def test_output_fits_exactly_at_the_boundary():
+    payload = {"model": "res.partner", "records": [{"id": i} for i in range(20)]}
+    full = json.dumps(payload, indent=2)
+    assert serializer.dump(payload, budget=len(full)) == full
+    cut = json.loads(serializer.dump(payload, budget=len(full) - 1, columnar=False))
+    assert cut["truncated"]["shown"] < 20
+    # the compact form still holds all twenty
+    text = serializer.dump(payload, budget=len(full) - 1)
+    assert len(text) < len(full) and len(json.loads(text)["records"]["rows"]) == 20
+
+
+def test_redaction_still_applies():
+    payload = {"model": "res.users", "api_key": "topsecretvalue",
+               "records": [{"id": i, "password": "hunter22", "login": "a",
+                            "signature": "key is K" * 3 + "leaked-key-123456"}
+                           for i in range(300)]}
+    for budget in (60000, 3000):
+        for columnar in (True, False):
+            text = serializer.dump(payload, secrets=("leaked-key-123456",), budget=budget,
+                                   columnar=columnar)
+            assert "hunter22" not in text and "topsecretvalue" not in text
+            assert "leaked-key-123456" not in text and "***REDACTED***" in text
+
+
+def test_secret_named_keys_in_a_mapping_result_are_masked():
+    payload = {"model": "res.users", "method": "read_credentials",
+               "result": {"password": "hunter2-plaintext", "api_key": "abcdef123456",
+                          "login": "admin"}}
+    for budget in (60000, 150):
+        text = serializer.dump(payload, budget=budget)
+        assert "hunter2-plaintext" not in text and "abcdef123456" not in text, text
+    assert serializer.dump(payload) == _old_dump(payload)
+    assert json.loads(tools._dump(payload))["result"]["password"] == "***REDACTED***"
+
+
+def test_truncation_keeps_valid_json_and_counts_what_fit():
+    text = serializer.dump(WIDE, columnar=False)
+    assert len(text) <= 60000
+    out = json.loads(text)
+    shown = out["truncated"]["shown"]
+    assert out["truncated"] == dict(out["truncated"], total=500, of="records")
+    assert [r["id"] for r in out["records"]] == list(range(1, shown + 1))
+    assert out["total_matching"] == 9000 and out["note"] == WIDE["note"]
+    assert out["records"][0]["note"].endswith("... [truncated 707 chars]")
+
+
+def test_columnar_form_fits_more_records():
+    indented = json.loads(serializer.dump(WIDE, columnar=False))
+    text = serializer.dump(WIDE)
+    assert len(text) <= 60000 and "\n" not in text
+    out = json.loads(text)
+    assert out["truncated"]["shown"] > indented["truncated"]["shown"]
+    block = out["records"]
+    assert len(block["rows"]) == out["truncated"]["shown"]
+    rebuilt = [dict(zip(block["columns"], row)) for row in block["rows"]]
+    assert rebuilt[:len(indented["records"])] == indented["records"]
+
+
+def test_budget_is_never_exceeded():
+    shapes = [WIDE, {"model": "x", "fields": {"f%d" % i: {"string": "F" * 90} for i in range(400)}},
+              {"model": "x", "groups": [{"k": "v" * (i % 50)} for i in range(900)]},
+              {"model": "x", "records": [[i] * 30 for i in range(900)]}]
+    for payload in shapes:
+        for budget in (1200, 2000, 5000, 17000, 60000):
+            text = serializer.dump(payload, budget=budget)
+            out = json.loads(text)
+            assert len(text) <= budget, (budget, len(text))
+            assert "truncated" in out or len(json.dumps(payload, indent=2)) <= budget
+
+
+def test_nothing_past_the_budget_is_encoded():
+    seen = []
+    real = serializer.shrink
+
+    def counting(node, max_str):
+        if isinstance(node, dict) and "id" in node:
+            seen.append(node["id"])
+        return real(node, max_str)
+    serializer.shrink = counting
+    try:
+        out = json.loads(serializer.dump(WIDE, columnar=False))
+    finally:
+        serializer.shrink = real
+    assert len(seen) == out["truncated"]["shown"] + 1, len(seen)
+
+
+def test_tool_results_go_through_the_serializer():
+    text = tools._dump(WIDE, ("leaked-key-123456",))
+    assert len(text) <= tools.MAX_CHARS
+    assert json.loads(text)["truncated"]["total"] == 500
+    assert tools._dump({"a": 1}) == '{\n  "a": 1\n}'
+
+
+def _run_all():
+    fns = [(n, f) for n, f in sorted(globals().items())
+           if n.startswith("test_") and callable(f)]
+    passed, failed = 0, []
+    for name, fn in fns:
+        try:
+            fn()
+            passed += 1
+            print("  PASS  %s" % name)
+        except AssertionError as exc:
+            failed.append((name, str(exc) or "assertion failed"))
+            print("  FAIL  %s\n        %s" % (name, str(exc)[:400]))
+        except Exception as exc:
+            failed.append((name, "%s: %s" % (type(exc).__name__, exc)))
+            print("  ERROR %s\n        %s: %s" % (name, type(exc).__name__, str(exc)[:400]))
+    print("\n%d passed, %d failed, %d total" % (passed, len(failed), len(fns)))
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    print("Odoo MCP serializer tests\n" + "-" * 60)
+    raise SystemExit(_run_all())
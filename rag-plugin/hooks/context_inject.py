@@ -35,7 +35,15 @@ What changed
   else a single resolution. Warm path: **zero** HTTP calls.
 * **Phase C** — the relevance probe is **scoped**, so it measures the index
   Claude will actually search instead of returning 422 forever.
+  A prompt probed moments ago against an unchanged index reuses that
+  verdict without HTTP (``scripts/probe_cache.py``; hashes only, D-012).
 * **Phase D** — one compact block: scope, mode, freshness, and the probe verdict.
+* **Budget** — B and C share one deadline (``RAG_PLUGIN_HOOK_BUDGET_MS``,
+  default 800 ms) that caps every network wait. On a scope-cache miss,
+  ``/health`` runs in the background while the focus state is read; a warm
+  scope never asks for it. A spent budget skips what is left and
+  says so in the log (``budget-exhausted``), and every record carries the
+  budget it spent and had left.
 
 A 422 after Phase C is now a real defect and is logged distinctly
 (``probe-error:http-422-after-scope``) rather than swallowed as noise.
@@ -54,6 +62,7 @@ import json
 import os
 import re
 import sys
+import threading
 import time
 import urllib.error
 import urllib.parse
@@ -77,6 +86,10 @@ CANDIDATE_PORTS = [int(_ENV_PORT)] if _ENV_PORT else [21420, 21421]
 HEALTH_TIMEOUT = float(os.environ.get("RAG_PLUGIN_HOOK_HEALTH_TIMEOUT", "0.5"))
 SEARCH_TIMEOUT = float(os.environ.get("RAG_PLUGIN_HOOK_SEARCH_TIMEOUT", "1.5"))
 PROBE_THRESHOLD = float(os.environ.get("RAG_PLUGIN_HOOK_PROBE_THRESHOLD", "0.65"))
+#: One end-to-end deadline for a prompt, in milliseconds. The per-call
+#: timeouts above are caps; every network wait is also cut to what is left of
+#: this. ``0`` turns the budget off and leaves only the caps.
+BUDGET_MS = float(os.environ.get("RAG_PLUGIN_HOOK_BUDGET_MS", "800"))
 
 _CLAUDE_HOME = os.path.expanduser("~/.claude")
 OBS_DIR = os.path.join(_CLAUDE_HOME, "rag-plugin")
@@ -152,21 +165,43 @@ def is_operational_intent(prompt: str) -> bool:
 # --- Phase B: scope ---------------------------------------------------------
 
 
+_load_lock = threading.Lock()
+
+
 def _load(module_name: str, filename: str):
     """Import a plugin script by path. None on any failure — the hook degrades
-    to 'no scope' rather than dying."""
+    to 'no scope' rather than dying.
+
+    A module already loaded from the same path is reused, so a resident process
+    (``hook_daemon.py``) imports each script once rather than once per prompt.
+    Serialized: the module is in ``sys.modules`` before it has finished
+    executing, and the background /health check loads scripts too, so an
+    unlocked second caller could be handed a half-initialised module.
+    """
+    with _load_lock:
+        return _load_unlocked(module_name, filename)
+
+
+def _load_unlocked(module_name: str, filename: str):
     try:
         import importlib.util
 
         path = os.path.join(_SCRIPTS_DIR, filename)
         if not os.path.isfile(path):
             return None
+        loaded = sys.modules.get(module_name)
+        if loaded is not None and getattr(loaded, "__file__", None) == path:
+            return loaded
         spec = importlib.util.spec_from_file_location(module_name, path)
         if spec is None or spec.loader is None:
             return None
         module = importlib.util.module_from_spec(spec)
         sys.modules[module_name] = module
-        spec.loader.exec_module(module)
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            sys.modules.pop(module_name, None)
+            raise
         return module
     except Exception:
         return None
@@ -230,6 +265,7 @@ class Scope(NamedTuple):
                                   # cache | resolved | none
     ambiguous: tuple = ()
     focus_note: str = ""          # "" | "other-workspace-only"
+    last_indexed: str = ""        # as the service reported it; "" = unknown
 
 
 def resolve_scope(cwd: str) -> Scope:
@@ -249,6 +285,13 @@ def resolve_scope(cwd: str) -> Scope:
     except Exception:
         return Scope()
 
+    # Only a cache miss needs the service. Start /health now so it runs while
+    # the focus state is read. (A focus override on an uncached workspace
+    # then leaves it to the probe, which needs the same URL.)
+    cached = scope.read_cache(workspace_key)
+    if not cached:
+        prefetch_live_base_url()
+
     focus_note = ""
     focus = _load("rp_project_focus", "project_focus.py")
     if focus is not None and _point_focus_engine_at_state_file(focus):
@@ -264,7 +307,6 @@ def resolve_scope(cwd: str) -> Scope:
             # fact, then try to resolve THIS workspace on its own merits.
             focus_note = "other-workspace-only"
 
-    cached = scope.read_cache(workspace_key)
     if cached:
         proj = cached.get("project") or {}
         if cached.get("ambiguous"):
@@ -273,16 +315,17 @@ def resolve_scope(cwd: str) -> Scope:
             return Scope(source="cache", ambiguous=ids, focus_note=focus_note)
         if proj.get("project_id"):
             return Scope(proj["project_id"], proj.get("mode", ""),
-                         proj.get("state", ""), "cache", (), focus_note)
+                         proj.get("state", ""), "cache", (), focus_note,
+                         proj.get("last_indexed", ""))
         return Scope(source="cache", focus_note=focus_note)
 
     base = _first_live_base_url()
-    if not base:
+    if not base or _budget.spent():
         return Scope(focus_note=focus_note)
     try:
         from pathlib import Path
 
-        projects = scope.fetch_projects(base, timeout=SEARCH_TIMEOUT)
+        projects = scope.fetch_projects(base, timeout=_budget.timeout(SEARCH_TIMEOUT))
         decision = scope.resolve(Path(cwd), projects)
         scope.write_cache(workspace_key, decision, service={"base_url": base})
         if decision.ambiguous:
@@ -290,42 +333,157 @@ def resolve_scope(cwd: str) -> Scope:
                          focus_note=focus_note)
         if decision.project:
             return Scope(decision.project.project_id, decision.project.mode,
-                         decision.project.state, "resolved", (), focus_note)
+                         decision.project.state, "resolved", (), focus_note,
+                         decision.project.last_indexed)
     except Exception:
         return Scope(focus_note=focus_note)
     return Scope(source="resolved", focus_note=focus_note)
 
 
+# --- latency budget ---------------------------------------------------------
+
+
+class Budget:
+    """The deadline every phase of one prompt draws its waits from.
+
+    The caps alone could stack — two health checks, the project list and the
+    probe add up to 4 s before the prompt is sent. The budget bounds the sum.
+    """
+
+    def __init__(self, ms: float):
+        self.ms = ms
+        self.start = time.monotonic()
+        self.deadline = self.start + ms / 1000 if ms > 0 else None
+
+    def remaining(self) -> float:
+        if self.deadline is None:
+            return float("inf")
+        return self.deadline - time.monotonic()
+
+    def spent(self) -> bool:
+        return self.remaining() <= 0
+
+    def timeout(self, cap: float) -> float:
+        """``cap``, cut to what is left. Never 0 — a zero socket timeout means
+        non-blocking, not "give up"; callers check :meth:`spent` first."""
+        return max(0.001, min(cap, self.remaining()))
+
+    def fields(self) -> dict:
+        """What each decision record carries, so the budget can be tuned."""
+        if self.deadline is None:
+            return {}
+        spent = (time.monotonic() - self.start) * 1000
+        return {"budget_ms": round(self.ms), "budget_spent_ms": round(spent, 1),
+                "budget_left_ms": round(max(0.0, self.ms - spent), 1)}
+
+
+#: The current prompt's budget. Unbounded outside ``main`` (tests, benches).
+_budget = Budget(0)
+
+
 # --- HTTP -------------------------------------------------------------------
 
-_live_base_url_cache: list = []
+#: How long the winning port is trusted. A one-shot hook process never lives
+#: this long, so there it simply means "once per process"; a resident daemon
+#: re-checks so a restarted or re-ported service is noticed.
+LIVE_URL_TTL = float(os.environ.get("RAG_PLUGIN_HOOK_LIVE_URL_TTL", "30"))
 
+_live_base_url_cache: list = []   # [(url, monotonic stamp)]
+_live_prefetch: list = []         # [(thread, result box)] while a check runs
+_health_gets: list = []           # one entry per /health request this prompt
+_search_gets: list = []           # one entry per probe search sent this prompt
 
-def _first_live_base_url():
-    """The first candidate port whose /health answers. Cached per process."""
+
+def _http_get(url: str, timeout: float):
+    """``(status, body)`` for a GET. Non-2xx is returned, not raised; network
+    failures raise ``OSError`` (``TimeoutError`` included).
+
+    Goes through the shared keep-alive client (``scripts/http_keepalive.py``),
+    so /health, the project list and the probe reuse one connection — and a
+    resident daemon reuses it across prompts. It is the instance
+    ``scope_resolve`` imported, not a second copy. Plain urllib if it cannot
+    load.
+    """
+    scope = _load("rp_scope_resolve", "scope_resolve.py")
+    pool = getattr(scope, "http_keepalive", None)
+    if pool is not None:
+        resp = pool.get(url, timeout=timeout)
+        return resp.status, resp.body
+    try:
+        with urllib.request.urlopen(url, timeout=timeout) as resp:
+            return resp.status, resp.read()
+    except urllib.error.HTTPError as e:
+        return e.code, b""
+
+
+def _cached_live_base_url():
     if _live_base_url_cache:
-        return _live_base_url_cache[0]
+        url, stamp = _live_base_url_cache[0]
+        if time.monotonic() - stamp < LIVE_URL_TTL:
+            return url
+        _live_base_url_cache.clear()
+    return None
+
+
+def _check_live_base_url():
     for port in CANDIDATE_PORTS:
+        if _budget.spent():
+            break
         url = f"http://127.0.0.1:{port}"
+        _health_gets.append(port)
         try:
-            with urllib.request.urlopen(f"{url}/health", timeout=HEALTH_TIMEOUT) as resp:
-                if resp.status == 200:
-                    _live_base_url_cache.append(url)
-                    return url
+            status, _ = _http_get(f"{url}/health", _budget.timeout(HEALTH_TIMEOUT))
+            if status == 200:
+                _live_base_url_cache[:] = [(url, time.monotonic())]
+                return url
         except Exception:
             continue
     return None
 
 
+def prefetch_live_base_url() -> None:
+    """Start the /health check in the background.
+
+    :func:`resolve_scope` starts it on a scope-cache miss, before reading the
+    focus state. The next :func:`_first_live_base_url` waits for it rather
+    than asking again.
+    """
+    if _live_prefetch or _cached_live_base_url():
+        return
+    box: list = []
+    thread = threading.Thread(target=lambda: box.append(_check_live_base_url()),
+                              name="rag-hook-health", daemon=True)
+    thread.start()
+    _live_prefetch.append((thread, box))
+
+
+def _first_live_base_url():
+    """The first candidate port whose /health answers. Cached for LIVE_URL_TTL.
+
+    Joins a running :func:`prefetch_live_base_url` for at most what is left of
+    the budget; None if it has not answered by then.
+    """
+    if _live_prefetch:
+        thread, box = _live_prefetch[0]
+        thread.join(_budget.timeout(HEALTH_TIMEOUT * len(CANDIDATE_PORTS)))
+        if thread.is_alive():
+            return None
+        _live_prefetch.clear()
+        return box[0] if box else None
+    return _cached_live_base_url() or _check_live_base_url()
+
+
 def domain_probe(prompt: str, project: str):
     """Phase C. A **scoped** top_k=1 search. ``(matched, score, error_reason)``.
 
     The scope argument is the whole fix. Without it this returned
     ``probe-error:http-422`` on every prompt from 2026-07-29 onward.
     """
+    if _budget.spent():
+        return False, 0.0, "budget-exhausted"
     base = _first_live_base_url()
     if not base:
-        return False, 0.0, "service-down"
+        return False, 0.0, "budget-exhausted" if _budget.spent() else "service-down"
     try:
         query = urllib.parse.urlencode({
             "query": prompt[:500],
@@ -333,21 +491,21 @@ def domain_probe(prompt: str, project: str):
             "top_k": "1",
             "compact": "true",
         })
-        with urllib.request.urlopen(f"{base}/api/search?{query}",
-                                    timeout=SEARCH_TIMEOUT) as resp:
-            if resp.status != 200:
-                return False, 0.0, f"probe-error:http-{resp.status}"
-            body = json.loads(resp.read().decode("utf-8"))
-    except urllib.error.HTTPError as e:
-        if e.code == 422:
+        _search_gets.append(project)
+        status, raw = _http_get(f"{base}/api/search?{query}",
+                                _budget.timeout(SEARCH_TIMEOUT))
+        if status == 422:
             # Scope WAS passed and the service still refused. That is a real
             # defect, not the ambient noise the old unscoped probe produced.
             return False, 0.0, "probe-error:http-422-after-scope"
-        return False, 0.0, f"probe-error:http-{e.code}"
-    except urllib.error.URLError:
-        return False, 0.0, "probe-error:network"
+        if status != 200:
+            return False, 0.0, f"probe-error:http-{status}"
+        body = json.loads(raw.decode("utf-8"))
     except TimeoutError:
-        return False, 0.0, "probe-error:timeout"
+        return False, 0.0, "budget-exhausted" if _budget.spent() else "probe-error:timeout"
+    except (urllib.error.URLError, OSError):
+        _live_base_url_cache.clear()
+        return False, 0.0, "probe-error:network"
     except json.JSONDecodeError:
         return False, 0.0, "probe-error:json"
     except Exception:
@@ -364,11 +522,42 @@ def domain_probe(prompt: str, project: str):
     return score >= PROBE_THRESHOLD, score, ""
 
 
+def cached_probe(prompt: str, scope: Scope):
+    """``domain_probe`` behind ``scripts/probe_cache.py``.
+
+    ``(matched, score, error_reason, log_fields)``. A prompt already probed
+    against the same project at the same index freshness reuses the verdict
+    with no HTTP at all. Only a clean verdict is remembered; an error is
+    retried on the next prompt. ``log_fields`` says which way it went
+    (``probe_cache``: hit / miss / expired / reindexed / disabled) and how
+    many entries a store evicted.
+    """
+    cache = _load("rp_probe_cache", "probe_cache.py")
+    if cache is None:
+        return (*domain_probe(prompt, scope.project), {})
+    marker = f"{scope.state}|{scope.last_indexed}"
+    status, verdict = cache.lookup(scope.project, prompt, marker)
+    if verdict is not None:
+        return verdict[0], verdict[1], "", {"probe_cache": status}
+    matched, score, err = domain_probe(prompt, scope.project)
+    fields: dict = {"probe_cache": status}
+    if not err:
+        evicted = cache.store(scope.project, prompt, marker, matched, score)
+        if evicted:
+            fields["probe_cache_evicted"] = evicted
+    return matched, score, err, fields
+
+
 # --- observability ----------------------------------------------------------
 
 
 def log_decision(**fields) -> None:
-    """One JSONL record. Never user content; never fails the hook (D-012)."""
+    """One JSONL record. Never user content; never fails the hook (D-012).
+
+    ``scripts/decision_log.py`` appends it, keeps the aggregate sidecar the
+    report and analyzer read, and rotates the log; without it the record is
+    still appended.
+    """
     if os.path.isfile(OBS_DISABLE_MARKER):
         return
     try:
@@ -376,6 +565,11 @@ def log_decision(**fields) -> None:
         entry = {"ts": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
                  "hook_version": HOOK_VERSION}
         entry.update(fields)
+        entry.update(_budget.fields())
+        dl = _load("decision_log", "decision_log.py")
+        if dl is not None:
+            dl.append(OBS_LOG, entry)
+            return
         with open(OBS_LOG, "a", encoding="utf-8") as f:
             f.write(json.dumps(entry, ensure_ascii=False) + "\n")
     except Exception:
@@ -518,15 +712,29 @@ def main() -> None:
                     prompt_length=prompt_length, http_calls=0)
         return
 
-    # Phase A.6 — repo context. NEW: exits before any network call.
+    # Phases B and C share one deadline.
+    global _budget
+    _budget = Budget(BUDGET_MS)
+    _live_prefetch.clear()
+    _health_gets.clear()
+    _search_gets.clear()
+
+    # Phase A.6 — repo context.
     scope = resolve_scope(str(cwd))
     if (not scope.project and not scope.ambiguous and scope.source == "none"
             and not scope.focus_note):
+        if _budget.spent():
+            silent_pass("budget-exhausted", shape_match=True, prompt_length=prompt_length,
+                        phase="scope", http_calls=len(_health_gets))
+            return
         silent_pass("no-repo-context", shape_match=True,
-                    prompt_length=prompt_length, scope_source="none", http_calls=0)
+                    prompt_length=prompt_length, scope_source="none",
+                    http_calls=len(_health_gets))
         return
 
-    http_calls = 0 if scope.source.startswith(("cache", "override")) else 1
+    # The project list on a live resolution, plus every /health asked so far.
+    scope_calls = 1 if scope.source == "resolved" else 0
+    http_calls = scope_calls + len(_health_gets)
 
     # Ambiguous or unresolved scope: say so; never probe unscoped.
     if scope.ambiguous or not scope.project:
@@ -536,8 +744,10 @@ def main() -> None:
                focus_note=scope.focus_note, http_calls=http_calls)
         return
 
-    # Phase C — SCOPED probe
-    matched, score, err = domain_probe(prompt, scope.project)
+    # Phase C — SCOPED probe, unless this prompt was just asked
+    matched, score, err, cache_fields = cached_probe(prompt, scope)
+    probe_calls = len(_search_gets)  # none on a hit, a spent budget or no service
+    http_calls = scope_calls + len(_health_gets)  # the probe may have asked /health
     if err:
         # Still inject the scope block: knowing the project and its mode is
         # useful even when relevance could not be measured.
@@ -545,14 +755,15 @@ def main() -> None:
                shape_match=True, prompt_length=prompt_length,
                scope_source=scope.source, project_id=scope.project,
                project_mode=scope.mode, project_state=scope.state,
-               probe_error=err, http_calls=http_calls + 1)
+               probe_error=err, http_calls=http_calls + probe_calls, **cache_fields)
         return
 
     inject(build_block(scope, score, matched),
            shape_match=True, prompt_length=prompt_length, scope_source=scope.source,
            project_id=scope.project, project_mode=scope.mode,
            project_state=scope.state, probe_match=matched,
-           probe_top_score=round(score, 3), http_calls=http_calls + 1)
+           probe_top_score=round(score, 3), http_calls=http_calls + probe_calls,
+           **cache_fields)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,508 @@
+#!/usr/bin/env python3
+"""rag-plugin resident hook daemon — opt-in warm mode for ``hook_launcher``.
+
+Why
+---
+Every ``UserPromptSubmit`` and every Bash ``PreToolUse`` cold-starts an
+interpreter, ``runpy``-compiles ``context_inject.py`` from source (``run_path``
+never uses bytecode), then imports ``scope_resolve.py`` and ``project_focus.py``
+through ``_load()``. None of that work depends on the prompt. A resident process
+does it once and keeps the live service URL and the parsed scope cache warm.
+
+The contract is unchanged
+-------------------------
+This is an optimisation *behind* the launcher, never in front of it:
+
+* **Opt-in.** Nothing talks to a daemon unless ``RAG_PLUGIN_HOOK_DAEMON`` is
+  set. Unset, the launcher is byte-for-byte today's in-process path.
+* **Fail-open (D-031).** The launcher is a thin client. No daemon, a stale
+  daemon, a wrong token, a refused request, a timeout, a malformed reply —
+  every one of them falls back to running the target in-process.
+* **Exit semantics stay in the launcher.** The daemon reports the target's raw
+  exit code (or the name of the exception it raised); ``hook_launcher`` applies
+  the advisory / guarded normalisation exactly as it does for ``runpy``.
+* **A daemon never answers with stale code or a foreign environment.** Before
+  each request it re-stats the files it loaded and exits if any changed; and the
+  client sends a fingerprint of its ``RAG_*`` environment and home directory,
+  which the daemon refuses unless it matches its own (module-level constants
+  such as ``SEARCH_TIMEOUT`` and the port overrides are read at import time).
+
+Transport
+---------
+A Unix domain socket under ``~/.claude/rag-plugin/run/`` where the platform has
+one. Elsewhere (Windows) a loopback TCP port: stdlib named pipes exist only via
+``multiprocessing.connection``, whose import alone costs more than the cold
+start this module removes. Either way the address, a random token and the pid
+are published in ``hook-daemon.json`` (mode 0600), and every request carries the
+token. One JSON object per connection in each direction; requests are served
+serially, which is also what keeps ``sys.stdin`` / ``sys.stdout`` swapping safe.
+A hook waits for its turn only about as long as the hooks' own budget
+(``REQUEST_TIMEOUT``) before it runs in-process, and the daemon skips a
+request whose client has given up.
+
+    python hooks/hook_daemon.py start      # detach a daemon (idempotent)
+    python hooks/hook_daemon.py status
+    python hooks/hook_daemon.py stop
+    python hooks/hook_daemon.py serve      # foreground, for debugging
+
+With ``RAG_PLUGIN_HOOK_DAEMON=1`` the launcher also starts one on first use; it
+exits by itself after ``RAG_PLUGIN_HOOK_DAEMON_IDLE`` seconds without a request
+(default 1800).
+
+Python 3 stdlib only.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import os
+import secrets
+import socket
+import sys
+import time
+
+DAEMON_VERSION = "1.0.0"
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+_PLUGIN_ROOT = os.path.dirname(_HERE)
+
+RUN_DIR = os.path.join(os.path.expanduser("~/.claude"), "rag-plugin", "run")
+ADDRESS_FILE = os.path.join(RUN_DIR, "hook-daemon.json")
+SOCKET_PATH = os.path.join(RUN_DIR, "hook-daemon.sock")
+SPAWN_MARKER = os.path.join(RUN_DIR, "hook-daemon.spawning")
+
+#: Connecting to a live local socket takes microseconds; anything slower means
+#: there is no daemon worth waiting for.
+CONNECT_TIMEOUT = 0.2
+#: Upper bound on ``status`` / ``stop`` and on reading one request. Hitting it
+#: means the daemon is wedged.
+CONTROL_TIMEOUT = 10.0
+_BUDGET_MS = float(os.environ.get("RAG_PLUGIN_HOOK_BUDGET_MS", "800"))
+REQUEST_MARGIN = 1.0
+#: How long a hook waits for its answer before running in-process instead.
+#: Requests are served one at a time, so this is also the most one slow hook
+#: can delay the next: the hooks' own budget (``RAG_PLUGIN_HOOK_BUDGET_MS``)
+#: plus ``REQUEST_MARGIN`` for the work outside it. With the budget off (0),
+#: the control bound.
+REQUEST_TIMEOUT = _BUDGET_MS / 1000 + REQUEST_MARGIN if _BUDGET_MS > 0 else CONTROL_TIMEOUT
+IDLE_SECONDS = float(os.environ.get("RAG_PLUGIN_HOOK_DAEMON_IDLE", "1800"))
+_MAX_FRAME = 4 * 1024 * 1024
+
+#: Env vars that must never enter the fingerprint: the opt-in switch itself
+#: (a daemon started by hand and one started by the launcher are the same
+#: daemon) and the idle knob.
+_FINGERPRINT_EXCLUDE = ("RAG_PLUGIN_HOOK_DAEMON", "RAG_PLUGIN_HOOK_DAEMON_IDLE")
+
+
+def env_fingerprint(environ=None) -> str:
+    """Hash of everything the targets read at import time.
+
+    ``RAG_*`` covers the port, timeout, threshold and state-file overrides;
+    the home directory decides every state path.
+    """
+    environ = os.environ if environ is None else environ
+    items = sorted((k, v) for k, v in environ.items()
+                   if k.startswith("RAG_") and k not in _FINGERPRINT_EXCLUDE)
+    items.append(("~", os.path.expanduser("~")))
+    return hashlib.sha256(json.dumps(items).encode("utf-8")).hexdigest()[:16]
+
+
+def _diag(msg: str) -> None:
+    if not os.environ.get("RAG_PLUGIN_HOOK_DEBUG"):
+        return
+    try:
+        sys.stderr.write("[rag-plugin hook_daemon] " + str(msg) + "\n")
+    except Exception:
+        pass
+
+
+# --------------------------------------------------------------------------- #
+# Wire format                                                                  #
+# --------------------------------------------------------------------------- #
+
+
+def _send(sock: socket.socket, obj) -> None:
+    sock.sendall(json.dumps(obj).encode("utf-8"))
+    sock.shutdown(socket.SHUT_WR)
+
+
+def _recv(sock: socket.socket):
+    chunks, size = [], 0
+    while True:
+        chunk = sock.recv(65536)
+        if not chunk:
+            break
+        size += len(chunk)
+        if size > _MAX_FRAME:
+            raise ValueError("frame too large")
+        chunks.append(chunk)
+    return json.loads(b"".join(chunks).decode("utf-8"))
+
+
+def _read_address():
+    try:
+        with open(ADDRESS_FILE, encoding="utf-8") as f:
+            info = json.load(f)
+        return info if isinstance(info, dict) and info.get("token") else None
+    except (OSError, ValueError):
+        return None
+
+
+def _connect(info, timeout: float):
+    if info.get("family") == "unix":
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        target = info["address"]
+    else:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        target = ("127.0.0.1", int(info["address"]))
+    sock.settimeout(timeout)
+    try:
+        sock.connect(target)
+    except BaseException:
+        sock.close()
+        raise
+    return sock
+
+
+# --------------------------------------------------------------------------- #
+# Client side (called by hook_launcher)                                        #
+# --------------------------------------------------------------------------- #
+
+
+def request(target: str, payload: str, cwd: str = ""):
+    """Ask a running daemon to run ``target`` with ``payload`` as stdin.
+
+    Returns ``(stdout, exit_code, error_name)`` or None when the daemon cannot
+    answer for any reason — the launcher then runs the target in-process.
+    Never raises.
+    """
+    info = _read_address()
+    if info is None:
+        return None
+    try:
+        sock = _connect(info, CONNECT_TIMEOUT)
+    except (OSError, ValueError, KeyError):
+        return None
+    try:
+        sock.settimeout(REQUEST_TIMEOUT)
+        _send(sock, {
+            "op": "run",
+            "token": info["token"],
+            "target": os.path.basename(target),
+            "payload": payload,
+            "cwd": cwd or os.getcwd(),
+            "env": env_fingerprint(),
+            # Past this the launcher has run the target itself; a request
+            # still queued then must not run it a second time.
+            "deadline": time.time() + REQUEST_TIMEOUT,
+        })
+        reply = _recv(sock)
+    except Exception as exc:  # noqa: BLE001 — any failure means "fall back"
+        _diag("request failed: %s" % type(exc).__name__)
+        return None
+    finally:
+        sock.close()
+    if not isinstance(reply, dict) or reply.get("status") != "ok":
+        _diag("daemon declined: %r" % (reply.get("status") if isinstance(reply, dict)
+                                       else reply,))
+        return None
+    code = reply.get("code")
+    return (str(reply.get("stdout") or ""),
+            code if isinstance(code, int) else 0,
+            reply.get("error") or None)
+
+
+def spawn_detached() -> bool:
+    """Start a daemon in the background, at most once per few seconds.
+
+    The marker file stops a burst of concurrent hooks from each spawning one.
+    The child holds none of our stdio: a hook host that waits for stdout to
+    close must never wait on the daemon.
+    """
+    try:
+        os.makedirs(RUN_DIR, exist_ok=True)
+        try:
+            if time.time() - os.path.getmtime(SPAWN_MARKER) < 10:
+                return False
+        except OSError:
+            pass
+        with open(SPAWN_MARKER, "w", encoding="utf-8") as f:
+            f.write(str(os.getpid()))
+        import subprocess
+
+        kwargs = {}
+        if os.name == "nt":
+            kwargs["creationflags"] = (getattr(subprocess, "DETACHED_PROCESS", 0x8)
+                                       | getattr(subprocess, "CREATE_NEW_PROCESS_GROUP",
+                                                 0x200))
+        else:
+            kwargs["start_new_session"] = True
+        subprocess.Popen([sys.executable, os.path.abspath(__file__), "serve"],
+                         stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                         stderr=subprocess.DEVNULL, close_fds=True, **kwargs)
+        return True
+    except Exception as exc:  # noqa: BLE001
+        _diag("spawn failed: %s" % type(exc).__name__)
+        return False
+
+
+# --------------------------------------------------------------------------- #
+# Server side                                                                  #
+# --------------------------------------------------------------------------- #
+
+
+class HookDaemon:
+    """Serve hook targets from one warm interpreter."""
+
+    def __init__(self, idle_seconds: float = IDLE_SECONDS):
+        self.idle_seconds = idle_seconds
+        self.token = secrets.token_hex(16)
+        self.env = env_fingerprint()
+        self.sock = None
+        self.modules = {}
+        self.allowed = self._allowed_targets()
+        self.started = time.time()
+        self.served = 0
+        self._stamps = {}
+
+    @staticmethod
+    def _allowed_targets() -> set:
+        """Only files ``hook_launcher._TARGETS`` names may run — a request
+        carries a file name, never a path."""
+        launcher = _import_path("rp_hook_launcher", os.path.join(_HERE, "hook_launcher.py"))
+        return {filename for filename, _mode in launcher._TARGETS.values()}
+
+    # -- staleness ---------------------------------------------------------
+
+    @staticmethod
+    def _watched_files() -> list:
+        out = []
+        for folder in (_HERE, os.path.join(_PLUGIN_ROOT, "scripts")):
+            try:
+                out += [os.path.join(folder, n) for n in os.listdir(folder)
+                        if n.endswith(".py")]
+            except OSError:
+                continue
+        return out
+
+    def _snapshot(self) -> dict:
+        stamps = {}
+        for path in self._watched_files():
+            try:
+                st = os.stat(path)
+                stamps[path] = (st.st_mtime_ns, st.st_size)
+            except OSError:
+                continue
+        return stamps
+
+    def is_stale(self) -> bool:
+        """True once any plugin source changed since start (an upgrade, an edit)."""
+        return self._snapshot() != self._stamps
+
+    # -- running targets ---------------------------------------------------
+
+    def _module(self, filename: str):
+        module = self.modules.get(filename)
+        if module is None:
+            name = "rp_hook_" + filename[:-3]
+            module = _import_path(name, os.path.join(_HERE, filename))
+            self.modules[filename] = module
+        return module
+
+    def run_target(self, filename: str, payload: str, cwd: str):
+        """Run ``main()`` of a warm target. Returns the reply dict."""
+        module = self._module(filename)
+        out = io.StringIO()
+        saved = (sys.stdin, sys.stdout, os.getcwd())
+        code, error = 0, None
+        sys.stdin, sys.stdout = io.StringIO(payload), out
+        try:
+            if cwd and os.path.isdir(cwd):
+                os.chdir(cwd)
+            module.main()
+        except SystemExit as exc:
+            code = exc.code if isinstance(exc.code, int) else 0
+        except BaseException as exc:  # noqa: BLE001 — reported, launcher fails open
+            error = type(exc).__name__
+        finally:
+            sys.stdin, sys.stdout = saved[0], saved[1]
+            try:
+                os.chdir(saved[2])
+            except OSError:
+                pass
+        return {"status": "ok", "stdout": out.getvalue(), "code": code, "error": error}
+
+    def handle(self, msg) -> dict:
+        if not isinstance(msg, dict) or not secrets.compare_digest(
+                str(msg.get("token", "")), self.token):
+            return {"status": "denied"}
+        op = msg.get("op")
+        if op == "status":
+            return {"status": "ok", "pid": os.getpid(), "version": DAEMON_VERSION,
+                    "uptime_s": round(time.time() - self.started, 1),
+                    "served": self.served, "warm": sorted(self.modules)}
+        if op == "stop":
+            return {"status": "ok", "stopping": True}
+        if op != "run":
+            return {"status": "bad-op"}
+        if msg.get("env") != self.env:
+            return {"status": "env-mismatch"}
+        filename = str(msg.get("target", ""))
+        if filename not in self.allowed:
+            return {"status": "unknown-target"}
+        deadline = msg.get("deadline")
+        if isinstance(deadline, (int, float)) and time.time() > deadline:
+            return {"status": "expired"}
+        self.served += 1
+        return self.run_target(filename, str(msg.get("payload", "")),
+                               str(msg.get("cwd", "")))
+
+    # -- lifecycle -----------------------------------------------------------
+
+    def bind(self) -> None:
+        os.makedirs(RUN_DIR, exist_ok=True)
+        if hasattr(socket, "AF_UNIX"):
+            try:
+                os.unlink(SOCKET_PATH)
+            except OSError:
+                pass
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.bind(SOCKET_PATH)
+            os.chmod(SOCKET_PATH, 0o600)
+            info = {"family": "unix", "address": SOCKET_PATH}
+        else:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            sock.bind(("127.0.0.1", 0))
+            info = {"family": "tcp", "address": sock.getsockname()[1]}
+        sock.listen(16)
+        sock.settimeout(1.0)
+        self.sock = sock
+        info.update(token=self.token, pid=os.getpid(), version=DAEMON_VERSION)
+        tmp = ADDRESS_FILE + ".tmp"
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(info, f)
+        os.replace(tmp, ADDRESS_FILE)
+
+    def close(self) -> None:
+        if self.sock is not None:
+            try:
+                self.sock.close()
+            except OSError:
+                pass
+        info = _read_address()
+        if info and info.get("pid") == os.getpid():
+            for path in (ADDRESS_FILE, SOCKET_PATH):
+                try:
+                    os.unlink(path)
+                except OSError:
+                    pass
+
+    def serve_forever(self) -> int:
+        # Warm everything a prompt would otherwise pay for, before publishing.
+        for filename in sorted(self.allowed):
+            try:
+                self._module(filename)
+            except Exception as exc:  # noqa: BLE001
+                _diag("preload %s failed: %s" % (filename, type(exc).__name__))
+        self._stamps = self._snapshot()
+        self.bind()
+        last = time.time()
+        try:
+            while True:
+                try:
+                    conn, _ = self.sock.accept()
+                except socket.timeout:
+                    if time.time() - last > self.idle_seconds:
+                        _diag("idle; exiting")
+                        return 0
+                    continue
+                last = time.time()
+                with conn:
+                    conn.settimeout(CONTROL_TIMEOUT)
+                    try:
+                        msg = _recv(conn)
+                    except Exception:  # noqa: BLE001
+                        continue
+                    if self.is_stale():
+                        _safe_send(conn, {"status": "stale"})
+                        _diag("plugin sources changed; exiting")
+                        return 0
+                    reply = self.handle(msg)
+                    _safe_send(conn, reply)
+                    if reply.get("stopping"):
+                        return 0
+        finally:
+            self.close()
+
+
+def _safe_send(conn, obj) -> None:
+    try:
+        _send(conn, obj)
+    except OSError:
+        pass
+
+
+def _import_path(name: str, path: str):
+    import importlib.util
+
+    spec = importlib.util.spec_from_file_location(name, path)
+    if spec is None or spec.loader is None:
+        raise ImportError(path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def _control(op: str):
+    info = _read_address()
+    if info is None:
+        return None
+    try:
+        sock = _connect(info, CONNECT_TIMEOUT)
+    except (OSError, ValueError, KeyError):
+        return None
+    try:
+        sock.settimeout(CONTROL_TIMEOUT)
+        _send(sock, {"op": op, "token": info["token"]})
+        return _recv(sock)
+    except Exception:  # noqa: BLE001
+        return None
+    finally:
+        sock.close()
+
+
+def main(argv=None) -> int:
+    import argparse
+
+    ap = argparse.ArgumentParser(description="rag-plugin resident hook daemon")
+    ap.add_argument("command", choices=("serve", "start", "stop", "status"))
+    ap.add_argument("--idle", type=float, default=IDLE_SECONDS,
+                    help="exit after this many seconds without a request")
+    args = ap.parse_args(argv)
+
+    if args.command == "status":
+        reply = _control("status")
+        print(json.dumps(reply or {"status": "not-running"}, indent=2))
+        return 0 if reply else 1
+    if args.command == "stop":
+        reply = _control("stop")
+        print("stopped" if reply else "not running")
+        return 0
+    if _control("status"):
+        print("already running")
+        return 0
+    if args.command == "start":
+        try:
+            os.unlink(SPAWN_MARKER)
+        except OSError:
+            pass
+        return 0 if spawn_detached() else 1
+    return HookDaemon(idle_seconds=args.idle).serve_forever()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
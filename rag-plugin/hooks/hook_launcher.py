@@ -48,6 +48,14 @@ Two modes (per target)
 In both modes a resolution failure yields ``0``; the difference is only what
 happens once the target actually runs.
 
+Resident mode (opt-in)
+----------------------
+With ``RAG_PLUGIN_HOOK_DAEMON`` set, the launcher first offers the payload to a
+warm ``hook_daemon.py`` process and applies the same mode rules to the exit code
+it reports. Any failure to get an answer — no daemon, stale daemon, timeout —
+falls through to the in-process path below with the payload restored on stdin,
+and a missing daemon is started in the background for the next hook.
+
 Python 3 stdlib only. Cross-platform: this launcher contains no shell-specific
 constructs, and the inline bootstrap that invokes it uses no shell metacharacters
 inside its payload.
@@ -105,6 +113,53 @@ def _resolve_target():
     return target, mode
 
 
+def _normalize(mode: str, code) -> int:
+    """Exit code for a target that ran and exited with ``code``."""
+    code = code if isinstance(code, int) else 0
+    if mode == "guarded":
+        # Preserve the target's intentional exit code (e.g. a deliberate
+        # block). A guarded hook is allowed to influence its tool call.
+        return code
+    # advisory: a target that ever exited non-zero (even 2) must not block.
+    if code != 0:
+        _diag("advisory target exited %r; normalizing to 0" % (code,))
+    return 0
+
+
+def _run_resident(target: str, mode: str):
+    """Try the opt-in resident daemon. Returns an exit code, or None to run the
+    target in-process (stdin is restored for it). Never raises."""
+    raw = None
+    try:
+        raw = sys.stdin.read()
+        import importlib.util
+
+        here = os.path.dirname(os.path.abspath(__file__))
+        spec = importlib.util.spec_from_file_location(
+            "rp_hook_daemon", os.path.join(here, "hook_daemon.py"))
+        client = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(client)
+        reply = client.request(target, raw)
+        if reply is None:
+            client.spawn_detached()
+        else:
+            stdout, code, error = reply
+            if stdout:
+                sys.stdout.write(stdout)
+                sys.stdout.flush()
+            if error:
+                _diag("resident target raised %s; failing open" % error)
+                return 0
+            return _normalize(mode, code)
+    except BaseException as exc:  # noqa: BLE001 — resident mode is best-effort
+        _diag("resident mode unavailable (%s); running in-process" % type(exc).__name__)
+    if raw is not None:
+        import io
+
+        sys.stdin = io.StringIO(raw)
+    return None
+
+
 def main() -> int:
     """Run the resolved target and return an exit code that can never falsely
     block. Path-resolution failures fail open in BOTH modes; once the target
@@ -116,6 +171,10 @@ def main() -> int:
         # unknown name). Fail open in BOTH modes — a hook that cannot be located
         # must never block a prompt or a tool call.
         return 0
+    if os.environ.get("RAG_PLUGIN_HOOK_DAEMON"):
+        code = _run_resident(target, mode)
+        if code is not None:
+            return code
     try:
         import runpy
 
@@ -124,15 +183,7 @@ def main() -> int:
         # __file__-relative logic keeps working). stdin/stdout pass through.
         runpy.run_path(target, run_name="__main__")
     except SystemExit as exc:
-        code = exc.code if isinstance(exc.code, int) else 0
-        if mode == "guarded":
-            # Preserve the target's intentional exit code (e.g. a deliberate
-            # block). A guarded hook is allowed to influence its tool call.
-            return code
-        # advisory: a target that ever exited non-zero (even 2) must not block.
-        if code != 0:
-            _diag("advisory target exited %r; normalizing to 0" % (code,))
-        return 0
+        return _normalize(mode, exc.code)
     except BaseException as exc:  # noqa: BLE001 — intentional catch-all
         # Unexpected error in EITHER mode -> fail open. The targets catch their
         # own known errors; this backstops the unexpected so an internal hook
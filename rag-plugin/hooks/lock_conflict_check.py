@@ -35,9 +35,11 @@ Design notes:
     on purpose and do not fight the lock.
   - The matcher requires a whole-word "rag" boundary so it does not
     false-match other commands that happen to contain the substring "rag".
-  - The health probe uses urllib.request.urlopen with a 1-second timeout;
-    any exception (timeout, connection refused, DNS error, JSON parse fail)
-    is treated as "service down" and the hook silently passes.
+  - The health probe uses the plugin's shared keep-alive client
+    (scripts/http_keepalive.py, falling back to urllib.request.urlopen) with
+    a 1-second timeout; any exception (timeout, connection refused, DNS
+    error, JSON parse fail) is treated as "service down" and the hook
+    silently passes.
 
 This hook is the security-guidance equivalent of the F-003 "Storage folder
 data/qdrant is already accessed by another instance" failure mode. It
@@ -116,6 +118,23 @@ def matches_lock_conflict(command: str) -> str | None:
     return None
 
 
+def _keepalive():
+    """The shared keep-alive client, or None. Imported the way scope_resolve
+    imports it - scripts/ on sys.path, then a plain import - so under the
+    resident daemon both hooks share one module, and the connection it holds
+    survives between Bash calls."""
+    try:
+        scripts = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                               "scripts")
+        if scripts not in sys.path:
+            sys.path.insert(0, scripts)
+        import http_keepalive
+
+        return http_keepalive
+    except Exception:
+        return None
+
+
 def service_is_up() -> bool:
     """Probe the candidate /health endpoints with a 1-second timeout each.
 
@@ -130,8 +149,13 @@ def service_is_up() -> bool:
     refuses immediately, so the second probe costs nothing when the first
     succeeds and almost nothing when it does not.
     """
+    pool = _keepalive()
     for url in HEALTH_URLS:
         try:
+            if pool is not None:
+                if pool.get(url, timeout=HEALTH_TIMEOUT_SECONDS).status == 200:
+                    return True
+                continue
             with urllib.request.urlopen(url, timeout=HEALTH_TIMEOUT_SECONDS) as resp:
                 if resp.status == 200:
                     return True
@@ -40,6 +40,8 @@ import shutil
 import subprocess
 import sys
 import tempfile
+import threading
+import time
 import unittest
 from pathlib import Path
 
@@ -90,15 +92,17 @@ def _split_bootstrap(command: str) -> tuple[str, list[str]]:
 
 
 def _run_bootstrap(target_name="context-inject", *, env_root=None,
-                   fallback=None, stdin="", timeout=30):
+                   fallback=None, stdin="", timeout=30, extra_env=None):
     """Run the real bootstrap argv under a controlled environment."""
     payload, args = _split_bootstrap(_bootstrap_command(target_name))
     if fallback is not None:
         args[1] = fallback
     env = dict(os.environ)
     env.pop("CLAUDE_PLUGIN_ROOT", None)
+    env.pop("RAG_PLUGIN_HOOK_DAEMON", None)
     if env_root is not None:
         env["CLAUDE_PLUGIN_ROOT"] = env_root
+    env.update(extra_env or {})
     return subprocess.run(
         [sys.executable, "-c", payload] + args,
         input=stdin, capture_output=True, text=True, timeout=timeout, env=env,
@@ -113,6 +117,7 @@ def _temp_plugin(target_body=None, include_target=True,
     hooks = Path(tmp) / "hooks"
     hooks.mkdir(parents=True)
     shutil.copy(str(LAUNCHER), str(hooks / "hook_launcher.py"))
+    shutil.copy(str(HERE / "hook_daemon.py"), str(hooks / "hook_daemon.py"))
     if include_target:
         body = target_body if target_body is not None else "import sys\nsys.exit(0)\n"
         (hooks / target_filename).write_text(body, encoding="utf-8")
@@ -310,6 +315,163 @@ class TestGuardedLockHook(unittest.TestCase):
         self.assertEqual(proc.returncode, 0, proc.stderr)
 
 
+# --------------------------------------------------------------------------- #
+# Resident mode: a warm daemon changes latency, never the exit contract.      #
+# --------------------------------------------------------------------------- #
+
+# A target whose module-level counter survives between calls only when a warm
+# daemon runs it; in-process every call prints n=1.
+_COUNTING_TARGET = (
+    "import sys\n"
+    "COUNT = [0]\n"
+    "def main():\n"
+    "    COUNT[0] += 1\n"
+    "    data = sys.stdin.read()\n"
+    "    sys.stdout.write('n=%d len=%d' % (COUNT[0], len(data)))\n"
+    "    sys.exit(EXIT)\n"
+    "if __name__ == '__main__':\n"
+    "    main()\n"
+)
+
+
+class TestResidentDaemon(unittest.TestCase):
+
+    def _plugin(self, target_filename="context_inject.py", exit_code=0, body=None):
+        body = body or _COUNTING_TARGET.replace("EXIT", str(exit_code))
+        tmp, launcher = _temp_plugin(target_body=body, target_filename=target_filename)
+        self.addCleanup(shutil.rmtree, tmp, ignore_errors=True)
+        home = tempfile.mkdtemp(prefix="raghome_")
+        self.addCleanup(shutil.rmtree, home, ignore_errors=True)
+        self.env = {"HOME": home, "USERPROFILE": home,
+                    "RAG_PLUGIN_HOOK_DAEMON_IDLE": "20"}
+        self.tmp, self.launcher = tmp, launcher
+        self.daemon_script = str(Path(tmp) / "hooks" / "hook_daemon.py")
+        self.addCleanup(self._stop)
+        return tmp, launcher
+
+    def _daemon_env(self):
+        env = dict(os.environ)
+        env.pop("RAG_PLUGIN_HOOK_DAEMON", None)
+        env.update(self.env)
+        return env
+
+    def _start(self):
+        proc = subprocess.Popen([sys.executable, self.daemon_script, "serve"],
+                                env=self._daemon_env(),
+                                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        self.addCleanup(proc.wait, 10)
+        self.addCleanup(self._stop)
+        address = Path(self.env["HOME"]) / ".claude" / "rag-plugin" / "run" / "hook-daemon.json"
+        for _ in range(200):
+            if address.is_file():
+                return proc
+            time.sleep(0.05)
+        proc.kill()
+        self.fail("daemon never published its address")
+
+    def _stop(self):
+        subprocess.run([sys.executable, self.daemon_script, "stop"],
+                       env=self._daemon_env(), capture_output=True, timeout=30)
+
+    def _hook(self, target_name="context-inject", **extra_env):
+        env = dict(self.env, RAG_PLUGIN_HOOK_DAEMON="1", **extra_env)
+        return _run_bootstrap(target_name=target_name, env_root=self.tmp,
+                              fallback=self.launcher, stdin=_GOOD_PAYLOAD,
+                              extra_env=env)
+
+    def test_warm_daemon_serves_and_keeps_state(self):
+        self._plugin()
+        self._start()
+        first = self._hook()
+        second = self._hook()
+        self.assertEqual((first.returncode, second.returncode), (0, 0), second.stderr)
+        self.assertIn("n=1 len=%d" % len(_GOOD_PAYLOAD), first.stdout)
+        self.assertIn("n=2", second.stdout, "second call was not served warm")
+
+    def test_advisory_exit_2_from_daemon_is_normalized(self):
+        self._plugin(exit_code=2)
+        self._start()
+        proc = self._hook()
+        self.assertEqual(proc.returncode, 0, proc.stderr)
+
+    def test_guarded_exit_2_from_daemon_passes_through(self):
+        self._plugin(target_filename="lock_conflict_check.py", exit_code=2)
+        self._start()
+        proc = self._hook(target_name="lock-conflict")
+        self.assertEqual(proc.returncode, 2,
+                         "guarded mode must pass an intentional block through the daemon")
+        self.assertIn("n=1", proc.stdout)
+
+    def test_target_crash_in_daemon_fails_open(self):
+        self._plugin(target_filename="lock_conflict_check.py",
+                     body="def main():\n    raise RuntimeError('boom')\n")
+        self._start()
+        proc = self._hook(target_name="lock-conflict")
+        self.assertEqual(proc.returncode, 0, proc.stderr)
+
+    def test_absent_daemon_falls_back_in_process_with_stdin_intact(self):
+        self._plugin()
+        proc = self._hook()
+        self.assertEqual(proc.returncode, 0, proc.stderr)
+        self.assertIn("n=1 len=%d" % len(_GOOD_PAYLOAD), proc.stdout)
+
+    def test_environment_mismatch_is_refused(self):
+        self._plugin()
+        self._start()
+        for _ in range(2):
+            proc = self._hook(RAG_PLUGIN_SERVICE_PORT="29999")
+            self.assertEqual(proc.returncode, 0, proc.stderr)
+            self.assertIn("n=1", proc.stdout,
+                          "a daemon with a different RAG_* environment answered")
+
+    def test_a_slow_hook_does_not_hold_up_the_next(self):
+        # The first call the daemon serves sleeps; the marker makes sure no
+        # in-process fallback does.
+        self._plugin(body=(
+            "import os, sys, time\n"
+            "COUNT = [0]\n"
+            "def main():\n"
+            "    COUNT[0] += 1\n"
+            "    sys.stdin.read()\n"
+            "    try:\n"
+            "        os.remove(os.path.expanduser('~/slow'))\n"
+            "        time.sleep(6)\n"
+            "    except OSError:\n"
+            "        pass\n"
+            "    sys.stdout.write('n=%d' % COUNT[0])\n"
+            "if __name__ == '__main__':\n"
+            "    main()\n"))
+        self.env["RAG_PLUGIN_HOOK_BUDGET_MS"] = "200"
+        self._start()
+        Path(self.env["HOME"], "slow").touch()
+        slow = threading.Thread(target=self._hook)
+        slow.start()
+        self.addCleanup(slow.join)
+        time.sleep(0.5)
+        t0 = time.monotonic()
+        proc = self._hook()
+        self.assertLess(time.monotonic() - t0, 4.0, "waited for the slow hook")
+        self.assertEqual(proc.returncode, 0, proc.stderr)
+        self.assertIn("n=1", proc.stdout, "expected the in-process fallback")
+        slow.join()
+        status = subprocess.run([sys.executable, self.daemon_script, "status"],
+                                env=self._daemon_env(), capture_output=True, text=True,
+                                timeout=30)
+        self.assertEqual(json.loads(status.stdout)["served"], 1,
+                         "a request its client had given up on was run anyway")
+
+    def test_edited_source_retires_the_daemon(self):
+        tmp, _ = self._plugin()
+        daemon = self._start()
+        self.assertIn("n=1", self._hook().stdout)
+        target = Path(tmp) / "hooks" / "context_inject.py"
+        target.write_text(target.read_text(encoding="utf-8") + "\n# edited\n",
+                          encoding="utf-8")
+        proc = self._hook()
+        self.assertIn("n=1", proc.stdout, "a stale daemon answered with old code")
+        self.assertEqual(daemon.wait(10), 0)
+
+
 # --------------------------------------------------------------------------- #
 # Wiring guards: hooks.json must stay fail-open; full string must parse in the #
 # host shell on this platform.                                                #
@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 """
-rag-plugin hook-decisions analyzer (v0.3.0).
+rag-plugin hook-decisions analyzer (v0.4.0).
 
 Reads ~/.claude/rag-plugin/hook-decisions.log (JSONL, written by
 hooks/context_inject.py, formerly prompt_retrieval_reminder.py) and prints
@@ -17,6 +17,9 @@ What you get:
   - Breakdown by action tag (shape-mismatch, service-down, probe-error,
     probe-below-threshold, reminder-injected, ...)
   - Probe score histogram (only for decisions that ran the probe)
+  - Probe cache: hits, misses by reason (miss / expired / reindexed),
+    evictions — scripts/probe_cache.py
+  - Latency budget: time spent per prompt, and how often it ran out
   - Average prompt length by action class
   - Hook version distribution (for cross-release comparison)
 
@@ -24,75 +27,56 @@ What this tool does NOT do:
   - It NEVER reads the prompt text (not stored in the log).
   - It NEVER calls the MCP or the HTTP API.
   - It NEVER writes to the log or to any other file.
-  - It does not take arguments. The log path is fixed.
+
+Where the numbers come from:
+  The hook keeps a running aggregate next to the log
+  (hook-decisions.stats.json, scripts/decision_log.py), so this reads the
+  aggregate plus any records appended since — not the whole history. The log
+  rotates into gzipped segments (hook-decisions.<stamp>.log.gz); --full
+  ignores the aggregate and recomputes across every segment.
 
 Usage:
-  python3 scripts/analyze_hook_decisions.py
+  python3 scripts/analyze_hook_decisions.py [--full]
 
 Exit code:
   0 always (even if the log is missing — it just prints a "no data" banner).
 """
 
-import json
+import argparse
 import os
 import sys
 from collections import Counter
 
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import decision_log  # noqa: E402
+
 LOG_PATH = os.path.expanduser("~/.claude/rag-plugin/hook-decisions.log")
 
 
-def main() -> None:
-    if not os.path.isfile(LOG_PATH):
+def main(argv=None) -> None:
+    ap = argparse.ArgumentParser(description="rag-plugin hook-decisions analyzer")
+    ap.add_argument("--full", action="store_true",
+                    help="recompute from every log segment instead of the running aggregate")
+    args = ap.parse_args(argv)
+
+    if not (os.path.isfile(LOG_PATH) or decision_log.segments(LOG_PATH)):
         print(f"no hook-decisions log at {LOG_PATH}")
         print("(the hook has not run yet, or observability is disabled)")
         sys.exit(0)
 
-    total = 0
-    actions: Counter = Counter()
-    action_prompt_lengths: dict[str, list[int]] = {}
-    probe_scores: list[float] = []
-    hook_versions: Counter = Counter()
-    malformed_lines = 0
-
     try:
-        with open(LOG_PATH, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    entry = json.loads(line)
-                except json.JSONDecodeError:
-                    malformed_lines += 1
-                    continue
-
-                total += 1
-                action = str(entry.get("action", "unknown"))
-                actions[action] += 1
-
-                plen = entry.get("prompt_length", 0)
-                try:
-                    plen = int(plen)
-                except (TypeError, ValueError):
-                    plen = 0
-                action_prompt_lengths.setdefault(action, []).append(plen)
-
-                score = entry.get("probe_top_score", 0.0)
-                try:
-                    score = float(score)
-                except (TypeError, ValueError):
-                    score = 0.0
-                # Only include in histogram if the probe actually ran (score > 0)
-                # or the action tag indicates the probe was invoked.
-                if score > 0.0 or "probe" in action or action == "reminder-injected":
-                    probe_scores.append(score)
-
-                hv = str(entry.get("hook_version", "unknown"))
-                hook_versions[hv] += 1
+        agg = decision_log.recompute(LOG_PATH) if args.full else decision_log.load(LOG_PATH)
     except Exception as e:
         print(f"error reading {LOG_PATH}: {e}")
         sys.exit(0)
 
+    total = agg["total"]
+    malformed_lines = agg["malformed"]
+    actions: Counter = Counter(agg["actions"])
+    hook_versions: Counter = Counter(agg["hook_versions"])
+    probe = agg["probe"]
+
     if total == 0:
         print(f"log at {LOG_PATH} exists but contains no valid records")
         print(f"malformed lines: {malformed_lines}")
@@ -103,6 +87,9 @@ def main() -> None:
     print(f" rag-plugin hook-decisions analyzer ")
     print("=" * 64)
     print(f"log: {LOG_PATH}")
+    if agg["segments"]:
+        print(f"rotated segments: {agg['segments']}")
+    print(f"source: {'full recompute' if args.full else 'running aggregate'}")
     print(f"total decisions: {total}")
     if malformed_lines:
         print(f"malformed lines skipped: {malformed_lines}")
@@ -111,8 +98,7 @@ def main() -> None:
     print("--- by action ---")
     for action, count in actions.most_common():
         pct = 100.0 * count / total
-        plens = action_prompt_lengths.get(action, [])
-        avg_plen = sum(plens) / len(plens) if plens else 0
+        avg_plen = agg["prompt_length_sum"].get(action, 0) / count
         print(f"  {action:36s} {count:6d}  ({pct:5.1f}%)   avg prompt len: {avg_plen:.0f}")
     print()
 
@@ -137,29 +123,44 @@ def main() -> None:
     print(f"  reminder injection rate (of prompts that passed shape gate): {injection_rate_of_shape_passed:5.1f}%")
     print()
 
-    if probe_scores:
+    if probe["count"]:
         print("--- probe score histogram (when probe ran) ---")
-        bins = [(0.0, 0.1), (0.1, 0.2), (0.2, 0.3), (0.3, 0.4), (0.4, 0.5),
-                (0.5, 0.6), (0.6, 0.7), (0.7, 0.8), (0.8, 0.9), (0.9, 1.0001)]
-        for lo, hi in bins:
-            n = sum(1 for s in probe_scores if lo <= s < hi)
+        for (lo, hi), n in zip(decision_log.SCORE_BINS, probe["hist"]):
             bar = "#" * min(40, n)
-            label = f"{lo:.1f}-{hi:.1f}" if hi <= 1.0 else f"{lo:.1f}-1.0"
-            # Normalize the 0.9-1.0 label
-            if lo == 0.9:
-                label = "0.9-1.0"
+            label = f"{lo:.1f}-{min(hi, 1.0):.1f}"
             print(f"  {label:9s} {n:5d}  {bar}")
         print()
 
         # Probe stats
-        if probe_scores:
-            avg_score = sum(probe_scores) / len(probe_scores)
-            min_score = min(probe_scores)
-            max_score = max(probe_scores)
-            print(f"  probe-ran count: {len(probe_scores)}")
-            print(f"  avg probe score: {avg_score:.3f}")
-            print(f"  min / max:       {min_score:.3f} / {max_score:.3f}")
-            print()
+        print(f"  probe-ran count: {probe['count']}")
+        print(f"  avg probe score: {probe['sum'] / probe['count']:.3f}")
+        print(f"  min / max:       {probe['min']:.3f} / {probe['max']:.3f}")
+        print()
+
+    cache = agg.get("probe_cache") or {}
+    lookups: Counter = Counter(cache.get("lookups") or {})
+    hits = lookups.get("hit", 0)
+    if lookups:
+        asked = sum(c for s, c in lookups.items() if s != "disabled")
+        print("--- probe cache ---")
+        for status, count in lookups.most_common():
+            print(f"  {status:12s} {count:6d}")
+        if asked:
+            print(f"  hit rate:    {100.0 * hits / asked:5.1f}%  ({hits}/{asked} lookups, "
+                  f"{hits} searches saved)")
+        print(f"  evicted:     {cache.get('evicted', 0)}")
+        print()
+
+    budget = agg.get("budget") or {}
+    if budget.get("count"):
+        n = budget["count"]
+        print("--- latency budget (ms spent per prompt) ---")
+        for (lo, hi), count in zip(decision_log.BUDGET_BINS, budget["hist"]):
+            label = f"{lo}-{hi}" if hi != float("inf") else f"{lo}+"
+            print(f"  {label:9s} {count:5d}  {'#' * min(40, count)}")
+        print(f"  avg / max:   {budget['sum_ms'] / n:.0f} / {budget['max_ms']:.0f}")
+        print(f"  exhausted:   {budget['exhausted']}  ({100.0 * budget['exhausted'] / n:.1f}%)")
+        print()
 
     print("--- hook version distribution ---")
     for version, count in hook_versions.most_common():
@@ -186,6 +187,15 @@ def main() -> None:
         pct = 100.0 * probe_errors / total
         print(f"  [WARN] {probe_errors} probe errors ({pct:.1f}%). check the ragtools service logs.")
 
+    if lookups.get("expired", 0) > hits and lookups.get("expired", 0) >= 10:
+        print("  [INFO] the probe cache expires more verdicts than it serves. if prompts")
+        print("    are often re-asked after a pause, raise RAG_PLUGIN_HOOK_PROBE_CACHE_TTL.")
+
+    if budget.get("count") and budget["exhausted"] / budget["count"] > 0.05:
+        print("  [WARN] the latency budget ran out on more than 5% of prompts. if the")
+        print("    service is just slow, raise RAG_PLUGIN_HOOK_BUDGET_MS; if it is down,")
+        print("    the hook is already skipping it as intended.")
+
     service_down = actions.get("silent-pass:service-down", 0)
     if service_down > 0:
         pct = 100.0 * service_down / total
@@ -197,8 +207,8 @@ def main() -> None:
     print("=" * 64)
     print("to disable observability logging:")
     print("  /config hook-observability off")
-    print("to clear the log:")
-    print(f"  rm {LOG_PATH}")
+    print("to clear the log (active segment, rotated segments and aggregate):")
+    print(f"  rm {os.path.splitext(LOG_PATH)[0]}.*")
     print("(the plugin never deletes this file for you — user owns it)")
 
 
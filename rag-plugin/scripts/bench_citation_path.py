@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""Citation-verification benchmark: ``normalize`` per citation vs. ``normalize_batch``.
+
+Builds P throwaway projects of nested directories and Markdown files, then a
+result set of N citations spread across them — doubled-segment paths, already
+correct ones, line-span suffixes, missing files, and foreign-project paths —
+and verifies it three ways:
+
+    single   ``normalize`` once per citation: one root expansion and one
+             ``stat`` each
+    cold     ``normalize_batch`` with no listings cached yet
+    warm     ``normalize_batch`` again — every directory unchanged, so one
+             ``stat`` per directory and no listing
+
+    python scripts/bench_citation_path.py                  # 10k citations, 8 projects
+    python scripts/bench_citation_path.py -n 50000 --projects 20 --runs 5
+
+Every mode must return the same citations; the script exits 1 otherwise. The
+directories' mtimes are set into the past so the listings are kept between
+batches, as they would be for any tree not being written that second.
+
+Stdlib only.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import citation_path as cp  # noqa: E402
+
+
+def build_projects(base: Path, projects: int, seed: int = 1) -> dict[str, list[str]]:
+    """Create ``projects`` trees under ``base``; return id -> relative file paths."""
+    rng = random.Random(seed)
+    files: dict[str, list[str]] = {}
+    past = time.time() - 3600
+    for p in range(projects):
+        pid = f"proj{p}"
+        rels = []
+        for d in range(rng.randint(6, 14)):
+            rel_dir = Path("docs", f"area{d}", *(["deep"] if d % 3 == 0 else []))
+            (base / pid / rel_dir).mkdir(parents=True, exist_ok=True)
+            for f in range(rng.randint(10, 40)):
+                rel = rel_dir / f"page{f}.md"
+                (base / pid / rel).write_text("x", encoding="utf-8")
+                rels.append(rel.as_posix())
+        for dirpath, _, _ in os.walk(base / pid):
+            os.utime(dirpath, (past, past))
+        files[pid] = rels
+    return files
+
+
+def citations(files: dict[str, list[str]], n: int, seed: int = 1) -> list[tuple[str, str]]:
+    rng = random.Random(seed)
+    pids = sorted(files)
+    out = []
+    for _ in range(n):
+        pid = rng.choice(pids)
+        rel = rng.choice(files[pid])
+        roll = rng.random()
+        if roll < 0.55:
+            cited = f"{pid}/{pid}/{rel}"
+        elif roll < 0.80:
+            cited = f"{pid}/{rel}"
+        elif roll < 0.90:
+            cited = f"{pid}/{pid}/{rel}:L{rng.randint(1, 400)}-{rng.randint(401, 900)}"
+        elif roll < 0.97:
+            cited = f"{pid}/{pid}/{rel.replace('page', 'ghost')}"
+        else:
+            cited = f"{rng.choice(pids)}/{rel}"
+        out.append((cited, pid))
+    return out
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=(__doc__ or "").split("\n")[0])
+    ap.add_argument("-n", type=int, default=10_000, help="citations (default: 10000)")
+    ap.add_argument("--projects", type=int, default=8)
+    ap.add_argument("--runs", type=int, default=3)
+    ap.add_argument("--seed", type=int, default=1)
+    args = ap.parse_args(argv)
+
+    base = Path(tempfile.mkdtemp(prefix="rag-bench-cite-"))
+    try:
+        files = build_projects(base, args.projects, args.seed)
+        roots = {pid: str(base / pid) for pid in files}
+        batch = citations(files, args.n, args.seed)
+        modes = {
+            "single": lambda: [cp.normalize(c, pid, roots.get(pid)) for c, pid in batch],
+            "cold": lambda: (cp._LISTINGS.clear(), cp.normalize_batch(batch, roots))[1],
+            "warm": lambda: cp.normalize_batch(batch, roots),
+        }
+        times: dict[str, list[float]] = {m: [] for m in modes}
+        answers: dict[str, list] = {}
+        for _ in range(args.runs):
+            for mode, fn in modes.items():
+                t0 = time.perf_counter()
+                got = fn()
+                times[mode].append(time.perf_counter() - t0)
+                answers[mode] = got
+    finally:
+        shutil.rmtree(base, ignore_errors=True)
+
+    same = answers["single"] == answers["cold"] == answers["warm"]
+    trusted = sum(c.trusted for c in answers["single"])
+    print(f"citation verification — {args.n:,} citations, {args.projects} projects, "
+          f"{trusted:,} trusted, median of {args.runs}")
+    print(f"  {'mode':8s} {'ms':>9s} {'speedup':>8s}")
+    for mode, samples in times.items():
+        ms = statistics.median(samples) * 1000
+        base_ms = statistics.median(times["single"]) * 1000
+        print(f"  {mode:8s} {ms:9.1f} {base_ms / max(ms, 1e-9):7.2f}x")
+    print(f"  identical: {'yes' if same else 'NO'}")
+    return 0 if same else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""Hook wall-time benchmark: cold launcher vs. the resident daemon.
+
+Runs the REAL ``hooks.json`` bootstrap for a hook target N times, exactly as the
+host runs it (a fresh interpreter per call), first with the default in-process
+path and then with ``RAG_PLUGIN_HOOK_DAEMON=1`` against a warm
+``hooks/hook_daemon.py``. Reports p50 / p99 / mean wall time per mode.
+
+    python scripts/bench_hook_latency.py                  # 50 runs, context-inject
+    python scripts/bench_hook_latency.py -n 200 --target lock-conflict
+
+State is written under a throwaway home directory so a benchmark never touches
+the real hook log or scope cache. Whether a ragtools service answers is up to
+the machine: with none running this measures the hook's own overhead, which is
+the part the daemon removes.
+
+Stdlib only.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PLUGIN_ROOT = Path(__file__).resolve().parent.parent
+HOOKS_JSON = PLUGIN_ROOT / "hooks" / "hooks.json"
+DAEMON = PLUGIN_ROOT / "hooks" / "hook_daemon.py"
+
+_PAYLOADS = {
+    "context-inject": {"hook_event_name": "UserPromptSubmit",
+                       "user_prompt": "What is our deployment process for the service?"},
+    "lock-conflict": {"hook_event_name": "PreToolUse", "tool_name": "Bash",
+                      "tool_input": {"command": "rag index ."}},
+}
+
+
+def _bootstrap_argv(target: str) -> list[str]:
+    """``[python, -c, <payload>, <target>, <launcher>]`` from the shipped hooks.json."""
+    data = json.loads(HOOKS_JSON.read_text(encoding="utf-8"))
+    for groups in data["hooks"].values():
+        for group in groups:
+            for hook in group["hooks"]:
+                cmd = hook["command"]
+                if f" {target} " in cmd:
+                    payload = cmd.split(' -c "', 1)[1].split('"', 1)[0]
+                    return [sys.executable, "-c", payload, target,
+                            str(PLUGIN_ROOT / "hooks" / "hook_launcher.py")]
+    raise SystemExit(f"no hook command for {target!r}")
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    k = max(0, min(len(ordered) - 1, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[k]
+
+
+def _time_runs(argv, env, stdin: str, runs: int) -> list[float]:
+    out = []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        subprocess.run(argv, input=stdin, capture_output=True, text=True,
+                       env=env, timeout=60)
+        out.append((time.perf_counter() - t0) * 1000)
+    return out
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=(__doc__ or "").split("\n")[0])
+    ap.add_argument("-n", "--runs", type=int, default=50)
+    ap.add_argument("--target", default="context-inject", choices=sorted(_PAYLOADS))
+    ap.add_argument("--warmup", type=int, default=3)
+    args = ap.parse_args(argv)
+
+    home = tempfile.mkdtemp(prefix="rag-bench-")
+    env = dict(os.environ)
+    env.update(HOME=home, USERPROFILE=home, CLAUDE_PLUGIN_ROOT=str(PLUGIN_ROOT))
+    env.pop("RAG_PLUGIN_HOOK_DAEMON", None)
+    argv_ = _bootstrap_argv(args.target)
+    stdin = json.dumps(_PAYLOADS[args.target])
+    daemon = None
+    try:
+        _time_runs(argv_, env, stdin, args.warmup)
+        cold = _time_runs(argv_, env, stdin, args.runs)
+
+        daemon = subprocess.Popen([sys.executable, str(DAEMON), "serve"], env=env,
+                                  stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        address = Path(home) / ".claude" / "rag-plugin" / "run" / "hook-daemon.json"
+        deadline = time.monotonic() + 10
+        while not address.is_file() and time.monotonic() < deadline:
+            time.sleep(0.02)
+        warm_env = dict(env, RAG_PLUGIN_HOOK_DAEMON="1")
+        _time_runs(argv_, warm_env, stdin, args.warmup)
+        warm = _time_runs(argv_, warm_env, stdin, args.runs)
+    finally:
+        if daemon is not None:
+            subprocess.run([sys.executable, str(DAEMON), "stop"], env=env,
+                           capture_output=True, timeout=30)
+            try:
+                daemon.wait(10)
+            except subprocess.TimeoutExpired:
+                daemon.kill()
+        shutil.rmtree(home, ignore_errors=True)
+
+    print(f"hook wall time — target={args.target}, runs={args.runs} (ms)")
+    print(f"  {'mode':6s} {'p50':>8s} {'p99':>8s} {'mean':>8s}")
+    for label, samples in (("cold", cold), ("warm", warm)):
+        print(f"  {label:6s} {_percentile(samples, 50):8.1f} "
+              f"{_percentile(samples, 99):8.1f} {statistics.mean(samples):8.1f}")
+    print(f"  p50 speedup: {_percentile(cold, 50) / max(_percentile(warm, 50), 1e-9):.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+"""Markdown-analysis benchmark: per-check body walks vs. the one-sweep tokenizer.
+
+Generates a synthetic reference page (default 1 MB, the analyzer's own size
+limit) and analyses it twice: once with the original engine, in which
+``_build_sections``, ``_iter_code_blocks``, ``_iter_tables`` and the GL checks
+each walked the body again, and once through ``md_analyzer._analyze``, where
+every check reads one ``_tokenize`` sweep:
+
+    python scripts/bench_md_analyzer.py              # 1 MB, 5 runs
+    python scripts/bench_md_analyzer.py --kb 256 --runs 20 --seed 7
+
+Both findings lists must be identical; the script exits 1 otherwise. The page
+mixes every construct the checks look at — nested and skipped heading levels,
+vague and duplicate headings, pseudo-headings, ``` and ~~~ fences (some
+oversized, some without an intro), tables with and without a separator row,
+tables running into fences, and knowledge-carrying frontmatter — so the
+comparison covers the edge cases, not only the fast path.
+
+Stdlib only.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import re
+import statistics
+import sys
+import time
+from dataclasses import asdict
+from pathlib import Path
+from typing import Iterator, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import md_analyzer as mda  # noqa: E402
+from md_analyzer import (  # noqa: E402
+    CODE_FENCE_RE, HEADING_RE, PSEUDO_HEADING_RE, TABLE_ROW_RE, TABLE_SEP_RE,
+    Finding, FileResult, Section,
+)
+
+_WORDS = ("chunk embedding retrieval index project service port config overlap "
+          "vector query latency token heading section table fence release path").split()
+_HEADINGS = ["Configuring the chunk overlap", "Usage", "Overview", "Notes", "Restarting the service",
+             "Troubleshooting port conflicts", "Summary", "Index layout", "Details"]
+
+
+def _sentence(rng: random.Random, n: int) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(n)).capitalize() + "."
+
+
+def _block(rng: random.Random) -> list[str]:
+    roll = rng.random()
+    if roll < 0.30:
+        return [" ".join(_sentence(rng, rng.randint(6, 18)) for _ in range(rng.randint(1, 12))), ""]
+    if roll < 0.45:
+        level = rng.choice((1, 2, 2, 3, 3, 4, 5))
+        return [f"{'#' * level} {rng.choice(_HEADINGS)}", ""] if rng.random() < 0.8 \
+            else [f"{'#' * level} {rng.choice(_HEADINGS)}"]
+    if roll < 0.52:
+        return ["", f"**{rng.choice(_HEADINGS)}**", "" if rng.random() < 0.8 else "Glued text."]
+    if roll < 0.67:
+        fence = rng.choice(("```", "~~~", "```bash"))
+        intro = [_sentence(rng, 6)] if rng.random() < 0.6 else []
+        inner = [f"run --{rng.choice(_WORDS)} {i}  # **{rng.choice(_WORDS)}**" if i % 7 else "# not a heading"
+                 for i in range(rng.choice((3, 10, 61, 80)))]
+        return intro + [fence] + inner + [fence[:3], ""]
+    if roll < 0.80:
+        rows = rng.choice((2, 5, 16, 30))
+        table = ["| key | value |"]
+        if rng.random() < 0.85:
+            table.append("|-----|:-----:|")
+        table += [f"| {rng.choice(_WORDS)} | {rng.randint(0, 999)} |" for _ in range(rows)]
+        if rng.random() < 0.2:
+            table += ["```", "glued to a table", "```"]
+        return table + [""]
+    if roll < 0.90:
+        return [f"- {_sentence(rng, rng.randint(3, 9))}" for _ in range(rng.randint(2, 8))] + [""]
+    return ["", "   ", "**not alone**", "text"]
+
+
+def synthetic_document(size: int, seed: int = 1) -> str:
+    """A Markdown page of about `size` bytes exercising every GL check."""
+    rng = random.Random(seed)
+    lines = ["---", "title: Synthetic reference", "tags: bench, synthetic", "---",
+             "Stray intro before any heading.", ""]
+    total = sum(len(s) + 1 for s in lines)
+    while total < size:
+        for line in _block(rng):
+            lines.append(line)
+            total += len(line) + 1
+    return "\n".join(lines) + "\n"
+
+
+# -- the original implementations, kept verbatim as the reference -------------
+
+WORD_RE = re.compile(r"\b\w+\b")
+
+
+def legacy_build_sections(body: list[str], body_offset: int) -> list[Section]:
+    """Walk body lines and build a section list with word counts."""
+    sections: list[Section] = []
+    in_fence = False
+    current: Optional[tuple[int, int, str]] = None  # (start_line, level, heading_text)
+    for idx, line in enumerate(body):
+        if CODE_FENCE_RE.match(line):
+            in_fence = not in_fence
+            continue
+        if in_fence:
+            continue
+        m = HEADING_RE.match(line)
+        if m:
+            if current is not None:
+                start, lvl, head = current
+                section_lines = body[start + 1: idx]
+                words = legacy_count_words_outside_fences(section_lines)
+                sections.append(Section(
+                    start=start + body_offset,
+                    end=idx + body_offset,
+                    level=lvl,
+                    heading=head,
+                    word_count=words,
+                    has_children=False,
+                ))
+            level = len(m.group(1))
+            heading_text = m.group(2).strip()
+            current = (idx, level, heading_text)
+    if current is not None:
+        start, lvl, head = current
+        section_lines = body[start + 1:]
+        words = legacy_count_words_outside_fences(section_lines)
+        sections.append(Section(
+            start=start + body_offset,
+            end=len(body) + body_offset,
+            level=lvl,
+            heading=head,
+            word_count=words,
+            has_children=False,
+        ))
+    # Second pass: mark has_children
+    for i, sec in enumerate(sections):
+        for j in range(i + 1, len(sections)):
+            if sections[j].level > sec.level:
+                sec.has_children = True
+                break
+            if sections[j].level <= sec.level:
+                break
+    return sections
+
+
+def legacy_count_words_outside_fences(lines: list[str]) -> int:
+    total = 0
+    in_fence = False
+    for line in lines:
+        if CODE_FENCE_RE.match(line):
+            in_fence = not in_fence
+            continue
+        if in_fence:
+            continue
+        total += len(WORD_RE.findall(line))
+    return total
+
+
+def legacy_iter_code_blocks(lines: list[str], body_offset: int) -> Iterator[tuple[int, int, int]]:
+    """Yield (start_line_0based, end_line_0based_exclusive, body_line_count) for each fenced code block."""
+    in_fence = False
+    start = 0
+    for idx, line in enumerate(lines):
+        if CODE_FENCE_RE.match(line):
+            if not in_fence:
+                start = idx
+                in_fence = True
+            else:
+                yield (start + body_offset, idx + 1 + body_offset, idx - start - 1)
+                in_fence = False
+
+
+def legacy_iter_tables(lines: list[str], body_offset: int) -> Iterator[tuple[int, int, int]]:
+    """Yield (start_line, end_line_exclusive, row_count) for each table.
+
+    A table is a sequence of contiguous `|`-prefixed lines with a
+    `|---|---|` separator row within the first 2 lines.
+    """
+    in_fence = False
+    i = 0
+    while i < len(lines):
+        if CODE_FENCE_RE.match(lines[i]):
+            in_fence = not in_fence
+            i += 1
+            continue
+        if in_fence:
+            i += 1
+            continue
+        if TABLE_ROW_RE.match(lines[i]):
+            start = i
+            # find end of the contiguous table
+            while i < len(lines) and TABLE_ROW_RE.match(lines[i]) and not CODE_FENCE_RE.match(lines[i]):
+                i += 1
+            block = lines[start:i]
+            has_sep = any(TABLE_SEP_RE.match(ln) for ln in block[:3])
+            if has_sep and len(block) >= 2:
+                yield (start + body_offset, i + body_offset, len(block) - 1)  # rows minus header+sep
+            continue
+        i += 1
+
+
+def legacy_check_gl_01(path: Path, body_offset: int, body: list[str], sections: list[Section]) -> list[Finding]:
+    """Content before first heading."""
+    if not sections:
+        if any(line.strip() for line in body):
+            return [Finding(str(path), 1, "GL-01", "HIGH",
+                            "File has content but no heading — chunks will be anchor-less.",
+                            "Add a top-level `# Title` as the first non-frontmatter line.")]
+        return []
+    first_heading_line = sections[0].start - body_offset
+    for idx in range(first_heading_line):
+        if body[idx].strip():
+            return [Finding(str(path), 1 + body_offset + 1, "GL-01", "HIGH",
+                            "Content appears before the first heading — produces empty-hierarchy chunks.",
+                            "Move the intro under a `# Title` heading, or add a title as the first line after frontmatter.")]
+    return []
+
+
+def legacy_check_gl_05(path: Path, body_offset: int, body: list[str]) -> list[Finding]:
+    """Pseudo-heading (bold line used as section title)."""
+    out: list[Finding] = []
+    in_fence = False
+    for idx, line in enumerate(body):
+        if CODE_FENCE_RE.match(line):
+            in_fence = not in_fence
+            continue
+        if in_fence:
+            continue
+        if PSEUDO_HEADING_RE.match(line.strip()):
+            # confirm surrounded by blank lines
+            prev_blank = idx == 0 or not body[idx - 1].strip()
+            next_blank = idx == len(body) - 1 or not body[idx + 1].strip()
+            if prev_blank and next_blank:
+                out.append(Finding(str(path), idx + body_offset + 1, "GL-05", "MEDIUM",
+                                   f"Pseudo-heading: '{line.strip()}' is bold-as-heading, not a real Markdown heading. Doesn't create a chunk boundary.",
+                                   "SAFE-AUTO-FIX: converted to `## <text>` (or `### <text>` if nested under an existing `##`)."))
+    return out
+
+
+def legacy_check_gl_06(path: Path, body: list[str], body_offset: int) -> list[Finding]:
+    """Code block > 60 lines."""
+    out: list[Finding] = []
+    for start, end, inner in legacy_iter_code_blocks(body, body_offset):
+        if inner > 60:
+            out.append(Finding(str(path), start + 1, "GL-06", "MEDIUM",
+                               f"Code block is {inner} lines (>60). When oversize, the sentence splitter mangles it; resulting chunks have no natural-language anchor.",
+                               f"Break into labelled steps with `### Step 1 — install`, `### Step 2 — configure` headings between sub-blocks."))
+    return out
+
+
+def legacy_check_gl_07(path: Path, body: list[str], body_offset: int) -> list[Finding]:
+    """Table > 15 rows."""
+    out: list[Finding] = []
+    for start, end, rows in legacy_iter_tables(body, body_offset):
+        if rows > 15:
+            out.append(Finding(str(path), start + 1, "GL-07", "MEDIUM",
+                               f"Table has {rows} data rows (>15). Splitter treats the table as a single paragraph; rows get stranded across chunk boundaries.",
+                               "Split into multiple tables by category, or move to a dedicated `reference/` file with one table per `##` heading."))
+    return out
+
+
+def legacy_check_gl_09(path: Path, body: list[str], body_offset: int) -> list[Finding]:
+    """Code block without prose intro within 2 lines before the fence."""
+    out: list[Finding] = []
+    for start, end, inner in legacy_iter_code_blocks(body, body_offset):
+        local_start = start - body_offset
+        # check 2 lines before the fence
+        prose_found = False
+        for j in (local_start - 1, local_start - 2):
+            if j < 0:
+                break
+            prev = body[j].strip()
+            if not prev:
+                continue
+            # skip heading lines (those are fine but not prose)
+            if HEADING_RE.match(body[j]):
+                break
+            # skip other code fences
+            if CODE_FENCE_RE.match(body[j]):
+                break
+            prose_found = True
+            break
+        if not prose_found:
+            out.append(Finding(str(path), start + 1, "GL-09", "LOW",
+                               "Code block has no prose intro sentence in the two lines before the fence. The embedding loses the semantic signal the code alone can't carry.",
+                               "Add an introduction sentence like 'The following command stops the service:' before the fence."))
+    return out
+
+
+def legacy_analyze(path: Path, doc) -> FileResult:
+    result = FileResult(path=str(path))
+    body, body_offset = doc.body, doc.body_offset
+    sections = legacy_build_sections(body, body_offset)
+    result.findings.extend(legacy_check_gl_01(path, body_offset, body, sections))
+    result.findings.extend(mda._check_gl_02(path, sections))
+    result.findings.extend(mda._check_gl_03(path, sections))
+    result.findings.extend(mda._check_gl_04(path, sections))
+    result.findings.extend(legacy_check_gl_05(path, body_offset, body))
+    result.findings.extend(legacy_check_gl_06(path, body, body_offset))
+    result.findings.extend(legacy_check_gl_07(path, body, body_offset))
+    result.findings.extend(mda._check_gl_08(path, doc.frontmatter))
+    result.findings.extend(legacy_check_gl_09(path, body, body_offset))
+    result.findings.extend(mda._check_gl_10(path, sections))
+    return result
+
+
+def _time(fn, doc, runs: int) -> tuple[float, list[dict]]:
+    samples, findings = [], []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        findings = [asdict(f) for f in fn(Path("synthetic.md"), doc).findings]
+        samples.append(time.perf_counter() - t0)
+    return statistics.median(samples), findings
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=(__doc__ or "").split("\n")[0])
+    ap.add_argument("--kb", type=int, default=mda.MAX_FILE_BYTES // 1024,
+                    help="document size in KiB (default: 1024)")
+    ap.add_argument("--runs", type=int, default=5)
+    ap.add_argument("--seed", type=int, default=1)
+    args = ap.parse_args(argv)
+
+    doc = mda._parse(synthetic_document(args.kb * 1024, args.seed))
+    t_old, old = _time(legacy_analyze, doc, args.runs)
+    t_new, new = _time(mda._analyze, doc, args.runs)
+    same = old == new
+    print(f"markdown analysis — {len(doc.raw) / 1024:.0f} KiB, {len(doc.lines):,} lines, "
+          f"{len(new)} findings, median of {args.runs}")
+    print(f"  {'legacy s':>9s} {'sweep s':>9s} {'speedup':>8s}  identical")
+    print(f"  {t_old:9.3f} {t_new:9.3f} {t_old / max(t_new, 1e-9):7.2f}x  {'yes' if same else 'NO'}")
+    return 0 if same else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
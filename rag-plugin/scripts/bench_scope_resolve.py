@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""Warm-path benchmark for ``context_inject.resolve_scope``.
+
+With the scope cache already holding this workspace's decision, the hook's
+remaining per-prompt cost is finding the workspace key. Before the workspace
+memo that meant a ``.git`` probe on every ancestor and, outside a repository,
+a ``git rev-parse`` subprocess. This times ``resolve_scope`` N times per case,
+with the memo (``detect_git_root`` as shipped) and without it (the bare
+ancestor walk), and reports p50 / p99 / mean:
+
+    python scripts/bench_scope_resolve.py              # 200 calls per case
+    python scripts/bench_scope_resolve.py -n 1000
+
+Cases: a subdirectory of a git repository, and a plain directory outside any
+repository — the one that used to spawn ``git``. Everything runs under a
+throwaway home directory; no ragtools service is needed because every call is
+a scope-cache hit.
+
+Stdlib only.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import os
+import shutil
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+PLUGIN_ROOT = Path(__file__).resolve().parent.parent
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def _time(fn, arg, n: int) -> list[float]:
+    out = []
+    for _ in range(n):
+        t0 = time.perf_counter()
+        fn(arg)
+        out.append((time.perf_counter() - t0) * 1000)
+    return out
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=(__doc__ or "").split("\n")[0])
+    ap.add_argument("-n", type=int, default=200, help="calls per case (default: 200)")
+    args = ap.parse_args(argv)
+
+    home = tempfile.mkdtemp(prefix="rag-bench-scope-")
+    os.environ["HOME"] = os.environ["USERPROFILE"] = home
+    os.environ.pop("RAG_PLUGIN_FOCUS_STATE_FILE", None)
+    try:
+        spec = importlib.util.spec_from_file_location(
+            "context_inject_bench", PLUGIN_ROOT / "hooks" / "context_inject.py")
+        ci = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(ci)
+        scope = ci._load("rp_scope_resolve", "scope_resolve.py")
+        if scope is None:
+            print("scope_resolve.py failed to load")
+            return 1
+
+        work = Path(tempfile.mkdtemp(prefix="rag-bench-ws-")).resolve()
+        repo_sub = work / "repo" / "src" / "pkg"
+        repo_sub.mkdir(parents=True)
+        (work / "repo" / ".git").mkdir()
+        plain = work / "plain" / "notes"
+        plain.mkdir(parents=True)
+        cases = [("git subdirectory", repo_sub), ("outside any repo", plain)]
+
+        decision = scope.ScopeDecision(
+            project=scope.ProjectMatch("bench", str(work), scope.EXACT, 1000), source="resolved")
+        for _, cwd in cases:
+            scope.write_cache(scope.resolve_workspace_key(cwd), decision)
+
+        memoised = scope.detect_git_root
+        print(f"resolve_scope warm path — {args.n} calls per case (ms)")
+        print(f"  {'case':18s} {'mode':8s} {'p50':>8s} {'p99':>8s} {'mean':>8s}")
+        for label, cwd in cases:
+            assert ci.resolve_scope(str(cwd)).source == "cache"
+            for mode in ("walk", "memo"):
+                scope.detect_git_root = (memoised if mode == "memo"
+                                         else lambda p: scope._find_git_root(Path(p).resolve()))
+                scope.resolve_workspace_key = (
+                    (lambda c: scope._workspace(c)[1]) if mode == "memo"
+                    else (lambda c: scope.norm(str(scope.detect_git_root(c) or c))))
+                samples = _time(ci.resolve_scope, str(cwd), args.n)
+                print(f"  {label:18s} {mode:8s} {_percentile(samples, 50):8.3f} "
+                      f"{_percentile(samples, 99):8.3f} {statistics.fmean(samples):8.3f}")
+        shutil.rmtree(work, ignore_errors=True)
+        return 0
+    finally:
+        shutil.rmtree(home, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
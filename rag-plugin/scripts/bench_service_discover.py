@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""Service-discovery benchmark against N stub ragtools services.
+
+Starts N local HTTP stubs that answer ``/health``, ``/identity`` and
+``/api/projects/configured`` like ragtools, each after an injected delay, and
+times three ways of discovering them:
+
+    serial   the previous engine: /health, /identity, /projects one after
+             another, port after port
+    cold     ``service_discover.discover`` with an empty identity cache
+    warm     the same call again — one /health per service, cached identity
+
+    python scripts/bench_service_discover.py                 # 6 services, 40 ms
+    python scripts/bench_service_discover.py -n 12 --latency 0.1 --runs 5
+
+The stubs bind ephemeral loopback ports, which ``discover`` is pointed at as
+its scan range (``LIKELY_PORTS`` is emptied). The identity cache is written
+under a throwaway directory. The script exits 1 if any mode finds a different
+set of services.
+
+Stdlib only.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import shutil
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import service_discover as sd  # noqa: E402
+
+
+class StubServices:
+    """``with StubServices(n, latency) as ports:`` — N fake ragtools services.
+
+    ``hits`` counts requests per path across all stubs. ``bump(port)`` changes
+    one service's ``/health`` fingerprint, as a restart would. With
+    ``instance_ids=False`` ``/health`` carries only status, collection and
+    version, as ragtools' own does.
+    """
+
+    def __init__(self, n: int, latency: float = 0.0, instance_ids: bool = True):
+        self.n, self.latency, self.instance_ids = n, latency, instance_ids
+        self.servers: list[ThreadingHTTPServer] = []
+        self.hits: dict[str, int] = {}
+        self.instance: dict[int, int] = {}
+        self._lock = threading.Lock()
+
+    def _handler(self):
+        stubs = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):  # noqa: N802 - http.server API
+                with stubs._lock:
+                    stubs.hits[self.path] = stubs.hits.get(self.path, 0) + 1
+                time.sleep(stubs.latency)
+                port = self.server.server_address[1]
+                health = {"status": "ok", "version": "3.5.1",
+                          "collection": f"{port - 40000} collections (per_project)"}
+                if stubs.instance_ids:
+                    health["instance_id"] = stubs.instance.get(port, 0)
+                body = {
+                    "/health": health,
+                    "/identity": {"bound_port": port, "data_dir": f"/srv/ragtools-{port}",
+                                  "storage": {"target": f"/srv/ragtools-{port}/qdrant"}},
+                    "/api/projects/configured": {"projects": [
+                        {"id": f"p{port}", "path": f"/work/{port}"}]},
+                }.get(self.path)
+                raw = json.dumps(body or {"detail": "not found"}).encode("utf-8")
+                self.send_response(200 if body else 404)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(raw)))
+                self.end_headers()
+                self.wfile.write(raw)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    def bump(self, port: int) -> None:
+        self.instance[port] = self.instance.get(port, 0) + 1
+
+    def __enter__(self) -> list[int]:
+        for _ in range(self.n):
+            server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+            server.daemon_threads = True
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+            self.servers.append(server)
+        return [s.server_address[1] for s in self.servers]
+
+    def __exit__(self, *exc) -> None:
+        for server in self.servers:
+            server.shutdown()
+            server.server_close()
+
+
+def serial_discover(ports: list[int]) -> list[int]:
+    """The pre-concurrency engine: three sequential GETs per port."""
+    found = []
+    for port in sd.open_ports(ports):
+        base = f"http://127.0.0.1:{port}"
+        if not sd.is_ragtools_health(sd._get_json(f"{base}/health")):
+            continue
+        sd._get_json(f"{base}/identity")
+        sd._get_json(f"{base}/api/projects/configured")
+        found.append(port)
+    return found
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=(__doc__ or "").split("\n")[0])
+    ap.add_argument("-n", type=int, default=6, help="stub services (default: 6)")
+    ap.add_argument("--latency", type=float, default=0.04,
+                    help="seconds each stub waits per request (default: 0.04)")
+    ap.add_argument("--runs", type=int, default=3)
+    args = ap.parse_args(argv)
+
+    state = Path(tempfile.mkdtemp(prefix="rag-bench-discover-"))
+    sd.IDENTITY_CACHE_FILE = state / "service-identity.json"
+    sd.LIKELY_PORTS = ()
+    times: dict[str, list[float]] = {"serial": [], "cold": [], "warm": []}
+    answers: dict[str, set] = {}
+    try:
+        with StubServices(args.n, args.latency) as ports:
+            for _ in range(args.runs):
+                sd.IDENTITY_CACHE_FILE.unlink(missing_ok=True)
+                for mode in ("serial", "cold", "warm"):
+                    t0 = time.perf_counter()
+                    if mode == "serial":
+                        got = set(serial_discover(ports))
+                    else:
+                        got = {c.port for c in sd.discover(ports=ports).candidates}
+                    times[mode].append(time.perf_counter() - t0)
+                    answers.setdefault(mode, got)
+                    if got != answers[mode]:
+                        answers[mode] = set()
+    finally:
+        shutil.rmtree(state, ignore_errors=True)
+
+    print(f"service discovery — {args.n} stub services, {args.latency * 1000:.0f} ms per request, "
+          f"{args.runs} runs")
+    print(f"  {'mode':8s} {'median s':>9s} {'found':>6s}")
+    for mode, samples in times.items():
+        print(f"  {mode:8s} {statistics.median(samples):9.3f} {len(answers[mode]):6d}")
+    return 0 if answers["serial"] == answers["cold"] == answers["warm"] and \
+        len(answers["serial"]) == args.n else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -31,6 +31,15 @@ comparison."*
 A probe measures the running service. A version floor infers from a number. One
 of those can be wrong about the machine in front of you.
 
+**Probe once per service version.** The probes are independent and run
+concurrently. A report with no failed probe is kept in
+``state/capabilities.json`` under ``(service identity, ragtools version)`` for
+``SNAPSHOT_TTL_SECONDS``; :func:`report_for` answers from it, so a ``gate()``
+on the hot path costs no request. A new version is a new key and is probed
+afresh; ``refresh=True`` (``--refresh``) forces it. A report containing a
+failed probe is never stored — "could not determine" must not outlive the
+outage that caused it.
+
 **Unknown is not False.** ``Capability.state`` distinguishes ``present`` /
 ``absent`` / ``unknown``, and gating treats ``unknown`` as absent (fail closed)
 while *saying* which it was. "Could not determine" and "confirmed not present"
@@ -40,16 +49,22 @@ lead to different user actions.
 from __future__ import annotations
 
 import json
+import os
+import threading
+import time
 import urllib.error
 import urllib.parse
 import urllib.request
-from dataclasses import dataclass
-from typing import Callable, Optional
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Optional
 
 __all__ = [
     "Capability",
     "CapabilityReport",
     "probe_all",
+    "report_for",
     "parse_version",
     "meets_floor",
     "PRESENT",
@@ -69,6 +84,13 @@ REDACTION_FLOOR = (3, 0, 0)
 
 _TIMEOUT = 1.5
 
+SNAPSHOT_FILE = Path.home() / ".claude" / "rag-plugin" / "state" / "capabilities.json"
+#: Capabilities change with the ragtools version, which is part of the key; the
+#: TTL only bounds how long a same-version reconfiguration (say, a layout
+#: migration) can go unseen.
+SNAPSHOT_TTL_SECONDS = 6 * 3600
+_SNAPSHOT_MAX = 16
+
 
 @dataclass(frozen=True)
 class Capability:
@@ -184,10 +206,16 @@ def probe_scope_mandatory(base_url: str) -> Capability:
     if status == 200:
         return Capability("scope_mandatory", ABSENT, "probe",
                           "unscoped search succeeded — legacy behaviour")
-    return Capability("scope_mandatory", UNKNOWN, "probe",
+    return Capability("scope_mandatory", UNKNOWN, _how(status),
                       f"unexpected status {status}")
 
 
+def _how(status: int) -> str:
+    """A 5xx (a 503 while ragtools starts, say) says nothing about the
+    capability: it is a failed probe, and never stored in the snapshot."""
+    return "probe failed" if status >= 500 else "probe"
+
+
 def probe_dependencies(base_url: str) -> Capability:
     """Shared-dependency catalogue (ragtools 3.0.0+)."""
     status, _ = _request(f"{base_url}/api/dependencies")
@@ -199,7 +227,7 @@ def probe_dependencies(base_url: str) -> Capability:
     if status == 404:
         return Capability("dependencies", ABSENT, "probe",
                           "no /api/dependencies on this version")
-    return Capability("dependencies", UNKNOWN, "probe", f"unexpected status {status}")
+    return Capability("dependencies", UNKNOWN, _how(status), f"unexpected status {status}")
 
 
 def probe_per_project_layout(base_url: str) -> Capability:
@@ -274,32 +302,123 @@ def probe_index_redaction(version: Optional[tuple[int, int, int]]) -> Capability
 
 def probe_all(base_url: str, version_raw: str = "",
               sample_project: str = "") -> CapabilityReport:
-    """Run every probe. Never raises; a failed probe becomes ``unknown``."""
-    version = parse_version(version_raw)
-    if version is None:
-        _, health = _request(f"{base_url}/health")
-        if isinstance(health, dict):
-            version = parse_version(str(health.get("version") or ""))
-
+    """Run every probe, concurrently. Never raises; a failed probe becomes
+    ``unknown``. Capabilities are reported in the same order as ever."""
     checks: list[Callable[[], Capability]] = [
         lambda: probe_scope_mandatory(base_url),
         lambda: probe_dependencies(base_url),
         lambda: probe_per_project_layout(base_url),
-        lambda: probe_index_redaction(version),
     ]
     if sample_project:
         checks.append(lambda: probe_path_doubling(base_url, sample_project))
 
-    report = CapabilityReport(version=version)
-    for check in checks:
+    def run(check: Callable[[], Capability]) -> Capability:
         try:
-            cap = check()
+            return check()
         except Exception as exc:  # noqa: BLE001 — a probe must never break the caller
-            cap = Capability("unknown-probe", UNKNOWN, "probe failed", str(exc))
+            return Capability("unknown-probe", UNKNOWN, "probe failed", str(exc))
+
+    version = parse_version(version_raw)
+    with ThreadPoolExecutor(max_workers=len(checks) + 1,
+                            thread_name_prefix="rag-capprobe") as pool:
+        health = pool.submit(_request, f"{base_url}/health") if version is None else None
+        futures = [pool.submit(run, check) for check in checks]
+        if health is not None:
+            _, body = health.result()
+            if isinstance(body, dict):
+                version = parse_version(str(body.get("version") or ""))
+        probed = [f.result() for f in futures]
+
+    report = CapabilityReport(version=version)
+    # index_redaction keeps its place after the layout probe.
+    for cap in probed[:3] + [run(lambda: probe_index_redaction(version))] + probed[3:]:
         report.capabilities[cap.name] = cap
     return report
 
 
+# --------------------------------------------------------------------------- #
+# Snapshot                                                                     #
+# --------------------------------------------------------------------------- #
+
+
+def _snapshot_key(identity: str, version: Optional[tuple[int, int, int]]) -> str:
+    return f"{identity}|{'.'.join(map(str, version)) if version else 'unknown'}"
+
+
+def _load_snapshots() -> dict[str, Any]:
+    try:
+        blob = json.loads(SNAPSHOT_FILE.read_text(encoding="utf-8"))
+        entries = blob.get("reports") if isinstance(blob, dict) else None
+        return entries if isinstance(entries, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _report_from_dict(raw: dict[str, Any]) -> CapabilityReport:
+    version = raw.get("version")
+    return CapabilityReport(
+        version=tuple(version) if version else None,  # type: ignore[arg-type]
+        capabilities={name: Capability(**cap)
+                      for name, cap in (raw.get("capabilities") or {}).items()},
+    )
+
+
+def _store_snapshot(key: str, report: CapabilityReport, now: float) -> None:
+    try:
+        entries = _load_snapshots()
+        entries[key] = {"at": now, "report": {
+            "version": list(report.version) if report.version else None,
+            "capabilities": {n: asdict(c) for n, c in report.capabilities.items()}}}
+        if len(entries) > _SNAPSHOT_MAX:
+            newest = sorted(entries.items(), key=lambda kv: kv[1].get("at", 0), reverse=True)
+            entries = dict(newest[:_SNAPSHOT_MAX])
+        SNAPSHOT_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp = SNAPSHOT_FILE.with_name(
+            f"{SNAPSHOT_FILE.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_text(json.dumps({"schema": 1, "reports": entries}, indent=2),
+                       encoding="utf-8")
+        os.replace(tmp, SNAPSHOT_FILE)
+    except (OSError, ValueError, TypeError):
+        pass
+
+
+def report_for(base_url: str, identity: str = "", version_raw: str = "",
+               sample_project: str = "", refresh: bool = False,
+               now: Optional[float] = None) -> CapabilityReport:
+    """The capability report for a service, from the snapshot when possible.
+
+    ``identity`` names the service (``service_id`` or ``data_dir`` from
+    discovery); without it the base URL stands in. With ``version_raw`` known
+    a snapshot hit makes no request at all; without it, one ``/health``.
+    Never raises.
+    """
+    current = time.time() if now is None else now
+    version = parse_version(version_raw)
+    if version is None:
+        _, health = _request(f"{base_url}/health")
+        if isinstance(health, dict):
+            version = parse_version(str(health.get("version") or ""))
+            version_raw = str(health.get("version") or "")
+    key = _snapshot_key(identity or base_url, version)
+
+    if not refresh and version is not None:
+        entry = _load_snapshots().get(key)
+        try:
+            if (isinstance(entry, dict)
+                    and 0 <= current - float(entry.get("at", 0)) <= SNAPSHOT_TTL_SECONDS):
+                report = _report_from_dict(entry["report"])
+                if not sample_project or "path_doubling" in report.capabilities:
+                    return report
+        except (KeyError, TypeError, ValueError):
+            pass
+
+    report = probe_all(base_url, version_raw, sample_project)
+    if report.version is not None and all(
+            c.how != "probe failed" for c in report.capabilities.values()):
+        _store_snapshot(_snapshot_key(identity or base_url, report.version), report, current)
+    return report
+
+
 def gate(report: CapabilityReport, capability: str, action: str) -> Optional[str]:
     """``None`` when ``action`` may proceed, else the specific refusal text.
 
@@ -322,9 +441,11 @@ if __name__ == "__main__":  # pragma: no cover - manual smoke aid
     ap = argparse.ArgumentParser(description="Probe ragtools capabilities")
     ap.add_argument("--base-url", default="http://127.0.0.1:21420")
     ap.add_argument("--project", default="", help="a project with chunks, for the A-02 probe")
+    ap.add_argument("--refresh", action="store_true",
+                    help="probe even if a snapshot for this version exists")
     args = ap.parse_args()
 
-    rep = probe_all(args.base_url, sample_project=args.project)
+    rep = report_for(args.base_url, sample_project=args.project, refresh=args.refresh)
     print(rep.describe())
     print()
     blocked = gate(rep, "index_redaction", "set_project_mode")
@@ -42,16 +42,35 @@ Usage
     c.absolute   -> "/path/to/rag/docs/decisions.md"
     c.exists     -> True
     c.trusted    -> True     # safe to cite
+
+A whole result set goes through :func:`normalize_batch`, which resolves each
+project root once and verifies against cached directory listings — one
+``scandir`` per directory, revalidated by the directory's mtime — instead of
+one ``stat`` per citation::
+
+    from citation_path import normalize_batch
+
+    cs = normalize_batch([("rag/rag/docs/a.md", "rag"), ("odoo/odoo/odoo/x.py", "odoo")],
+                         roots={"rag": "/path/to/rag", "odoo": "/path/to/odoo"})
 """
 
 from __future__ import annotations
 
 import os
+import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Iterable, Mapping, Optional
+
+__all__ = ["Citation", "normalize", "normalize_batch", "to_native"]
 
-__all__ = ["Citation", "normalize", "to_native"]
+# Directory listings kept between batches: path -> (st_mtime_ns, file names).
+_LISTINGS: dict[str, tuple[int, frozenset[str]]] = {}
+_LISTINGS_MAX = 1024
+# A listing taken within this long of the directory's last change is used for
+# the batch at hand but not kept: a second change in the same mtime tick would
+# leave the stamp unchanged (coarse-timestamp filesystems tick in seconds).
+_RACY_SECONDS = 2.0
 
 
 @dataclass(frozen=True)
@@ -116,6 +135,85 @@ def normalize(
         result with a reason, because a citation helper that throws inside an
         answer is worse than one that says "unverified".
     """
+    return _normalize(cited, project_id, project_root,
+                      lambda root: Path(root).expanduser(), Path.is_file)
+
+
+def normalize_batch(
+    citations: Iterable[tuple[str, str]],
+    roots: Mapping[str, Optional[str]],
+) -> list[Citation]:
+    """Repair and verify a whole result set at once.
+
+    Args:
+        citations: ``(cited, project_id)`` pairs, in presentation order.
+        roots: project id -> absolute project root. A project missing here is
+            treated like ``normalize(..., project_root=None)``.
+
+    Returns:
+        One :class:`Citation` per input, in order, equal to what
+        :func:`normalize` returns for it. Each root is expanded once per call,
+        and a citation repeated in the set is resolved once.
+        Existence is read from directory listings: every directory is stat'ed
+        once per call and listed only when its mtime changed since the last
+        call. A name the listing lacks is confirmed with a ``stat`` of its
+        own, so case-insensitive filesystems and concurrent writers get the
+        same answer as the one-at-a-time path; only the common case — the
+        file is there — is served from the listing.
+    """
+    expanded: dict[str, Path] = {}
+    seen: dict[str, Optional[frozenset[str]]] = {}
+
+    def root_of(root: str) -> Path:
+        if root not in expanded:
+            expanded[root] = Path(root).expanduser()
+        return expanded[root]
+
+    def is_file(path: Path) -> bool:
+        names = _listing(str(path.parent), seen)
+        return (names is not None and path.name in names) or path.is_file()
+
+    done: dict[tuple[str, str], Citation] = {}
+    out = []
+    for cited, pid in citations:
+        key = (cited, pid)
+        if key not in done:  # several chunks of one file cite it alike
+            done[key] = _normalize(cited, pid, roots.get(pid), root_of, is_file)
+        out.append(done[key])
+    return out
+
+
+def _listing(directory: str, seen: dict[str, Optional[frozenset[str]]]) -> Optional[frozenset[str]]:
+    """Names of the regular files (symlinks followed) in ``directory``, or
+    None when it cannot be listed. ``seen`` memoises within one batch."""
+    if directory in seen:
+        return seen[directory]
+    names: Optional[frozenset[str]] = None
+    try:
+        st = os.stat(directory)
+        cached = _LISTINGS.get(directory)
+        if cached is not None and cached[0] == st.st_mtime_ns:
+            names = cached[1]
+        else:
+            with os.scandir(directory) as it:
+                names = frozenset(e.name for e in it if e.is_file())
+            if time.time() - st.st_mtime > _RACY_SECONDS:
+                if directory not in _LISTINGS and len(_LISTINGS) >= _LISTINGS_MAX:
+                    _LISTINGS.pop(next(iter(_LISTINGS)))
+                _LISTINGS[directory] = (st.st_mtime_ns, names)
+    except (OSError, ValueError):
+        names = None
+    seen[directory] = names
+    return names
+
+
+def _normalize(
+    cited: str,
+    project_id: str,
+    project_root: Optional[str],
+    root_of: Callable[[str], Path],
+    is_file: Callable[[Path], bool],
+) -> Citation:
     raw = (cited or "").strip()
     if not raw:
         return Citation(raw, "", None, False, None, "empty path")
@@ -153,8 +251,8 @@ def normalize(
                         "path resolved to the project root itself")
 
     try:
-        absolute = Path(project_root).expanduser().joinpath(*rel_segments)
-        exists = absolute.is_file()
+        absolute = root_of(project_root).joinpath(*rel_segments)
+        exists = is_file(absolute)
         return Citation(
             raw,
             stored + line_suffix,
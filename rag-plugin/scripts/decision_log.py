@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""Hook-decisions log: append, rotate, and a running aggregate (rag-plugin, D-017).
+
+Why
+---
+``context_inject.log_decision`` appended one JSONL record per prompt to
+``~/.claude/rag-plugin/hook-decisions.log`` forever, and both readers —
+``rag_report.inspect_hook_log`` and ``scripts/analyze_hook_decisions.py`` —
+re-read and ``json.loads``-ed the whole file to produce a handful of counts.
+A long-lived install had thousands of records and every report paid for all
+of them.
+
+Layout
+------
+::
+
+    hook-decisions.log                      active segment (JSONL, appended)
+    hook-decisions.20261017T091500Z.log.gz  rotated segments, gzipped
+    hook-decisions.stats.json               aggregate over everything above
+
+**Rotation.** After an append, the active segment is rotated when it exceeds
+``RAG_PLUGIN_HOOK_LOG_MAX_BYTES`` (default 5 MB) or its first record is older
+than ``RAG_PLUGIN_HOOK_LOG_MAX_AGE_DAYS`` (default 30). Rotated segments are
+never deleted — the log is the user's (D-017).
+
+**The aggregate is a cache of the log, not a second source of truth.** It
+records how far into the active segment it has folded (inode + byte offset of
+the last complete line). Every writer *catches up* from that offset to EOF
+rather than adding only its own record, so two hooks appending at once both
+arrive at the same aggregate, and a lost or stale sidecar costs one read of the
+missing bytes. A missing or unreadable sidecar is rebuilt from the segments.
+:func:`recompute` ignores it entirely.
+
+Stdlib only; imported by the ``UserPromptSubmit`` hook, so nothing here may
+raise into it — :func:`append` is wrapped by the caller.
+"""
+
+from __future__ import annotations
+
+import calendar
+import glob
+import json
+import os
+import threading
+import time
+from typing import Any, Optional
+
+__all__ = ["BUDGET_BINS", "SCORE_BINS", "append", "load", "recompute", "segments", "sidecar_path"]
+
+SCHEMA = 3  # 2: probe-cache counters; 3: latency budget
+MAX_BYTES = int(os.environ.get("RAG_PLUGIN_HOOK_LOG_MAX_BYTES", "") or 5_000_000)
+MAX_AGE_DAYS = float(os.environ.get("RAG_PLUGIN_HOOK_LOG_MAX_AGE_DAYS", "") or 30)
+
+#: Probe-score histogram buckets, ``lo <= score < hi``. The last one is
+#: closed at 1.0 (scores are cosine similarities).
+SCORE_BINS = [(0.0, 0.1), (0.1, 0.2), (0.2, 0.3), (0.3, 0.4), (0.4, 0.5),
+              (0.5, 0.6), (0.6, 0.7), (0.7, 0.8), (0.8, 0.9), (0.9, 1.0001)]
+
+#: Latency-budget histogram buckets in milliseconds spent, ``lo <= ms < hi``.
+BUDGET_BINS = [(0, 50), (50, 100), (100, 200), (200, 400), (400, 800),
+               (800, 1600), (1600, float("inf"))]
+
+
+# --- paths --------------------------------------------------------------------
+
+
+def sidecar_path(log_path: str) -> str:
+    return os.path.splitext(log_path)[0] + ".stats.json"
+
+
+def segments(log_path: str) -> list[str]:
+    """Rotated segments, oldest first (the timestamped names sort by age)."""
+    stem = os.path.splitext(log_path)[0]
+    found = glob.glob(glob.escape(stem) + ".*.log.gz") + glob.glob(glob.escape(stem) + ".*.log")
+    return sorted(found, key=lambda p: os.path.basename(p).replace(".log.gz", ".log"))
+
+
+# --- aggregate ----------------------------------------------------------------
+
+
+def _empty() -> dict[str, Any]:
+    return {
+        "schema": SCHEMA, "inode": None, "offset": 0, "segment_started": None,
+        "segments": 0, "total": 0, "malformed": 0,
+        "actions": {}, "prompt_length_sum": {}, "hook_versions": {},
+        "probe": {"count": 0, "sum": 0.0, "min": None, "max": None,
+                  "hist": [0] * len(SCORE_BINS)},
+        "probe_cache": {"lookups": {}, "evicted": 0},
+        "budget": {"count": 0, "exhausted": 0, "sum_ms": 0.0, "max_ms": 0.0,
+                   "hist": [0] * len(BUDGET_BINS)},
+        "first_ts": "", "last_ts": "",
+    }
+
+
+def _epoch(ts: Any) -> Optional[float]:
+    try:
+        return float(calendar.timegm(time.strptime(ts, "%Y-%m-%dT%H:%M:%SZ")))
+    except (TypeError, ValueError):
+        return None
+
+
+def _fold_line(agg: dict[str, Any], line: str) -> None:
+    line = line.strip()
+    if not line:
+        return
+    try:
+        rec = json.loads(line)
+    except json.JSONDecodeError:
+        rec = None
+    if not isinstance(rec, dict):
+        agg["malformed"] += 1
+        return
+    agg["total"] += 1
+    action = str(rec.get("action", "unknown"))
+    agg["actions"][action] = agg["actions"].get(action, 0) + 1
+    try:
+        plen = int(rec.get("prompt_length", 0))
+    except (TypeError, ValueError):
+        plen = 0
+    agg["prompt_length_sum"][action] = agg["prompt_length_sum"].get(action, 0) + plen
+    try:
+        score = float(rec.get("probe_top_score", 0.0))
+    except (TypeError, ValueError):
+        score = 0.0
+    # Only count a score when the probe actually ran.
+    if score > 0.0 or "probe" in action or action == "reminder-injected":
+        probe = agg["probe"]
+        probe["count"] += 1
+        probe["sum"] += score
+        probe["min"] = score if probe["min"] is None else min(probe["min"], score)
+        probe["max"] = score if probe["max"] is None else max(probe["max"], score)
+        for i, (lo, hi) in enumerate(SCORE_BINS):
+            if lo <= score < hi:
+                probe["hist"][i] += 1
+                break
+    status = rec.get("probe_cache")
+    if isinstance(status, str):
+        cache = agg["probe_cache"]
+        cache["lookups"][status] = cache["lookups"].get(status, 0) + 1
+        try:
+            cache["evicted"] += int(rec.get("probe_cache_evicted", 0))
+        except (TypeError, ValueError):
+            pass
+    try:
+        spent = float(rec["budget_spent_ms"])
+    except (KeyError, TypeError, ValueError):
+        spent = None
+    if spent is not None:
+        budget = agg["budget"]
+        budget["count"] += 1
+        budget["sum_ms"] += spent
+        budget["max_ms"] = max(budget["max_ms"], spent)
+        budget["exhausted"] += ("budget-exhausted" in action
+                                or rec.get("probe_error") == "budget-exhausted")
+        for i, (lo, hi) in enumerate(BUDGET_BINS):
+            if lo <= spent < hi:
+                budget["hist"][i] += 1
+                break
+    hv = str(rec.get("hook_version", "unknown"))
+    agg["hook_versions"][hv] = agg["hook_versions"].get(hv, 0) + 1
+    ts = rec.get("ts") or rec.get("timestamp")
+    if isinstance(ts, str):
+        agg["first_ts"] = agg["first_ts"] or ts
+        agg["last_ts"] = ts
+        if agg["segment_started"] is None:
+            agg["segment_started"] = _epoch(ts)
+
+
+def _fold_active(agg: dict[str, Any], log_path: str) -> None:
+    """Fold complete lines from ``agg['offset']`` to EOF of the active segment."""
+    with open(log_path, "rb") as f:
+        agg["inode"] = os.fstat(f.fileno()).st_ino
+        f.seek(agg["offset"])
+        for raw in f:
+            if not raw.endswith(b"\n"):
+                break  # a record still being written; fold it next time
+            agg["offset"] += len(raw)
+            _fold_line(agg, raw.decode("utf-8", errors="replace"))
+
+
+def _fold_segment(agg: dict[str, Any], path: str) -> None:
+    if path.endswith(".gz"):
+        import gzip
+
+        opener = gzip.open
+    else:
+        opener = open
+    with opener(path, "rt", encoding="utf-8", errors="replace") as f:
+        for line in f:
+            _fold_line(agg, line)
+    agg["segments"] += 1
+
+
+def recompute(log_path: str) -> dict[str, Any]:
+    """Aggregate every rotated segment plus the active one, ignoring the sidecar."""
+    agg = _empty()
+    for seg in segments(log_path):
+        try:
+            _fold_segment(agg, seg)
+        except (OSError, EOFError):
+            continue
+    agg["segment_started"] = None
+    if os.path.isfile(log_path):
+        _fold_active(agg, log_path)
+    return agg
+
+
+def _read_sidecar(log_path: str) -> Optional[dict[str, Any]]:
+    try:
+        with open(sidecar_path(log_path), encoding="utf-8") as f:
+            agg = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(agg, dict) or agg.get("schema") != SCHEMA:
+        return None
+    return agg
+
+
+def load(log_path: str, persist: bool = False) -> dict[str, Any]:
+    """The current aggregate: the sidecar caught up to EOF, or a full
+    :func:`recompute` when there is no usable sidecar. Read-only unless
+    ``persist``."""
+    agg = _read_sidecar(log_path)
+    try:
+        st = os.stat(log_path)
+    except OSError:
+        st = None
+    if agg is None:
+        agg = recompute(log_path)
+    elif st is not None:
+        if agg.get("inode") not in (None, st.st_ino) or agg.get("offset", 0) > st.st_size:
+            agg = recompute(log_path)  # the active segment was replaced behind us
+        elif agg["offset"] < st.st_size:
+            _fold_active(agg, log_path)
+    if persist:
+        _write_sidecar(log_path, agg)
+    return agg
+
+
+def _write_sidecar(log_path: str, agg: dict[str, Any]) -> None:
+    path = sidecar_path(log_path)
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(agg, f, separators=(",", ":"))
+    os.replace(tmp, path)
+
+
+# --- writing ------------------------------------------------------------------
+
+
+def _due(agg: dict[str, Any], max_bytes: int, max_age_days: float, now: float) -> bool:
+    if agg["offset"] >= max_bytes:
+        return True
+    started = agg.get("segment_started")
+    return started is not None and now - started >= max_age_days * 86400
+
+
+def _rotate(log_path: str, agg: dict[str, Any], now: float) -> None:
+    import gzip
+    import shutil
+
+    stem = os.path.splitext(log_path)[0]
+    stamp = time.strftime("%Y%m%dT%H%M%SZ", time.gmtime(now))
+    target, n = f"{stem}.{stamp}.log", 1
+    while os.path.exists(target) or os.path.exists(target + ".gz"):
+        n += 1
+        target = f"{stem}.{stamp}-{n}.log"
+    os.replace(log_path, target)
+    # A record appended between the last fold and the rename went to the
+    # renamed file; fold it before it leaves the active segment for good.
+    try:
+        _fold_active(agg, target)
+    except OSError:
+        pass
+    with open(target, "rb") as src, gzip.open(target + ".gz", "wb") as dst:
+        shutil.copyfileobj(src, dst)
+    os.remove(target)
+    agg.update(inode=None, offset=0, segment_started=None, segments=agg["segments"] + 1)
+
+
+def append(log_path: str, entry: dict[str, Any], max_bytes: Optional[int] = None,
+           max_age_days: Optional[float] = None) -> None:
+    """Append one record, bring the aggregate up to date, rotate if due."""
+    os.makedirs(os.path.dirname(log_path) or ".", exist_ok=True)
+    with open(log_path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+    agg = load(log_path)
+    now = time.time()
+    if _due(agg, MAX_BYTES if max_bytes is None else max_bytes,
+            MAX_AGE_DAYS if max_age_days is None else max_age_days, now):
+        _rotate(log_path, agg, now)
+    _write_sidecar(log_path, agg)
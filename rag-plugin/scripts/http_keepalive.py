@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""Keep-alive HTTP client for the loopback ragtools service (rag-plugin).
+
+Why
+---
+``urllib.request.urlopen`` opens a new TCP connection for every request and
+closes it afterwards. A qualifying prompt makes up to three calls to the same
+``127.0.0.1:21420`` (``/health``, ``/api/projects/configured``,
+``/api/search``), so the hook paid connection setup three times inside its
+1.5 s search budget — and a resident hook daemon paid it again on every prompt.
+
+This module keeps one idle ``http.client`` connection per ``host:port`` and
+hands it to the next request. It is deliberately small:
+
+* **GET only, bodies read in full.** A connection goes back to the pool only
+  after its response is drained and the server did not ask to close it.
+* **Per-request timeouts.** The caller's timeout is applied to the socket on
+  every request, so ``HEALTH_TIMEOUT`` and ``SEARCH_TIMEOUT`` keep their
+  meaning on a reused connection.
+* **Idle connections expire before the server's do.** uvicorn (which serves
+  ragtools) drops keep-alive connections after 5 s idle; ours are discarded
+  after ``IDLE_SECONDS``. A reused socket the server closed anyway is detected
+  before sending, and a request that still fails on a *reused* connection is
+  retried once on a fresh one. A fresh connection is never retried.
+* **Thread-safe.** A connection is checked out for the duration of a request,
+  so concurrent callers never share a socket.
+
+Errors follow the socket layer: network failures raise ``OSError`` (including
+``ConnectionRefusedError`` and ``TimeoutError``); a protocol failure - a bad
+status line, a peer that hangs up mid-response - raises ``ConnectionError``,
+which is an ``OSError`` too. Non-2xx statuses are *returned*, not raised.
+
+Load it with a plain ``import http_keepalive`` once ``scripts/`` is on
+``sys.path`` (``scope_resolve`` puts it there, and ``lock_conflict_check``
+does the same). Every caller then shares one module, and so one pool.
+
+Stdlib only: it runs inside the ``UserPromptSubmit`` and ``PreToolUse`` hooks.
+"""
+
+from __future__ import annotations
+
+import http.client
+import json
+import select
+import threading
+import time
+import urllib.parse
+from typing import Any, NamedTuple, Optional
+
+__all__ = ["Response", "KeepAlivePool", "get", "get_json", "close_all", "stats"]
+
+#: Below uvicorn's default ``timeout_keep_alive`` of 5 s.
+IDLE_SECONDS = 4.0
+MAX_IDLE_PER_HOST = 4
+USER_AGENT = "rag-plugin-keepalive/1.0.0"
+
+_STALE_ERRORS = (http.client.RemoteDisconnected, http.client.BadStatusLine,
+                 BrokenPipeError, ConnectionResetError, ConnectionAbortedError)
+
+
+class Response(NamedTuple):
+    status: int
+    body: bytes
+
+    def json(self) -> Any:
+        return json.loads(self.body.decode("utf-8", errors="replace"))
+
+
+class KeepAlivePool:
+    """Idle ``http.client`` connections keyed by ``(scheme, host, port)``."""
+
+    def __init__(self, idle_seconds: float = IDLE_SECONDS,
+                 max_idle_per_host: int = MAX_IDLE_PER_HOST):
+        self.idle_seconds = idle_seconds
+        self.max_idle_per_host = max_idle_per_host
+        self._idle: dict[tuple, list] = {}
+        self._lock = threading.Lock()
+        self.counters = {"opened": 0, "reused": 0, "retried": 0}
+
+    # -- connection bookkeeping --------------------------------------------
+
+    def _checkout(self, key: tuple, timeout: float):
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._idle.get(key) or []
+            while bucket:
+                conn, stamp = bucket.pop()
+                if now - stamp < self.idle_seconds and not _peer_closed(conn):
+                    self.counters["reused"] += 1
+                    _set_timeout(conn, timeout)
+                    return conn, True
+                conn.close()
+            self.counters["opened"] += 1
+        scheme, host, port = key
+        cls = (http.client.HTTPSConnection if scheme == "https"
+               else http.client.HTTPConnection)
+        return cls(host, port, timeout=timeout), False
+
+    def _checkin(self, key: tuple, conn) -> None:
+        with self._lock:
+            bucket = self._idle.setdefault(key, [])
+            if len(bucket) >= self.max_idle_per_host:
+                conn.close()
+                return
+            bucket.append((conn, time.monotonic()))
+
+    def close(self) -> None:
+        with self._lock:
+            for bucket in self._idle.values():
+                for conn, _ in bucket:
+                    conn.close()
+            self._idle.clear()
+
+    # -- requests -------------------------------------------------------------
+
+    def get(self, url: str, timeout: float,
+            headers: Optional[dict[str, str]] = None) -> Response:
+        """GET ``url``. Returns ``Response``; raises ``OSError`` (``ConnectionError``
+        for protocol failures) or ``ValueError`` for a URL it cannot fetch."""
+        parts = urllib.parse.urlsplit(url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise ValueError(f"unsupported URL: {url!r}")
+        port = parts.port or (443 if parts.scheme == "https" else 80)
+        key = (parts.scheme, parts.hostname, port)
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+        hdrs = {"User-Agent": USER_AGENT, "Connection": "keep-alive"}
+        hdrs.update(headers or {})
+
+        conn, reused = self._checkout(key, timeout)
+        try:
+            try:
+                return self._send(key, conn, path, hdrs)
+            except _STALE_ERRORS:
+                if not reused:
+                    raise
+                with self._lock:
+                    self.counters["retried"] += 1
+                    self.counters["opened"] += 1
+                conn = type(conn)(key[1], key[2], timeout=timeout)
+                return self._send(key, conn, path, hdrs)
+        except http.client.HTTPException as exc:
+            # BadStatusLine / RemoteDisconnected on a fresh connection (or on
+            # the retry) are not OSErrors; callers catch only those.
+            raise ConnectionError(f"HTTP protocol error: {type(exc).__name__}") from exc
+
+    def _send(self, key: tuple, conn, path: str, hdrs: dict) -> Response:
+        try:
+            conn.request("GET", path, headers=hdrs)
+            resp = conn.getresponse()
+            body = resp.read()
+        except _STALE_ERRORS:
+            conn.close()
+            raise
+        except http.client.HTTPException as exc:
+            conn.close()
+            raise ConnectionError(f"HTTP protocol error: {type(exc).__name__}") from exc
+        except BaseException:
+            conn.close()
+            raise
+        if resp.will_close:
+            conn.close()
+        else:
+            self._checkin(key, conn)
+        return Response(resp.status, body)
+
+
+def _set_timeout(conn, timeout: float) -> None:
+    conn.timeout = timeout
+    if conn.sock is not None:
+        conn.sock.settimeout(timeout)
+
+
+def _peer_closed(conn) -> bool:
+    """An idle keep-alive socket that is readable has been closed by the peer
+    (or carries bytes nobody asked for) — either way it is not reusable."""
+    sock = conn.sock
+    if sock is None:
+        return False
+    try:
+        readable, _, _ = select.select([sock], [], [], 0)
+        return bool(readable)
+    except (OSError, ValueError):
+        return True
+
+
+_POOL = KeepAlivePool()
+
+
+def get(url: str, timeout: float, headers: Optional[dict[str, str]] = None) -> Response:
+    """GET through the process-wide pool."""
+    return _POOL.get(url, timeout, headers)
+
+
+def get_json(url: str, timeout: float) -> Any:
+    """Decoded JSON of a 2xx response, else None. Never raises — the shape
+    ``scope_resolve._http_json`` and friends already expect."""
+    try:
+        resp = _POOL.get(url, timeout)
+        if not 200 <= resp.status < 300:
+            return None
+        return resp.json()
+    except (OSError, ValueError, http.client.HTTPException):
+        return None
+
+
+def close_all() -> None:
+    _POOL.close()
+
+
+def stats() -> dict[str, int]:
+    return dict(_POOL.counters)
@@ -20,7 +20,20 @@ Safety invariants:
   - Backup before every write (.bak-pre-md-rag-enhance sibling).
   - Skip files under .git/, node_modules/, .venv/, dist/, build/, __pycache__/.
   - Skip binary files, symlinks, files > 1 MB.
-  - Hardcoded 500-file safety cap for whole-project runs.
+  - 500-file safety cap for whole-project runs (`--max-files N` to change
+    it, `--max-files 0` to lift it).
+
+Large trees: `--jobs N` spreads files over a process pool (0 = one worker
+per CPU); results are printed in file order as they arrive. Each file is read
+and parsed once, for the checks and the fixes alike. A file whose content hash
+matches a cached fixed-point result (no safe fix to apply) is not re-analysed;
+the cache lives in ~/.claude/rag-plugin/state/, never in the scanned tree, and
+is invalidated by any change to this script. `--no-cache` bypasses it.
+
+Incremental runs: `--git-diff [REV]` or `--changed LIST` ('-' = stdin, with
+`--follow` for a never-ending event stream) process only the named files.
+The same store keeps every file's latest findings, so the summary still
+covers the whole tree without rescanning it.
 
 Stdlib-only. Python 3.10+.
 
@@ -31,6 +44,7 @@ for the full authoring standard this tool enforces.
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
 import os
 import re
@@ -38,7 +52,7 @@ import shutil
 import sys
 from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import Iterator, Optional
+from typing import Iterable, Iterator, Optional
 
 # ---------------------------------------------------------------------------
 # Constants and regexes
@@ -47,6 +61,9 @@ MAX_FILES = 500
 MAX_FILE_BYTES = 1_048_576  # 1 MB
 BACKUP_SUFFIX = ".bak-pre-md-rag-enhance"
 
+CACHE_FILE = Path.home() / ".claude" / "rag-plugin" / "state" / "md-analyzer-cache.json"
+_CACHE_SCHEMA = 1
+
 SKIP_DIRS = {
     ".git", "node_modules", ".venv", "venv", "dist", "build",
     "__pycache__", ".tox", ".pytest_cache", ".mypy_cache", ".ruff_cache",
@@ -64,7 +81,7 @@ VAGUE_HEADING_RE = re.compile(
     re.IGNORECASE,
 )
 
-WORD_RE = re.compile(r"\b\w+\b")
+WORD_RE = re.compile(r"\w+")  # same runs as \b\w+\b, without the boundary tests
 
 # ---------------------------------------------------------------------------
 # Data structures
@@ -126,11 +143,13 @@ def _load_gitignore(root: Path) -> set[str]:
     return patterns
 
 
-def discover_files(target: Optional[Path]) -> tuple[list[Path], Optional[str]]:
+def discover_files(target: Optional[Path],
+                   max_files: int = MAX_FILES) -> tuple[list[Path], Optional[str]]:
     """Return the list of .md files to process, plus an optional error string.
 
     If `target` is a file, return just that file.
     If `target` is a directory (or None, meaning cwd), walk recursively.
+    More than `max_files` files is an error; `max_files=0` means no cap.
     """
     if target is not None and target.is_file():
         return [target], None
@@ -157,11 +176,11 @@ def discover_files(target: Optional[Path]) -> tuple[list[Path], Optional[str]]:
             except OSError:
                 continue
             found.append(p)
-            if len(found) > MAX_FILES:
+            if max_files and len(found) > max_files:
                 return [], (
-                    f"exceeded {MAX_FILES}-file safety cap under {root}. "
+                    f"exceeded {max_files}-file safety cap under {root}. "
                     f"Pass a specific file path to /md-rag-enhance instead, "
-                    f"or narrow the working directory."
+                    f"narrow the working directory, or raise the cap with --max-files."
                 )
     return sorted(found), None
 
@@ -191,131 +210,114 @@ def _strip_frontmatter(lines: list[str]) -> tuple[list[str], int, Optional[dict[
     return lines, 0, None
 
 
-def _build_sections(body: list[str], body_offset: int) -> list[Section]:
-    """Walk body lines and build a section list with word counts."""
-    sections: list[Section] = []
-    in_fence = False
-    current: Optional[tuple[int, int, str]] = None  # (start_line, level, heading_text)
-    for idx, line in enumerate(body):
-        if CODE_FENCE_RE.match(line):
-            in_fence = not in_fence
-            continue
-        if in_fence:
-            continue
-        m = HEADING_RE.match(line)
-        if m:
-            if current is not None:
-                start, lvl, head = current
-                section_lines = body[start + 1: idx]
-                words = _count_words_outside_fences(section_lines)
-                sections.append(Section(
-                    start=start + body_offset,
-                    end=idx + body_offset,
-                    level=lvl,
-                    heading=head,
-                    word_count=words,
-                    has_children=False,
-                ))
-            level = len(m.group(1))
-            heading_text = m.group(2).strip()
-            current = (idx, level, heading_text)
-    if current is not None:
-        start, lvl, head = current
-        section_lines = body[start + 1:]
-        words = _count_words_outside_fences(section_lines)
-        sections.append(Section(
-            start=start + body_offset,
-            end=len(body) + body_offset,
-            level=lvl,
-            heading=head,
-            word_count=words,
-            has_children=False,
-        ))
-    # Second pass: mark has_children
-    for i, sec in enumerate(sections):
-        for j in range(i + 1, len(sections)):
-            if sections[j].level > sec.level:
-                sec.has_children = True
-                break
-            if sections[j].level <= sec.level:
-                break
-    return sections
+@dataclass
+class _Tokens:
+    """Everything the checks need from a body, collected in one sweep.
+
+    Line numbers in `fences` and `tables` are file-relative (body_offset
+    applied), like `Section.start`; `pseudo` and `first_content` are body
+    indices.
+    """
 
+    sections: list[Section] = field(default_factory=list)
+    fences: list[tuple[int, int, int]] = field(default_factory=list)  # (start, end_excl, inner_lines)
+    tables: list[tuple[int, int, int]] = field(default_factory=list)  # (start, end_excl, data_rows)
+    pseudo: list[int] = field(default_factory=list)  # standalone bold lines outside fences
+    first_content: Optional[int] = None  # first non-blank line, fenced or not
 
-def _count_words_outside_fences(lines: list[str]) -> int:
-    total = 0
-    in_fence = False
-    for line in lines:
-        if CODE_FENCE_RE.match(line):
-            in_fence = not in_fence
-            continue
-        if in_fence:
-            continue
-        total += len(WORD_RE.findall(line))
-    return total
 
+def _tokenize(body: list[str], body_offset: int) -> _Tokens:
+    """Walk the body once: fences, tables, headings, pseudo-headings and
+    per-section word counts (words outside fences, heading lines excluded).
 
-def _iter_code_blocks(lines: list[str], body_offset: int) -> Iterator[tuple[int, int, int]]:
-    """Yield (start_line_0based, end_line_0based_exclusive, body_line_count) for each fenced code block."""
+    An unterminated fence swallows the rest of the body and yields no block.
+    A table is a run of contiguous `|`-prefixed lines with a `|---|---|`
+    separator among its first three lines.
+    """
+    tok = _Tokens()
+    fence_match, heading_match = CODE_FENCE_RE.match, HEADING_RE.match
+    row_match, sep_match = TABLE_ROW_RE.match, TABLE_SEP_RE.match
+    pseudo_match, count_words = PSEUDO_HEADING_RE.match, WORD_RE.findall
+    last = len(body) - 1
     in_fence = False
-    start = 0
-    for idx, line in enumerate(lines):
-        if CODE_FENCE_RE.match(line):
-            if not in_fence:
-                start = idx
-                in_fence = True
-            else:
-                yield (start + body_offset, idx + 1 + body_offset, idx - start - 1)
-                in_fence = False
+    fence_start = 0
+    table_start, table_sep = -1, False
+    current: Optional[tuple[int, int, str]] = None  # (start_line, level, heading_text)
+    words = 0
 
+    def close_table(end: int) -> None:
+        if table_sep and end - table_start >= 2:
+            tok.tables.append((table_start + body_offset, end + body_offset, end - table_start - 1))
 
-def _iter_tables(lines: list[str], body_offset: int) -> Iterator[tuple[int, int, int]]:
-    """Yield (start_line, end_line_exclusive, row_count) for each table.
+    def close_section(end: int) -> None:
+        start, lvl, head = current  # type: ignore[misc]
+        tok.sections.append(Section(start=start + body_offset, end=end + body_offset,
+                                    level=lvl, heading=head, word_count=words,
+                                    has_children=False))
 
-    A table is a sequence of contiguous `|`-prefixed lines with a
-    `|---|---|` separator row within the first 2 lines.
-    """
-    in_fence = False
-    i = 0
-    while i < len(lines):
-        if CODE_FENCE_RE.match(lines[i]):
+    for idx, line in enumerate(body):
+        stripped = line.strip()
+        if tok.first_content is None and stripped:
+            tok.first_content = idx
+        if fence_match(line):
+            if table_start >= 0:
+                close_table(idx)
+                table_start = -1
+            if in_fence:
+                tok.fences.append((fence_start + body_offset, idx + 1 + body_offset,
+                                   idx - fence_start - 1))
+            else:
+                fence_start = idx
             in_fence = not in_fence
-            i += 1
             continue
         if in_fence:
-            i += 1
             continue
-        if TABLE_ROW_RE.match(lines[i]):
-            start = i
-            # find end of the contiguous table
-            while i < len(lines) and TABLE_ROW_RE.match(lines[i]) and not CODE_FENCE_RE.match(lines[i]):
-                i += 1
-            block = lines[start:i]
-            has_sep = any(TABLE_SEP_RE.match(ln) for ln in block[:3])
-            if has_sep and len(block) >= 2:
-                yield (start + body_offset, i + body_offset, len(block) - 1)  # rows minus header+sep
+        if row_match(line):
+            if table_start < 0:
+                table_start, table_sep = idx, False
+            if not table_sep and idx - table_start < 3 and sep_match(line):
+                table_sep = True
+        elif table_start >= 0:
+            close_table(idx)
+            table_start = -1
+        m = heading_match(line)
+        if m:
+            if current is not None:
+                close_section(idx)
+            current = (idx, len(m.group(1)), m.group(2).strip())
+            words = 0
             continue
-        i += 1
+        if current is not None:
+            words += len(count_words(line))
+        if stripped.startswith("**") and pseudo_match(stripped):
+            # only a bold line standing alone between blank lines reads as a heading
+            if (idx == 0 or not body[idx - 1].strip()) and (idx == last or not body[idx + 1].strip()):
+                tok.pseudo.append(idx)
+    if table_start >= 0:
+        close_table(len(body))
+    if current is not None:
+        close_section(len(body))
+    for sec, nxt in zip(tok.sections, tok.sections[1:]):
+        sec.has_children = nxt.level > sec.level
+    return tok
 
 
 # ---------------------------------------------------------------------------
-# Checks (one function per rule)
+# Checks (one function per rule, all reading the same token sweep)
 
 
-def _check_gl_01(path: Path, body_offset: int, body: list[str], sections: list[Section]) -> list[Finding]:
+def _check_gl_01(path: Path, body_offset: int, tok: _Tokens) -> list[Finding]:
     """Content before first heading."""
-    if not sections:
-        if any(line.strip() for line in body):
-            return [Finding(str(path), 1, "GL-01", "HIGH",
-                            "File has content but no heading — chunks will be anchor-less.",
-                            "Add a top-level `# Title` as the first non-frontmatter line.")]
+    if tok.first_content is None:
         return []
-    first_heading_line = sections[0].start - body_offset
-    for idx in range(first_heading_line):
-        if body[idx].strip():
-            return [Finding(str(path), 1 + body_offset + 1, "GL-01", "HIGH",
-                            "Content appears before the first heading — produces empty-hierarchy chunks.",
-                            "Move the intro under a `# Title` heading, or add a title as the first line after frontmatter.")]
+    if not tok.sections:
+        return [Finding(str(path), 1, "GL-01", "HIGH",
+                        "File has content but no heading — chunks will be anchor-less.",
+                        "Add a top-level `# Title` as the first non-frontmatter line.")]
+    if tok.first_content < tok.sections[0].start - body_offset:
+        return [Finding(str(path), 1 + body_offset + 1, "GL-01", "HIGH",
+                        "Content appears before the first heading — produces empty-hierarchy chunks.",
+                        "Move the intro under a `# Title` heading, or add a title as the first line after frontmatter.")]
     return []
 
 
@@ -359,31 +361,20 @@ def _check_gl_04(path: Path, sections: list[Section]) -> list[Finding]:
     return out
 
 
-def _check_gl_05(path: Path, body_offset: int, body: list[str]) -> list[Finding]:
+def _check_gl_05(path: Path, body_offset: int, body: list[str], tok: _Tokens) -> list[Finding]:
     """Pseudo-heading (bold line used as section title)."""
     out: list[Finding] = []
-    in_fence = False
-    for idx, line in enumerate(body):
-        if CODE_FENCE_RE.match(line):
-            in_fence = not in_fence
-            continue
-        if in_fence:
-            continue
-        if PSEUDO_HEADING_RE.match(line.strip()):
-            # confirm surrounded by blank lines
-            prev_blank = idx == 0 or not body[idx - 1].strip()
-            next_blank = idx == len(body) - 1 or not body[idx + 1].strip()
-            if prev_blank and next_blank:
-                out.append(Finding(str(path), idx + body_offset + 1, "GL-05", "MEDIUM",
-                                   f"Pseudo-heading: '{line.strip()}' is bold-as-heading, not a real Markdown heading. Doesn't create a chunk boundary.",
-                                   "SAFE-AUTO-FIX: converted to `## <text>` (or `### <text>` if nested under an existing `##`)."))
+    for idx in tok.pseudo:
+        out.append(Finding(str(path), idx + body_offset + 1, "GL-05", "MEDIUM",
+                           f"Pseudo-heading: '{body[idx].strip()}' is bold-as-heading, not a real Markdown heading. Doesn't create a chunk boundary.",
+                           "SAFE-AUTO-FIX: converted to `## <text>` (or `### <text>` if nested under an existing `##`)."))
     return out
 
 
-def _check_gl_06(path: Path, body: list[str], body_offset: int) -> list[Finding]:
+def _check_gl_06(path: Path, tok: _Tokens) -> list[Finding]:
     """Code block > 60 lines."""
     out: list[Finding] = []
-    for start, end, inner in _iter_code_blocks(body, body_offset):
+    for start, end, inner in tok.fences:
         if inner > 60:
             out.append(Finding(str(path), start + 1, "GL-06", "MEDIUM",
                                f"Code block is {inner} lines (>60). When oversize, the sentence splitter mangles it; resulting chunks have no natural-language anchor.",
@@ -391,10 +382,10 @@ def _check_gl_06(path: Path, body: list[str], body_offset: int) -> list[Finding]
     return out
 
 
-def _check_gl_07(path: Path, body: list[str], body_offset: int) -> list[Finding]:
+def _check_gl_07(path: Path, tok: _Tokens) -> list[Finding]:
     """Table > 15 rows."""
     out: list[Finding] = []
-    for start, end, rows in _iter_tables(body, body_offset):
+    for start, end, rows in tok.tables:
         if rows > 15:
             out.append(Finding(str(path), start + 1, "GL-07", "MEDIUM",
                                f"Table has {rows} data rows (>15). Splitter treats the table as a single paragraph; rows get stranded across chunk boundaries.",
@@ -415,10 +406,10 @@ def _check_gl_08(path: Path, frontmatter: Optional[dict[str, str]]) -> list[Find
     return []
 
 
-def _check_gl_09(path: Path, body: list[str], body_offset: int) -> list[Finding]:
+def _check_gl_09(path: Path, body: list[str], body_offset: int, tok: _Tokens) -> list[Finding]:
     """Code block without prose intro within 2 lines before the fence."""
     out: list[Finding] = []
-    for start, end, inner in _iter_code_blocks(body, body_offset):
+    for start, end, inner in tok.fences:
         local_start = start - body_offset
         # check 2 lines before the fence
         prose_found = False
@@ -539,46 +530,60 @@ def _apply_fix_blank_lines(body: list[str]) -> tuple[list[str], int]:
 # Per-file pipeline
 
 
-def analyze_file(path: Path) -> FileResult:
-    result = FileResult(path=str(path))
-    try:
-        raw = path.read_text(encoding="utf-8", errors="replace")
-    except (OSError, UnicodeDecodeError) as exc:
-        result.skipped_reason = f"read failed: {exc}"
-        return result
+@dataclass
+class _Document:
+    """One file, read and parsed once for both the checks and the fixes."""
+
+    raw: str
+    lines: list[str]
+    body: list[str]
+    body_offset: int
+    frontmatter: Optional[dict[str, str]]
+
 
+def _decode(data: bytes) -> str:
+    # What Path.read_text(errors="replace") returns: universal newlines.
+    return data.decode("utf-8", errors="replace").replace("\r\n", "\n").replace("\r", "\n")
+
+
+def _parse(raw: str) -> _Document:
     lines = raw.splitlines(keepends=True)
     body, body_offset, frontmatter = _strip_frontmatter(lines)
-    sections = _build_sections(body, body_offset)
+    return _Document(raw, lines, body, body_offset, frontmatter)
+
+
+def _analyze(path: Path, doc: _Document) -> FileResult:
+    result = FileResult(path=str(path))
+    body, body_offset = doc.body, doc.body_offset
+    tok = _tokenize(body, body_offset)
+    sections = tok.sections
 
     # Run all checks
-    result.findings.extend(_check_gl_01(path, body_offset, body, sections))
+    result.findings.extend(_check_gl_01(path, body_offset, tok))
     result.findings.extend(_check_gl_02(path, sections))
     result.findings.extend(_check_gl_03(path, sections))
     result.findings.extend(_check_gl_04(path, sections))
-    result.findings.extend(_check_gl_05(path, body_offset, body))
-    result.findings.extend(_check_gl_06(path, body, body_offset))
-    result.findings.extend(_check_gl_07(path, body, body_offset))
-    result.findings.extend(_check_gl_08(path, frontmatter))
-    result.findings.extend(_check_gl_09(path, body, body_offset))
+    result.findings.extend(_check_gl_05(path, body_offset, body, tok))
+    result.findings.extend(_check_gl_06(path, tok))
+    result.findings.extend(_check_gl_07(path, tok))
+    result.findings.extend(_check_gl_08(path, doc.frontmatter))
+    result.findings.extend(_check_gl_09(path, body, body_offset, tok))
     result.findings.extend(_check_gl_10(path, sections))
 
     return result
 
 
-def enhance_file(path: Path, *, no_backup: bool, dry_run: bool) -> tuple[FileResult, Optional[str]]:
-    """Analyze, apply safe fixes, write atomically with backup.
+def analyze_file(path: Path) -> FileResult:
+    try:
+        data = path.read_bytes()
+    except OSError as exc:
+        return FileResult(path=str(path), skipped_reason=f"read failed: {exc}")
+    return _analyze(path, _parse(_decode(data)))
 
-    Returns (result, diff_string_or_None). The diff is only populated in
-    dry_run mode; otherwise None and the write has happened.
-    """
-    result = analyze_file(path)
-    if result.skipped_reason:
-        return result, None
 
-    raw = path.read_text(encoding="utf-8", errors="replace")
-    lines = raw.splitlines(keepends=True)
-    body, body_offset, _fm = _strip_frontmatter(lines)
+def _enhance(path: Path, doc: _Document, result: FileResult, *,
+             no_backup: bool, dry_run: bool) -> Optional[str]:
+    raw, lines, body, body_offset = doc.raw, doc.lines, doc.body, doc.body_offset
 
     # Apply fix 1: pseudo-headings
     new_body, fix1_count = _apply_fix_gl_05(body)
@@ -589,7 +594,7 @@ def enhance_file(path: Path, *, no_backup: bool, dry_run: bool) -> tuple[FileRes
     result.safe_fixes_applied = total_fixes
 
     if total_fixes == 0:
-        return result, None
+        return None
 
     new_text = "".join(lines[:body_offset]) + "".join(new_body)
     # Preserve final-newline convention
@@ -597,7 +602,7 @@ def enhance_file(path: Path, *, no_backup: bool, dry_run: bool) -> tuple[FileRes
         new_text += "\n"
 
     if new_text == raw:
-        return result, None
+        return None
 
     if dry_run:
         import difflib
@@ -608,7 +613,7 @@ def enhance_file(path: Path, *, no_backup: bool, dry_run: bool) -> tuple[FileRes
             tofile=f"{path} (enhanced)",
             n=2,
         ))
-        return result, diff
+        return diff
 
     # Backup
     if not no_backup:
@@ -625,7 +630,239 @@ def enhance_file(path: Path, *, no_backup: bool, dry_run: bool) -> tuple[FileRes
             tmp.unlink(missing_ok=True)
         raise
 
-    return result, None
+    return None
+
+
+def enhance_file(path: Path, *, no_backup: bool, dry_run: bool) -> tuple[FileResult, Optional[str]]:
+    """Analyze, apply safe fixes, write atomically with backup.
+
+    Returns (result, diff_string_or_None). The diff is only populated in
+    dry_run mode; otherwise None and the write has happened.
+    """
+    result, diff, _digest = _process(str(path), no_backup, dry_run, None)
+    assert result is not None
+    return result, diff
+
+
+def _process(path_str: str, no_backup: bool, dry_run: bool,
+             known_digest: Optional[str]) -> tuple[Optional[FileResult], Optional[str], str]:
+    """One file: read once, then analyze and fix from the same parse.
+
+    Returns ``(result, diff, content_sha256)``; ``result`` is None when the
+    content hashes to ``known_digest`` and the cached result stands.
+    Module-level so a process pool can pickle it.
+    """
+    path = Path(path_str)
+    try:
+        data = path.read_bytes()
+    except OSError as exc:
+        return FileResult(path=path_str, skipped_reason=f"read failed: {exc}"), None, ""
+    digest = hashlib.sha256(data).hexdigest()
+    if digest == known_digest:
+        return None, None, digest
+    doc = _parse(_decode(data))
+    result = _analyze(path, doc)
+    diff = _enhance(path, doc, result, no_backup=no_backup, dry_run=dry_run)
+    return result, diff, digest
+
+
+# ---------------------------------------------------------------------------
+# Batch engine
+
+
+_RULES_DIGEST: Optional[str] = None
+
+
+def _rules_digest() -> str:
+    """Digest of this script: any rule, threshold or fix change invalidates
+    every cached result."""
+    global _RULES_DIGEST
+    if _RULES_DIGEST is None:
+        try:
+            _RULES_DIGEST = hashlib.sha256(Path(__file__).read_bytes()).hexdigest()[:16]
+        except OSError:
+            _RULES_DIGEST = "unknown"
+    return _RULES_DIGEST
+
+
+def _load_cache() -> dict[str, dict]:
+    try:
+        blob = json.loads(CACHE_FILE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if (not isinstance(blob, dict) or blob.get("schema") != _CACHE_SCHEMA
+            or blob.get("rules") != _rules_digest()):
+        return {}
+    files = blob.get("files")
+    return files if isinstance(files, dict) else {}
+
+
+def _save_cache(files: dict[str, dict]) -> None:
+    """Atomic replace; a run must never fail because its cache did."""
+    try:
+        CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp = CACHE_FILE.with_name(f"{CACHE_FILE.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps({"schema": _CACHE_SCHEMA, "rules": _rules_digest(),
+                                   "files": files}), encoding="utf-8")
+        os.replace(tmp, CACHE_FILE)
+    except (OSError, ValueError, TypeError):
+        pass
+
+
+def _cached_result(path_str: str, entry: dict) -> FileResult:
+    return FileResult(path=path_str,
+                      findings=[Finding(**f) for f in entry.get("findings", [])])
+
+
+def run_batch(files: list[Path], *, no_backup: bool, dry_run: bool, jobs: int = 1,
+              use_cache: bool = True,
+              store: Optional[dict[str, dict]] = None) -> Iterator[tuple[FileResult, Optional[str]]]:
+    """``(result, diff)`` per file, in ``files`` order, as each completes.
+
+    ``jobs > 1`` shards files across a process pool; a pool that cannot start
+    or breaks part-way falls back to processing the rest in-process. Every
+    result is recorded in the findings store, but only a fixed-point result
+    (no safe fix to apply) is ever reused: a file that was fixed has new
+    content and is analysed again next run.
+
+    ``store`` is a findings store the caller already holds (``--follow``):
+    it is updated in place and left to the caller to save.
+    """
+    cache = store if store is not None else (_load_cache() if use_cache else {})
+    changed = False
+    paths = [str(p) for p in files]
+    known = [(cache.get(p) or {}).get("sha256") if (cache.get(p) or {}).get("fixed_point")
+             else None for p in paths]
+    flags = ([no_backup] * len(paths), [dry_run] * len(paths))
+
+    outputs: Iterator = iter(())
+    done = 0
+    if jobs > 1 and len(paths) > 1:
+        try:
+            from concurrent.futures import ProcessPoolExecutor
+
+            pool = ProcessPoolExecutor(max_workers=min(jobs, len(paths)))
+            outputs = pool.map(_process, paths, *flags, known,
+                               chunksize=max(1, len(paths) // (jobs * 8)))
+        except Exception:
+            pool = None
+    else:
+        pool = None
+    try:
+        while done < len(paths):
+            try:
+                result, diff, digest = next(outputs)
+            except StopIteration:
+                result, diff, digest = _process(paths[done], no_backup, dry_run, known[done])
+            except Exception as exc:
+                from concurrent.futures.process import BrokenProcessPool
+
+                if not isinstance(exc, BrokenProcessPool):
+                    raise
+                outputs = iter(())
+                continue
+            path_str = paths[done]
+            done += 1
+            if result is None:
+                yield _cached_result(path_str, cache[path_str]), None
+                continue
+            if use_cache:
+                if result.skipped_reason:
+                    changed |= cache.pop(path_str, None) is not None
+                else:
+                    cache[path_str] = {"sha256": digest,
+                                       "fixed_point": result.safe_fixes_applied == 0,
+                                       "findings": [asdict(f) for f in result.findings]}
+                    changed = True
+            yield result, diff
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+        if changed and store is None:
+            _save_cache(cache)
+
+
+# ---------------------------------------------------------------------------
+# Incremental runs
+
+
+def _eligible(path: Path, root: Path, skip: set[str]) -> bool:
+    """The same filter discover_files applies, for a single path."""
+    try:
+        rel = path.relative_to(root)
+    except ValueError:
+        return False
+    if path.suffix != ".md" or any(part in skip for part in rel.parts[:-1]):
+        return False
+    try:
+        return (not path.is_symlink() and path.is_file()
+                and path.stat().st_size <= MAX_FILE_BYTES)
+    except OSError:
+        return False
+
+
+def changed_files(names: Iterable[str], root: Path,
+                  base: Optional[Path] = None) -> tuple[list[Path], list[Path]]:
+    """Split a changed-path list into ``(to_process, gone)``.
+
+    Relative names are taken against ``base`` (default cwd). Paths outside
+    ``root``, in skipped directories, or not Markdown are ignored; a ``.md``
+    path under ``root`` that no longer exists is ``gone``.
+    """
+    base = base or Path.cwd()
+    skip = SKIP_DIRS | _load_gitignore(root)
+    todo: dict[Path, None] = {}
+    gone: dict[Path, None] = {}
+    for name in names:
+        name = name.strip()
+        if not name:
+            continue
+        p = Path(name) if Path(name).is_absolute() else base / name
+        p = Path(os.path.abspath(p))
+        if _eligible(p, root, skip):
+            todo[p] = None
+        elif p.suffix == ".md" and not p.exists() and root in p.parents:
+            gone[p] = None
+    return sorted(todo), sorted(gone)
+
+
+def git_changed(root: Path, rev: str = "HEAD") -> tuple[list[str], Path, Optional[str]]:
+    """Paths changed since ``rev`` plus untracked ones, relative to the
+    repository top level (which is returned as the base to resolve them)."""
+    import subprocess
+
+    def git(*args: str) -> str:
+        return subprocess.run(["git", "-C", str(root), *args], capture_output=True,
+                              text=True, timeout=60, check=True).stdout
+
+    try:
+        top = Path(git("rev-parse", "--show-toplevel").strip())
+        names = git("diff", "--name-only", rev, "--").splitlines()
+        names += git("ls-files", "--others", "--exclude-standard", "--full-name").splitlines()
+    except (OSError, subprocess.SubprocessError) as exc:
+        detail = getattr(exc, "stderr", "") or str(exc)
+        return [], root, f"git diff failed under {root}: {detail.strip()}"
+    return names, top, None
+
+
+def forget_files(paths: Iterable[Path], store: Optional[dict[str, dict]] = None) -> None:
+    """Drop deleted files from the findings store (``store`` if given, unsaved)."""
+    cache = store if store is not None else _load_cache()
+    if any(cache.pop(str(p), None) is not None for p in list(paths)) and store is None:
+        _save_cache(cache)
+
+
+def tree_results(root: Path, fresh: Iterable[FileResult] = (),
+                 store: Optional[dict[str, dict]] = None) -> list[FileResult]:
+    """Every stored result under ``root``, with ``fresh`` results in place of
+    their stored ones, in path order — a whole-tree report without a rescan.
+    Stored results report no safe fixes: those were applied when recorded."""
+    prefix = str(root).rstrip(os.sep) + os.sep
+    cache = store if store is not None else _load_cache()
+    merged = {p: _cached_result(p, e) for p, e in cache.items()
+              if p.startswith(prefix)}
+    merged.update((r.path, r) for r in fresh)
+    return [merged[p] for p in sorted(merged)]
 
 
 # ---------------------------------------------------------------------------
@@ -772,13 +1009,31 @@ def main() -> int:
                         help="Emit structured JSON findings to stdout. (Script-only.)")
     parser.add_argument("--self-test", action="store_true",
                         help="Run built-in tests and exit. (Script-only.)")
+    parser.add_argument("--jobs", type=int, default=1, metavar="N",
+                        help="Process files on N worker processes (0 = one per CPU; default 1).")
+    parser.add_argument("--max-files", type=int, default=MAX_FILES, metavar="N",
+                        help=f"Refuse whole-tree runs over N files (default {MAX_FILES}; 0 = no cap).")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Re-analyse every file, ignoring and not updating the findings store.")
+    parser.add_argument("--changed", metavar="LIST",
+                        help="Only process the paths listed in LIST, one per line ('-' = stdin, "
+                             "e.g. `git diff --name-only | ... --changed -`). The summary still "
+                             "covers the whole tree, from the findings store.")
+    parser.add_argument("--git-diff", metavar="REV", nargs="?", const="HEAD",
+                        help="Only process .md files changed since REV (default HEAD) or untracked.")
+    parser.add_argument("--follow", action="store_true",
+                        help="With --changed -, process each path as it arrives (a filesystem-event "
+                             "stream such as `inotifywait -m --format %%w%%f`) until EOF. With "
+                             "--json, prints one JSON object per line (NDJSON).")
     args = parser.parse_args()
 
     if args.self_test:
         return _self_test()
 
     target = Path(args.file).resolve() if args.file else None
-    files, err = discover_files(target)
+    if args.changed or args.git_diff:
+        return _main_incremental(args, target or Path.cwd().resolve())
+    files, err = discover_files(target, max_files=max(0, args.max_files))
     if err:
         print(f"md-rag-enhance: {err}", file=sys.stderr)
         return 1
@@ -786,21 +1041,11 @@ def main() -> int:
         print("md-rag-enhance: no .md files found.")
         return 0
 
-    results: list[FileResult] = []
-    diffs: list[str] = []
-    for p in files:
-        result, diff = enhance_file(p, no_backup=args.no_backup, dry_run=args.dry_run)
-        results.append(result)
-        if diff:
-            diffs.append(diff)
-
+    results = _run_and_stream(files, args)
     if args.json:
-        print(render_json(results))
         return 0
 
     if args.dry_run:
-        for d in diffs:
-            print(d)
         print()
 
     if args.verbose:
@@ -810,5 +1055,100 @@ def main() -> int:
     return 0
 
 
+def _run_and_stream(files: list[Path], args: argparse.Namespace,
+                    store: Optional[dict[str, dict]] = None) -> list[FileResult]:
+    """Process ``files``, printing diffs (or the JSON array) as results arrive.
+    Under ``--follow`` JSON is one compact object per line (NDJSON) instead,
+    so the whole stream stays parseable."""
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    results: list[FileResult] = []
+    first = True
+    ndjson = args.json and args.follow
+    if args.json and not ndjson:
+        sys.stdout.write("[")
+    for result, diff in run_batch(files, no_backup=args.no_backup, dry_run=args.dry_run,
+                                  jobs=jobs, use_cache=not args.no_cache, store=store):
+        results.append(result)
+        if ndjson:
+            sys.stdout.write(json.dumps(asdict(result), ensure_ascii=False) + "\n")
+        elif args.json:
+            # Same text json.dumps(list, indent=2) would produce, one file at a time.
+            item = json.dumps(asdict(result), indent=2, ensure_ascii=False)
+            sys.stdout.write(("\n" if first else ",\n") + "\n".join(
+                "  " + ln for ln in item.splitlines()))
+            first = False
+        elif args.dry_run and diff:
+            print(diff)
+        sys.stdout.flush()
+    if args.json and not ndjson:
+        print("]" if first else "\n]")
+    return results
+
+
+def _main_incremental(args: argparse.Namespace, root: Path) -> int:
+    """``--changed`` / ``--git-diff``: process only the changed files, then
+    report the whole tree from the findings store."""
+    if not root.is_dir():
+        print(f"md-rag-enhance: incremental mode needs a directory, not {root}", file=sys.stderr)
+        return 1
+    if args.no_cache:
+        print("md-rag-enhance: --no-cache cannot be combined with an incremental run "
+              "(the findings store is what makes it incremental).", file=sys.stderr)
+        return 1
+
+    if args.git_diff:
+        names, base, err = git_changed(root, args.git_diff)
+        if err:
+            print(f"md-rag-enhance: {err}", file=sys.stderr)
+            return 1
+        sources = [names]
+    elif args.changed == "-":
+        base = Path.cwd()
+        sources = ([line] for line in sys.stdin) if args.follow else [sys.stdin.read().splitlines()]
+    else:
+        base = Path.cwd()
+        try:
+            sources = [Path(args.changed).read_text(encoding="utf-8").splitlines()]
+        except OSError as exc:
+            print(f"md-rag-enhance: cannot read {args.changed}: {exc}", file=sys.stderr)
+            return 1
+
+    # --follow holds the store for the whole stream and saves it once at the
+    # end, instead of reloading and rewriting it on every event.
+    store = _load_cache() if args.follow else None
+    fresh: dict[str, FileResult] = {}  # by path: an edited file counts once
+    try:
+        for names in sources:
+            files, gone = changed_files(names, root, base)
+            forget_files(gone, store)
+            batch = _run_and_stream(files, args, store)
+            for p in gone:
+                fresh.pop(str(p), None)
+            fresh.update((r.path, r) for r in batch)
+            if args.follow and args.json:
+                for p in gone:
+                    print(json.dumps({"path": str(p), "removed": True}), flush=True)
+            elif args.follow:
+                for r in batch:
+                    print(f"{r.path}: {r.safe_fixes_applied} safe fix(es), "
+                          f"{len(r.findings)} finding(s)", flush=True)
+                for p in gone:
+                    print(f"{p}: removed", flush=True)
+    finally:
+        if store is not None:
+            _save_cache(store)
+    if args.json:
+        return 0
+
+    tree = tree_results(root, fresh.values(), store)
+    if args.dry_run:
+        print()
+    print(render_verbose(tree) if args.verbose else render_compact(tree))
+    print(f"\n(incremental: {len(fresh)} changed file(s) processed; the other "
+          f"{len(tree) - len(fresh)} reported from the findings store. "
+          "Files never seen by a full run are not included.)")
+    return 0
+
+
 if __name__ == "__main__":
     raise SystemExit(main())
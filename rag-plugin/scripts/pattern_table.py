@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""Labelled regex tables scanned once per line (rag-plugin report engine).
+
+Why
+---
+``rag_report`` classified every transcript line by trying each of
+``_SIGNAL_PATTERNS`` in turn, redacted every snippet by running ten
+``re.sub`` passes, and tested every log line against seven error patterns —
+one full scan of the text per pattern, on lines that almost never match any
+of them.
+
+:class:`PatternTable` compiles a table into one alternation of named groups
+and puts a literal-anchor prefilter in front of it:
+
+* **Anchors.** Each entry may name lowercase literals, one of which occurs in
+  any text the pattern can match. Entries whose anchors are all absent are
+  dropped before the regex engine runs; if none are left the line is done.
+* **One alternation.** The remaining entries are searched as
+  ``(?P<_p0>...)|(?P<_p1>...)|...`` (compiled once per candidate set), with
+  each entry's flags scoped to its own group.
+
+Results are *identical* to the sequential loop, not approximately so.
+:meth:`PatternTable.first` returns the first entry in table order that
+matches anywhere: the alternation reports the leftmost match, and the search
+is repeated over only the entries ahead of it until none match.
+:class:`RedactionChain` keeps the sequential ``re.sub`` semantics (a later
+pattern sees the earlier ones' output) and only uses the alternation to prove
+that nothing matches, which is the common case.
+
+Case folding
+------------
+Anchors are compared against ``str.lower()``. Under ``re.IGNORECASE`` four
+non-ASCII characters also match an ASCII letter (``ı``/``İ`` ~ ``i``,
+``ſ`` ~ ``s``, the Kelvin sign ~ ``k``); :func:`fold` maps them first so the
+prefilter can never drop a line the pattern would match.
+
+Stdlib only.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Iterable, Optional, Sequence
+
+__all__ = ["PatternTable", "RedactionChain", "fold", "FOLD_BYTES"]
+
+_FOLD = str.maketrans({"İ": "i", "ı": "i", "ſ": "s", "K": "k"})
+#: UTF-8 encodings of the characters :func:`fold` maps, for byte-level filters.
+FOLD_BYTES = tuple(c.encode("utf-8") for c in ("İ", "ı", "ſ", "K"))
+
+_LEADING_FLAGS = re.compile(r"^\(\?([aiLmsux]+)\)")
+_SCOPED_FLAGS = ((re.IGNORECASE, "i"), (re.MULTILINE, "m"), (re.DOTALL, "s"),
+                 (re.VERBOSE, "x"))
+
+
+def fold(text: str) -> str:
+    """Lowercase ``text`` the way the prefilter compares it."""
+    if not text.isascii():
+        text = text.translate(_FOLD)
+    return text.lower()
+
+
+def _scoped(pat: re.Pattern) -> str:
+    """``pat`` as a group that carries its own flags inside an alternation."""
+    src = _LEADING_FLAGS.sub("", pat.pattern, count=1)
+    flags = "".join(ch for flag, ch in _SCOPED_FLAGS if pat.flags & flag)
+    return f"(?{flags}:{src})" if flags else f"(?:{src})"
+
+
+class PatternTable:
+    """An ordered ``(label, pattern, anchors)`` table.
+
+    ``anchors`` is a sequence of lowercase literals, or empty for an entry that
+    must always be tried.
+    """
+
+    def __init__(self, entries: Iterable[tuple[str, "re.Pattern[str] | str", Sequence[str]]]):
+        self.labels: list[str] = []
+        self.patterns: list[re.Pattern] = []
+        self.anchors: list[tuple[str, ...]] = []
+        for label, pat, anchors in entries:
+            self.labels.append(label)
+            self.patterns.append(re.compile(pat) if isinstance(pat, str) else pat)
+            self.anchors.append(tuple(a.lower() for a in anchors or ()))
+        self._combined: dict[tuple[int, ...], Optional[re.Pattern]] = {}
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    def candidates(self, text: str) -> tuple[int, ...]:
+        """Indices of the entries the anchors cannot rule out for ``text``."""
+        low = fold(text)
+        return tuple(i for i, anchors in enumerate(self.anchors)
+                     if not anchors or any(a in low for a in anchors))
+
+    def _alternation(self, idx: tuple[int, ...]) -> Optional[re.Pattern]:
+        try:
+            return self._combined[idx]
+        except KeyError:
+            pass
+        try:
+            combined: Optional[re.Pattern] = re.compile(
+                "|".join(f"(?P<_p{i}>{_scoped(self.patterns[i])})" for i in idx))
+        except re.error:
+            combined = None  # e.g. two entries reuse a group name: go sequential
+        self._combined[idx] = combined
+        return combined
+
+    def first_index(self, text: str) -> Optional[int]:
+        """Index of the first entry in table order that matches anywhere."""
+        if not text:
+            return None
+        idx = self.candidates(text)
+        best = None
+        while idx:
+            combined = self._alternation(idx)
+            if combined is None:
+                return next((i for i in idx if self.patterns[i].search(text)), best)
+            m = combined.search(text)
+            if m is None:
+                break
+            best = int(m.lastgroup[2:]) if m.lastgroup else next(
+                int(k[2:]) for k, v in m.groupdict().items() if v is not None)
+            idx = tuple(i for i in idx if i < best)
+        return best
+
+    def first(self, text: str) -> Optional[str]:
+        """Label of the first entry in table order that matches, or None."""
+        i = self.first_index(text)
+        return None if i is None else self.labels[i]
+
+    def any(self, text: str) -> bool:
+        """Whether any entry matches — one search."""
+        if not text:
+            return False
+        idx = self.candidates(text)
+        if not idx:
+            return False
+        combined = self._alternation(idx)
+        if combined is None:
+            return any(self.patterns[i].search(text) for i in idx)
+        return combined.search(text) is not None
+
+    def all(self, text: str) -> list[str]:
+        """Every label that matches, in table order."""
+        if not text:
+            return []
+        return [self.labels[i] for i in self.candidates(text)
+                if self.patterns[i].search(text)]
+
+
+class RedactionChain:
+    """Ordered ``(pattern, replacement, anchors)`` substitutions.
+
+    :meth:`apply` equals ``for pat, repl in chain: text = pat.sub(repl, text)``.
+    A text no pattern matches is returned after one combined search; otherwise
+    the substitutions run in order, skipping any whose anchors are absent from
+    the text as it stands at that step.
+    """
+
+    def __init__(self, entries: Iterable[tuple["re.Pattern[str] | str", str, Sequence[str]]]):
+        entries = list(entries)
+        self.replacements = [repl for _, repl, _ in entries]
+        self.table = PatternTable((str(i), pat, anchors)
+                                  for i, (pat, _, anchors) in enumerate(entries))
+
+    def apply(self, text: str) -> str:
+        if not text or not self.table.any(text):
+            return text
+        out = text
+        low = fold(out)
+        for pat, repl, anchors in zip(self.table.patterns, self.replacements,
+                                      self.table.anchors):
+            if anchors and not any(a in low for a in anchors):
+                continue
+            new = pat.sub(repl, out)
+            if new != out:
+                out = new
+                low = fold(out)
+        return out
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""Relevance-probe cache for the UserPromptSubmit hook (rag-plugin, D-017).
+
+Why
+---
+``context_inject.domain_probe`` sends a scoped ``top_k=1`` search for every
+qualifying prompt. A prompt that is re-submitted, or edited only in case,
+spacing or trailing punctuation, gets the same verdict from an unchanged
+index, and paid for a full search round trip each time.
+
+What is kept
+------------
+``~/.claude/rag-plugin/state/probe-cache.json`` holds at most
+``MAX_ENTRIES`` verdicts in recency order, least recently used first out::
+
+    {"schema": 1, "entries": {"<sha256>": {"marker": "<sha256>", "matched": true,
+                                           "score": 0.71, "at": 1760700000.0}}}
+
+The key is a SHA-256 of the project id and the normalised prompt; the marker
+is a SHA-256 of the project's index freshness (``state`` and, when the service
+reports it, ``last_indexed``). **No prompt text and no project name is ever
+written** — D-012: the file cannot say what was asked, only whether a
+question hashing to this key matched last time.
+
+A verdict is reused only while its marker matches the index as the hook now
+sees it and it is younger than ``TTL_SECONDS``
+(``RAG_PLUGIN_HOOK_PROBE_CACHE_TTL``, default 600 s; ``0`` disables the
+cache). Every lookup reports why it missed — ``miss``, ``expired`` or
+``reindexed`` — and every store how many entries it evicted, so the hook can
+log both and ``scripts/analyze_hook_decisions.py`` can show whether the
+bound and the TTL are right.
+
+Stdlib only; loaded by the hook, so nothing here raises into it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+__all__ = ["MAX_ENTRIES", "TTL_SECONDS", "lookup", "normalize_prompt", "store"]
+
+SCHEMA = 1
+CACHE_FILE = Path.home() / ".claude" / "rag-plugin" / "state" / "probe-cache.json"
+MAX_ENTRIES = 256
+TTL_SECONDS = float(os.environ.get("RAG_PLUGIN_HOOK_PROBE_CACHE_TTL", "") or 600)
+
+#: The probe searches the first 500 characters; so does the key.
+_PROBE_CHARS = 500
+_EDGE_PUNCT = " \t\r\n.,;:!?…'\"`"
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Case-folded, whitespace-collapsed, without leading/trailing punctuation."""
+    return " ".join(prompt[:_PROBE_CHARS].casefold().split()).strip(_EDGE_PUNCT)
+
+
+def _digest(*parts: str) -> str:
+    return hashlib.sha256("\0".join(parts).encode("utf-8", "surrogatepass")).hexdigest()
+
+
+def _key(project: str, prompt: str) -> str:
+    return _digest(project, normalize_prompt(prompt))
+
+
+def _read() -> dict[str, Any]:
+    try:
+        with open(CACHE_FILE, encoding="utf-8") as f:
+            blob = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(blob, dict) or blob.get("schema") != SCHEMA:
+        return {}
+    entries = blob.get("entries")
+    return entries if isinstance(entries, dict) else {}
+
+
+def _write(entries: dict[str, Any]) -> None:
+    CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    tmp = CACHE_FILE.with_name(f"{CACHE_FILE.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump({"schema": SCHEMA, "entries": entries}, f, separators=(",", ":"))
+    os.replace(tmp, CACHE_FILE)
+
+
+def lookup(project: str, prompt: str, marker: str,
+           now: Optional[float] = None) -> tuple[str, Optional[tuple[bool, float]]]:
+    """``(status, verdict)``. ``status`` is ``hit`` (verdict is
+    ``(matched, score)``), ``miss``, ``expired``, ``reindexed`` or
+    ``disabled``; only a hit carries a verdict. Never raises."""
+    if TTL_SECONDS <= 0:
+        return "disabled", None
+    try:
+        now = time.time() if now is None else now
+        entries = _read()
+        key = _key(project, prompt)
+        entry = entries.get(key)
+        if not isinstance(entry, dict):
+            return "miss", None
+        if entry.get("marker") != _digest(marker):
+            return "reindexed", None
+        if now - float(entry.get("at", 0)) > TTL_SECONDS:
+            return "expired", None
+        verdict = (bool(entry.get("matched")), float(entry.get("score", 0.0)))
+        # Recency is insertion order: move the hit to the young end.
+        entries.pop(key)
+        entries[key] = entry
+        _write(entries)
+        return "hit", verdict
+    except (OSError, ValueError, TypeError):
+        return "miss", None
+
+
+def store(project: str, prompt: str, marker: str, matched: bool, score: float,
+          now: Optional[float] = None) -> int:
+    """Remember a fresh verdict. Returns how many entries were evicted to
+    stay within ``MAX_ENTRIES`` (expired ones go first). Never raises."""
+    if TTL_SECONDS <= 0:
+        return 0
+    try:
+        now = time.time() if now is None else now
+        entries = _read()
+        key = _key(project, prompt)
+        entries.pop(key, None)
+        live = {k: v for k, v in entries.items()
+                if isinstance(v, dict) and now - float(v.get("at", 0)) <= TTL_SECONDS}
+        evicted = len(entries) - len(live)
+        while len(live) >= MAX_ENTRIES:
+            live.pop(next(iter(live)))
+            evicted += 1
+        live[key] = {"marker": _digest(marker), "matched": bool(matched),
+                     "score": float(score), "at": now}
+        _write(live)
+        return evicted
+    except (OSError, ValueError, TypeError):
+        return 0
@@ -16,7 +16,11 @@ Plus:
   summary.md             — top-level executive summary + paths
   github-rag-issue.md    — copy-pasteable issue body for github.com/taqat-techno/rag
   github-plugins-issue.md — copy-pasteable issue body for github.com/taqat-techno/plugins
-  redacted-diagnostics.json — structured raw findings (machine-readable)
+  redacted-diagnostics.json — structured raw findings (machine-readable),
+                           including per-phase timings
+  report-trace.json      — with --trace: Chrome trace-event JSON of every
+                           phase, HTTP call and subprocess (chrome://tracing,
+                           ui.perfetto.dev)
 
 Privacy / safety invariants:
   - Secrets, API keys, tokens, bearer headers, passwords, cookies, SSH/private
@@ -36,6 +40,7 @@ Output directory:
 
 CLI:
   python rag_report.py [--out <dir>] [--no-sessions] [--max-sessions N]
+                       [--jobs N] [--full-rescan] [--since AGE] [--trace]
                        [--quiet] [--self-test]
 """
 
@@ -51,6 +56,9 @@ import shutil
 import socket
 import subprocess
 import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, timezone
 from pathlib import Path
@@ -59,6 +67,13 @@ from urllib import parse as urlparse
 from urllib import request as urlrequest
 from urllib.error import URLError, HTTPError
 
+if str(Path(__file__).resolve().parent) not in sys.path:
+    sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import decision_log  # noqa: E402
+from pattern_table import FOLD_BYTES, PatternTable, RedactionChain  # noqa: E402
+from span_trace import Tracer  # noqa: E402
+
 # Force UTF-8 stdout on Windows cp1252 consoles (same pattern as md_analyzer.py)
 try:
     sys.stdout.reconfigure(encoding="utf-8", errors="replace")  # type: ignore[attr-defined]
@@ -105,15 +120,30 @@ _REDACT_PATTERNS: list[tuple[re.Pattern[str], str]] = [
      "<redacted-private-key>"),
 ]
 
+#: Lowercase literals present in any text the matching _REDACT_PATTERNS entry
+#: can rewrite (see pattern_table). Same order as the patterns.
+_REDACT_ANCHORS: list[tuple[str, ...]] = [
+    ("authorization",),
+    ("authorization",),
+    ("api", "access", "secret", "passw", "pwd", "private"),
+    ("ghp_",),
+    ("github_pat_",),
+    ("akia",),
+    ("xox",),
+    ("=",),
+    ("cookie",),
+    ("-----begin ",),
+]
+
+_REDACT_CHAIN = RedactionChain(
+    (pat, repl, anchors) for (pat, repl), anchors in zip(_REDACT_PATTERNS, _REDACT_ANCHORS))
+
 
 def redact(text: str) -> str:
     """Apply secret-redaction patterns to a string."""
     if not text:
         return text
-    out = text
-    for pat, repl in _REDACT_PATTERNS:
-        out = pat.sub(repl, out)
-    return out
+    return _REDACT_CHAIN.apply(text)
 
 
 def normalize_home(path: str | None) -> str:
@@ -172,6 +202,15 @@ class State:
     has_doctor_json: bool = False
     port: int = DEFAULT_PORT
     host: str = DEFAULT_HOST
+    # One row per HTTP call probe_api made: endpoint, code, ms, error. Written
+    # to redacted-diagnostics.json so a slow endpoint is visible in the artifact.
+    probe_timings: list[dict[str, Any]] = field(default_factory=list)
+
+
+#: Phase spans and I/O counters for the current run (``span_trace``). ``main``
+#: starts a fresh one; the timings land in redacted-diagnostics.json, the
+#: summary's Timings section and, with ``--trace``, report-trace.json.
+TRACE = Tracer()
 
 
 # --------------------------------------------------------------------------- #
@@ -180,6 +219,7 @@ class State:
 
 
 def _safe_run(cmd: list[str], timeout: float = 5.0) -> tuple[int, str, str]:
+    t0 = time.perf_counter()
     try:
         p = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout, check=False)
         return p.returncode, (p.stdout or "").strip(), (p.stderr or "").strip()
@@ -189,15 +229,36 @@ def _safe_run(cmd: list[str], timeout: float = 5.0) -> tuple[int, str, str]:
         return 124, "", "timeout"
     except Exception as e:
         return 1, "", f"error: {e}"
+    finally:
+        # The executable's name and first argument only: never a path.
+        TRACE.event(" ".join([Path(cmd[0]).name] + cmd[1:2]), t0, time.perf_counter(),
+                    cat="exec")
+
+
+def _trace_endpoint(url: str) -> str:
+    """The URL path with project ids masked, so a trace names no project."""
+    return re.sub(r"^/api/projects/[^/]+/", "/api/projects/<id>/",
+                  urlparse.urlsplit(url).path) or "/"
 
 
 def _http_get_json(url: str, timeout: float = 2.0) -> tuple[int, Any, str]:
-    """Returns (http_code, parsed_json_or_none, error_message)."""
+    """Returns (http_code, parsed_json_or_none, error_message). Counted and
+    timed in ``TRACE``."""
+    t0 = time.perf_counter()
+    code, body, err = _fetch_json(url, timeout)
+    TRACE.count("http_calls")
+    TRACE.event(_trace_endpoint(url), t0, time.perf_counter(), cat="http", code=code)
+    return code, body, err
+
+
+def _fetch_json(url: str, timeout: float) -> tuple[int, Any, str]:
     try:
         req = urlrequest.Request(url, headers={"User-Agent": f"rag-plugin-report/{REPORT_VERSION}"})
         with urlrequest.urlopen(req, timeout=timeout) as resp:
             code = resp.getcode()
-            raw = resp.read().decode("utf-8", errors="replace")
+            data = resp.read()
+            TRACE.count("bytes_read", len(data))
+            raw = data.decode("utf-8", errors="replace")
             try:
                 return code, json.loads(raw), ""
             except json.JSONDecodeError:
@@ -279,59 +340,147 @@ def probe_service(state: State) -> None:
         state.health_status = {"_code": code, "_error": err}
 
 
-def probe_api(state: State) -> None:
+#: Concurrent loopback probes. Each endpoint is answered independently by the
+#: service; more workers than this only queue on its side.
+PROBE_WORKERS = 8
+#: Wall-clock budget for the whole of probe_api. A call still outstanding when
+#: it runs out is recorded as ``deadline`` in the timing table and its project
+#: keeps its lean /api/projects record.
+PROBE_DEADLINE_SECONDS = 8.0
+
+
+class _ProbeTimer:
+    """Times each probe_api call into ``state.probe_timings`` (thread-safe)."""
+
+    def __init__(self) -> None:
+        self.rows: list[dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    def get(self, seq: int, endpoint: str, url: str,
+            timeout: float) -> tuple[int, Any, str]:
+        t0 = time.perf_counter()
+        code, body, err = _http_get_json(url, timeout=timeout)
+        row: dict[str, Any] = {"seq": seq, "endpoint": endpoint, "code": code,
+                               "ms": round((time.perf_counter() - t0) * 1000, 1)}
+        if err:
+            row["error"] = redact(err)[:160]
+        with self._lock:
+            self.rows.append(row)
+        return code, body, err
+
+    def missed(self, seq: int, endpoint: str) -> None:
+        with self._lock:
+            self.rows.append({"seq": seq, "endpoint": endpoint, "code": 0,
+                              "ms": None, "error": "deadline"})
+
+    def table(self) -> list[dict[str, Any]]:
+        return [{k: v for k, v in row.items() if k != "seq"}
+                for row in sorted(self.rows, key=lambda r: r["seq"])]
+
+
+def _project_list(code: int, body: Any) -> list[dict[str, Any]]:
+    # Modern ragtools wraps the list as {"projects": [...]} with lean records
+    # ({project_id, files, chunks}); older builds returned a bare list.
+    if code != 200:
+        return []
+    if isinstance(body, list):
+        return [p for p in body if isinstance(p, dict)]
+    if isinstance(body, dict) and isinstance(body.get("projects"), list):
+        return [p for p in body["projects"] if isinstance(p, dict)]
+    return []
+
+
+def probe_api(state: State, deadline: float = PROBE_DEADLINE_SECONDS,
+              workers: int = PROBE_WORKERS) -> None:
+    """Fetch /api/status, /api/projects (+ per-project status) and
+    /api/watcher/status concurrently on a bounded pool.
+
+    The three top-level endpoints are independent and start together; each
+    project's ``/status`` hydration is submitted as soon as the list arrives.
+    ``state.api_projects`` keeps the service's list order regardless of which
+    hydration finishes first.
+    """
     if state.service_mode != "UP":
         return
     base = f"http://{state.host}:{state.port}"
+    timer = _ProbeTimer()
+    stop_at = time.monotonic() + deadline
+    pool = ThreadPoolExecutor(max_workers=max(1, workers),
+                              thread_name_prefix="rag-report-probe")
+    try:
+        # /api/status — store the whole body, then resolve any path-like fields
+        # the running build exposes. ragtools v2.5.x exposes points_count, scale,
+        # total_files, total_chunks, last_indexed, projects[]; older builds expose
+        # config_path / data_path / log_path. Read both shapes.
+        #
+        # /api/watcher/status — modern ragtools also exposes this under
+        # /api/status, but the dedicated endpoint is more reliable on older
+        # builds. Newer builds additionally carry `state`, `desired`,
+        # `autostart_error`; older builds lack them (app_health_signals reads
+        # them defensively).
+        pending = {
+            pool.submit(timer.get, 0, "/api/status", f"{base}/api/status", 2.0):
+                ("status", None),
+            pool.submit(timer.get, 1, "/api/projects", f"{base}/api/projects", 2.0):
+                ("projects", None),
+            pool.submit(timer.get, 2, "/api/watcher/status",
+                        f"{base}/api/watcher/status", 2.0):
+                ("watcher", None),
+        }
+        raw_list: list[dict[str, Any]] = []
+        details: dict[int, dict[str, Any]] = {}
+        seq = 3
+        while pending:
+            remaining = stop_at - time.monotonic()
+            if remaining <= 0:
+                break
+            done, _ = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+            for fut in done:
+                kind, index = pending.pop(fut)
+                code, body, _ = fut.result()
+                if kind == "status" and code == 200 and isinstance(body, dict):
+                    state.api_status = body
+                    for key in ("config_path", "data_path", "log_path"):
+                        v = body.get(key)
+                        if v and isinstance(v, str):
+                            setattr(state, key, v)
+                elif kind == "watcher" and code == 200 and isinstance(body, dict):
+                    state.watcher_status = body
+                elif kind == "projects":
+                    # Hydrate each project's full status (path, last_indexed,
+                    # enabled) via the per-project endpoint.
+                    raw_list = _project_list(code, body)
+                    for i, proj in enumerate(raw_list):
+                        pid = str(proj.get("project_id") or proj.get("id")
+                                  or proj.get("name") or "").strip()
+                        if not pid:
+                            continue
+                        url = f"{base}/api/projects/{urlparse.quote(pid)}/status"
+                        pending[pool.submit(timer.get, seq,
+                                            "/api/projects/<id>/status", url, 1.5)] = (
+                            "project", i)
+                        seq += 1
+                elif (kind == "project" and code == 200 and isinstance(body, dict)
+                      and index is not None):
+                    details[index] = body
+        for fut, (kind, index) in pending.items():
+            fut.cancel()
+            timer.missed(seq, "/api/projects/<id>/status" if kind == "project"
+                         else {"status": "/api/status", "projects": "/api/projects",
+                               "watcher": "/api/watcher/status"}[kind])
+            seq += 1
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
 
-    # /api/status — store the whole body, then resolve any path-like fields
-    # the running build exposes. ragtools v2.5.x exposes points_count, scale,
-    # total_files, total_chunks, last_indexed, projects[]; older builds expose
-    # config_path / data_path / log_path. Read both shapes.
-    code, body, _ = _http_get_json(f"{base}/api/status", timeout=2.0)
-    if code == 200 and isinstance(body, dict):
-        state.api_status = body
-        for key in ("config_path", "data_path", "log_path"):
-            v = body.get(key)
-            if v and isinstance(v, str):
-                setattr(state, key, v)
-
-    # /api/projects — modern ragtools wraps the list as {"projects": [...]}
-    # with lean records ({project_id, files, chunks}). Older builds returned
-    # a bare list. Handle both. After the list is resolved, hydrate each
-    # project's full status (path, last_indexed, enabled) via
-    # /api/projects/<id>/status — the per-project endpoint.
-    code, body, _ = _http_get_json(f"{base}/api/projects", timeout=2.0)
-    raw_list: list[dict[str, Any]] = []
-    if code == 200:
-        if isinstance(body, list):
-            raw_list = [p for p in body if isinstance(p, dict)]
-        elif isinstance(body, dict) and isinstance(body.get("projects"), list):
-            raw_list = [p for p in body["projects"] if isinstance(p, dict)]
     hydrated: list[dict[str, Any]] = []
-    for proj in raw_list:
-        pid = str(proj.get("project_id") or proj.get("id") or proj.get("name") or "").strip()
-        if pid:
-            code2, body2, _ = _http_get_json(
-                f"{base}/api/projects/{urlparse.quote(pid)}/status", timeout=1.5
-            )
-            merged = dict(proj)
-            if code2 == 200 and isinstance(body2, dict):
-                for k, v in body2.items():
-                    if v is not None:
-                        merged[k] = v
-            hydrated.append(merged)
-        else:
-            hydrated.append(proj)
+    for i, proj in enumerate(raw_list):
+        merged = dict(proj)
+        for k, v in details.get(i, {}).items():
+            if v is not None:
+                merged[k] = v
+        hydrated.append(merged)
     state.api_projects = hydrated
-
-    # /api/watcher/status — modern ragtools also exposes this under /api/status,
-    # but the dedicated endpoint is more reliable on older builds. Newer builds
-    # additionally carry `state`, `desired`, `autostart_error`; older builds lack
-    # them (app_health_signals reads them defensively).
-    code, body, _ = _http_get_json(f"{base}/api/watcher/status", timeout=2.0)
-    if code == 200 and isinstance(body, dict):
-        state.watcher_status = body
+    state.probe_timings = timer.table()
 
 
 def probe_system_health(state: State) -> None:
@@ -675,9 +824,10 @@ _RETRIEVAL_RULE_MARKERS = [
 
 def _read_text_safe(p: Path, limit: int = 1_500_000) -> str:
     try:
-        if p.stat().st_size > limit:
-            return p.read_text(encoding="utf-8", errors="replace")[:limit]
-        return p.read_text(encoding="utf-8", errors="replace")
+        size = p.stat().st_size
+        text = p.read_text(encoding="utf-8", errors="replace")
+        TRACE.count("bytes_read", size)
+        return text[:limit] if size > limit else text
     except Exception:
         return ""
 
@@ -769,35 +919,24 @@ class HookLogStats:
 
 
 def inspect_hook_log() -> HookLogStats:
+    """Counts from the hook-decisions aggregate (``decision_log``): the sidecar
+    plus whatever was appended since, across rotated segments. Read-only."""
     stats = HookLogStats()
     stats.log_path = str(Path.home() / ".claude" / "rag-plugin" / "hook-decisions.log")
     p = Path(stats.log_path)
-    if not p.exists():
+    if not (p.exists() or Path(decision_log.sidecar_path(str(p))).exists()
+            or decision_log.segments(str(p))):
         stats.notes = "no hook-decisions log (hook never fired or observability disabled)"
         return stats
     stats.log_exists = True
-    actions: dict[str, int] = {}
-    last_ts = ""
     try:
-        with p.open("r", encoding="utf-8", errors="replace") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                stats.total_lines += 1
-                try:
-                    rec = json.loads(line)
-                except json.JSONDecodeError:
-                    continue
-                act = str(rec.get("action", "unknown"))
-                actions[act] = actions.get(act, 0) + 1
-                ts = rec.get("ts") or rec.get("timestamp")
-                if isinstance(ts, str):
-                    last_ts = ts
+        agg = decision_log.load(str(p))
     except Exception as e:
         stats.notes = f"read error: {e}"
-    stats.actions = dict(sorted(actions.items(), key=lambda kv: -kv[1]))
-    stats.last_entry_ts = last_ts
+        return stats
+    stats.total_lines = agg["total"] + agg["malformed"]
+    stats.actions = dict(sorted(agg["actions"].items(), key=lambda kv: -kv[1]))
+    stats.last_entry_ts = agg["last_ts"]
     return stats
 
 
@@ -815,41 +954,229 @@ _LOG_ERROR_PATTERNS = [
     re.compile(r"Permission denied"),
     re.compile(r"port .* in use", re.IGNORECASE),
 ]
+_LOG_ERROR_TABLE = PatternTable(
+    (pat.pattern, pat, anchors) for pat, anchors in zip(_LOG_ERROR_PATTERNS, [
+        ("error",), ("traceback",), ("critical",), ("qdrant client",),
+        ("startup failed",), ("permission denied",), ("port",),
+    ]))
+
+
+_TAIL_BLOCK = 64 * 1024
+#: A single log line is kept to its first this-many bytes, so one runaway
+#: line cannot make the tail unbounded.
+_TAIL_MAX_LINE = 64 * 1024
+#: Lines read beyond ``lines_per_file`` to reach the start of the record (or
+#: traceback) the window would otherwise cut through.
+_TAIL_RECORD_SLACK = 200
+#: ragtools logs with ``%(asctime)s %(levelname)-8s ...`` (local time).
+_LOG_TS = re.compile(r"^(\d{4}-\d{2}-\d{2})[ T](\d{2}:\d{2}:\d{2})")
+_TB_START = "Traceback (most recent call last)"
+_TB_HEADERS = ("Traceback (most recent call last)", "During handling of the above exception",
+               "The above exception was the direct cause")
+_HIT_MAX_CHARS = 1500
+
+
+def _reverse_lines(path: Path):
+    """Complete lines of ``path`` from the last one backwards, as bytes.
+
+    Reads fixed blocks from the end, so memory is one block plus one line
+    (itself capped at ``_TAIL_MAX_LINE``) whatever the file size. A final
+    fragment with no newline — a record still being written — is skipped.
+    """
+    with path.open("rb") as fh:
+        fh.seek(0, os.SEEK_END)
+        pos = fh.tell()
+        carry = b""
+        fragment = True  # still inside the bytes after the last newline
+        while pos > 0:
+            step = min(_TAIL_BLOCK, pos)
+            pos -= step
+            fh.seek(pos)
+            TRACE.count("bytes_read", step)
+            parts = (fh.read(step) + carry).split(b"\n")
+            if fragment:
+                if len(parts) == 1:
+                    carry = b""
+                    continue
+                parts.pop()
+                fragment = False
+            carry = parts[0][:_TAIL_MAX_LINE]
+            for line in reversed(parts[1:]):
+                yield line[:_TAIL_MAX_LINE]
+        if not fragment:
+            yield carry
+
+
+def _log_epoch(line: str) -> Optional[float]:
+    m = _LOG_TS.match(line)
+    if not m:
+        return None
+    try:
+        return time.mktime(time.strptime(f"{m.group(1)} {m.group(2)}", "%Y-%m-%d %H:%M:%S"))
+    except (ValueError, OverflowError):
+        return None
+
+
+def _tail_lines(path: Path, limit: int, since: Optional[float]) -> list[str]:
+    """Up to ``limit`` (+ record slack) last complete lines, oldest first. Stops
+    early at a timestamp older than ``since``. ``.gz`` files are streamed
+    forward through a bounded deque — a gzip stream cannot be read backwards."""
+    cap = limit + _TAIL_RECORD_SLACK
+    if path.suffix == ".gz":
+        import gzip
+        from collections import deque
+
+        window: deque[str] = deque(maxlen=cap)
+        with gzip.open(path, "rb") as fh:
+            for raw in fh:
+                TRACE.count("bytes_read", len(raw))
+                if raw.endswith(b"\n"):
+                    window.append(raw[:_TAIL_MAX_LINE].decode("utf-8", errors="replace").rstrip("\r\n"))
+        lines = list(window)
+        if since is not None:
+            for i in range(len(lines) - 1, -1, -1):
+                ts = _log_epoch(lines[i])
+                if ts is not None and ts < since:
+                    lines = _drop_orphans(lines[i + 1:])
+                    break
+        return lines
+    rev: list[str] = []
+    for raw in _reverse_lines(path):
+        line = raw.decode("utf-8", errors="replace").rstrip("\r")
+        if since is not None:
+            ts = _log_epoch(line)
+            if ts is not None and ts < since:
+                rev.reverse()
+                return _drop_orphans(rev)
+        rev.append(line)
+        if len(rev) >= cap:
+            break
+    rev.reverse()
+    return rev
+
+
+def _drop_orphans(lines: list[str]) -> list[str]:
+    """Drop the leading untimestamped lines left when a cutoff fell on the
+    record they continue — they are as old as that record."""
+    for i, line in enumerate(lines):
+        if _LOG_TS.match(line):
+            return lines[i:]
+    return lines
+
+
+def _window_start(lines: list[str], limit: int) -> int:
+    """Index of the first line to report: the last ``limit`` lines, moved back
+    to the start of the record the cut falls inside (a timestamped line when
+    the log has them, else the traceback header or first unindented line)."""
+    start = max(0, len(lines) - limit)
+    timed = any(_LOG_TS.match(line) for line in lines)
+    while start > 0:
+        line = lines[start]
+        if timed:
+            if _LOG_TS.match(line):
+                break
+        elif line.startswith(_TB_START) or not (line[:1] in (" ", "\t") or not line.strip()
+                                                or line.startswith(_TB_HEADERS)):
+            break
+        start -= 1
+    return start
+
+
+def _group_records(lines: list[str]) -> list[tuple[int, list[str]]]:
+    """``(first line index, lines)`` per log record: a line plus its
+    continuation lines, so a logged exception and its traceback are one
+    record. A timestamped line always starts a record."""
+    records: list[tuple[int, list[str]]] = []
+    in_tb = False
+    for i, line in enumerate(lines):
+        if records and not _LOG_TS.match(line):
+            indented = line[:1] in (" ", "\t") or not line.strip()
+            if line.startswith(_TB_HEADERS) or indented:
+                records[-1][1].append(line)
+                in_tb = in_tb or line.startswith(_TB_START)
+                continue
+            if in_tb:
+                records[-1][1].append(line)  # the exception line closes it
+                in_tb = False
+                continue
+        records.append((i, [line]))
+        in_tb = line.startswith(_TB_START)
+    return records
+
+
+def _clip_record(text: str) -> str:
+    """Long tracebacks keep their head and their exception line."""
+    if len(text) <= _HIT_MAX_CHARS:
+        return text
+    return text[:600] + "\n[...]\n" + text[-(_HIT_MAX_CHARS - 608):]
 
 
-def tail_recent_errors(log_dir: str, max_files: int = 4, lines_per_file: int = 200) -> list[dict[str, Any]]:
+def _log_files(base: Path, max_files: int, since: Optional[float]) -> list[Path]:
+    """Newest ``*.log`` files; with ``since``, rotated ``*.log.N`` / ``*.gz``
+    segments modified inside the window too."""
+    if base.is_file():
+        return [base]
+    found = list(base.glob("*.log"))
+    if since is not None:
+        found += [p for p in base.glob("*.log.*") if p.suffix == ".gz" or p.suffix[1:].isdigit()]
+    stamped = []
+    for p in found:
+        try:
+            mtime = p.stat().st_mtime
+        except OSError:
+            continue
+        if since is None or mtime >= since:
+            stamped.append((mtime, p))
+    stamped.sort(key=lambda t: t[0], reverse=True)
+    return [p for _, p in stamped[:max_files]]
+
+
+def tail_recent_errors(log_dir: str, max_files: int = 4, lines_per_file: int = 200,
+                       since: Optional[float] = None) -> list[dict[str, Any]]:
+    """Error records in the last ``lines_per_file`` lines of each recent log.
+
+    Each match is a whole record — a logged exception arrives with its
+    traceback — read backwards from the end of the file in bounded memory.
+    ``since`` (epoch seconds) drops records older than the cutoff.
+    """
     out: list[dict[str, Any]] = []
     if not log_dir:
         return out
     base = Path(log_dir)
     if not base.exists():
         return out
-    if base.is_file():
-        files = [base]
-    else:
-        files = sorted(base.glob("*.log"), key=lambda p: p.stat().st_mtime, reverse=True)[:max_files]
-    for f in files:
+    for f in _log_files(base, max_files, since):
         try:
-            with f.open("rb") as fh:
-                # Tail naive
-                fh.seek(0, os.SEEK_END)
-                size = fh.tell()
-                # ~32 KB tail is enough
-                fh.seek(max(0, size - 32_768))
-                tail = fh.read().decode("utf-8", errors="replace").splitlines()[-lines_per_file:]
+            lines = _tail_lines(f, lines_per_file, since)
         except Exception:
             continue
+        start = _window_start(lines, lines_per_file)
         hits = []
-        for i, line in enumerate(tail):
-            for pat in _LOG_ERROR_PATTERNS:
-                if pat.search(line):
-                    hits.append({"line_no": i, "text": redact(line)[:300]})
-                    break
+        last_ts: Optional[float] = None
+        for i, record in _group_records(lines[start:]):
+            ts = _log_epoch(record[0])
+            last_ts = ts if ts is not None else last_ts
+            if since is not None and last_ts is not None and last_ts < since:
+                continue
+            if any(_LOG_ERROR_TABLE.any(line) for line in record):
+                hit: dict[str, Any] = {"line_no": i,
+                                       "text": _clip_record(redact("\n".join(record)))}
+                if len(record) > 1:
+                    hit["lines"] = len(record)
+                hits.append(hit)
         if hits:
             out.append({"file": normalize_home(str(f)), "matches": hits[-15:]})  # cap per file
     return out
 
 
+def parse_since(text: str) -> float:
+    """``"2h"`` / ``"30m"`` / ``"1d"`` / ``"90s"`` / ``"1w"`` -> seconds."""
+    m = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([smhdw])\s*", text or "")
+    if not m:
+        raise argparse.ArgumentTypeError(f"expected e.g. 30m, 2h, 1d — got {text!r}")
+    return float(m.group(1)) * {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800}[m.group(2)]
+
+
 # --------------------------------------------------------------------------- #
 # Session JSONL scanner (privacy-bounded)                                     #
 # --------------------------------------------------------------------------- #
@@ -916,6 +1243,9 @@ class SessionScanResult:
     signal_counts: dict[str, int] = field(default_factory=dict)
     examples: list[dict[str, Any]] = field(default_factory=list)
     notes: str = ""
+    #: Files whose index entry was still exact, and bytes actually parsed.
+    sessions_reused: int = 0
+    bytes_scanned: int = 0
 
 
 def _redact_snippet(text: str, max_len: int = 220) -> str:
@@ -927,66 +1257,312 @@ def _redact_snippet(text: str, max_len: int = 220) -> str:
     return s
 
 
-def scan_sessions(max_sessions: int = 60, max_examples: int = 12) -> SessionScanResult:
+#: Lowercase literals at least one of which appears in any line a signal
+#: pattern can match. A line containing none of them is skipped before it is
+#: decoded, which on a real transcript is the vast majority of lines. Keep in
+#: step with _SIGNAL_PATTERNS — the test suite checks every label has anchors
+#: and every positive fixture passes the filter.
+_SIGNAL_ANCHORS: dict[str, tuple[str, ...]] = {
+    "rag-mention": ("ragtools", "rac/rag", "rag-plugin", "search_knowledge_base",
+                    "knowledge base"),
+    "rag-port": ("21420",),
+    "mcp-error": ("mcp", "plugin:rag"),
+    "retrieval-skipped": ("don't have",),
+    "user-correct-search": ("didn", "knowledge base", "search first", "did you check"),
+    "rag-error-line": ("[rag ",),
+    "connect-refused": ("econnrefused", "connection refused", "httpconnectionpool"),
+    "port-in-use": ("eaddrinuse", "in use"),
+    "hook-path-fatal": ("open file", "[errno 2]", "claude_plugin_root"),
+}
+_ANCHOR_BYTES = tuple(sorted({a.encode("ascii") for anchors in _SIGNAL_ANCHORS.values()
+                              for a in anchors}))
+_FOLD_ESCAPES = tuple(json.dumps(b.decode("utf-8")).strip('"').lower().encode("ascii")
+                      for b in FOLD_BYTES)
+_SIGNAL_TABLE = PatternTable(
+    (label, pat, _SIGNAL_ANCHORS[label]) for label, pat in _SIGNAL_PATTERNS)
+#: Lines longer than this are skipped outright (a pasted blob, not a signal).
+_MAX_SESSION_LINE = 200_000
+
+
+def _could_signal(line: bytes) -> bool:
+    """Cheap prefilter on the raw JSONL bytes. Conservative: a JSON escape that
+    could hide an anchor (``\\/`` or ``\\u00XX``) or a character that
+    case-folds onto one (see ``pattern_table.fold``) always passes."""
+    low = line.lower()
+    if b"\\/" in low or b"\\u00" in low:
+        return True
+    if not low.isascii() and any(b in low for b in FOLD_BYTES):
+        return True
+    if b"\\u" in low and any(e in low for e in _FOLD_ESCAPES):
+        return True
+    return any(a in low for a in _ANCHOR_BYTES)
+
+
+#: Per-file scan state so a re-run only parses bytes appended since the last
+#: one. Keyed to the signal set: see :func:`_scan_index_key`.
+SESSION_INDEX_FILE = "session-scan-index.json"
+_SESSION_INDEX_SCHEMA = 2
+#: Bytes before the recorded offset compared on resume; a mismatch means the
+#: file was rewritten rather than appended to, and it is rescanned from 0.
+_RESUME_CHECK_BYTES = 64
+
+
+def _session_files(base: Path, max_sessions: int) -> tuple[int, list[tuple[Path, os.stat_result]]]:
+    """``(found, newest-first (file, stat))`` — one stat per file."""
+    stamped: list[tuple[float, str, os.stat_result]] = []
+    for child in base.iterdir():
+        if not child.is_dir():
+            continue
+        for f in child.glob("*.jsonl"):
+            try:
+                st = f.stat()
+            except OSError:
+                continue
+            stamped.append((st.st_mtime, str(f), st))
+    stamped.sort(key=lambda t: t[0], reverse=True)
+    return len(stamped), [(Path(p), st) for _, p, st in stamped[:max_sessions]]
+
+
+def _scan_session_file(path: str, start: int = 0) -> dict[str, Any]:
+    """Scan one transcript from byte ``start``. Pure and picklable, so it runs
+    in a worker process.
+
+    Returns per-signal line counts and, per label, the first two snippets in
+    line order — a superset of anything the global example caps can select
+    from this file, so the merge in :func:`scan_sessions` reproduces the serial
+    result exactly. ``offset`` is the end of the last complete line. A final
+    line with no newline yet (the last record of a finished transcript, or one
+    still being written) is scanned into ``tail`` instead: reported by this
+    run, but not folded into the indexed counts, so the next run reads it
+    again from ``offset`` and never counts it twice.
+    """
+    counts: dict[str, int] = {}
+    examples: list[tuple[str, str]] = []
+    kept: dict[str, int] = {}
+    tail: dict[str, Any] = {"counts": {}, "examples": []}
+    offset = read = start
+    try:
+        with open(path, "rb") as fh:
+            fh.seek(start)
+            for line in fh:
+                read += len(line)
+                if line.endswith(b"\n"):
+                    offset += len(line)
+                    label, msg = _session_line_signal(line)
+                    if label is not None:
+                        counts[label] = counts.get(label, 0) + 1
+                        if kept.get(label, 0) < 2:
+                            examples.append((label, _redact_snippet(msg)))
+                            kept[label] = kept.get(label, 0) + 1
+                    continue
+                label, msg = _session_line_signal(line)
+                if label is not None:
+                    tail = {"counts": {label: 1}, "examples": [(label, _redact_snippet(msg))]}
+    except Exception:
+        return {"ok": False, "counts": {}, "examples": [], "offset": 0, "bytes": 0}
+    return {"ok": True, "counts": counts, "examples": examples, "tail": tail,
+            "offset": offset, "bytes": read - start}
+
+
+def _session_line_signal(line: bytes) -> tuple[Optional[str], str]:
+    """``(label, text)`` of the first signal one transcript line carries, or
+    ``(None, "")``."""
+    if len(line) > _MAX_SESSION_LINE or not _could_signal(line):
+        return None, ""
+    raw = line.decode("utf-8", errors="replace").strip()
+    if not raw or not raw.startswith("{"):
+        return None, ""
+    try:
+        rec = json.loads(raw)
+    except json.JSONDecodeError:
+        return None, ""
+    # Pull a textual representation for signal scanning
+    msg = rec.get("message") or rec.get("content") or rec.get("text") or ""
+    if isinstance(msg, (dict, list)):
+        msg = json.dumps(msg, ensure_ascii=False)
+    elif not isinstance(msg, str):
+        msg = str(msg)
+    if not msg:
+        # As a last resort try the whole record
+        msg = raw[:4000]
+    # First matching signal only: don't double-count a line
+    return _SIGNAL_TABLE.first(msg), msg
+
+
+def _scan_files(tasks: list[tuple[str, int]], jobs: int) -> list[dict[str, Any]]:
+    """Per-file results for ``(path, start)`` tasks, in input order. ``jobs > 1``
+    shards across processes; a pool that cannot start (frozen interpreter, no
+    fork, unpicklable module name) falls back to scanning in-process."""
+    if jobs > 1 and len(tasks) > 1:
+        try:
+            from concurrent.futures import ProcessPoolExecutor
+
+            with ProcessPoolExecutor(max_workers=min(jobs, len(tasks))) as pool:
+                return list(pool.map(_scan_session_file,
+                                     [p for p, _ in tasks], [o for _, o in tasks]))
+        except Exception:
+            pass
+    return [_scan_session_file(p, o) for p, o in tasks]
+
+
+def _scan_index_key() -> str:
+    """Changes whenever a stored count could mean something different: a new
+    report engine, or an edited signal pattern, anchor or line cap."""
+    material = json.dumps([
+        _SESSION_INDEX_SCHEMA, REPORT_VERSION, _MAX_SESSION_LINE,
+        [(label, pat.pattern, pat.flags) for label, pat in _SIGNAL_PATTERNS],
+        sorted((k, list(v)) for k, v in _SIGNAL_ANCHORS.items()),
+    ])
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()[:16]
+
+
+def _load_scan_index(path: Path, key: str) -> dict[str, dict[str, Any]]:
+    try:
+        blob = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(blob, dict) or blob.get("key") != key:
+        return {}
+    files = blob.get("files")
+    return files if isinstance(files, dict) else {}
+
+
+def _save_scan_index(path: Path, key: str, files: dict[str, dict[str, Any]]) -> None:
+    """Atomic replace; a report must never fail because its cache did."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps({"key": key, "files": files}), encoding="utf-8")
+        os.replace(tmp, path)
+    except (OSError, ValueError, TypeError):
+        pass
+
+
+def _resume_offset(path: str, st: os.stat_result, entry: Optional[dict[str, Any]]) -> Optional[int]:
+    """Where to continue scanning ``path`` given its index entry.
+
+    ``None`` means the entry is still exact (nothing to read); ``0`` means
+    rescan; otherwise the recorded offset, once the bytes just before it are
+    confirmed unchanged (transcripts are append-only, a rewrite is not).
+    """
+    if (not isinstance(entry, dict) or entry.get("ino") != st.st_ino
+            or not isinstance(entry.get("offset"), int)
+            or not isinstance(entry.get("counts"), dict)
+            or not isinstance(entry.get("examples"), list)):
+        return 0
+    offset = entry["offset"]
+    if st.st_size == entry.get("size") and st.st_mtime_ns == entry.get("mtime_ns"):
+        return None
+    if st.st_size <= offset:
+        return 0
+    lo = max(0, offset - _RESUME_CHECK_BYTES)
+    try:
+        with open(path, "rb") as fh:
+            fh.seek(lo)
+            tail = fh.read(offset - lo)
+    except OSError:
+        return 0
+    if hashlib.sha256(tail).hexdigest() != entry.get("tail_sha256"):
+        return 0
+    return offset
+
+
+def _tail_digest(path: str, offset: int) -> str:
+    lo = max(0, offset - _RESUME_CHECK_BYTES)
+    try:
+        with open(path, "rb") as fh:
+            fh.seek(lo)
+            return hashlib.sha256(fh.read(offset - lo)).hexdigest()
+    except OSError:
+        return ""
+
+
+def _extend_entry(entry: dict[str, Any], new: dict[str, Any]) -> dict[str, Any]:
+    """Fold a resumed scan of appended lines into the file's indexed result,
+    keeping the first two examples per label in line order."""
+    counts = dict(entry.get("counts") or {})
+    for label, n in new["counts"].items():
+        counts[label] = counts.get(label, 0) + n
+    kept: dict[str, int] = {}
+    examples = []
+    for label, snippet in list(entry.get("examples") or []) + new["examples"]:
+        if kept.get(label, 0) < 2:
+            examples.append((label, snippet))
+            kept[label] = kept.get(label, 0) + 1
+    return dict(new, counts=counts, examples=examples)
+
+
+def scan_sessions(max_sessions: int = 60, max_examples: int = 12,
+                  jobs: int = 1, full_rescan: bool = False) -> SessionScanResult:
+    """Scan the newest session transcripts for RAG-related signals.
+
+    Per-file results are kept in ``~/.claude/rag-plugin/session-scan-index.json``;
+    a re-run reads only files that changed, from where the last run stopped.
+    ``full_rescan`` ignores the index (it is still rewritten). ``jobs`` > 1 scans
+    files in a process pool (0 = one per CPU). Results are merged in
+    newest-first file order, so counts and the retained examples are identical
+    for every ``jobs`` value and with or without the index.
+    """
     res = SessionScanResult()
     base = Path.home() / ".claude" / "projects"
     if not base.exists():
         res.notes = "no Claude session directory found"
         return res
-    files: list[Path] = []
-    for child in base.iterdir():
-        if not child.is_dir():
-            continue
-        for f in child.glob("*.jsonl"):
-            files.append(f)
-    res.sessions_found = len(files)
-    files.sort(key=lambda p: p.stat().st_mtime, reverse=True)
-    files = files[:max_sessions]
+    res.sessions_found, files = _session_files(base, max_sessions)
+    if jobs <= 0:
+        jobs = os.cpu_count() or 1
+
+    index_path = Path.home() / ".claude" / "rag-plugin" / SESSION_INDEX_FILE
+    key = _scan_index_key()
+    prior = {} if full_rescan else _load_scan_index(index_path, key)
+
+    plan = []
+    for f, st in files:
+        entry = prior.get(str(f))
+        plan.append((f, st, entry, _resume_offset(str(f), st, entry)))
+    scanned = iter(_scan_files([(str(f), start) for f, _, _, start in plan
+                                if start is not None], jobs))
+
+    parts: list[dict[str, Any]] = []
+    index: dict[str, dict[str, Any]] = {}
+    for f, st, entry, start in plan:
+        if start is None:
+            res.sessions_reused += 1
+        else:
+            new = next(scanned)
+            res.bytes_scanned += new["bytes"]
+            # Counted here, not in _scan_session_file: that may run in a worker process.
+            TRACE.count("bytes_read", new["bytes"])
+            if start and new["ok"]:
+                new = _extend_entry(entry, new)
+            entry = dict(new, ino=st.st_ino, size=st.st_size, mtime_ns=st.st_mtime_ns,
+                         tail_sha256=_tail_digest(str(f), new["offset"]))
+        parts.append(entry)
+        if entry.get("ok"):
+            index[str(f)] = entry
+    _save_scan_index(index_path, key, index)
 
     seen_examples_per_signal: dict[str, int] = {}
-    for f in files:
+    for (f, _), part in zip(files, parts):
         res.sessions_scanned += 1
-        any_signal = False
-        try:
-            with f.open("r", encoding="utf-8", errors="replace") as fh:
-                for raw in fh:
-                    if len(raw) > 200_000:
-                        continue  # huge single line, skip
-                    raw = raw.strip()
-                    if not raw or not raw.startswith("{"):
-                        continue
-                    try:
-                        rec = json.loads(raw)
-                    except json.JSONDecodeError:
-                        continue
-                    # Pull a textual representation for signal scanning
-                    msg = rec.get("message") or rec.get("content") or rec.get("text") or ""
-                    if isinstance(msg, dict):
-                        msg = json.dumps(msg, ensure_ascii=False)
-                    elif isinstance(msg, list):
-                        msg = json.dumps(msg, ensure_ascii=False)
-                    elif not isinstance(msg, str):
-                        msg = str(msg)
-                    if not msg:
-                        # As a last resort try the whole record
-                        msg = raw[:4000]
-                    for label, pat in _SIGNAL_PATTERNS:
-                        if pat.search(msg):
-                            res.signal_counts[label] = res.signal_counts.get(label, 0) + 1
-                            any_signal = True
-                            seen = seen_examples_per_signal.get(label, 0)
-                            if seen < 2 and len(res.examples) < max_examples:
-                                res.examples.append({
-                                    "session_file": normalize_home(str(f)),
-                                    "signal": label,
-                                    "snippet": _redact_snippet(msg),
-                                })
-                                seen_examples_per_signal[label] = seen + 1
-                            # Don't double-count multiple patterns on same line
-                            break
-        except Exception:
+        if not part.get("ok"):
             continue
-        if any_signal:
+        tail = part.get("tail") or {}
+        counts = dict(part["counts"])
+        for label, n in (tail.get("counts") or {}).items():
+            counts[label] = counts.get(label, 0) + n
+        for label, n in counts.items():
+            res.signal_counts[label] = res.signal_counts.get(label, 0) + n
+        for label, snippet in list(part["examples"]) + list(tail.get("examples") or []):
+            seen = seen_examples_per_signal.get(label, 0)
+            if seen < 2 and len(res.examples) < max_examples:
+                res.examples.append({
+                    "session_file": normalize_home(str(f)),
+                    "signal": label,
+                    "snippet": snippet,
+                })
+                seen_examples_per_signal[label] = seen + 1
+        if counts:
             res.sessions_with_signal += 1
     return res
 
@@ -1997,8 +2573,24 @@ def render_plugin_report(state: State, plugin: PluginInspection,
     return "\n".join(md)
 
 
+def _render_timings(timings: list[dict[str, Any]]) -> str:
+    if not timings:
+        return "_No phase timings recorded._\n"
+    lines = ["| Phase | Wall (ms) | Bytes read | HTTP calls |", "|---|---:|---:|---:|"]
+    for row in timings:
+        lines.append(f"| {row['phase']} | {row['ms']:.1f} | {row['bytes_read']:,} | "
+                     f"{row['http_calls']} |")
+    total = sum(row["ms"] for row in timings)
+    lines.append(f"| **total** | **{total:.1f}** | "
+                 f"**{sum(row['bytes_read'] for row in timings):,}** | "
+                 f"**{sum(row['http_calls'] for row in timings)}** |")
+    return "\n".join(lines) + "\n"
+
+
 def render_summary(state: State, app_findings: list[Finding], plugin_findings: list[Finding],
-                   plugin: PluginInspection, meta: dict[str, str], outdir: Path) -> str:
+                   plugin: PluginInspection, meta: dict[str, str], outdir: Path,
+                   timings: Optional[list[dict[str, Any]]] = None,
+                   trace_file: str = "") -> str:
     md: list[str] = []
     md.append("# rag-plugin Diagnostic Summary\n")
     md.append(f"_Generated at {meta['timestamp']} (report engine v{REPORT_VERSION})._\n")
@@ -2029,7 +2621,13 @@ def render_summary(state: State, app_findings: list[Finding], plugin_findings: l
     md.append(f"- [`github-rag-issue.md`](github-rag-issue.md)")
     md.append(f"- [`github-plugins-issue.md`](github-plugins-issue.md)")
     md.append(f"- [`redacted-diagnostics.json`](redacted-diagnostics.json)")
+    if trace_file:
+        md.append(f"- [`{trace_file}`]({trace_file}) — open in chrome://tracing or ui.perfetto.dev")
     md.append("")
+    if timings is not None:
+        md.append("## Timings\n")
+        md.append("Wall time and I/O per phase of this run (writing the files excluded).\n")
+        md.append(_render_timings(timings))
     md.append(f"Output directory: `{normalize_home(str(outdir))}`\n")
     md.append("\n_This command does NOT upload anything. Copy the GitHub-ready files into a new issue manually._\n")
     return "\n".join(md)
@@ -2365,6 +2963,17 @@ def main(argv: Optional[list[str]] = None) -> int:
                     help="skip the session JSONL scanner (privacy-cautious mode)")
     ap.add_argument("--max-sessions", type=int, default=60,
                     help="max session JSONL files to scan (default: 60, newest-first)")
+    ap.add_argument("--since", type=parse_since, default=None, metavar="AGE",
+                    help="only report service-log errors newer than AGE (e.g. 30m, 2h, 1d); "
+                         "rotated log segments inside the window are read too")
+    ap.add_argument("--full-rescan", action="store_true",
+                    help="ignore the session-scan index and rescan every file from byte 0")
+    ap.add_argument("--jobs", type=int, default=1,
+                    help="scan session files in N worker processes (0 = one per CPU; "
+                         "default: 1, in-process)")
+    ap.add_argument("--trace", action="store_true",
+                    help="also write report-trace.json (Chrome trace-event format) with "
+                         "every phase, HTTP call and subprocess")
     ap.add_argument("--quiet", action="store_true", help="suppress progress lines")
     ap.add_argument("--self-test", action="store_true", help="run internal sanity tests and exit")
     ap.add_argument("--create", action="store_true",
@@ -2394,9 +3003,13 @@ def main(argv: Optional[list[str]] = None) -> int:
         if not args.quiet:
             print(f"[rag_report] {msg}")
 
+    global TRACE
+    TRACE = Tracer()
+
     # Resolve plugin
-    plugin_dir = find_plugin_dir()
-    plugin = inspect_plugin(plugin_dir)
+    with TRACE.span("plugin"):
+        plugin_dir = find_plugin_dir()
+        plugin = inspect_plugin(plugin_dir)
     plugin_version = plugin.manifest_version or "unknown"
     meta = _gather_meta(plugin_version)
 
@@ -2416,66 +3029,97 @@ def main(argv: Optional[list[str]] = None) -> int:
     # Probe state
     state = State()
     log("detecting install mode")
-    detect_install_mode(state)
+    with TRACE.span("detect"):
+        detect_install_mode(state)
     log(f"install_mode={state.install_mode}")
 
     if state.install_mode != "not-installed":
-        log("probing service /health")
-        probe_service(state)
-        log(f"service_mode={state.service_mode}")
-        if state.service_mode == "UP":
-            probe_api(state)
-            # Newer structured contract — preferred source of watcher/freshness
-            # signal while the service is UP. No-ops on older builds (404).
-            probe_system_health(state)
-        if state.binary_path:
-            detect_version(state)
-        # When the service is NOT UP, fall back to `rag doctor --json` so a
-        # down-service report still gets a structured signal. No-op on older
-        # ragtools that lacks the --json flag.
-        if state.service_mode != "UP":
-            probe_doctor_json(state)
-        resolve_default_paths(state)
+        with TRACE.span("probe"):
+            log("probing service /health")
+            with TRACE.span("probe_service"):
+                probe_service(state)
+            log(f"service_mode={state.service_mode}")
+            if state.service_mode == "UP":
+                with TRACE.span("probe_api"):
+                    probe_api(state)
+                # Newer structured contract — preferred source of watcher/freshness
+                # signal while the service is UP. No-ops on older builds (404).
+                with TRACE.span("probe_system_health"):
+                    probe_system_health(state)
+            if state.binary_path:
+                with TRACE.span("detect_version"):
+                    detect_version(state)
+            # When the service is NOT UP, fall back to `rag doctor --json` so a
+            # down-service report still gets a structured signal. No-op on older
+            # ragtools that lacks the --json flag.
+            if state.service_mode != "UP":
+                with TRACE.span("probe_doctor_json"):
+                    probe_doctor_json(state)
+            resolve_default_paths(state)
 
     # Inspect Claude config
     log("inspecting Claude config")
-    cci = inspect_claude_config()
+    with TRACE.span("config"):
+        cci = inspect_claude_config()
 
     # Hook log
     log("inspecting hook decision log")
-    hook_stats = inspect_hook_log()
+    with TRACE.span("hook_log"):
+        hook_stats = inspect_hook_log()
 
     # Tail logs
     log_hits: list[dict[str, Any]] = []
     if state.log_path:
-        log_hits = tail_recent_errors(state.log_path)
+        with TRACE.span("log_tail"):
+            log_hits = tail_recent_errors(
+                state.log_path,
+                since=None if args.since is None else time.time() - args.since)
 
     # Sessions
     if args.no_sessions:
         scan = SessionScanResult(notes="session scan skipped (--no-sessions)")
     else:
         log(f"scanning sessions (max {args.max_sessions})")
-        scan = scan_sessions(max_sessions=args.max_sessions)
+        with TRACE.span("sessions", jobs=args.jobs):
+            scan = scan_sessions(max_sessions=args.max_sessions, jobs=args.jobs,
+                                 full_rescan=args.full_rescan)
 
     # Synthesize
     log("synthesizing findings")
-    app_findings, plugin_findings = synthesize_findings(state, plugin, cci, hook_stats, log_hits, scan)
+    with TRACE.span("synthesis"):
+        app_findings, plugin_findings = synthesize_findings(state, plugin, cci, hook_stats,
+                                                            log_hits, scan)
 
     # Render reports
-    app_md = render_application_report(state, log_hits, app_findings, meta)
-    plugin_md = render_plugin_report(state, plugin, cci, hook_stats, scan, plugin_findings, meta)
-    summary_md = render_summary(state, app_findings, plugin_findings, plugin, meta, outdir)
-    # Route every finding to its issue by target (merging both source lists) so a
-    # service-down MCP/retrieval fault re-targeted to 'rag' lands in the rag issue
-    # instead of being silently dropped. `dropped` surfaces the invariant.
-    rag_findings, plugins_findings, dropped = route_findings(app_findings, plugin_findings)
-    if dropped:
-        print(f"[rag_report] WARNING: {len(dropped)} finding(s) had an unroutable target and were "
-              f"omitted from issues: {dropped}", file=sys.stderr)
-    issue_rag = render_github_issue("rag", rag_findings,
-                                    state, plugin, cci, hook_stats, scan, meta)
-    issue_plg = render_github_issue("plugins", plugins_findings,
-                                    state, plugin, cci, hook_stats, scan, meta)
+    with TRACE.span("render"):
+        app_md = render_application_report(state, log_hits, app_findings, meta)
+        plugin_md = render_plugin_report(state, plugin, cci, hook_stats, scan,
+                                         plugin_findings, meta)
+        # Route every finding to its issue by target (merging both source lists) so a
+        # service-down MCP/retrieval fault re-targeted to 'rag' lands in the rag issue
+        # instead of being silently dropped. `dropped` surfaces the invariant.
+        rag_findings, plugins_findings, dropped = route_findings(app_findings, plugin_findings)
+        if dropped:
+            print(f"[rag_report] WARNING: {len(dropped)} finding(s) had an unroutable target "
+                  f"and were omitted from issues: {dropped}", file=sys.stderr)
+        issue_rag = render_github_issue("rag", rag_findings,
+                                        state, plugin, cci, hook_stats, scan, meta)
+        issue_plg = render_github_issue("plugins", plugins_findings,
+                                        state, plugin, cci, hook_stats, scan, meta)
+
+        # Issue creation plan + clean (post-preamble, fingerprint-marked) issue bodies.
+        routed = [
+            ("rag", rag_findings, issue_rag, "github-rag-issue.md"),
+            ("plugins", plugins_findings, issue_plg, "github-plugins-issue.md"),
+        ]
+        issue_plan, issue_bodies = build_issue_plan(routed, state, plugin)
+
+    # Every phase up to here is closed, so the summary and the diagnostics can
+    # carry their timings; only writing the files (and the trace) is left.
+    timings = TRACE.phases()
+    trace_file = "report-trace.json" if args.trace else ""
+    summary_md = render_summary(state, app_findings, plugin_findings, plugin, meta, outdir,
+                                timings=timings, trace_file=trace_file)
 
     # Structured diagnostics (machine-readable, redacted)
     diag = {
@@ -2484,7 +3128,10 @@ def main(argv: Optional[list[str]] = None) -> int:
         "host": meta["hostname"],
         "platform": meta["platform"],
         "plugin_version": plugin.manifest_version,
-        "state": {k: v for k, v in asdict(state).items() if k != "health_status"},
+        "state": {k: v for k, v in asdict(state).items()
+                  if k not in ("health_status", "probe_timings")},
+        "probe_timings": state.probe_timings,
+        "timings": timings,
         "plugin": asdict(plugin),
         "claude_config": asdict(cci),
         "hook_stats": asdict(hook_stats),
@@ -2494,13 +3141,6 @@ def main(argv: Optional[list[str]] = None) -> int:
         "plugin_findings": [f.to_dict() for f in plugin_findings],
     }
 
-    # Issue creation plan + clean (post-preamble, fingerprint-marked) issue bodies.
-    routed = [
-        ("rag", rag_findings, issue_rag, "github-rag-issue.md"),
-        ("plugins", plugins_findings, issue_plg, "github-plugins-issue.md"),
-    ]
-    issue_plan, issue_bodies = build_issue_plan(routed, state, plugin)
-
     files = {
         "rag-application-setup-report.md": app_md,
         "rag-plugin-behavior-report.md": plugin_md,
@@ -2511,12 +3151,21 @@ def main(argv: Optional[list[str]] = None) -> int:
         "issue-plan.json": json.dumps(issue_plan, indent=2),
     }
     files.update(issue_bodies)
-    for name, content in files.items():
-        path = outdir / name
+    with TRACE.span("write", files=len(files)):
+        for name, content in files.items():
+            path = outdir / name
+            try:
+                path.write_text(content, encoding="utf-8")
+            except Exception as e:
+                print(f"[rag_report] FATAL: writing {path}: {e}", file=sys.stderr)
+                return 3
+    if trace_file:
+        # Last, so the trace also shows the write phase.
+        files[trace_file] = json.dumps(TRACE.chrome_trace())
         try:
-            path.write_text(content, encoding="utf-8")
+            (outdir / trace_file).write_text(files[trace_file], encoding="utf-8")
         except Exception as e:
-            print(f"[rag_report] FATAL: writing {path}: {e}", file=sys.stderr)
+            print(f"[rag_report] FATAL: writing {outdir / trace_file}: {e}", file=sys.stderr)
             return 3
 
     if not args.quiet:
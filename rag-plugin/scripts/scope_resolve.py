@@ -53,9 +53,12 @@ hook on every qualifying prompt.
 
 from __future__ import annotations
 
+import hashlib
 import json
 import os
 import subprocess
+import sys
+import threading
 import time
 import urllib.error
 import urllib.request
@@ -80,6 +83,7 @@ __all__ = [
 SCRIPT_VERSION = "1.0.0"
 
 STATE_DIR = Path.home() / ".claude" / "rag-plugin" / "state"
+#: The pre-shard single-file cache. Read as a fallback, never written.
 CACHE_FILE = STATE_DIR / "context-cache.json"
 #: Scope changes when the directory changes, not when the prompt does. Long
 #: enough that a normal session never re-fetches; short enough that adding a
@@ -97,6 +101,19 @@ NAME_PARTIAL = "name-partial"
 
 _PRECEDENCE = {EXACT: 3, ANCESTOR: 2, DESCENDANT: 1}
 
+# The shared keep-alive client: the hook's /health, /api/projects/configured
+# and /api/search then travel over one connection instead of three. Optional —
+# a missing sibling degrades to plain urllib, never to an import error.
+# This import is the one way the plugin loads it: the hooks reach it through
+# this module (context_inject) or the same sys.path entry (lock_conflict_check),
+# so every caller in a process shares one module and one pool.
+if str(Path(__file__).resolve().parent) not in sys.path:
+    sys.path.insert(0, str(Path(__file__).resolve().parent))
+try:
+    import http_keepalive  # noqa: E402
+except ImportError:  # pragma: no cover - sibling always ships
+    http_keepalive = None
+
 
 # --------------------------------------------------------------------------- #
 # Path normalisation — the single owner of path comparison                     #
@@ -125,12 +142,7 @@ def norm(p: str) -> str:
     return out
 
 
-def detect_git_root(start: Path) -> Optional[Path]:
-    """Nearest ancestor containing ``.git``, else ``git rev-parse``, else None."""
-    try:
-        p = Path(start).resolve()
-    except (OSError, ValueError):
-        return None
+def _find_git_root(p: Path) -> Optional[Path]:
     for ancestor in [p] + list(p.parents):
         try:
             if (ancestor / ".git").exists():
@@ -149,10 +161,83 @@ def detect_git_root(start: Path) -> Optional[Path]:
     return None
 
 
+#: ``cwd -> (git root, workspace key)``, persisted so the ``UserPromptSubmit``
+#: hook does not spawn ``git rev-parse`` on every prompt outside any
+#: repository. "Not a git repo" is remembered too. One shard per directory,
+#: ``workspace-keys/<sha256(dir)[:32]>.json``, written by atomic replace like
+#: the scope cache's (see :data:`CACHE_DIR`), so concurrent sessions never
+#: overwrite each other's entries.
+WORKSPACE_MEMO_DIR = STATE_DIR / "workspace-keys"
+#: The pre-shard single-file memo. Never read now; removed by a full
+#: :func:`invalidate_cache`.
+WORKSPACE_MEMO_FILE = STATE_DIR / "workspace-keys.json"
+#: An entry holds while no ``.git`` has appeared in the directory or any
+#: ancestor below the remembered root (``git init`` there), the root still has
+#: its own, and for at most this long.
+WORKSPACE_MEMO_TTL_SECONDS = CACHE_TTL_SECONDS
+WORKSPACE_MEMO_MAX = 512
+_MEMO_SCHEMA = 2
+
+
+def _memo_holds(p: Path, root: Optional[str]) -> bool:
+    """True while ``root`` is still the nearest ancestor of ``p`` with a
+    ``.git`` (``None``: no ancestor has one). Probes the same directories as
+    :func:`_find_git_root`, but never spawns ``git``."""
+    stop = Path(root) if root else None
+    for ancestor in [p] + list(p.parents):
+        found = (ancestor / ".git").exists()
+        if ancestor == stop:
+            return found
+        if found:
+            return False
+    return stop is None
+
+
+def _workspace(cwd: Path, now: Optional[float] = None) -> tuple[Optional[str], str]:
+    """``(git root or None, workspace key)`` for ``cwd``, memoised."""
+    try:
+        p = Path(cwd).resolve()
+    except (OSError, ValueError):
+        return None, norm(str(cwd))
+    current = time.time() if now is None else now
+    memoise = os.path.isdir(p)
+    shard = _shard(str(p), WORKSPACE_MEMO_DIR)
+    if memoise:
+        try:
+            hit = _load_json_file(shard)
+            if (isinstance(hit, dict) and hit.get("dir") == str(p)
+                    and 0 <= current - float(hit.get("at", 0)) <= WORKSPACE_MEMO_TTL_SECONDS
+                    and _memo_holds(p, hit.get("root"))):
+                return hit.get("root"), hit["key"]
+        except (OSError, ValueError, TypeError, AttributeError, KeyError):
+            pass
+
+    root = _find_git_root(p)
+    key = norm(str(root or cwd))
+    if memoise:
+        try:
+            WORKSPACE_MEMO_DIR.mkdir(parents=True, exist_ok=True)
+            _atomic_write(shard, {"schema": _MEMO_SCHEMA, "dir": str(p),
+                                  "root": str(root) if root else None, "key": key,
+                                  "at": current})
+            _evict(WORKSPACE_MEMO_MAX, WORKSPACE_MEMO_DIR)
+        except (OSError, ValueError, TypeError):
+            pass
+    return (str(root) if root else None), key
+
+
+def detect_git_root(start: Path) -> Optional[Path]:
+    """Nearest ancestor containing ``.git``, else ``git rev-parse``, else None.
+
+    Memoised per directory, one shard each in :data:`WORKSPACE_MEMO_DIR`.
+    """
+    root, _ = _workspace(start)
+    return Path(root) if root else None
+
+
 def resolve_workspace_key(cwd: Path) -> str:
     """Stable key for a workspace: normalised git root, else normalised cwd."""
-    root = detect_git_root(cwd) or Path(cwd)
-    return norm(str(root))
+    return _workspace(cwd)[1]
 
 
 # --------------------------------------------------------------------------- #
@@ -177,6 +262,9 @@ class ProjectMatch:
     mode: str = "docs"
     state: str = ""
     enabled: bool = True
+    #: When the service last indexed the project, as it reports it (naive
+    #: local time; compare for equality only). "" when it does not say.
+    last_indexed: str = ""
     raw: dict[str, Any] = field(default_factory=dict, compare=False, repr=False)
 
     @property
@@ -232,6 +320,8 @@ class ScopeDecision:
 
 
 def _http_json(url: str, timeout: float = 1.5) -> Any:
+    if http_keepalive is not None:
+        return http_keepalive.get_json(url, timeout=timeout)
     try:
         req = urllib.request.Request(
             url, headers={"User-Agent": f"rag-plugin-scope/{SCRIPT_VERSION}"}
@@ -303,6 +393,7 @@ def _make(project: dict[str, Any], path: str, method: str, score: int) -> Projec
         mode=str(project.get("mode") or "docs"),
         state=str(project.get("state") or ""),
         enabled=bool(project.get("enabled", True)),
+        last_indexed=str(project.get("last_indexed") or ""),
         raw=project,
     )
 
@@ -432,18 +523,77 @@ def match_project(cwd: Path, projects: list[dict[str, Any]],
 # --------------------------------------------------------------------------- #
 
 
+#: One shard per workspace: ``context-cache/<sha256(key)[:32]>.json``, written
+#: by atomic replace. Two sessions in different repositories never touch the
+#: same file, so neither can lose the other's entry; two sessions in the same
+#: one both write a valid entry and the later wins. No lock is needed.
+CACHE_DIR = STATE_DIR / "context-cache"
+#: Shards kept; beyond this the least recently written are evicted. A
+#: workspace in use is rewritten every TTL, so write time tracks use.
+CACHE_MAX_WORKSPACES = 256
+_SHARD_SCHEMA = 2
+
+#: ``path -> ((inode, mtime_ns, size), parsed blob)`` for cache files already
+#: read. A one-shot hook reads one shard anyway; a resident process (the hook
+#: daemon) skips the re-parse until another session rewrites it.
+_parsed_cache: dict[str, Any] = {}
+_PARSED_MAX = 64
+
+
+def _shard(workspace_key: str, directory: Optional[Path] = None) -> Path:
+    digest = hashlib.sha256(workspace_key.encode("utf-8")).hexdigest()[:32]
+    return (CACHE_DIR if directory is None else directory) / f"{digest}.json"
+
+
+def _load_json_file(path: Path) -> Any:
+    st = path.stat()
+    stamp = (st.st_ino, st.st_mtime_ns, st.st_size)
+    hit = _parsed_cache.get(str(path))
+    if hit is not None and hit[0] == stamp:
+        return hit[1]
+    blob = json.loads(path.read_text(encoding="utf-8"))
+    if len(_parsed_cache) >= _PARSED_MAX:
+        _parsed_cache.clear()
+    _parsed_cache[str(path)] = (stamp, blob)
+    return blob
+
+
+def _atomic_write(path: Path, payload: Any) -> None:
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        tmp.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+        raise
+
+
+def _cached_entry(workspace_key: str) -> Optional[dict[str, Any]]:
+    """The shard's entry; failing that, one from the pre-shard single-file
+    cache (``CACHE_FILE``), which is only ever read now."""
+    shard = _shard(workspace_key)
+    if shard.is_file():
+        blob = _load_json_file(shard)
+        if isinstance(blob, dict) and blob.get("workspace_key") == workspace_key:
+            return blob.get("entry")
+        return None
+    if CACHE_FILE.is_file():
+        return (_load_json_file(CACHE_FILE).get("workspaces") or {}).get(workspace_key)
+    return None
+
+
 def read_cache(workspace_key: str, ttl: float = CACHE_TTL_SECONDS,
                now: Optional[float] = None) -> Optional[dict[str, Any]]:
     """Cached context for a workspace, or None when absent/expired/unreadable.
 
-    Never raises: a hook that dies on a corrupt cache is worse than one that
-    re-resolves.
+    One file read. Never raises: a hook that dies on a corrupt cache is worse
+    than one that re-resolves.
     """
     try:
-        if not CACHE_FILE.is_file():
-            return None
-        blob = json.loads(CACHE_FILE.read_text(encoding="utf-8"))
-        entry = (blob.get("workspaces") or {}).get(workspace_key)
+        entry = _cached_entry(workspace_key)
         if not isinstance(entry, dict):
             return None
         stamped = float(entry.get("as_of_epoch", 0))
@@ -451,25 +601,40 @@ def read_cache(workspace_key: str, ttl: float = CACHE_TTL_SECONDS,
         if current - stamped > ttl:
             return None
         return entry
-    except (OSError, ValueError, TypeError):
+    except (OSError, ValueError, TypeError, AttributeError):
         return None
 
 
+def _evict(keep: Optional[int] = None, directory: Optional[Path] = None) -> None:
+    """Remove the least recently written shards in ``directory`` (default
+    :data:`CACHE_DIR`) beyond ``keep`` (default :data:`CACHE_MAX_WORKSPACES`)."""
+    keep = CACHE_MAX_WORKSPACES if keep is None else keep
+    shards = []
+    with os.scandir(CACHE_DIR if directory is None else directory) as it:
+        for e in it:
+            if e.name.endswith(".json"):
+                try:
+                    shards.append((e.stat().st_mtime_ns, e.path))
+                except OSError:
+                    continue
+    if len(shards) <= keep:
+        return
+    shards.sort()
+    for _, path in shards[:len(shards) - keep]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        _parsed_cache.pop(path, None)
+
+
 def write_cache(workspace_key: str, decision: ScopeDecision,
                 service: Optional[dict[str, Any]] = None,
                 now: Optional[float] = None) -> bool:
     """Persist a resolved context. Returns success; never raises."""
     try:
-        STATE_DIR.mkdir(parents=True, exist_ok=True)
-        blob: dict[str, Any] = {"schema": 1, "workspaces": {}}
-        if CACHE_FILE.is_file():
-            try:
-                existing = json.loads(CACHE_FILE.read_text(encoding="utf-8"))
-                if isinstance(existing, dict) and isinstance(existing.get("workspaces"), dict):
-                    blob = existing
-            except (OSError, ValueError):
-                pass
-        blob.setdefault("workspaces", {})[workspace_key] = {
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        entry = {
             "as_of_epoch": time.time() if now is None else now,
             "project": _cacheable(decision.project) if decision.project else None,
             "candidates": [_cacheable(c) for c in decision.candidates],
@@ -478,9 +643,10 @@ def write_cache(workspace_key: str, decision: ScopeDecision,
             "reason": decision.reason,
             "service": service or {},
         }
-        tmp = CACHE_FILE.with_suffix(".tmp")
-        tmp.write_text(json.dumps(blob, indent=2), encoding="utf-8")
-        tmp.replace(CACHE_FILE)
+        _atomic_write(_shard(workspace_key), {"schema": _SHARD_SCHEMA,
+                                              "workspace_key": workspace_key,
+                                              "entry": entry})
+        _evict()
         return True
     except (OSError, ValueError, TypeError):
         return False
@@ -488,17 +654,25 @@ def write_cache(workspace_key: str, decision: ScopeDecision,
 
 def invalidate_cache(workspace_key: Optional[str] = None) -> bool:
     """Drop one workspace's entry, or the whole cache. Never raises."""
+    _parsed_cache.clear()
     try:
         if workspace_key is None:
-            if CACHE_FILE.is_file():
-                CACHE_FILE.unlink()
-            return True
-        if not CACHE_FILE.is_file():
+            for shards in (CACHE_DIR, WORKSPACE_MEMO_DIR):
+                if shards.is_dir():
+                    _evict(0, shards)
+            for stale in (CACHE_FILE, WORKSPACE_MEMO_FILE):
+                if stale.is_file():
+                    stale.unlink()
             return True
-        blob = json.loads(CACHE_FILE.read_text(encoding="utf-8"))
-        if isinstance(blob, dict):
-            (blob.get("workspaces") or {}).pop(workspace_key, None)
-            CACHE_FILE.write_text(json.dumps(blob, indent=2), encoding="utf-8")
+        try:
+            _shard(workspace_key).unlink()
+        except FileNotFoundError:
+            pass
+        if CACHE_FILE.is_file():
+            blob = json.loads(CACHE_FILE.read_text(encoding="utf-8"))
+            if isinstance(blob, dict) and workspace_key in (blob.get("workspaces") or {}):
+                blob["workspaces"].pop(workspace_key)
+                _atomic_write(CACHE_FILE, blob)
         return True
     except (OSError, ValueError, TypeError):
         return False
@@ -41,6 +41,21 @@ clears ``MIN_SCORE`` and leads the runner-up by ``MIN_MARGIN`` is selected;
 anything else is reported as ambiguous so the caller can ask. Guessing between
 two services means answering from the wrong knowledge base.
 
+Concurrency and the identity cache
+----------------------------------
+Every port to be probed gets its ``/health``, ``/identity`` and
+``/api/projects/configured`` requests at once, on one pool, under one deadline
+(``DISCOVERY_DEADLINE_SECONDS``) — N services cost one round-trip, not 3N.
+
+What a service *is* (identity, registered projects) is kept per ``host:port``
+in ``state/service-identity.json``, beside a fingerprint of its ``/health``
+body. A later discovery sends only ``/health`` to a port with a fresh entry; if
+the fingerprint still matches, the cached identity is reused, so on an
+unchanged machine discovery is one ``/health`` per service, in parallel. A
+changed fingerprint, a stale entry (``IDENTITY_CACHE_TTL_SECONDS``) or a new
+responder is probed in full. Health itself is never cached — ``degraded`` and
+``issues`` always come from the live answer.
+
 Portability
 -----------
 Discovery uses ``socket.connect_ex`` plus HTTP, which behave identically on
@@ -56,9 +71,11 @@ import os
 import socket
 import subprocess
 import sys
+import threading
+import time
 import urllib.error
 import urllib.request
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Optional
@@ -91,6 +108,26 @@ MIN_MARGIN = 15
 _CONNECT_TIMEOUT = 0.08
 _HTTP_TIMEOUT = 1.0
 
+#: One wall-clock bound for all the HTTP a discovery makes, however many
+#: services answer.
+DISCOVERY_DEADLINE_SECONDS = 2.5
+PROBE_WORKERS = 24
+
+IDENTITY_CACHE_FILE = (Path.home() / ".claude" / "rag-plugin" / "state"
+                       / "service-identity.json")
+#: The scope cache's horizon: a project registered since is picked up within
+#: it even if the service never restarts.
+IDENTITY_CACHE_TTL_SECONDS = 900
+#: ``/health`` fields that change when a different or restarted service takes
+#: the port. Whichever of them the running build reports are compared.
+_FINGERPRINT_KEYS = ("collection", "version", "instance_id", "service_id",
+                     "pid", "started_at")
+#: Of those, the ones that tell one run of a service from the next. Without
+#: any of them (ragtools' own ``/health`` has only status, collection and
+#: version) a restarted or different service with the same collection label
+#: would inherit the old ``data_dir``, so such a port is never cached.
+_RESTART_KEYS = ("instance_id", "service_id", "pid", "started_at")
+
 
 # --------------------------------------------------------------------------- #
 # Probing                                                                      #
@@ -168,6 +205,7 @@ class ServiceCandidate:
     projects: list[dict[str, Any]] = field(default_factory=list)
     score: int = 0
     reasons: list[str] = field(default_factory=list)
+    from_cache: bool = False        # identity/projects reused after a /health match
 
     @property
     def base_url(self) -> str:
@@ -252,20 +290,124 @@ class ServiceCandidate:
         return " · ".join(bits)
 
 
+def _fingerprint(health: dict[str, Any]) -> dict[str, Any]:
+    return {k: health[k] for k in _FINGERPRINT_KEYS if k in health}
+
+
+def _marks_restarts(fingerprint: dict[str, Any]) -> bool:
+    return any(k in fingerprint for k in _RESTART_KEYS)
+
+
+def _load_identity_cache(now: float) -> dict[str, Any]:
+    """Fresh ``host:port -> entry`` records. Never raises."""
+    try:
+        blob = json.loads(IDENTITY_CACHE_FILE.read_text(encoding="utf-8"))
+        entries = blob.get("services") if isinstance(blob, dict) else None
+        if not isinstance(entries, dict):
+            return {}
+        return {k: v for k, v in entries.items() if isinstance(v, dict)
+                and 0 <= now - float(v.get("at", 0)) <= IDENTITY_CACHE_TTL_SECONDS}
+    except (OSError, ValueError, TypeError):
+        return {}
+
+
+def _save_identity_cache(entries: dict[str, Any]) -> None:
+    try:
+        IDENTITY_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp = IDENTITY_CACHE_FILE.with_name(
+            f"{IDENTITY_CACHE_FILE.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_text(json.dumps({"schema": 1, "services": entries}, indent=2),
+                       encoding="utf-8")
+        os.replace(tmp, IDENTITY_CACHE_FILE)
+    except (OSError, ValueError, TypeError):
+        pass
+
+
+def _fetch(urls: dict[Any, str], stop_at: float,
+           workers: int = PROBE_WORKERS) -> dict[Any, Optional[dict]]:
+    """GET every URL at once; whatever has not answered by ``stop_at`` is None."""
+    if not urls:
+        return {}
+    out: dict[Any, Optional[dict]] = dict.fromkeys(urls)
+    pool = ThreadPoolExecutor(max_workers=max(1, min(workers, len(urls))),
+                              thread_name_prefix="rag-discover")
+    try:
+        timeout = max(0.05, min(_HTTP_TIMEOUT, stop_at - time.monotonic()))
+        futures = {pool.submit(_get_json, url, timeout): key for key, url in urls.items()}
+        done, _ = wait(futures, timeout=max(0.0, stop_at - time.monotonic()))
+        for fut in done:
+            out[futures[fut]] = fut.result()
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+    return out
+
+
+def _probe_ports(ports, host: str, stop_at: float, with_projects: bool = True,
+                 cache: Optional[dict[str, Any]] = None) -> list[ServiceCandidate]:
+    """Probe ``ports`` concurrently, in the given order, reusing ``cache``.
+
+    A port with a cache entry is asked for ``/health`` only; any other port for
+    all its endpoints at once. A cached port whose fingerprint no longer
+    matches gets a second, full round. Reused candidates are marked
+    ``from_cache``.
+    """
+    cache = cache if cache is not None else {}
+    ports = list(dict.fromkeys(ports))
+    wanted = ["health", "identity"] + (["projects"] if with_projects else [])
+    paths = {"health": "/health", "identity": "/identity",
+             "projects": "/api/projects/configured"}
+
+    def full(port):
+        return {(port, kind): f"http://{host}:{port}{paths[kind]}" for kind in wanted}
+
+    urls: dict[Any, str] = {}
+    for port in ports:
+        if f"{host}:{port}" in cache:
+            urls[(port, "health")] = f"http://{host}:{port}/health"
+        else:
+            urls.update(full(port))
+    got = _fetch(urls, stop_at)
+
+    reused: dict[int, dict[str, Any]] = {}
+    again: dict[Any, str] = {}
+    for port in ports:
+        entry = cache.get(f"{host}:{port}")
+        health = got.get((port, "health"))
+        if entry is None or not is_ragtools_health(health):
+            continue
+        fingerprint = _fingerprint(health or {})
+        if entry.get("fingerprint") == fingerprint and _marks_restarts(fingerprint) and (
+                not with_projects or "projects" in entry):
+            reused[port] = entry
+        else:
+            again.update({k: v for k, v in full(port).items() if k[1] != "health"})
+    got.update(_fetch(again, stop_at))
+
+    found: list[ServiceCandidate] = []
+    for port in ports:
+        health = got.get((port, "health"))
+        if not is_ragtools_health(health):
+            continue
+        cand = ServiceCandidate(port=port, host=host, health=health or {})
+        if port in reused:
+            cand.identity = dict(reused[port].get("identity") or {})
+            cand.projects = list(reused[port].get("projects") or []) if with_projects else []
+            cand.from_cache = True
+        else:
+            cand.identity = got.get((port, "identity")) or {}
+            body = got.get((port, "projects"))
+            if isinstance(body, dict) and isinstance(body.get("projects"), list):
+                cand.projects = [p for p in body["projects"] if isinstance(p, dict)]
+        found.append(cand)
+    return found
+
+
 def probe(port: int, host: str = "127.0.0.1",
           with_projects: bool = False) -> Optional[ServiceCandidate]:
     """Probe one port. ``None`` unless it answers as ragtools."""
-    base = f"http://{host}:{port}"
-    health = _get_json(f"{base}/health")
-    if not is_ragtools_health(health):
-        return None
-    cand = ServiceCandidate(port=port, host=host, health=health or {})
-    cand.identity = _get_json(f"{base}/identity") or {}
-    if with_projects:
-        body = _get_json(f"{base}/api/projects/configured")
-        if isinstance(body, dict) and isinstance(body.get("projects"), list):
-            cand.projects = [p for p in body["projects"] if isinstance(p, dict)]
-    return cand
+    found = _probe_ports([port], host, time.monotonic() + DISCOVERY_DEADLINE_SECONDS,
+                         with_projects)
+    return found[0] if found else None
 
 
 # --------------------------------------------------------------------------- #
@@ -361,6 +503,24 @@ class DiscoveryResult:
         return f"no ragtools service found ({self.reason})"
 
 
+def _remember(cache: dict[str, Any], tried, found: list[ServiceCandidate],
+              host: str, now: float) -> None:
+    """Record what answered on ``tried`` and forget what no longer does."""
+    entries = dict(cache)
+    for port in tried:
+        entries.pop(f"{host}:{port}", None)
+    for cand in found:
+        key = f"{host}:{cand.port}"
+        if cand.from_cache and key in cache:
+            entries[key] = cache[key]   # keep its age: the TTL bounds reuse
+        elif cand.identity and _marks_restarts(_fingerprint(cand.health)):
+            entries[key] = {"fingerprint": _fingerprint(cand.health),
+                            "identity": cand.identity, "projects": cand.projects,
+                            "at": now}
+    if entries != cache:
+        _save_identity_cache(entries)
+
+
 def _override_port() -> Optional[int]:
     for var in ("RAG_PLUGIN_SERVICE_PORT", "RAG_SERVICE_PORT"):
         raw = os.environ.get(var, "").strip()
@@ -373,16 +533,26 @@ def discover(workspace: Optional[Path] = None,
              prefer_source: Optional[bool] = None,
              host: str = "127.0.0.1",
              scan: bool = True,
-             ports=DEFAULT_SCAN_RANGE) -> DiscoveryResult:
+             ports=DEFAULT_SCAN_RANGE,
+             use_cache: bool = True) -> DiscoveryResult:
     """Find and select the ragtools service for ``workspace``.
 
-    Order: explicit override → likely ports → bounded scan. Scoring only ever
-    runs on responders that pass :func:`is_ragtools_health`.
+    Order: explicit override → likely ports (previously seen ones first) →
+    bounded scan. Scoring only ever runs on responders that pass
+    :func:`is_ragtools_health`. ``use_cache=False`` neither reads nor writes
+    the identity cache.
     """
+    stop_at = time.monotonic() + DISCOVERY_DEADLINE_SECONDS
+    now = time.time()
+    cache = _load_identity_cache(now) if use_cache else {}
+
     forced = _override_port()
     if forced:
-        cand = probe(forced, host, with_projects=True)
-        if cand:
+        found = _probe_ports([forced], host, stop_at, cache=cache)
+        if use_cache:
+            _remember(cache, [forced], found, host, now)
+        if found:
+            cand = found[0]
             score_candidate(cand, workspace, prefer_source)
             return DiscoveryResult(selected=cand, candidates=[cand], source="override",
                                    reason=f"RAG_SERVICE_PORT={forced}")
@@ -390,21 +560,22 @@ def discover(workspace: Optional[Path] = None,
                                reason=f"port {forced} was named explicitly but did not "
                                       "answer as ragtools")
 
-    found: list[ServiceCandidate] = []
-    for port in LIKELY_PORTS:
-        cand = probe(port, host, with_projects=True)
-        if cand:
-            found.append(cand)
+    # The likely ports, those a service answered on last time first. The
+    # cache orders the probes but never adds one: with or without it the
+    # same ports are asked, so the same live state selects the same service.
+    tried = sorted((p for p in dict.fromkeys(LIKELY_PORTS) if p not in ENGINE_PORTS),
+                   key=lambda p: f"{host}:{p}" not in cache)
+    found = _probe_ports(tried, host, stop_at, cache=cache)
 
     source = "probe"
     if not found and scan:
         source = "scan"
-        for port in open_ports(ports, host):
-            if port in LIKELY_PORTS:
-                continue
-            cand = probe(port, host, with_projects=True)
-            if cand:
-                found.append(cand)
+        extra = [p for p in open_ports(ports, host) if p not in tried]
+        found = _probe_ports(extra, host, stop_at, cache=cache)
+        # Every scanned port was checked: a closed one's entry goes too.
+        tried += [p for p in ports if p not in tried]
+    if use_cache:
+        _remember(cache, tried, found, host, now)
 
     if not found:
         return DiscoveryResult(source="none",
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""Phase spans for the report engine: wall time, bytes read, HTTP calls.
+
+Why
+---
+``rag_report.main`` runs detect → probe → config inspection → hook log → log
+tail → session scan → synthesis → rendering, and said so only in free-text
+progress lines that ``--quiet`` suppresses and no artifact keeps. A report
+that took a minute on a user's machine could not say where the minute went.
+
+Model
+-----
+A :class:`Tracer` keeps process-wide counters (``bytes_read``,
+``http_calls``) that any thread may bump with :meth:`Tracer.count`, and a list
+of finished spans:
+
+* :meth:`Tracer.span` is a context manager for a phase (or a step inside
+  one). It records wall time and how much each counter moved while it was
+  open. Spans nest per thread.
+* :meth:`Tracer.event` records an interval that has already finished — one
+  HTTP call, one subprocess — on the calling thread, so calls made
+  concurrently show as parallel lanes in a trace viewer.
+
+Counter deltas are process-wide, so a phase also counts what its worker
+threads did. ``rag_report`` runs its phases one after another, which makes
+that attribution exact; two top-level spans open at once would both count
+the same work.
+
+Output
+------
+:meth:`Tracer.phases` gives one row per top-level span for
+``redacted-diagnostics.json`` and the summary. :meth:`Tracer.chrome_trace`
+returns the Trace Event Format (complete ``"X"`` events, microseconds),
+which ``chrome://tracing`` and https://ui.perfetto.dev open directly. Span
+names are chosen by the caller and must not carry user data; nothing here
+records a path, URL or host.
+
+Stdlib only.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Iterator
+
+__all__ = ["COUNTERS", "Span", "Tracer"]
+
+#: Counters every span reports, even when they did not move.
+COUNTERS = ("bytes_read", "http_calls")
+
+
+@dataclass
+class Span:
+    """One finished interval. Times are ``time.perf_counter()`` seconds."""
+    name: str
+    start: float
+    end: float = 0.0
+    cat: str = "phase"
+    depth: int = 0
+    thread: str = ""
+    counts: dict[str, int] = field(default_factory=dict)
+    args: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def ms(self) -> float:
+        return (self.end - self.start) * 1000
+
+
+class Tracer:
+    """Spans and counters for one run. Thread-safe; never raises into callers."""
+
+    def __init__(self) -> None:
+        self.origin = time.perf_counter()
+        self._lock = threading.Lock()
+        self._counts: dict[str, int] = dict.fromkeys(COUNTERS, 0)
+        self._spans: list[Span] = []
+        self._local = threading.local()
+
+    def _stack(self) -> list[Span]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def count(self, counter: str, n: int = 1) -> None:
+        with self._lock:
+            self._counts[counter] = self._counts.get(counter, 0) + n
+
+    def counts(self) -> dict[str, int]:
+        with self._lock:
+            return dict(self._counts)
+
+    @contextmanager
+    def span(self, name: str, **args: Any) -> Iterator[Span]:
+        """Time the ``with`` body as ``name``; ``args`` go into the trace."""
+        stack = self._stack()
+        before = self.counts()
+        sp = Span(name, time.perf_counter(), depth=len(stack),
+                  thread=threading.current_thread().name, args=args)
+        stack.append(sp)
+        try:
+            yield sp
+        finally:
+            stack.pop()
+            sp.end = time.perf_counter()
+            after = self.counts()
+            sp.counts = {k: after.get(k, 0) - before.get(k, 0) for k in after}
+            with self._lock:
+                self._spans.append(sp)
+
+    def event(self, name: str, start: float, end: float, cat: str = "call",
+              **args: Any) -> None:
+        """Record an interval that has already ended, on the calling thread."""
+        sp = Span(name, start, end, cat=cat, depth=len(self._stack()),
+                  thread=threading.current_thread().name, args=args)
+        with self._lock:
+            self._spans.append(sp)
+
+    def spans(self) -> list[Span]:
+        with self._lock:
+            return sorted(self._spans, key=lambda s: (s.start, s.depth))
+
+    def phases(self) -> list[dict[str, Any]]:
+        """One row per top-level span, in the order they started."""
+        return [{"phase": s.name, "ms": round(s.ms, 1),
+                 **{k: s.counts.get(k, 0) for k in COUNTERS}}
+                for s in self.spans() if s.depth == 0 and s.cat == "phase"]
+
+    def chrome_trace(self) -> dict[str, Any]:
+        """The Trace Event Format document for every span and event so far.
+
+        Threads become lanes numbered in order of first appearance (the
+        main thread is lane 1); their names are emitted as metadata events.
+        """
+        lanes: dict[str, int] = {}
+        events: list[dict[str, Any]] = []
+        for s in self.spans():
+            tid = lanes.setdefault(s.thread, len(lanes) + 1)
+            events.append({
+                "name": s.name, "cat": s.cat, "ph": "X", "pid": 1, "tid": tid,
+                "ts": round((s.start - self.origin) * 1e6, 1),
+                "dur": round((s.end - s.start) * 1e6, 1),
+                "args": {**s.args, **s.counts},
+            })
+        meta = [{"name": "thread_name", "ph": "M", "pid": 1, "tid": tid,
+                 "args": {"name": thread}} for thread, tid in lanes.items()]
+        return {"traceEvents": meta + events, "displayTimeUnit": "ms"}
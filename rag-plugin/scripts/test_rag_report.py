@@ -710,6 +710,271 @@ class TestHookPathFatalSignal(unittest.TestCase):
         self.assertFalse(self._match(_FP_CONNECT_LS))
 
 
+# ============================================================================
+# Session scan: the literal prefilter and the process pool must not change what
+# the scan reports.
+# ============================================================================
+
+_POSITIVE_LINES = [
+    ("port-in-use", "Error: listen EADDRINUSE: address already in use :::21420"),
+    ("port-in-use", "port 21420 is already in use"),
+    ("connect-refused", "fetch failed: connect ECONNREFUSED 127.0.0.1:21420"),
+    ("rag-error-line", "[RAG ERROR] Service unavailable. The RAG service may have stopped."),
+    ("mcp-error", "MCP server failed to start: stdio handshake timeout"),
+    ("mcp-error", "Failed to reconnect to plugin:rag:ragtools after 3 attempts"),
+    ("mcp-error", "mcp_server.STARTUP_FAILED: encoder load failed"),
+    ("retrieval-skipped", "I don't have enough information about that."),
+    ("user-correct-search", "why didn't you search the docs?"),
+    ("rag-mention", "Ask the knowledge base about retention."),
+    ("rag-port", "curl http://127.0.0.1:21420/health"),
+    ("hook-path-fatal", "python3: can't open file '/hooks/prompt_retrieval_reminder.py': "
+                        "[Errno 2] No such file or directory"),
+]
+
+
+class TestSessionScanPrefilter(unittest.TestCase):
+
+    def setUp(self):
+        self.rr = _load_rr()
+
+    def test_every_signal_has_anchors(self):
+        self.assertEqual(set(self.rr._SIGNAL_ANCHORS), set(dict(self.rr._SIGNAL_PATTERNS)))
+
+    def test_positive_lines_pass_as_jsonl(self):
+        import json
+        for label, text in _POSITIVE_LINES:
+            self.assertTrue(dict(self.rr._SIGNAL_PATTERNS)[label].search(text), label)
+            for rec in ({"message": text}, {"message": {"content": [{"text": text}]}}):
+                line = json.dumps(rec).encode()
+                self.assertTrue(self.rr._could_signal(line), f"{label}: {line!r}")
+
+    def test_escaped_slash_is_not_filtered(self):
+        self.assertTrue(self.rr._could_signal(b'{"message": "rac\\/rag"}'))
+
+    def test_ordinary_output_is_filtered(self):
+        self.assertFalse(self.rr._could_signal(b'{"message": "Exit code 2\\ntotal 48"}'))
+
+
+class TestSessionScanParallel(unittest.TestCase):
+    """``jobs`` must only change how fast the scan runs, never its result."""
+
+    def setUp(self):
+        import json
+        import os
+        import tempfile
+        self.rr = _load_rr()
+        self.home = Path(tempfile.mkdtemp(prefix="rr-sessions-"))
+        base = self.home / ".claude" / "projects"
+        noise = {"type": "tool_result", "message": "drwxr-xr-x 3 me staff 96 ls -la"}
+        for i in range(9):
+            proj = base / f"proj{i % 3}"
+            proj.mkdir(parents=True, exist_ok=True)
+            f = proj / f"session{i}.jsonl"
+            lines = [json.dumps(noise)] * 40
+            for j, (_, text) in enumerate(_POSITIVE_LINES):
+                if (i + j) % 3:
+                    lines.insert(j * 3, json.dumps({"message": f"{text} #{i}"}))
+            lines.append("not json at all 21420")
+            f.write_text("\n".join(lines) + "\n", encoding="utf-8")
+            os.utime(f, (1_700_000_000 + i, 1_700_000_000 + i))
+        self._saved = {k: os.environ.get(k) for k in ("HOME", "USERPROFILE")}
+        os.environ["HOME"] = os.environ["USERPROFILE"] = str(self.home)
+
+    def tearDown(self):
+        import os
+        import shutil
+        for k, v in self._saved.items():
+            if v is None:
+                os.environ.pop(k, None)
+            else:
+                os.environ[k] = v
+        shutil.rmtree(self.home, ignore_errors=True)
+
+    def test_parallel_matches_serial(self):
+        from dataclasses import asdict
+        serial = asdict(self.rr.scan_sessions(max_sessions=8, jobs=1, full_rescan=True))
+        parallel = asdict(self.rr.scan_sessions(max_sessions=8, jobs=3, full_rescan=True))
+        self.assertEqual(serial, parallel)
+        self.assertEqual(serial["sessions_found"], 9)
+        self.assertEqual(serial["sessions_scanned"], 8)
+        self.assertEqual(len(serial["examples"]), 12)
+
+    def test_examples_come_from_the_newest_sessions_first(self):
+        res = self.rr.scan_sessions(max_sessions=9, jobs=2)
+        self.assertTrue(res.examples[0]["session_file"].endswith("session8.jsonl"))
+        per_signal = {}
+        for ex in res.examples:
+            per_signal[ex["signal"]] = per_signal.get(ex["signal"], 0) + 1
+        self.assertLessEqual(max(per_signal.values()), 2)
+
+
+class TestSessionScanIndex(TestSessionScanParallel):
+    """A re-run parses only appended bytes and still reports what a full scan
+    would."""
+
+    def _scan(self, **kw):
+        return self.rr.scan_sessions(max_sessions=9, **kw)
+
+    @staticmethod
+    def _report(res):
+        return (res.signal_counts, res.examples, res.sessions_with_signal)
+
+    def _newest(self):
+        return self.home / ".claude" / "projects" / "proj2" / "session8.jsonl"
+
+    def _append(self, text):
+        import os
+        f = self._newest()
+        with open(f, "a", encoding="utf-8") as fh:
+            fh.write(text)
+        os.utime(f, (1_700_000_100, 1_700_000_100))
+
+    def test_unchanged_files_are_not_reread(self):
+        first = self._scan()
+        second = self._scan()
+        self.assertEqual(first.sessions_reused, 0)
+        self.assertEqual(second.sessions_reused, 9)
+        self.assertEqual(second.bytes_scanned, 0)
+        self.assertEqual(self._report(first), self._report(second))
+
+    def test_appended_lines_are_scanned_from_the_last_offset(self):
+        import json
+        self._scan()
+        line = json.dumps({"message": "connect ECONNREFUSED 127.0.0.1:21420 again"}) + "\n"
+        self._append(line)
+        res = self._scan()
+        self.assertEqual(res.bytes_scanned, len(line.encode()))
+        self.assertEqual(res.sessions_reused, 8)
+        self.assertEqual(self._report(res), self._report(self._scan(full_rescan=True)))
+
+    def test_a_last_line_without_newline_is_counted_once(self):
+        import json
+        start = self._scan().signal_counts.get("port-in-use", 0)
+        line = json.dumps({"message": "listen EADDRINUSE"})
+        self._append(line)
+        tail = self._scan()
+        self.assertEqual(tail.signal_counts.get("port-in-use", 0), start + 1)
+        self.assertEqual(self._report(tail), self._report(self._scan(full_rescan=True)))
+        self.assertEqual(self._report(self._scan()), self._report(tail))  # reused as is
+        self._append("\n")
+        done = self._scan()
+        # re-read from the saved offset, so the tail is parsed again, not added twice
+        self.assertEqual(done.bytes_scanned, len(line) + 1)
+        self.assertEqual(done.signal_counts.get("port-in-use", 0), start + 1)
+
+    def test_rewritten_file_is_rescanned(self):
+        import os
+        self._scan()
+        f = self._newest()
+        data = f.read_bytes()
+        f.write_bytes(b"{}\n" * 5 + data)  # longer, but not an append
+        os.utime(f, (1_700_000_100, 1_700_000_100))
+        res = self._scan()
+        self.assertEqual(res.bytes_scanned, len(data) + 15)
+        self.assertEqual(self._report(res), self._report(self._scan(full_rescan=True)))
+
+    def test_pattern_change_invalidates_the_index(self):
+        self._scan()
+        self.rr.REPORT_VERSION = self.rr.REPORT_VERSION + "-next"
+        self.assertEqual(self._scan().sessions_reused, 0)
+
+    def test_corrupt_index_is_ignored(self):
+        self._scan()
+        (self.home / ".claude" / "rag-plugin" / self.rr.SESSION_INDEX_FILE).write_text("{nope")
+        self.assertEqual(self._scan().sessions_reused, 0)
+
+
+# ============================================================================
+# tail_recent_errors: reverse block reader, whole-record hits, --since
+# ============================================================================
+
+
+class TestTailRecentErrors(unittest.TestCase):
+
+    def setUp(self):
+        import tempfile
+        self.rr = _load_rr()
+        self.dir = Path(tempfile.mkdtemp(prefix="rr-logs-"))
+
+    def tearDown(self):
+        import shutil
+        shutil.rmtree(self.dir, ignore_errors=True)
+
+    @staticmethod
+    def _ts(epoch):
+        import time
+        return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(epoch)) + ",000"
+
+    def _write(self, name, lines, trailing="\n"):
+        path = self.dir / name
+        path.write_text("\n".join(lines) + trailing, encoding="utf-8")
+        return path
+
+    def _traceback(self, epoch, exc="ValueError: boom"):
+        return [f"{self._ts(epoch)} ERROR    ragtools.service request failed",
+                "Traceback (most recent call last):",
+                '  File "/srv/ragtools/service.py", line 10, in handle',
+                "    raise ValueError('boom')",
+                exc]
+
+    def test_a_traceback_is_one_hit(self):
+        import time
+        now = time.time()
+        self._write("service.log", [f"{self._ts(now)} INFO     ragtools ok"] * 3
+                    + self._traceback(now) + [f"{self._ts(now)} INFO     ragtools ok"])
+        (item,) = self.rr.tail_recent_errors(str(self.dir))
+        (hit,) = item["matches"]
+        self.assertEqual(hit["lines"], 5)
+        self.assertTrue(hit["text"].endswith("ValueError: boom"))
+
+    def test_window_extends_back_to_the_start_of_the_cut_record(self):
+        import time
+        now = time.time()
+        lines = [f"{self._ts(now)} INFO     ragtools ok"] * 500 + self._traceback(now)
+        self._write("service.log", lines)
+        (item,) = self.rr.tail_recent_errors(str(self.dir), lines_per_file=3)
+        self.assertIn("request failed", item["matches"][0]["text"])
+
+    def test_long_lines_and_large_files_stay_whole(self):
+        import time
+        now = time.time()
+        filler = [f"{self._ts(now)} INFO     ragtools " + "x" * 5000] * 400
+        self._write("service.log", filler + [f"{self._ts(now)} ERROR    " + "y" * 40_000,
+                                             f"{self._ts(now)} INFO     tail"])
+        (item,) = self.rr.tail_recent_errors(str(self.dir), lines_per_file=5)
+        self.assertEqual(len(item["matches"]), 1)
+        self.assertIn(" ERROR ", item["matches"][0]["text"])
+
+    def test_a_half_written_last_line_is_ignored(self):
+        import time
+        self._write("service.log", [f"{self._ts(time.time())} INFO ok",
+                                    f"{self._ts(time.time())} ERROR half"], trailing="")
+        self.assertEqual(self.rr.tail_recent_errors(str(self.dir)), [])
+
+    def test_since_filters_records_and_reads_rotated_segments(self):
+        import gzip
+        import time
+        now = time.time()
+        self._write("service.log", self._traceback(now - 7200, "OldError: x")
+                    + self._traceback(now - 60, "NewError: y"))
+        with gzip.open(self.dir / "service.log.1.gz", "wt", encoding="utf-8") as fh:
+            fh.write("\n".join(self._traceback(now - 600, "RotatedError: z")) + "\n")
+        self.assertEqual(len(self.rr.tail_recent_errors(str(self.dir))), 1)
+        hits = self.rr.tail_recent_errors(str(self.dir), since=now - 3600)
+        texts = [m["text"] for item in hits for m in item["matches"]]
+        self.assertEqual(len(hits), 2)
+        self.assertTrue(any("NewError" in t for t in texts))
+        self.assertTrue(any("RotatedError" in t for t in texts))
+        self.assertFalse(any("OldError" in t for t in texts))
+
+    def test_parse_since(self):
+        self.assertEqual(self.rr.parse_since("2h"), 7200)
+        self.assertEqual(self.rr.parse_since("30m"), 1800)
+        self.assertEqual(self.rr.parse_since("1d"), 86400)
+        with self.assertRaises(Exception):
+            self.rr.parse_since("yesterday")
+
+
 # ============================================================================
 # PL1 — consume the newer structured diagnostics contract when available, with
 # graceful fallback for older ragtools. Covers probe_system_health,
@@ -810,6 +1075,87 @@ class TestProbeSystemHealth(unittest.TestCase):
         self.assertFalse(state.has_system_health)
 
 
+class TestProbeApiConcurrent(unittest.TestCase):
+    """probe_api runs its calls on a bounded pool under one deadline."""
+
+    def setUp(self):
+        self.rr = _load_rr()
+        self._orig = self.rr._http_get_json
+
+    def tearDown(self):
+        self.rr._http_get_json = self._orig
+
+    def _fake(self, n_projects, delay=0.0, slow_ids=(), slow_delay=0.0):
+        import time as _time
+
+        ids = [f"p{i:02d}" for i in range(n_projects)]
+
+        def fake(url, timeout=2.0):
+            if url.endswith("/api/status"):
+                return 200, {"status": "ready", "log_path": "/x/logs"}, ""
+            if url.endswith("/api/watcher/status"):
+                return 200, {"running": True}, ""
+            if url.endswith("/api/projects"):
+                return 200, {"projects": [{"project_id": pid} for pid in ids]}, ""
+            pid = url.rsplit("/", 2)[-2]
+            _time.sleep(slow_delay if pid in slow_ids else delay)
+            return 200, {"path": f"/work/{pid}", "enabled": True}, ""
+        return fake, ids
+
+    def test_hydration_runs_concurrently_and_keeps_order(self):
+        import time as _time
+
+        fake, ids = self._fake(24, delay=0.1)
+        self.rr._http_get_json = fake
+        state = _installed_up_state(self.rr)
+        t0 = _time.monotonic()
+        self.rr.probe_api(state, workers=8)
+        elapsed = _time.monotonic() - t0
+        self.assertLess(elapsed, 24 * 0.1 / 2, "per-project status calls ran serially")
+        self.assertEqual([p["project_id"] for p in state.api_projects], ids)
+        self.assertTrue(all(p["path"] == f"/work/{p['project_id']}"
+                            for p in state.api_projects))
+        self.assertEqual(state.api_status["status"], "ready")
+        self.assertEqual(state.log_path, "/x/logs")
+        self.assertEqual(state.watcher_status, {"running": True})
+        self.assertEqual(len(state.probe_timings), 3 + 24)
+        self.assertEqual(state.probe_timings[0]["endpoint"], "/api/status")
+        self.assertTrue(all(isinstance(r["ms"], float) for r in state.probe_timings))
+
+    def test_deadline_leaves_slow_projects_lean_and_says_so(self):
+        fake, ids = self._fake(4, slow_ids=("p02",), slow_delay=1.0)
+        self.rr._http_get_json = fake
+        state = _installed_up_state(self.rr)
+        self.rr.probe_api(state, deadline=0.4)
+        self.assertEqual([p["project_id"] for p in state.api_projects], ids)
+        self.assertNotIn("path", state.api_projects[2])
+        self.assertEqual(state.api_projects[3]["path"], "/work/p03")
+        missed = [r for r in state.probe_timings if r.get("error") == "deadline"]
+        self.assertEqual(len(missed), 1)
+        self.assertEqual(missed[0]["endpoint"], "/api/projects/<id>/status")
+
+    def test_legacy_bare_list_still_hydrates(self):
+        def fake(url, timeout=2.0):
+            if url.endswith("/api/projects"):
+                return 200, [{"id": "a"}, {"name": "b"}], ""
+            if url.endswith("/status") and "/api/projects/" in url:
+                return 200, {"last_indexed": "t"}, ""
+            return 404, None, "not found"
+        self.rr._http_get_json = fake
+        state = _installed_up_state(self.rr)
+        self.rr.probe_api(state)
+        self.assertEqual([p.get("last_indexed") for p in state.api_projects], ["t", "t"])
+
+    def test_noop_when_service_not_up(self):
+        def fake(url, timeout=2.0):
+            raise AssertionError("no call expected")
+        self.rr._http_get_json = fake
+        state = _installed_up_state(self.rr)
+        state.service_mode = "DOWN"
+        self.rr.probe_api(state)
+        self.assertEqual(state.probe_timings, [])
+
+
 class TestProbeDoctorJson(unittest.TestCase):
     """`rag doctor --json` capability-detect + graceful absence on old builds."""
 
@@ -1078,5 +1424,115 @@ class TestHealthySystemNoStaleHeuristics(unittest.TestCase):
         self.assertIsNone(_by_id(app, "A-015"), _ids(app))
 
 
+
+# ============================================================================
+# Phase timings: span_trace spans in diagnostics, summary and Chrome trace
+# ============================================================================
+
+
+class TestPhaseTimings(unittest.TestCase):
+    """Each phase reports wall time, bytes read and HTTP calls; --trace writes
+    a trace-event file that names no project or path."""
+
+    def setUp(self):
+        self.rr = _load_rr()
+
+    def test_spans_nest_and_count_worker_threads(self):
+        import threading
+
+        tracer = self.rr.Tracer()
+        with tracer.span("outer"):
+            tracer.count("bytes_read", 10)
+            with tracer.span("inner"):
+                worker = threading.Thread(target=tracer.count, args=("http_calls", 2))
+                worker.start()
+                worker.join()
+        (row,) = tracer.phases()
+        self.assertGreaterEqual(row.pop("ms"), 0)
+        self.assertEqual(row, {"phase": "outer", "bytes_read": 10, "http_calls": 2})
+        inner = [sp for sp in tracer.spans() if sp.name == "inner"][0]
+        self.assertEqual((inner.depth, inner.counts), (1, {"bytes_read": 0, "http_calls": 2}))
+
+    def test_concurrent_calls_get_their_own_lanes(self):
+        import threading
+        import time as _time
+
+        tracer = self.rr.Tracer()
+
+        def call():
+            t0 = _time.perf_counter()
+            _time.sleep(0.01)
+            tracer.event("/api/status", t0, _time.perf_counter(), cat="http", code=200)
+        with tracer.span("probe"):
+            threads = [threading.Thread(target=call, name=f"w{i}") for i in range(3)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        doc = tracer.chrome_trace()
+        calls = [e for e in doc["traceEvents"] if e.get("cat") == "http"]
+        self.assertEqual(len({e["tid"] for e in calls}), 3)
+        self.assertTrue(all(e["ph"] == "X" and e["dur"] > 0 for e in calls))
+        lanes = {e["args"]["name"] for e in doc["traceEvents"] if e["ph"] == "M"}
+        self.assertEqual(lanes, {"MainThread", "w0", "w1", "w2"})
+
+    def test_http_calls_are_counted_and_project_ids_masked(self):
+        import http.server
+        import threading
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = b'{"status": "ready"}'
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        base = f"http://127.0.0.1:{server.server_address[1]}"
+        with self.rr.TRACE.span("probe"):
+            self.rr._http_get_json(f"{base}/api/projects/secret-project/status")
+            self.rr._http_get_json(f"{base}/health")
+        row = self.rr.TRACE.phases()[-1]
+        self.assertEqual((row["http_calls"], row["bytes_read"]), (2, 38))
+        names = [e["name"] for e in self.rr.TRACE.chrome_trace()["traceEvents"]
+                 if e.get("cat") == "http"]
+        self.assertEqual(names, ["/api/projects/<id>/status", "/health"])
+
+    def test_main_writes_timings_and_the_trace(self):
+        import json
+
+        with tempfile.TemporaryDirectory() as tmp:
+            rc = self.rr.main(["--dry-run", "--no-sessions", "--quiet", "--trace", "--out", tmp])
+            self.assertEqual(rc, 0)
+            out = Path(tmp).resolve()
+            diag = json.loads((out / "redacted-diagnostics.json").read_text(encoding="utf-8"))
+            summary = (out / "summary.md").read_text(encoding="utf-8")
+            trace_text = (out / "report-trace.json").read_text(encoding="utf-8")
+        phases = [row["phase"] for row in diag["timings"]]
+        for phase in ("plugin", "detect", "config", "hook_log", "synthesis", "render"):
+            self.assertIn(phase, phases)
+        self.assertNotIn("write", phases)
+        self.assertIn("## Timings", summary)
+        self.assertIn("| **total** |", summary)
+        self.assertIn("report-trace.json", summary)
+        trace = json.loads(trace_text)
+        traced = {e["name"] for e in trace["traceEvents"] if e.get("cat") == "phase"}
+        self.assertTrue(set(phases) | {"write"} <= traced)
+        self.assertNotIn(str(Path.home()), trace_text)
+        self.assertNotIn(tmp, trace_text)
+
+    def test_no_trace_file_without_the_flag(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            self.rr.main(["--dry-run", "--no-sessions", "--quiet", "--out", tmp])
+            self.assertFalse((Path(tmp).resolve() / "report-trace.json").exists())
+
+
 if __name__ == "__main__":
     unittest.main(verbosity=2)
@@ -4,6 +4,7 @@
     python tests/run_all.py                 # live tree — everything must pass
     python tests/run_all.py --baseline      # v0.17.0 snapshot — gates must FAIL
     python tests/run_all.py --quick         # skip the slow subprocess suites
+    python tests/run_all.py --jobs 0        # parallel: one worker per core
 
 Why a runner rather than "just use unittest discover"
 -----------------------------------------------------
@@ -20,15 +21,33 @@ reports as success.
 
 **Skips are printed, never hidden.** ragtools itself shipped two E2E suites that
 had never executed, because a skip and a pass look identical from outside.
+
+Parallel mode
+-------------
+``--jobs N`` (``0`` = one per core) runs each ``tests/test_*.py`` module as its
+own shard, a subprocess of this script (``--shard``), side by side with the
+sidecar suites. A shard imports only its own module, so one module's
+``sys.path`` and ``sys.modules`` cannot decide another's imports. In one
+process they can: during ``--baseline``, ``test_wp03``'s negative control finds
+the live ``citation_path`` through the ``scripts/`` a sibling module put on
+the path, and reports it as a contaminated snapshot.
+Either way every test and suite is timed, and the slowest are printed
+(``--slowest``, default 10), so the gate can be kept inside a pre-commit
+budget. Counts and skips are the same in both modes, except under
+``--baseline``: the serial run counts that contaminated snapshot as one more
+failed gate.
 """
 
 from __future__ import annotations
 
 import argparse
+import json
 import os
 import subprocess
 import sys
+import time
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 PLUGIN_ROOT = Path(__file__).resolve().parent.parent
@@ -44,8 +63,26 @@ SIDECAR_SUITES = [
 ]
 
 
-def _run_structural(baseline: bool) -> tuple[int, int, int]:
-    """Run tests/. Returns (run, failures+errors, skipped)."""
+class _TimedResult(unittest.TextTestResult):
+    """Records each test's wall time next to the usual outcome lists."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.timings: list[tuple[str, float]] = []
+        self._started = 0.0
+
+    def startTest(self, test):
+        self._started = time.perf_counter()
+        super().startTest(test)
+
+    def stopTest(self, test):
+        super().stopTest(test)
+        self.timings.append((test.id(), time.perf_counter() - self._started))
+
+
+def _run_suite(load, baseline: bool, stream=None) -> tuple[int, int, int, list]:
+    """Run what ``load(loader)`` returns under the structural environment.
+    Returns (run, failures+errors, skipped, per-test timings)."""
     env_key = "RAG_PLUGIN_TEST_ROOT"
     previous = os.environ.get(env_key)
     if baseline:
@@ -54,12 +91,12 @@ def _run_structural(baseline: bool) -> tuple[int, int, int]:
         os.environ.pop(env_key, None)
     try:
         sys.path.insert(0, str(TESTS_DIR))
-        loader = unittest.TestLoader()
-        suite = loader.discover(str(TESTS_DIR), top_level_dir=str(TESTS_DIR))
-        result = unittest.TextTestRunner(verbosity=1).run(suite)
+        suite = load(unittest.TestLoader())
+        result = unittest.TextTestRunner(stream=stream, verbosity=1,
+                                         resultclass=_TimedResult).run(suite)
         return (result.testsRun,
                 len(result.failures) + len(result.errors),
-                len(result.skipped))
+                len(result.skipped), result.timings)
     finally:
         if previous is None:
             os.environ.pop(env_key, None)
@@ -67,46 +104,142 @@ def _run_structural(baseline: bool) -> tuple[int, int, int]:
             os.environ[env_key] = previous
 
 
-def _run_sidecars(quick: bool) -> list[tuple[str, bool]]:
+def _run_structural(baseline: bool) -> tuple[int, int, int, list]:
+    """Run tests/ in this process."""
+    return _run_suite(lambda loader: loader.discover(str(TESTS_DIR),
+                                                     top_level_dir=str(TESTS_DIR)),
+                      baseline)
+
+
+def _shard_main(module: str, baseline: bool) -> int:
+    """``--shard``: run one test module; the report goes to stderr, the counts
+    and timings as one JSON line to stdout for :func:`_run_shard`."""
+    run, bad, skipped, timings = _run_suite(
+        lambda loader: loader.loadTestsFromName(module), baseline, stream=sys.stderr)
+    print(json.dumps({"run": run, "bad": bad, "skipped": skipped, "timings": timings}))
+    return 1 if bad else 0
+
+
+def _run_shard(path: Path, baseline: bool) -> tuple[str, float, dict, str]:
+    """One structural module in a subprocess. ``(module, seconds, counts, report)``;
+    a shard that dies before reporting counts as one failure."""
+    t0 = time.perf_counter()
+    proc = subprocess.run([sys.executable, str(Path(__file__).resolve()), "--shard", path.stem]
+                          + (["--baseline"] if baseline else []),
+                          capture_output=True, text=True, timeout=300, cwd=str(TESTS_DIR))
+    elapsed = time.perf_counter() - t0
+    lines = proc.stdout.strip().splitlines()
+    try:
+        counts = json.loads(lines[-1])
+    except (IndexError, ValueError):
+        counts = {"run": 0, "bad": 1, "skipped": 0, "timings": []}
+    return path.stem, elapsed, counts, proc.stderr
+
+
+def _run_sidecar(label: str, path: Path, slow: bool, quick: bool) -> tuple[str, bool, str, float]:
+    """``(label, ok, report line, seconds)`` for one SIDECAR_SUITES entry."""
+    if quick and slow:
+        return label, True, f"  SKIPPED (--quick): {label}", 0.0
+    if not path.is_file():
+        return label, False, f"  MISSING: {label} ({path.name})", 0.0
+    t0 = time.perf_counter()
+    proc = subprocess.run([sys.executable, str(path)],
+                          capture_output=True, text=True, timeout=300)
+    ok = proc.returncode == 0
+    tail = (proc.stdout or proc.stderr).strip().splitlines()
+    summary = tail[-1] if tail else "(no output)"
+    return (label, ok, f"  {'OK  ' if ok else 'FAIL'}  {label:34s} {summary}",
+            time.perf_counter() - t0)
+
+
+def _run_sidecars(quick: bool) -> list[tuple[str, bool, str, float]]:
     results = []
     for label, path, slow in SIDECAR_SUITES:
-        if quick and slow:
-            print(f"  SKIPPED (--quick): {label}")
-            results.append((label, True))
-            continue
-        if not path.is_file():
-            print(f"  MISSING: {label} ({path.name})")
-            results.append((label, False))
-            continue
-        proc = subprocess.run([sys.executable, str(path)],
-                              capture_output=True, text=True, timeout=300)
-        ok = proc.returncode == 0
-        tail = (proc.stdout or proc.stderr).strip().splitlines()
-        summary = tail[-1] if tail else "(no output)"
-        print(f"  {'OK  ' if ok else 'FAIL'}  {label:34s} {summary}")
-        results.append((label, ok))
+        results.append(_run_sidecar(label, path, slow, quick))
+        print(results[-1][2])
     return results
 
 
+def _run_parallel(baseline: bool, quick: bool, jobs: int):
+    """Structural shards and sidecar suites on one pool of ``jobs`` workers.
+
+    Returns ``((run, bad, skipped, timings), shard seconds, sidecars)``; the
+    failing shards' reports go to stderr, as the serial runner's would.
+    """
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        # Sidecars first: the report engine is the longest single job.
+        sidecars = [] if baseline else [pool.submit(_run_sidecar, label, path, slow, quick)
+                                        for label, path, slow in SIDECAR_SUITES]
+        shards = [pool.submit(_run_shard, path, baseline)
+                  for path in sorted(TESTS_DIR.glob("test_*.py"))]
+        run = bad = skipped = 0
+        timings: list = []
+        seconds: dict[str, float] = {}
+        for future in shards:
+            module, elapsed, counts, report = future.result()
+            run += counts["run"]
+            bad += counts["bad"]
+            skipped += counts["skipped"]
+            timings.extend((name, t) for name, t in counts["timings"])
+            seconds[module] = elapsed
+            if counts["bad"]:
+                print(report.rstrip(), file=sys.stderr)
+        return (run, bad, skipped, timings), seconds, [f.result() for f in sidecars]
+
+
+def _print_timings(timings: list, suites: dict[str, float], slowest: int, total: float) -> None:
+    """The slowest suites (test modules and sidecars), then the slowest tests."""
+    print(f"\n--- timings ({total:.2f}s wall) ---")
+    if slowest <= 0:
+        return
+    for label, seconds in sorted(suites.items(), key=lambda kv: -kv[1])[:slowest]:
+        print(f"  {seconds:7.2f}s  {label}")
+    if timings:
+        print("  tests:")
+        for name, seconds in sorted(timings, key=lambda kv: -kv[1])[:slowest]:
+            print(f"  {seconds:7.2f}s  {name}")
+
+
 def main(argv=None) -> int:
     ap = argparse.ArgumentParser(description=(__doc__ or "").split("\n")[0])
     ap.add_argument("--baseline", action="store_true",
                     help="run the structural gates against tests/baseline_v0.17.0; "
                          "they are EXPECTED to fail, so the exit code is inverted")
     ap.add_argument("--quick", action="store_true", help="skip the slow suites")
+    ap.add_argument("--jobs", "-j", type=int, default=1, metavar="N",
+                    help="run test modules and sidecar suites on N workers "
+                         "(default: 1, serial; 0 = one per core)")
+    ap.add_argument("--slowest", type=int, default=10, metavar="N",
+                    help="print the N slowest suites and tests (default: 10; 0 = none)")
+    ap.add_argument("--shard", metavar="MODULE", help=argparse.SUPPRESS)
     args = ap.parse_args(argv)
 
+    if args.shard:
+        return _shard_main(args.shard, args.baseline)
+
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
     mode = "BASELINE (v0.17.0 snapshot)" if args.baseline else "LIVE"
-    print(f"=== rag-plugin checks — {mode} ===\n")
+    workers = f", {jobs} workers" if jobs > 1 else ""
+    print(f"=== rag-plugin checks — {mode}{workers} ===\n")
 
+    t0 = time.perf_counter()
     print("--- structural gates (tests/) ---")
-    run, bad, skipped = _run_structural(args.baseline)
+    if jobs > 1:
+        (run, bad, skipped, timings), suites, sidecars = _run_parallel(
+            args.baseline, args.quick, jobs)
+    else:
+        run, bad, skipped, timings = _run_structural(args.baseline)
+        suites = {}
+        for name, seconds in timings:
+            module = name.split(".")[0]
+            suites[module] = suites.get(module, 0.0) + seconds
     print(f"    {run} run, {bad} failed, {skipped} skipped")
     if skipped:
         print("    NOTE: skips above are real. A suite that skips is a suite that "
               "did not run — do not read this as coverage.")
 
     if args.baseline:
+        _print_timings(timings, suites, args.slowest, time.perf_counter() - t0)
         print()
         if bad > 0:
             print(f"NEGATIVE CONTROL PASSED: {bad} gate(s) correctly failed against "
@@ -118,8 +251,14 @@ def main(argv=None) -> int:
         return 1
 
     print("\n--- sidecar suites ---")
-    sidecars = _run_sidecars(args.quick)
-    failed = [name for name, ok in sidecars if not ok]
+    if jobs > 1:
+        for _, _, line, _ in sidecars:
+            print(line)
+    else:
+        sidecars = _run_sidecars(args.quick)
+    suites.update((f"sidecar: {label}", seconds) for label, _, _, seconds in sidecars if seconds)
+    failed = [label for label, ok, _, _ in sidecars if not ok]
+    _print_timings(timings, suites, args.slowest, time.perf_counter() - t0)
 
     print()
     if bad == 0 and not failed:
@@ -0,0 +1,158 @@
+"""The hook-decisions aggregate must always equal a full recount of the log.
+
+``scripts/decision_log.py`` lets the report and the analyzer read a running
+aggregate instead of every record ever written. That is only safe if the
+aggregate cannot drift from the log it summarises: not when two hooks append
+at once, not across rotation into gzipped segments, not when the sidecar is
+lost or was never written by an older hook. Every test compares the cached
+answer with :func:`decision_log.recompute`.
+"""
+
+from __future__ import annotations
+
+import gzip
+import importlib.util
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from _tree import PLUGIN_ROOT  # type: ignore[import-not-found]  # noqa: E402
+
+sys.path.insert(0, str(PLUGIN_ROOT / "scripts"))
+
+import decision_log  # type: ignore[import-not-found]  # noqa: E402
+
+
+def _entry(i: int, action: str = "silent-pass:shape-mismatch", score: float = 0.0) -> dict:
+    return {"ts": "2026-10-17T09:%02d:%02dZ" % (i // 60 % 60, i % 60), "hook_version": "1.0.0",
+            "action": action, "prompt_length": i, "probe_top_score": score}
+
+
+class _LogCase(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp(prefix="rag-decisions-")
+        self.addCleanup(shutil.rmtree, self.dir, True)
+        self.log = os.path.join(self.dir, "hook-decisions.log")
+
+    def assertMatchesRecount(self, agg=None):
+        agg = decision_log.load(self.log) if agg is None else agg
+        full = decision_log.recompute(self.log)
+        for key in ("total", "malformed", "actions", "prompt_length_sum",
+                    "hook_versions", "probe", "last_ts", "segments"):
+            self.assertEqual(agg[key], full[key], key)
+        return agg
+
+
+class TestRunningAggregate(_LogCase):
+
+    def test_append_keeps_the_sidecar_current(self):
+        for i in range(20):
+            decision_log.append(self.log, _entry(i, "reminder-injected" if i % 4 else
+                                                 "silent-pass:probe-below-threshold", 0.05 * i))
+        with open(decision_log.sidecar_path(self.log), encoding="utf-8") as f:
+            cached = json.load(f)
+        self.assertEqual(cached["offset"], os.path.getsize(self.log))
+        agg = self.assertMatchesRecount(cached)
+        self.assertEqual(agg["total"], 20)
+        self.assertEqual(sum(agg["probe"]["hist"]), 20)
+
+    def test_records_written_without_the_sidecar_are_caught_up(self):
+        decision_log.append(self.log, _entry(0))
+        with open(self.log, "a", encoding="utf-8") as f:  # an older hook, say
+            for i in range(1, 6):
+                f.write(json.dumps(_entry(i)) + "\n")
+            f.write("not json\n")
+        agg = self.assertMatchesRecount()
+        self.assertEqual((agg["total"], agg["malformed"]), (6, 1))
+
+    def test_a_log_that_predates_the_sidecar_is_rebuilt(self):
+        with open(self.log, "w", encoding="utf-8") as f:
+            for i in range(10):
+                f.write(json.dumps(_entry(i)) + "\n")
+        self.assertEqual(decision_log.load(self.log)["total"], 10)
+        self.assertFalse(os.path.exists(decision_log.sidecar_path(self.log)))
+
+    def test_a_half_written_record_waits(self):
+        decision_log.append(self.log, _entry(0))
+        with open(self.log, "a", encoding="utf-8") as f:
+            f.write('{"action": "reminder-inj')
+        self.assertEqual(decision_log.load(self.log)["total"], 1)
+
+    def test_concurrent_appenders_converge(self):
+        def writer(base):
+            for i in range(25):
+                decision_log.append(self.log, _entry(base + i))
+
+        threads = [threading.Thread(target=writer, args=(k * 100,)) for k in range(6)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(self.assertMatchesRecount()["total"], 150)
+
+
+class TestRotation(_LogCase):
+
+    def test_size_rotation_gzips_and_keeps_the_totals(self):
+        for i in range(40):
+            decision_log.append(self.log, _entry(i), max_bytes=1500)
+        segs = decision_log.segments(self.log)
+        self.assertGreater(len(segs), 1)
+        self.assertTrue(all(s.endswith(".log.gz") for s in segs))
+        with gzip.open(segs[0], "rt", encoding="utf-8") as f:
+            self.assertTrue(json.loads(f.readline())["action"])
+        agg = self.assertMatchesRecount()
+        self.assertEqual(agg["total"], 40)
+        self.assertEqual(agg["segments"], len(segs))
+
+    def test_age_rotation(self):
+        decision_log.append(self.log, dict(_entry(0), ts="2020-01-01T00:00:00Z"),
+                            max_age_days=1e9)
+        self.assertEqual(decision_log.segments(self.log), [])
+        decision_log.append(self.log, _entry(1), max_age_days=30)
+        self.assertEqual(len(decision_log.segments(self.log)), 1)
+        self.assertFalse(os.path.exists(self.log))
+        self.assertEqual(self.assertMatchesRecount()["total"], 2)
+
+
+class TestReaders(_LogCase):
+
+    def test_report_and_hook_share_the_aggregate(self):
+        home = tempfile.mkdtemp(prefix="rag-home-")
+        self.addCleanup(shutil.rmtree, home, True)
+        spec = importlib.util.spec_from_file_location(
+            "context_inject_under_test", PLUGIN_ROOT / "hooks" / "context_inject.py")
+        ci = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(ci)
+        ci.OBS_DIR = os.path.join(home, ".claude", "rag-plugin")
+        ci.OBS_LOG = os.path.join(ci.OBS_DIR, "hook-decisions.log")
+        ci.OBS_DISABLE_MARKER = os.path.join(ci.OBS_DIR, ".disabled")
+        for i in range(3):
+            ci.log_decision(action="context-injected", prompt_length=i)
+        self.assertTrue(os.path.isfile(decision_log.sidecar_path(ci.OBS_LOG)))
+
+        import rag_report  # type: ignore[import-not-found]
+
+        saved = os.environ.get("HOME")
+        os.environ["HOME"] = home
+        try:
+            stats = rag_report.inspect_hook_log()
+        finally:
+            if saved is None:
+                os.environ.pop("HOME", None)
+            else:
+                os.environ["HOME"] = saved
+        self.assertEqual(stats.total_lines, 3)
+        self.assertEqual(stats.actions, {"context-injected": 3})
+        self.assertTrue(stats.last_entry_ts)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
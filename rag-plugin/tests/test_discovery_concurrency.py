@@ -0,0 +1,137 @@
+"""Concurrent discovery and the identity cache must not change what is selected.
+
+``service_discover.discover`` now probes every responder's endpoints at once
+under one deadline and reuses a cached identity when a port's ``/health``
+fingerprint is unchanged. These tests run it against real local stub services
+(``scripts/bench_service_discover.StubServices``) and check the parts that
+could go wrong: a restarted service must be re-identified, a vanished one
+forgotten, a slow one cut off by the deadline rather than stalling discovery.
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from _tree import PLUGIN_ROOT  # type: ignore[import-not-found]  # noqa: E402
+
+sys.path.insert(0, str(PLUGIN_ROOT / "scripts"))
+
+import service_discover as sd  # type: ignore[import-not-found]  # noqa: E402
+from bench_service_discover import StubServices  # type: ignore[import-not-found]  # noqa: E402
+
+
+class _StubCase(unittest.TestCase):
+
+    def setUp(self):
+        state = tempfile.mkdtemp(prefix="rag-discover-")
+        self.addCleanup(shutil.rmtree, state, True)
+        saved = (sd.IDENTITY_CACHE_FILE, sd.LIKELY_PORTS, sd.DISCOVERY_DEADLINE_SECONDS)
+        sd.IDENTITY_CACHE_FILE = Path(state) / "service-identity.json"
+        sd.LIKELY_PORTS = ()
+
+        def restore():
+            sd.IDENTITY_CACHE_FILE, sd.LIKELY_PORTS, sd.DISCOVERY_DEADLINE_SECONDS = saved
+        self.addCleanup(restore)
+        for var in ("RAG_PLUGIN_SERVICE_PORT", "RAG_SERVICE_PORT"):
+            if var in os.environ:
+                self.addCleanup(os.environ.__setitem__, var, os.environ.pop(var))
+
+    def start(self, n, latency=0.0, instance_ids=True):
+        stubs = StubServices(n, latency, instance_ids)
+        ports = stubs.__enter__()
+        self.addCleanup(stubs.__exit__, None, None, None)
+        return stubs, ports
+
+
+class TestConcurrentProbe(_StubCase):
+
+    def test_all_services_found_in_one_round(self):
+        _, ports = self.start(5, latency=0.2)
+        t0 = time.monotonic()
+        result = sd.discover(ports=ports, use_cache=False)
+        elapsed = time.monotonic() - t0
+        self.assertEqual(sorted(c.port for c in result.candidates), sorted(ports))
+        self.assertTrue(all(c.identity and c.projects for c in result.candidates))
+        self.assertLess(elapsed, 0.2 * 3 * 5 / 2, "the endpoints were probed serially")
+        self.assertFalse(sd.IDENTITY_CACHE_FILE.exists())
+
+    def test_the_deadline_bounds_a_slow_service(self):
+        _, ports = self.start(1, latency=0.8)
+        sd.DISCOVERY_DEADLINE_SECONDS = 0.2
+        t0 = time.monotonic()
+        result = sd.discover(ports=ports, use_cache=False)
+        self.assertLess(time.monotonic() - t0, 0.7)
+        self.assertEqual(result.candidates, [])
+
+
+class TestIdentityCache(_StubCase):
+
+    def test_a_warm_discovery_asks_only_for_health(self):
+        stubs, ports = self.start(3)
+        cold = sd.discover(ports=ports)
+        self.assertTrue(sd.IDENTITY_CACHE_FILE.is_file())
+        stubs.hits.clear()
+        warm = sd.discover(ports=ports)
+        self.assertEqual(stubs.hits, {"/health": 3})
+        self.assertTrue(all(c.from_cache for c in warm.candidates))
+        self.assertEqual(sorted((c.port, c.data_dir, c.score) for c in warm.candidates),
+                         sorted((c.port, c.data_dir, c.score) for c in cold.candidates))
+
+    def test_the_cache_never_widens_the_probe(self):
+        _, ports = self.start(2)
+        sd.discover(ports=ports)  # found both by scanning; both are cached now
+        sd.LIKELY_PORTS = (ports[0],)
+        warm = sd.discover(ports=ports)
+        cold = sd.discover(ports=ports, use_cache=False)
+        self.assertEqual([c.port for c in warm.candidates], [ports[0]])
+        self.assertEqual([c.port for c in cold.candidates], [ports[0]])
+        self.assertEqual((warm.selected.port, warm.source), (cold.selected.port, cold.source))
+
+    def test_a_changed_fingerprint_is_reidentified(self):
+        stubs, ports = self.start(2)
+        sd.discover(ports=ports)
+        stubs.bump(ports[0])
+        stubs.hits.clear()
+        warm = {c.port: c for c in sd.discover(ports=ports).candidates}
+        self.assertFalse(warm[ports[0]].from_cache)
+        self.assertTrue(warm[ports[1]].from_cache)
+        self.assertEqual(stubs.hits.get("/identity"), 1)
+
+    def test_without_a_restart_marker_nothing_is_reused(self):
+        stubs, ports = self.start(2, instance_ids=False)
+        sd.discover(ports=ports)
+        stubs.hits.clear()
+        warm = sd.discover(ports=ports)
+        self.assertFalse(any(c.from_cache for c in warm.candidates))
+        self.assertEqual(stubs.hits.get("/identity"), 2)
+        self.assertEqual(stubs.hits.get("/health"), 2, "a second round was spent")
+
+    def test_a_stale_entry_is_not_reused(self):
+        _, ports = self.start(1)
+        sd.discover(ports=ports)
+        saved = sd.IDENTITY_CACHE_TTL_SECONDS
+        sd.IDENTITY_CACHE_TTL_SECONDS = -1
+        self.addCleanup(setattr, sd, "IDENTITY_CACHE_TTL_SECONDS", saved)
+        self.assertFalse(sd.discover(ports=ports).candidates[0].from_cache)
+
+    def test_a_vanished_service_is_forgotten(self):
+        stubs, ports = self.start(2)
+        sd.discover(ports=ports)
+        stubs.servers[1].shutdown()
+        stubs.servers[1].server_close()
+        result = sd.discover(ports=ports)
+        self.assertEqual([c.port for c in result.candidates], [ports[0]])
+        self.assertEqual(list(sd._load_identity_cache(time.time())),
+                         [f"127.0.0.1:{ports[0]}"])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,244 @@
+"""The context injector must spend at most one latency budget per prompt.
+
+``hooks/context_inject.py`` used to cap each wait on its own — /health per
+port, the project list, the probe — so the caps could stack to seconds before
+the prompt was sent. ``Budget`` bounds the sum: every wait is cut to what is
+left, a spent budget skips the remaining phases with ``budget-exhausted``,
+and on a scope-cache miss the /health check runs in the background while the
+focus state is read — a warm scope never asks for it. The
+``budget_*`` fields it logs are folded into the hook-decisions aggregate.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import importlib.util
+import io
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import types
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from _tree import PLUGIN_ROOT  # type: ignore[import-not-found]  # noqa: E402
+
+sys.path.insert(0, str(PLUGIN_ROOT / "scripts"))
+
+import analyze_hook_decisions  # type: ignore[import-not-found]  # noqa: E402
+import decision_log  # type: ignore[import-not-found]  # noqa: E402
+
+
+class _HookCase(unittest.TestCase):
+
+    def setUp(self):
+        spec = importlib.util.spec_from_file_location(
+            "context_inject_budget", PLUGIN_ROOT / "hooks" / "context_inject.py")
+        self.ci = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(self.ci)
+        self.ci.CANDIDATE_PORTS = (1,)
+        self.gets = []
+
+    def serve(self, delay):
+        """Stub ``_http_get``: every request takes ``delay`` seconds, or times
+        out early if the caller's timeout is shorter."""
+        def fake_get(url, timeout):
+            self.gets.append((url.split("?")[0], timeout))
+            if timeout < delay:
+                time.sleep(timeout)
+                raise TimeoutError
+            time.sleep(delay)
+            return 200, b'{"results": []}'
+        self.ci._http_get = fake_get
+
+
+class TestBudget(_HookCase):
+
+    def test_timeouts_are_cut_to_what_is_left(self):
+        budget = self.ci.Budget(200)
+        self.assertEqual(budget.timeout(0.05), 0.05)
+        self.assertLessEqual(budget.timeout(5.0), 0.2)
+        time.sleep(0.21)
+        self.assertTrue(budget.spent())
+        self.assertEqual(budget.timeout(5.0), 0.001)
+
+    def test_zero_is_unbounded_and_logs_nothing(self):
+        budget = self.ci.Budget(0)
+        self.assertFalse(budget.spent())
+        self.assertEqual(budget.timeout(1.5), 1.5)
+        self.assertEqual(budget.fields(), {})
+
+    def test_fields_add_up_to_the_budget(self):
+        fields = self.ci.Budget(800).fields()
+        self.assertEqual(fields["budget_ms"], 800)
+        self.assertAlmostEqual(fields["budget_spent_ms"] + fields["budget_left_ms"], 800, delta=0.2)
+
+
+class TestPhasesShareTheBudget(_HookCase):
+
+    def test_a_spent_budget_skips_the_probe(self):
+        self.serve(0.0)
+        self.ci._budget = self.ci.Budget(1)
+        time.sleep(0.01)
+        self.assertEqual(self.ci.domain_probe("question", "rag"), (False, 0.0, "budget-exhausted"))
+        self.assertEqual(self.gets, [])
+
+    def test_a_slow_search_is_cut_off_at_the_budget(self):
+        self.serve(1.0)
+        self.ci._live_base_url_cache[:] = [("http://127.0.0.1:1", time.monotonic())]
+        self.ci._budget = self.ci.Budget(150)
+        t0 = time.monotonic()
+        self.assertEqual(self.ci.domain_probe("question", "rag")[2], "budget-exhausted")
+        self.assertLess(time.monotonic() - t0, 0.4)
+        self.assertLessEqual(self.gets[0][1], 0.15)
+
+    def test_health_runs_while_the_scope_is_read(self):
+        self.serve(0.2)
+        self.ci._budget = self.ci.Budget(5000)
+        t0 = time.monotonic()
+        self.ci.prefetch_live_base_url()
+        time.sleep(0.2)  # stands in for the focus state and scope cache reads
+        self.assertEqual(self.ci._first_live_base_url(), "http://127.0.0.1:1")
+        self.assertLess(time.monotonic() - t0, 0.35, "health waited for the scope")
+        self.assertEqual([u for u, _ in self.gets], ["http://127.0.0.1:1/health"])
+        self.assertEqual(self.ci._live_prefetch, [])
+
+    def test_an_unanswered_prefetch_is_not_waited_past_the_budget(self):
+        release = threading.Event()
+        self.ci._http_get = lambda url, timeout: (release.wait(2), (200, b""))[1]
+        self.addCleanup(release.set)
+        self.ci._budget = self.ci.Budget(100)
+        self.ci.prefetch_live_base_url()
+        t0 = time.monotonic()
+        self.assertIsNone(self.ci._first_live_base_url())
+        self.assertLess(time.monotonic() - t0, 0.3)
+
+
+class TestHealthOnlyWhenTheScopeNeedsIt(_HookCase):
+
+    def _scope_module(self, cached):
+        fake = types.SimpleNamespace(
+            resolve_workspace_key=lambda cwd: "ws",
+            read_cache=lambda key: cached,
+            fetch_projects=lambda base, timeout: [],
+            resolve=lambda cwd, projects: types.SimpleNamespace(
+                ambiguous=False, project=None, union_ids=[]),
+            write_cache=lambda *a, **kw: None,
+        )
+        self.ci._load = lambda name, filename: fake if name == "rp_scope_resolve" else None
+
+    def test_a_warm_scope_asks_for_nothing(self):
+        self.serve(0.0)
+        self._scope_module({"project": {"project_id": "rag", "mode": "full"}})
+        scope = self.ci.resolve_scope(os.getcwd())
+        self.assertEqual((scope.project, scope.source), ("rag", "cache"))
+        self.assertEqual(self.gets, [])
+        self.assertEqual(self.ci._live_prefetch, [])
+
+    def _prompt(self, lookup):
+        """Run ``main`` on a warm scope with ``lookup`` as the probe cache;
+        the decisions it logged."""
+        self._scope_module({"project": {"project_id": "rag", "mode": "full"}})
+        cache = types.SimpleNamespace(lookup=lookup, store=lambda *a: 0)
+        scope_load = self.ci._load
+        self.ci._load = lambda name, filename: (cache if name == "rp_probe_cache"
+                                                else scope_load(name, filename))
+        logged = []
+        self.ci.log_decision = lambda **fields: logged.append(fields)
+        stdin = io.StringIO('{"prompt": "What is our convention for naming the release '
+                            'branches?", "cwd": "%s"}' % os.getcwd().replace("\\", "/"))
+        with mock.patch.object(sys, "stdin", stdin), contextlib.redirect_stdout(io.StringIO()), \
+                contextlib.suppress(SystemExit):
+            self.ci.main()
+        return logged
+
+    def test_a_warm_prompt_makes_no_http_call(self):
+        self.serve(0.0)
+        logged = self._prompt(lambda *a: ("hit", (True, 0.9)))
+        self.assertEqual(logged[0]["action"], "context-injected", logged)
+        self.assertEqual(logged[0]["http_calls"], 0)
+        self.assertEqual(self.gets, [])
+
+    def test_a_search_never_sent_is_not_counted(self):
+        def down(url, timeout):
+            self.gets.append(url)
+            raise ConnectionRefusedError
+        self.ci._http_get = down
+        logged = self._prompt(lambda *a: ("miss", None))
+        self.assertEqual(logged[0]["probe_error"], "service-down", logged)
+        self.assertEqual(logged[0]["http_calls"], len(self.gets), self.gets)
+
+    def test_a_cache_miss_asks_health_once_and_counts_it(self):
+        self.serve(0.0)
+        self._scope_module(None)
+        self.ci._health_gets.clear()
+        scope = self.ci.resolve_scope(os.getcwd())
+        self.assertEqual(scope.source, "resolved")
+        self.assertEqual([u for u, _ in self.gets], ["http://127.0.0.1:1/health"])
+        self.assertEqual(len(self.ci._health_gets), 1)
+
+
+class TestLoadIsThreadSafe(_HookCase):
+
+    def test_concurrent_loads_never_see_a_half_initialised_module(self):
+        scripts = tempfile.mkdtemp(prefix="rag-load-")
+        self.addCleanup(shutil.rmtree, scripts, True)
+        self.addCleanup(sys.modules.pop, "rp_slow_for_test", None)
+        with open(os.path.join(scripts, "slow.py"), "w", encoding="utf-8") as f:
+            f.write("import time\ntime.sleep(0.2)\nREADY = True\n")
+        self.ci._SCRIPTS_DIR = scripts
+        seen = []
+
+        def load():
+            seen.append(getattr(self.ci._load("rp_slow_for_test", "slow.py"), "READY", None))
+        threads = [threading.Thread(target=load) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(seen, [True] * 4)
+
+
+class TestBudgetStatistics(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp(prefix="rag-budget-stats-")
+        self.addCleanup(shutil.rmtree, self.dir, True)
+        self.log = os.path.join(self.dir, "hook-decisions.log")
+
+    def test_spend_and_exhaustion_reach_the_analyzer(self):
+        for action, spent, probe_error in (("context-injected", 30.0, ""),
+                                           ("context-injected", 120.0, ""),
+                                           ("silent-pass:budget-exhausted", 801.0, ""),
+                                           ("context-injected", 790.5, "budget-exhausted")):
+            entry = {"ts": "2026-10-17T09:00:00Z", "hook_version": "1.0.0", "action": action,
+                     "budget_ms": 800, "budget_spent_ms": spent}
+            if probe_error:
+                entry["probe_error"] = probe_error
+            decision_log.append(self.log, entry)
+        decision_log.append(self.log, {"action": "silent-pass:too-short"})
+        agg = decision_log.load(self.log)
+        self.assertEqual(agg["budget"]["count"], 4)
+        self.assertEqual(agg["budget"]["exhausted"], 2)
+        self.assertEqual(agg["budget"]["max_ms"], 801.0)
+        self.assertEqual(sum(agg["budget"]["hist"]), 4)
+        self.assertEqual(agg["budget"], decision_log.recompute(self.log)["budget"])
+
+        saved = analyze_hook_decisions.LOG_PATH
+        analyze_hook_decisions.LOG_PATH = self.log
+        self.addCleanup(setattr, analyze_hook_decisions, "LOG_PATH", saved)
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            analyze_hook_decisions.main([])
+        self.assertIn("--- latency budget (ms spent per prompt) ---", out.getvalue())
+        self.assertIn("exhausted:   2  (50.0%)", out.getvalue())
+        self.assertIn("RAG_PLUGIN_HOOK_BUDGET_MS", out.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,196 @@
+"""The shared keep-alive client must save connections without changing answers.
+
+``scripts/http_keepalive.py`` replaces ``urlopen`` on the hook path. The
+saving is only worth having if every observable behaviour the hooks relied on
+survives it: non-2xx statuses still distinguishable (the 422-after-scope log
+line depends on it), the caller's timeout still binding on a *reused* socket,
+and a connection the server has quietly closed never surfacing as an error.
+
+Runs against a real loopback HTTP/1.1 server, so connection reuse is counted
+on the server side rather than inferred from the client's own bookkeeping.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import sys
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from _tree import PLUGIN_ROOT  # type: ignore[import-not-found]  # noqa: E402
+
+sys.path.insert(0, str(PLUGIN_ROOT / "scripts"))
+
+import http_keepalive  # type: ignore[import-not-found]  # noqa: E402
+import scope_resolve  # type: ignore[import-not-found]  # noqa: E402
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    connections: set = set()
+    sockets: list = []
+
+    def log_message(self, *args):  # keep test output clean
+        pass
+
+    def setup(self):
+        super().setup()
+        type(self).connections.add(id(self.connection))
+        type(self).sockets.append(self.connection)
+
+    def _reply(self, status, payload, close=False):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if close:
+            self.send_header("Connection", "close")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path.startswith("/slow"):
+            time.sleep(0.6)
+            self._reply(200, {"slow": True})
+        elif self.path.startswith("/close"):
+            self._reply(200, {"closing": True}, close=True)
+        elif self.path.startswith("/missing"):
+            self._reply(422, {"error_code": "SCOPE_UNRESOLVED"})
+        elif self.path.startswith("/api/projects/configured"):
+            self._reply(200, {"projects": [{"id": "p1", "path": "/x"}]})
+        else:
+            self._reply(200, {"ok": True, "path": self.path})
+
+
+class _ServerCase(unittest.TestCase):
+
+    def setUp(self):
+        _Handler.connections = set()
+        _Handler.sockets = []
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.base = "http://127.0.0.1:%d" % self.server.server_address[1]
+        self.pool = http_keepalive.KeepAlivePool()
+
+    def tearDown(self):
+        self.pool.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class TestReuse(_ServerCase):
+
+    def test_sequential_requests_share_one_connection(self):
+        for i in range(5):
+            resp = self.pool.get(f"{self.base}/health?i={i}", timeout=2)
+            self.assertEqual(resp.status, 200)
+            self.assertEqual(resp.json()["path"], f"/health?i={i}")
+        self.assertEqual(len(_Handler.connections), 1)
+        self.assertEqual(self.pool.counters["reused"], 4)
+
+    def test_connection_close_is_honoured(self):
+        self.pool.get(f"{self.base}/close", timeout=2)
+        self.pool.get(f"{self.base}/health", timeout=2)
+        self.assertEqual(len(_Handler.connections), 2)
+
+    def test_idle_connections_expire(self):
+        pool = http_keepalive.KeepAlivePool(idle_seconds=0.0)
+        self.addCleanup(pool.close)
+        pool.get(f"{self.base}/health", timeout=2)
+        pool.get(f"{self.base}/health", timeout=2)
+        self.assertEqual(pool.counters["reused"], 0)
+
+    def test_concurrent_callers_never_share_a_socket(self):
+        errors = []
+
+        def worker():
+            try:
+                for _ in range(10):
+                    self.assertEqual(self.pool.get(f"{self.base}/x", timeout=2).status, 200)
+            except Exception as exc:  # noqa: BLE001
+                errors.append(exc)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(errors, [])
+
+
+class TestContractPreserved(_ServerCase):
+
+    def test_non_2xx_is_returned_not_raised(self):
+        resp = self.pool.get(f"{self.base}/missing", timeout=2)
+        self.assertEqual(resp.status, 422)
+
+    def test_timeout_binds_on_a_reused_connection(self):
+        self.pool.get(f"{self.base}/health", timeout=5)
+        with self.assertRaises(TimeoutError):
+            self.pool.get(f"{self.base}/slow", timeout=0.2)
+
+    def test_server_side_close_of_an_idle_socket_is_invisible(self):
+        self.pool.get(f"{self.base}/health", timeout=2)
+        # What uvicorn does after its keep-alive timeout: close its end of the
+        # idle connection behind the pool's back.
+        for conn in _Handler.sockets:
+            conn.shutdown(socket.SHUT_RDWR)
+        time.sleep(0.05)
+        resp = self.pool.get(f"{self.base}/health", timeout=2)
+        self.assertEqual(resp.status, 200)
+        self.assertEqual(len(_Handler.connections), 2)
+
+    def test_refused_port_raises_oserror(self):
+        sock = socket.socket()
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+        sock.close()
+        with self.assertRaises(OSError):
+            self.pool.get(f"http://127.0.0.1:{port}/health", timeout=1)
+
+    def test_a_garbled_reply_on_a_fresh_connection_is_an_oserror(self):
+        # Something that is not HTTP on the port: http.client raises
+        # BadStatusLine / RemoteDisconnected, which are not OSErrors.
+        listener = socket.socket()
+        listener.bind(("127.0.0.1", 0))
+        listener.listen(4)
+        self.addCleanup(listener.close)
+
+        def serve():
+            for reply in (b"SSH-2.0-OpenSSH\r\n", b""):
+                conn, _ = listener.accept()
+                conn.recv(4096)
+                conn.sendall(reply)
+                conn.close()
+        threading.Thread(target=serve, daemon=True).start()
+        url = "http://127.0.0.1:%d/health" % listener.getsockname()[1]
+        with self.assertRaises(ConnectionError):
+            self.pool.get(url, timeout=2)
+        self.assertIsNone(http_keepalive.get_json(url, timeout=2))
+
+    def test_get_json_keeps_the_none_on_failure_shape(self):
+        self.assertIsNone(http_keepalive.get_json(f"{self.base}/missing", timeout=2))
+        self.assertEqual(http_keepalive.get_json(f"{self.base}/health", timeout=2)["ok"],
+                         True)
+
+
+class TestScopeResolverUsesThePool(_ServerCase):
+
+    def test_fetch_projects_goes_through_the_shared_client(self):
+        before = http_keepalive.stats()
+        projects = scope_resolve.fetch_projects(self.base, timeout=2)
+        scope_resolve.fetch_projects(self.base, timeout=2)
+        after = http_keepalive.stats()
+        self.assertEqual([p["id"] for p in projects], ["p1"])
+        self.assertGreaterEqual(after["reused"] - before["reused"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,242 @@
+"""md_analyzer's batch engine must be a pure speed-up.
+
+``scripts/md_analyzer.py`` now reads each file once, can spread a tree over a
+process pool, and skips files whose content hash matches a cached fixed-point
+result. None of that may change what a run reports or writes: the same
+findings in the same order, the same fixes, and a cached file that is edited
+must be analysed again.
+
+The same store backs incremental runs (``--changed`` / ``--git-diff``): only
+the changed files are processed, yet the summary must still account for the
+whole tree, and a deleted file must leave it.
+
+The checks themselves read one ``_tokenize`` sweep instead of walking the body
+once per check; ``scripts/bench_md_analyzer.py`` keeps the original walks as
+the reference, and the findings must match it exactly.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from dataclasses import asdict
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from _tree import PLUGIN_ROOT  # type: ignore[import-not-found]  # noqa: E402
+
+sys.path.insert(0, str(PLUGIN_ROOT / "scripts"))
+
+import md_analyzer as mda  # type: ignore[import-not-found]  # noqa: E402
+from bench_md_analyzer import legacy_analyze, synthetic_document  # type: ignore[import-not-found]  # noqa: E402
+
+_NEEDS_FIXES = mda._SELF_TEST_INPUT
+_CLEAN = "# Clean\n\nA short introduction that says what follows.\n\n## Usage\n\nRun it.\n"
+
+
+class _TreeCase(unittest.TestCase):
+
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp(prefix="rag-md-tree-"))
+        self.addCleanup(shutil.rmtree, self.root, True)
+        saved = mda.CACHE_FILE
+        mda.CACHE_FILE = self.root / ".state" / "md-analyzer-cache.json"
+        self.addCleanup(setattr, mda, "CACHE_FILE", saved)
+
+    def write_tree(self, n=12):
+        for i in range(n):
+            sub = self.root / "docs" / f"part{i % 3}"
+            sub.mkdir(parents=True, exist_ok=True)
+            (sub / f"page{i}.md").write_text(_NEEDS_FIXES if i % 2 else _CLEAN, encoding="utf-8")
+        files, err = mda.discover_files(self.root / "docs")
+        self.assertIsNone(err)
+        return files
+
+    @staticmethod
+    def run_all(files, **kwargs):
+        kwargs.setdefault("no_backup", True)
+        kwargs.setdefault("dry_run", True)
+        return [(asdict(r), d) for r, d in mda.run_batch(files, **kwargs)]
+
+
+class TestBatchEngine(_TreeCase):
+
+    def test_batch_matches_the_per_file_pipeline(self):
+        files = self.write_tree()
+        expected = [(asdict(r), d) for r, d in
+                    (mda.enhance_file(p, no_backup=True, dry_run=True) for p in files)]
+        self.assertEqual(self.run_all(files, use_cache=False), expected)
+        self.assertEqual(self.run_all(files, use_cache=False, jobs=3), expected)
+
+    def test_fixed_point_files_are_served_from_the_cache(self):
+        files = self.write_tree()
+        first = self.run_all(files)
+        self.assertTrue(mda.CACHE_FILE.is_file())
+        calls = []
+        real = mda._analyze
+
+        def counting(path, doc):
+            calls.append(path)
+            return real(path, doc)
+        mda._analyze = counting
+        self.addCleanup(setattr, mda, "_analyze", real)
+        self.assertEqual(self.run_all(files), first)
+        self.assertEqual(len(calls), len([f for f in files if int(f.stem[4:]) % 2]),
+                         "only files with pending fixes should be analysed again")
+
+    def test_an_edited_file_is_analysed_again(self):
+        files = self.write_tree(2)
+        self.run_all(files, dry_run=False)
+        self.run_all(files)
+        clean = files[0]
+        clean.write_text(_CLEAN + "\n**Now a pseudo heading**\n\nText.\n", encoding="utf-8")
+        results = dict((r["path"], r) for r, _ in self.run_all(files))
+        self.assertEqual([f["rule_id"] for f in results[str(clean)]["findings"]
+                          if f["rule_id"] == "GL-05"], ["GL-05"])
+
+    def test_writes_then_reaches_a_fixed_point(self):
+        files = self.write_tree(4)
+        self.run_all(files, dry_run=False)
+        again = self.run_all(files, dry_run=False)
+        self.assertEqual([r["safe_fixes_applied"] for r, _ in again], [0] * 4)
+
+
+class TestFileCap(_TreeCase):
+
+    def test_the_cap_is_explicit(self):
+        self.write_tree(6)
+        files, err = mda.discover_files(self.root / "docs", max_files=5)
+        self.assertEqual(files, [])
+        self.assertIn("--max-files", err)
+        files, err = mda.discover_files(self.root / "docs", max_files=0)
+        self.assertEqual((len(files), err), (6, None))
+
+
+class TestIncremental(_TreeCase):
+
+    def test_changed_list_is_filtered_like_discovery(self):
+        files = self.write_tree(3)
+        (self.root / "docs" / "node_modules").mkdir()
+        (self.root / "docs" / "node_modules" / "x.md").write_text("# x\n", encoding="utf-8")
+        names = [str(files[0].relative_to(self.root)), "docs/notes.txt",
+                 "docs/node_modules/x.md", "docs/deleted.md", "/elsewhere/y.md", ""]
+        todo, gone = mda.changed_files(names, self.root / "docs", base=self.root)
+        self.assertEqual(todo, [files[0]])
+        self.assertEqual(gone, [self.root / "docs" / "deleted.md"])
+
+    def test_whole_tree_totals_without_a_rescan(self):
+        files = self.write_tree(6)
+        full = [asdict(r) for r, _ in mda.run_batch(files, no_backup=True, dry_run=True)]
+        fresh = [r for r, _ in mda.run_batch(files[:1], no_backup=True, dry_run=True)]
+        tree = mda.tree_results(self.root / "docs", fresh)
+        self.assertEqual([r.path for r in tree], [r["path"] for r in full])
+        self.assertEqual([f.rule_id for r in tree for f in r.findings],
+                         [f["rule_id"] for r in full for f in r["findings"]])
+        self.assertEqual(tree[0].safe_fixes_applied, fresh[0].safe_fixes_applied)
+
+    def test_deleted_files_leave_the_store(self):
+        files = self.write_tree(2)
+        list(mda.run_batch(files, no_backup=True, dry_run=True))
+        files[1].unlink()
+        _, gone = mda.changed_files([str(files[1])], self.root / "docs")
+        mda.forget_files(gone)
+        self.assertEqual([r.path for r in mda.tree_results(self.root / "docs")], [str(files[0])])
+
+    def follow(self, lines, *flags):
+        """Run ``--changed - --follow`` over ``lines``; return stdout and the saves."""
+        saves = []
+        real = mda._save_cache
+        argv = ["md_analyzer.py", str(self.root / "docs"), "--changed", "-", "--follow",
+                "--dry-run", *flags]
+        out = io.StringIO()
+        with mock.patch.object(sys, "argv", argv), \
+                mock.patch.object(sys, "stdin", io.StringIO("".join(l + "\n" for l in lines))), \
+                mock.patch.object(mda, "_save_cache",
+                                  side_effect=lambda s: (saves.append(1), real(s))), \
+                contextlib.redirect_stdout(out):
+            self.assertEqual(mda.main(), 0)
+        return out.getvalue(), len(saves)
+
+    def test_follow_json_is_one_object_per_line(self):
+        files = self.write_tree(2)
+        gone = self.root / "docs" / "gone.md"
+        text, _ = self.follow([str(files[0]), str(files[1]), str(gone)], "--json")
+        records = [json.loads(line) for line in text.splitlines()]
+        self.assertEqual([r["path"] for r in records], [str(files[0]), str(files[1]), str(gone)])
+        self.assertEqual(records[-1], {"path": str(gone), "removed": True})
+
+    def test_follow_counts_a_repeated_path_once_and_saves_once(self):
+        files = self.write_tree(2)
+        text, saves = self.follow([str(files[0]), str(files[1]), str(files[0])])
+        self.assertIn("incremental: 2 changed file(s) processed", text)
+        self.assertEqual(saves, 1)
+
+    @unittest.skipUnless(shutil.which("git"), "git is not installed")
+    def test_git_diff_names_changed_and_untracked_files(self):
+        files = self.write_tree(2)
+
+        def git(*args):
+            subprocess.run(["git", "-C", str(self.root), *args], check=True,
+                           capture_output=True)
+        git("init", "-q")
+        git("-c", "user.email=t@t", "-c", "user.name=t", "add", "-A")
+        git("-c", "user.email=t@t", "-c", "user.name=t", "commit", "-qm", "seed")
+        files[0].write_text("# Changed\n", encoding="utf-8")
+        (self.root / "docs" / "new.md").write_text("# New\n", encoding="utf-8")
+        names, base, err = mda.git_changed(self.root / "docs")
+        self.assertIsNone(err)
+        todo, _ = mda.changed_files(names, (self.root / "docs").resolve(), base)
+        self.assertEqual(sorted(p.name for p in todo), sorted([files[0].name, "new.md"]))
+
+
+class TestTokenizer(unittest.TestCase):
+
+    EDGES = {
+        "self-test": _NEEDS_FIXES,
+        "clean": _CLEAN,
+        "empty": "",
+        "blank only": "\n  \n",
+        "no heading": "Just prose.\n",
+        "frontmatter": "---\ntags: a\n---\n\nIntro.\n# T\n",
+        "unterminated fence": "# T\n\nText:\n```\n# not a heading\n| a | b |\n|---|---|\n",
+        "table into fence": "# T\n\n| a | b |\n|---|---|\n| 1 | 2 |\n```\nx\n```\n",
+        "late separator": "# T\n\n| a |\n| b |\n| c |\n|---|\n| d |\n",
+        "tilde and skips": "# A\n#### B\n~~~\n**x**\n~~~\n\n**Bold**\n\n## Notes\n## Notes\n",
+        "trailing table": "# T\n\n| a |\n|---|\n" + "| r |\n" * 20,
+    }
+
+    def assertSameFindings(self, text):
+        doc = mda._parse(text)
+        path = Path("doc.md")
+        self.assertEqual([asdict(f) for f in mda._analyze(path, doc).findings],
+                         [asdict(f) for f in legacy_analyze(path, doc).findings])
+
+    def test_fixtures_match_the_per_check_walks(self):
+        for name, text in self.EDGES.items():
+            with self.subTest(name):
+                self.assertSameFindings(text)
+                self.assertSameFindings(text.replace("\n", "\r\n"))
+
+    def test_synthetic_pages_match_the_per_check_walks(self):
+        for seed in range(1, 9):
+            with self.subTest(seed=seed):
+                self.assertSameFindings(synthetic_document(48 * 1024, seed))
+
+    def test_sections_carry_word_counts_and_children(self):
+        tok = mda._tokenize(mda._parse("# A\none two\n```\nthree\n```\n## B\nfour\n# C\n").body, 0)
+        self.assertEqual([(s.heading, s.word_count, s.has_children) for s in tok.sections],
+                         [("A", 2, True), ("B", 1, False), ("C", 0, False)])
+        self.assertEqual(tok.fences, [(2, 5, 1)])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,189 @@
+"""The relevance-probe cache must save searches without stale or leaked verdicts.
+
+``scripts/probe_cache.py`` lets ``context_inject`` skip the scoped ``top_k=1``
+search for a prompt it probed moments ago. That is only safe if a verdict
+dies with the index it was measured against or with its TTL, if the bound
+evicts the least recently used entry, and if nothing on disk can say what was
+asked (D-012). The counters it feeds into the hook-decisions aggregate are
+covered here too, because they are how the TTL and the bound get tuned.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import importlib.util
+import io
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from _tree import PLUGIN_ROOT  # type: ignore[import-not-found]  # noqa: E402
+
+sys.path.insert(0, str(PLUGIN_ROOT / "scripts"))
+
+import analyze_hook_decisions  # type: ignore[import-not-found]  # noqa: E402
+import decision_log  # type: ignore[import-not-found]  # noqa: E402
+import probe_cache  # type: ignore[import-not-found]  # noqa: E402
+
+_PROMPT = "What is our convention for naming the release branches?"
+
+
+class _CacheCase(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = Path(tempfile.mkdtemp(prefix="rag-probe-cache-"))
+        self.addCleanup(shutil.rmtree, self.dir, True)
+        saved = (probe_cache.CACHE_FILE, probe_cache.MAX_ENTRIES, probe_cache.TTL_SECONDS)
+        probe_cache.CACHE_FILE = self.dir / "probe-cache.json"
+        probe_cache.TTL_SECONDS = 600
+
+        def restore():
+            probe_cache.CACHE_FILE, probe_cache.MAX_ENTRIES, probe_cache.TTL_SECONDS = saved
+        self.addCleanup(restore)
+
+
+class TestVerdicts(_CacheCase):
+
+    def test_a_light_edit_is_a_hit(self):
+        probe_cache.store("rag", _PROMPT, "indexed|t1", True, 0.81, now=1000.0)
+        for variant in (_PROMPT, "  what is our convention for naming the RELEASE branches",
+                        "What is our convention for\nnaming the release branches?!"):
+            self.assertEqual(probe_cache.lookup("rag", variant, "indexed|t1", now=1001.0),
+                             ("hit", (True, 0.81)), variant)
+
+    def test_another_project_or_question_misses(self):
+        probe_cache.store("rag", _PROMPT, "indexed|t1", True, 0.81, now=1000.0)
+        self.assertEqual(probe_cache.lookup("docs", _PROMPT, "indexed|t1", now=1001.0)[0], "miss")
+        self.assertEqual(probe_cache.lookup("rag", _PROMPT + " for hotfixes", "indexed|t1",
+                                            now=1001.0)[0], "miss")
+
+    def test_a_reindex_or_the_ttl_ends_a_verdict(self):
+        probe_cache.store("rag", _PROMPT, "indexed|t1", False, 0.2, now=1000.0)
+        self.assertEqual(probe_cache.lookup("rag", _PROMPT, "indexed|t2", now=1001.0),
+                         ("reindexed", None))
+        self.assertEqual(probe_cache.lookup("rag", _PROMPT, "indexed_stale|t1", now=1001.0),
+                         ("reindexed", None))
+        self.assertEqual(probe_cache.lookup("rag", _PROMPT, "indexed|t1", now=1601.0),
+                         ("expired", None))
+
+    def test_ttl_zero_disables(self):
+        probe_cache.TTL_SECONDS = 0
+        self.assertEqual(probe_cache.store("rag", _PROMPT, "m", True, 0.9), 0)
+        self.assertEqual(probe_cache.lookup("rag", _PROMPT, "m"), ("disabled", None))
+        self.assertFalse(probe_cache.CACHE_FILE.exists())
+
+    def test_a_corrupt_file_is_a_miss(self):
+        probe_cache.CACHE_FILE.write_text("{not json", encoding="utf-8")
+        self.assertEqual(probe_cache.lookup("rag", _PROMPT, "m"), ("miss", None))
+        probe_cache.store("rag", _PROMPT, "m", True, 0.9)
+        self.assertEqual(probe_cache.lookup("rag", _PROMPT, "m")[0], "hit")
+
+    def test_nothing_on_disk_names_the_prompt_or_project(self):
+        probe_cache.store("secret-project", _PROMPT, "indexed|2026-10-17 09:00", True, 0.9)
+        text = probe_cache.CACHE_FILE.read_text(encoding="utf-8").lower()
+        for leak in ("secret-project", "convention", "release", "2026-10-17"):
+            self.assertNotIn(leak, text)
+
+
+class TestBound(_CacheCase):
+
+    def test_least_recently_used_goes_first(self):
+        probe_cache.MAX_ENTRIES = 3
+        for n in range(3):
+            self.assertEqual(probe_cache.store("rag", f"question {n}", "m", True, 0.9, now=1000.0), 0)
+        self.assertEqual(probe_cache.lookup("rag", "question 0", "m", now=1001.0)[0], "hit")
+        self.assertEqual(probe_cache.store("rag", "question 3", "m", True, 0.9, now=1002.0), 1)
+        self.assertEqual([probe_cache.lookup("rag", f"question {n}", "m", now=1003.0)[0]
+                          for n in range(4)], ["hit", "miss", "hit", "hit"])
+
+    def test_expired_entries_are_dropped_on_store(self):
+        probe_cache.store("rag", "old", "m", True, 0.9, now=1000.0)
+        self.assertEqual(probe_cache.store("rag", "new", "m", True, 0.9, now=2000.0), 1)
+
+
+class TestHookUsesTheCache(_CacheCase):
+
+    def setUp(self):
+        super().setUp()
+        spec = importlib.util.spec_from_file_location(
+            "context_inject_probe_cache", PLUGIN_ROOT / "hooks" / "context_inject.py")
+        self.ci = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(self.ci)
+        self.addCleanup(sys.modules.pop, "rp_probe_cache", None)
+        sys.modules.pop("rp_probe_cache", None)
+        loaded = self.ci._load("rp_probe_cache", "probe_cache.py")
+        loaded.CACHE_FILE, loaded.TTL_SECONDS = probe_cache.CACHE_FILE, 600
+        self.calls = []
+        self.answer = (True, 0.77, "")
+
+        def fake_probe(prompt, project):
+            self.calls.append(project)
+            return self.answer
+        self.ci.domain_probe = fake_probe
+        self.scope = self.ci.Scope("rag", "docs", "indexed", "cache", last_indexed="t1")
+
+    def test_a_repeated_prompt_costs_no_search(self):
+        self.assertEqual(self.ci.cached_probe(_PROMPT, self.scope),
+                         (True, 0.77, "", {"probe_cache": "miss"}))
+        self.assertEqual(self.ci.cached_probe(_PROMPT.upper(), self.scope),
+                         (True, 0.77, "", {"probe_cache": "hit"}))
+        self.assertEqual(self.calls, ["rag"])
+        reindexed = self.scope._replace(last_indexed="t2")
+        self.assertEqual(self.ci.cached_probe(_PROMPT, reindexed)[3], {"probe_cache": "reindexed"})
+        self.assertEqual(len(self.calls), 2)
+
+    def test_an_error_is_not_remembered(self):
+        self.answer = (False, 0.0, "probe-error:timeout")
+        self.ci.cached_probe(_PROMPT, self.scope)
+        self.answer = (True, 0.9, "")
+        self.assertEqual(self.ci.cached_probe(_PROMPT, self.scope)[:3], (True, 0.9, ""))
+        self.assertEqual(len(self.calls), 2)
+
+
+class TestCacheStatistics(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp(prefix="rag-probe-stats-")
+        self.addCleanup(shutil.rmtree, self.dir, True)
+        self.log = os.path.join(self.dir, "hook-decisions.log")
+
+    def test_lookups_and_evictions_reach_the_analyzer(self):
+        for status, evicted in (("miss", 0), ("hit", 0), ("hit", 0), ("expired", 2)):
+            entry = {"ts": "2026-10-17T09:00:00Z", "hook_version": "1.0.0",
+                     "action": "context-injected", "probe_cache": status}
+            if evicted:
+                entry["probe_cache_evicted"] = evicted
+            decision_log.append(self.log, entry)
+        agg = decision_log.load(self.log)
+        self.assertEqual(agg["probe_cache"], {"lookups": {"miss": 1, "hit": 2, "expired": 1},
+                                              "evicted": 2})
+        self.assertEqual(agg["probe_cache"], decision_log.recompute(self.log)["probe_cache"])
+
+        saved = analyze_hook_decisions.LOG_PATH
+        analyze_hook_decisions.LOG_PATH = self.log
+        self.addCleanup(setattr, analyze_hook_decisions, "LOG_PATH", saved)
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            analyze_hook_decisions.main([])
+        self.assertIn("--- probe cache ---", out.getvalue())
+        self.assertIn("hit rate:     50.0%  (2/4 lookups", out.getvalue())
+        self.assertIn("evicted:     2", out.getvalue())
+
+    def test_a_schema_1_sidecar_is_rebuilt(self):
+        decision_log.append(self.log, {"action": "context-injected", "probe_cache": "hit"})
+        sidecar = decision_log.sidecar_path(self.log)
+        with open(sidecar, encoding="utf-8") as f:
+            text = f.read()
+        self.assertIn(f'"schema":{decision_log.SCHEMA}', text)
+        with open(sidecar, "w", encoding="utf-8") as f:
+            f.write(text.replace(f'"schema":{decision_log.SCHEMA}', '"schema":1', 1))
+        self.assertEqual(decision_log.load(self.log)["probe_cache"]["lookups"], {"hit": 1})
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
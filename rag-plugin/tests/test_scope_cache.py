@@ -0,0 +1,240 @@
+"""The scope cache must survive many sessions writing it at once.
+
+``scope_resolve`` used to keep every workspace in one ``context-cache.json``
+and rewrite the whole file on each resolution: two sessions in different
+repositories could each read the file, add their own entry, and the slower
+``replace`` erased the faster one's. The cache is now one shard per workspace
+written by atomic replace. These tests run real parallel writer *processes*
+against one cache directory and then require that every workspace is readable,
+every shard parses, and no temp file is left behind. The workspace-key memo
+that sits in front of the cache lives in the same state directory and is
+covered here too.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from _tree import PLUGIN_ROOT  # type: ignore[import-not-found]  # noqa: E402
+
+sys.path.insert(0, str(PLUGIN_ROOT / "scripts"))
+
+import scope_resolve as sr  # type: ignore[import-not-found]  # noqa: E402
+from scope_resolve import EXACT, ProjectMatch, ScopeDecision  # type: ignore[import-not-found]  # noqa: E402
+
+_WRITER = r"""
+import sys
+from pathlib import Path
+sys.path.insert(0, sys.argv[1])
+import scope_resolve as sr
+state, writer, keys, rounds = Path(sys.argv[2]), sys.argv[3], int(sys.argv[4]), int(sys.argv[5])
+sr.STATE_DIR, sr.CACHE_DIR, sr.CACHE_FILE = state, state / "context-cache", state / "context-cache.json"
+failed = 0
+for r in range(rounds):
+    for k in range(keys):
+        d = sr.ScopeDecision(project=sr.ProjectMatch(f"p{k}", f"/w/{k}", sr.EXACT, 1000),
+                             source="resolved", reason=f"{writer}:{r}")
+        failed += not sr.write_cache(f"ws-{k}", d, service={"writer": writer})
+        failed += sr.read_cache(f"ws-{k}") is None
+sys.exit(1 if failed else 0)
+"""
+
+
+class _CacheCase(unittest.TestCase):
+
+    def setUp(self):
+        self.state = Path(tempfile.mkdtemp(prefix="rag-scope-cache-"))
+        self.addCleanup(shutil.rmtree, self.state, True)
+        saved = (sr.STATE_DIR, sr.CACHE_DIR, sr.CACHE_FILE, sr.WORKSPACE_MEMO_DIR,
+                 sr.WORKSPACE_MEMO_FILE)
+        sr.STATE_DIR = self.state
+        sr.CACHE_DIR = self.state / "context-cache"
+        sr.CACHE_FILE = self.state / "context-cache.json"
+        sr.WORKSPACE_MEMO_DIR = self.state / "workspace-keys"
+        sr.WORKSPACE_MEMO_FILE = self.state / "workspace-keys.json"
+        sr._parsed_cache.clear()
+
+        def restore():
+            (sr.STATE_DIR, sr.CACHE_DIR, sr.CACHE_FILE, sr.WORKSPACE_MEMO_DIR,
+             sr.WORKSPACE_MEMO_FILE) = saved
+            sr._parsed_cache.clear()
+        self.addCleanup(restore)
+
+    @staticmethod
+    def decision(pid: str = "p") -> ScopeDecision:
+        return ScopeDecision(project=ProjectMatch(pid, "/x", EXACT, 1000), source="resolved")
+
+
+class TestParallelWriters(_CacheCase):
+
+    WRITERS, KEYS, ROUNDS = 12, 6, 15
+
+    def test_many_writer_processes_lose_nothing(self):
+        procs = [subprocess.Popen([sys.executable, "-c", _WRITER, str(PLUGIN_ROOT / "scripts"),
+                                   str(self.state), f"w{n}", str(self.KEYS), str(self.ROUNDS)])
+                 for n in range(self.WRITERS)]
+        codes = [p.wait(timeout=120) for p in procs]
+        self.assertEqual(codes, [0] * self.WRITERS, "a writer failed to write or read back")
+
+        leftovers = [p.name for p in sr.CACHE_DIR.iterdir() if not p.name.endswith(".json")]
+        self.assertEqual(leftovers, [])
+        shards = list(sr.CACHE_DIR.glob("*.json"))
+        self.assertEqual(len(shards), self.KEYS)
+        for shard in shards:
+            json.loads(shard.read_text(encoding="utf-8"))
+        for k in range(self.KEYS):
+            entry = sr.read_cache(f"ws-{k}")
+            self.assertIsNotNone(entry, k)
+            self.assertEqual(entry["project"]["project_id"], f"p{k}")  # type: ignore[index]
+
+
+class TestShards(_CacheCase):
+
+    def test_one_workspace_one_file(self):
+        sr.write_cache("a", self.decision("pa"))
+        sr.write_cache("b", self.decision("pb"))
+        self.assertEqual(len(list(sr.CACHE_DIR.glob("*.json"))), 2)
+        self.assertFalse(sr.CACHE_FILE.exists(), "the legacy blob is never written")
+        sr.invalidate_cache("a")
+        self.assertIsNone(sr.read_cache("a"))
+        self.assertEqual(sr.read_cache("b")["project"]["project_id"], "pb")  # type: ignore[index]
+        sr.invalidate_cache()
+        self.assertIsNone(sr.read_cache("b"))
+
+    def test_least_recently_written_are_evicted(self):
+        saved = sr.CACHE_MAX_WORKSPACES
+        sr.CACHE_MAX_WORKSPACES = 3
+        self.addCleanup(setattr, sr, "CACHE_MAX_WORKSPACES", saved)
+        for n, key in enumerate("abcd"):
+            if n:  # mtime resolution: make the write order unambiguous
+                os.utime(sr._shard("abcd"[n - 1]), ns=(n * 10**9, n * 10**9))
+            sr.write_cache(key, self.decision(key))
+        self.assertIsNone(sr.read_cache("a"))
+        self.assertEqual([k for k in "bcd" if sr.read_cache(k)], list("bcd"))
+
+    def test_legacy_single_file_is_still_read(self):
+        sr.STATE_DIR.mkdir(parents=True, exist_ok=True)
+        sr.CACHE_FILE.write_text(json.dumps({"schema": 1, "workspaces": {
+            "old": {"as_of_epoch": time.time(), "project": {"project_id": "legacy"}}}}),
+            encoding="utf-8")
+        self.assertEqual(sr.read_cache("old")["project"]["project_id"], "legacy")  # type: ignore[index]
+        sr.write_cache("old", self.decision("fresh"))
+        self.assertEqual(sr.read_cache("old")["project"]["project_id"], "fresh")  # type: ignore[index]
+        sr.invalidate_cache("old")
+        self.assertIsNone(sr.read_cache("old"), "invalidation must reach the legacy entry too")
+
+    def test_a_shard_for_another_key_is_a_miss(self):
+        sr.write_cache("a", self.decision())
+        shard = sr._shard("a")
+        blob = json.loads(shard.read_text(encoding="utf-8"))
+        blob["workspace_key"] = "someone-else"
+        shard.write_text(json.dumps(blob), encoding="utf-8")
+        self.assertIsNone(sr.read_cache("a"))
+
+
+class TestWorkspaceMemo(_CacheCase):
+    """``resolve_workspace_key`` is on every prompt; outside a repository it
+    used to spawn ``git rev-parse`` each time."""
+
+    def setUp(self):
+        super().setUp()
+        self.tree = Path(tempfile.mkdtemp(prefix="rag-scope-ws-")).resolve()
+        self.addCleanup(shutil.rmtree, self.tree, True)
+        self.walks = 0
+        real = sr._find_git_root
+
+        def counting(p):
+            self.walks += 1
+            return real(p)
+        sr._find_git_root = counting
+        self.addCleanup(setattr, sr, "_find_git_root", real)
+
+    def test_not_a_repo_is_remembered(self):
+        d = self.tree / "plain"
+        d.mkdir()
+        self.assertEqual(sr.resolve_workspace_key(d), sr.norm(str(d)))
+        self.assertEqual(sr.resolve_workspace_key(d), sr.norm(str(d)))
+        self.assertIsNone(sr.detect_git_root(d))
+        self.assertEqual(self.walks, 1)
+        self.assertTrue(sr._shard(str(d), sr.WORKSPACE_MEMO_DIR).is_file())
+
+    def test_git_init_in_the_directory_invalidates(self):
+        d = self.tree / "becomes-a-repo"
+        d.mkdir()
+        os.utime(d, ns=(10**9, 10**9))
+        sr.resolve_workspace_key(d)
+        (d / ".git").mkdir()
+        self.assertEqual(sr.detect_git_root(d), d)
+        self.assertEqual(self.walks, 2)
+
+    def test_git_init_in_a_parent_invalidates(self):
+        parent = self.tree / "becomes-a-repo"
+        d = parent / "docs" / "notes"
+        d.mkdir(parents=True)
+        self.assertIsNone(sr.detect_git_root(d))
+        (parent / ".git").mkdir()
+        self.assertEqual(sr.detect_git_root(d), parent)
+        self.assertEqual(sr.detect_git_root(d), parent)
+        self.assertEqual(self.walks, 2)
+
+    def test_a_nested_repository_or_a_removed_one_invalidates(self):
+        root = self.tree / "repo"
+        sub = root / "vendor" / "lib"
+        sub.mkdir(parents=True)
+        (root / ".git").mkdir()
+        self.assertEqual(sr.detect_git_root(sub), root)
+        (root / "vendor" / ".git").mkdir()
+        self.assertEqual(sr.detect_git_root(sub), root / "vendor")
+        shutil.rmtree(root / "vendor" / ".git")
+        shutil.rmtree(root / ".git")
+        self.assertIsNone(sr.detect_git_root(sub))
+        self.assertEqual(self.walks, 3)
+
+    def test_concurrent_sessions_keep_each_others_entries(self):
+        dirs = [self.tree / f"d{n}" for n in range(8)]
+        for d in dirs:
+            d.mkdir()
+        threads = [threading.Thread(target=sr.resolve_workspace_key, args=(d,)) for d in dirs]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(self.walks, len(dirs))
+        for d in dirs:
+            sr.resolve_workspace_key(d)
+        self.assertEqual(self.walks, len(dirs), "an entry was lost to a concurrent write")
+
+    def test_entries_expire(self):
+        root = self.tree / "repo"
+        (root / ".git").mkdir(parents=True)
+        sub = root / "src"
+        sub.mkdir()
+        self.assertEqual(sr._workspace(sub, now=1000.0), (str(root), sr.norm(str(root))))
+        sr._workspace(sub, now=1000.0 + sr.WORKSPACE_MEMO_TTL_SECONDS)
+        self.assertEqual(self.walks, 1)
+        sr._workspace(sub, now=1001.0 + sr.WORKSPACE_MEMO_TTL_SECONDS)
+        self.assertEqual(self.walks, 2)
+
+    def test_a_corrupt_memo_is_ignored(self):
+        d = self.tree / "plain"
+        d.mkdir()
+        shard = sr._shard(str(d), sr.WORKSPACE_MEMO_DIR)
+        shard.parent.mkdir(parents=True)
+        shard.write_text("{not json", encoding="utf-8")
+        self.assertEqual(sr.resolve_workspace_key(d), sr.norm(str(d)))
+        self.assertEqual(json.loads(shard.read_text(encoding="utf-8"))["schema"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
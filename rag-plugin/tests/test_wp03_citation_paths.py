@@ -20,6 +20,7 @@ from __future__ import annotations
 import os
 import sys
 import tempfile
+import time
 import unittest
 from pathlib import Path
 
@@ -37,13 +38,17 @@ sys.path.insert(0, str(tree_root() / "scripts"))
 # skip plus one explicit assertion, not as ten collection errors.
 HAS_CITATION_PATH = True
 try:
-    from citation_path import normalize, to_native  # type: ignore[import-not-found]  # noqa: E402
+    import citation_path  # type: ignore[import-not-found]  # noqa: E402
+    from citation_path import normalize, normalize_batch, to_native  # type: ignore[import-not-found]  # noqa: E402
 except ImportError:  # pragma: no cover - baseline run
     HAS_CITATION_PATH = False
 
     def normalize(*_args, **_kwargs):  # type: ignore[misc]
         raise RuntimeError("citation_path is unavailable in this tree")
 
+    def normalize_batch(*_args, **_kwargs):  # type: ignore[misc]
+        raise RuntimeError("citation_path is unavailable in this tree")
+
     def to_native(*_args, **_kwargs):  # type: ignore[misc]
         raise RuntimeError("citation_path is unavailable in this tree")
 
@@ -214,6 +219,75 @@ class TestGuardsRejectNaiveImplementations(unittest.TestCase):
             self.assertFalse(c.trusted, "a nonexistent file was reported as trusted")
 
 
+@unittest.skipUnless(HAS_CITATION_PATH, "citation_path not present (baseline tree)")
+class TestBatch(unittest.TestCase):
+    """``normalize_batch`` must answer exactly as ``normalize`` would, item by
+    item, while verifying from directory listings instead of a stat each."""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.base = Path(tmp.name)
+        for pid in ("alpha", "beta"):
+            (self.base / pid / "docs").mkdir(parents=True)
+            for name in ("a.md", "b.md"):
+                (self.base / pid / "docs" / name).write_text("x", encoding="utf-8")
+        self.roots = {pid: str(self.base / pid) for pid in ("alpha", "beta")}
+        self.age(self.base)
+        citation_path._LISTINGS.clear()
+        self.addCleanup(citation_path._LISTINGS.clear)
+
+    @staticmethod
+    def age(root):
+        """Date every directory an hour back, out of the racy window."""
+        past = time.time() - 3600
+        for dirpath, _, _ in os.walk(root):
+            os.utime(dirpath, (past, past))
+
+    def single(self, batch):
+        return [normalize(c, pid, self.roots.get(pid)) for c, pid in batch]
+
+    def test_matches_normalize_item_by_item(self):
+        batch = [
+            ("alpha/alpha/docs/a.md", "alpha"), ("alpha/docs/b.md:L3-9", "alpha"),
+            ("beta/beta/docs/ghost.md", "beta"), ("alpha/docs/a.md", "beta"),
+            ("gamma/gamma/docs/a.md", "gamma"), ("", "alpha"), ("alpha/alpha", "alpha"),
+            ("alpha/alpha/docs/./a.md", "alpha"), ("alpha/docs/../docs/a.md", "alpha"),
+            ("alpha/alpha/docs", "alpha"), ("alpha/alpha/docs/a.md", "alpha"),
+        ]
+        self.assertEqual(normalize_batch(batch, self.roots), self.single(batch))
+        self.assertEqual(normalize_batch(batch, self.roots), self.single(batch), "warm listings")
+
+    def test_listed_files_are_not_stat_ed_one_by_one(self):
+        batch = [(f"alpha/alpha/docs/{n}", "alpha") for n in ("a.md", "b.md")] * 5
+        normalize_batch(batch, self.roots)
+        calls = []
+        real = Path.is_file
+
+        def counting(path):
+            calls.append(path)
+            return real(path)
+        Path.is_file = counting  # type: ignore[method-assign]
+        self.addCleanup(setattr, Path, "is_file", real)
+        self.assertTrue(all(c.trusted for c in normalize_batch(batch, self.roots)))
+        self.assertEqual(calls, [])
+
+    def test_a_changed_directory_is_listed_again(self):
+        normalize_batch([("alpha/docs/a.md", "alpha")], self.roots)
+        (self.base / "alpha" / "docs" / "c.md").write_text("x", encoding="utf-8")
+        (self.base / "alpha" / "docs" / "a.md").unlink()
+        self.age(self.base)  # still a new mtime, just not a racy one
+        got = normalize_batch([("alpha/docs/a.md", "alpha"), ("alpha/docs/c.md", "alpha")],
+                              self.roots)
+        self.assertEqual([c.trusted for c in got], [False, True])
+
+    def test_a_fresh_directory_listing_is_not_kept(self):
+        (self.base / "beta" / "new").mkdir()
+        (self.base / "beta" / "new" / "n.md").write_text("x", encoding="utf-8")
+        self.assertTrue(normalize_batch([("beta/new/n.md", "beta")], self.roots)[0].trusted)
+        self.assertNotIn(str(self.base / "beta" / "new"), citation_path._LISTINGS)
+
+
 class TestBaselineLacksTheCapability(unittest.TestCase):
     def test_baseline_has_no_citation_handling(self):
         """The negative control for this whole module: against v0.17.0 the
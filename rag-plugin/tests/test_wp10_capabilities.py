@@ -24,8 +24,12 @@ being distinguishable from a confirmed absence.** "Could not determine" and
 from __future__ import annotations
 
 import os
+import shutil
 import sys
+import tempfile
+import time
 import unittest
+from pathlib import Path
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
@@ -45,6 +49,7 @@ from capability_probe import (  # type: ignore[import-not-found]  # noqa: E402
     parse_version,
     probe_index_redaction,
 )
+import capability_probe  # type: ignore[import-not-found]  # noqa: E402
 
 
 class TestVersionParsing(unittest.TestCase):
@@ -175,5 +180,73 @@ class TestProbePreferenceIsDocumented(unittest.TestCase):
                       "the reason redaction stays version-gated must be stated")
 
 
+class TestCapabilitySnapshot(unittest.TestCase):
+    """``report_for`` must make ``gate()`` a local lookup without letting a
+    snapshot outlive the version — or the outage — it describes."""
+
+    def setUp(self):
+        from bench_service_discover import StubServices  # type: ignore[import-not-found]
+
+        state = tempfile.mkdtemp(prefix="rag-capabilities-")
+        self.addCleanup(shutil.rmtree, state, True)
+        saved = capability_probe.SNAPSHOT_FILE
+        capability_probe.SNAPSHOT_FILE = Path(state) / "capabilities.json"
+        self.addCleanup(setattr, capability_probe, "SNAPSHOT_FILE", saved)
+        self.stubs = StubServices(1, latency=0.15)
+        port = self.stubs.__enter__()[0]
+        self.addCleanup(self.stubs.__exit__, None, None, None)
+        self.base = f"http://127.0.0.1:{port}"
+
+    def test_probes_run_concurrently_in_the_usual_order(self):
+        t0 = time.monotonic()
+        report = capability_probe.probe_all(self.base, sample_project="p")
+        self.assertLess(time.monotonic() - t0, 0.15 * 5 / 2)
+        self.assertEqual(list(report.capabilities), [
+            "scope_mandatory", "dependencies", "per_project_layout",
+            "index_redaction", "path_doubling"])
+        self.assertEqual(report.version, (3, 5, 1))
+
+    def test_a_snapshot_hit_makes_no_request(self):
+        first = capability_probe.report_for(self.base, identity="svc-a", version_raw="3.5.1")
+        self.stubs.hits.clear()
+        again = capability_probe.report_for(self.base, identity="svc-a", version_raw="3.5.1")
+        self.assertEqual(self.stubs.hits, {})
+        self.assertEqual(again.capabilities, first.capabilities)
+        self.assertIsNone(gate(again, "index_redaction", "set_project_mode"))
+
+    def test_a_new_version_or_refresh_probes_again(self):
+        capability_probe.report_for(self.base, identity="svc-a", version_raw="3.5.1")
+        for kwargs in ({"version_raw": "3.6.0"}, {"version_raw": "3.5.1", "refresh": True}):
+            self.stubs.hits.clear()
+            capability_probe.report_for(self.base, identity="svc-a", **kwargs)
+            self.assertIn("/api/dependencies", self.stubs.hits, kwargs)
+
+    def test_a_failed_probe_is_never_stored(self):
+        self.stubs.servers[0].shutdown()
+        self.stubs.servers[0].server_close()
+        report = capability_probe.report_for(self.base, identity="svc-a", version_raw="3.5.1")
+        self.assertEqual(report.get("scope_mandatory").state, UNKNOWN)
+        self.assertFalse(capability_probe.SNAPSHOT_FILE.exists())
+
+    def test_a_server_error_is_not_stored(self):
+        real = capability_probe._request
+
+        def starting(url, *args, **kwargs):
+            if url.endswith("/api/dependencies"):
+                return 503, None
+            return real(url, *args, **kwargs)
+        capability_probe._request = starting
+        try:
+            report = capability_probe.report_for(self.base, identity="svc-a",
+                                                 version_raw="3.5.1")
+        finally:
+            capability_probe._request = real
+        self.assertEqual(report.get("dependencies").state, UNKNOWN)
+        self.assertFalse(capability_probe.SNAPSHOT_FILE.exists())
+        report = capability_probe.report_for(self.base, identity="svc-a", version_raw="3.5.1")
+        self.assertEqual(report.get("dependencies").state, ABSENT)  # the stub has none
+        self.assertTrue(capability_probe.SNAPSHOT_FILE.exists())
+
+
 if __name__ == "__main__":
     unittest.main(verbosity=2)